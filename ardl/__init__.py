@@ -0,0 +1,22 @@
+from ardl.bootstrap import BootstrapBounds, bootstrap_bounds
+from ardl.bounds import BoundsTest, CriticalValueTable, bounds_test, critical_value_table
+from ardl.breaks import BreakTest, MultipleBreakTest, ardl_breaks, break_dummies, break_test, multiple_breaks
+from ardl.diagnostics import diagnostic_tests
+from ardl.dynamics import DynamicResponses, dynamic_multipliers, dynamic_responses
+from ardl.fourier import FourierARDL, FourierARDLResults, fourier_bounds_test
+from ardl.midas import MIDAS, MIDASResults, midas_lags, midas_weights
+from ardl.model import ARDL, ARDLResults, UECMResults
+from ardl.nardl import NARDL, NARDLResults, decompose, partial_sums
+from ardl.selection import OrderSelection, select_order
+from ardl.stability import StabilityTest, stability_test
+from ardl.unitroot import FourierUnitRootTest, fourier_adf, fourier_kpss, fourier_screen
+
+__all__ = ["ARDL", "ARDLResults", "UECMResults", "OrderSelection", "select_order", "BoundsTest", "bounds_test",
+		   "CriticalValueTable", "critical_value_table",
+		   "BootstrapBounds", "bootstrap_bounds", "StabilityTest", "stability_test",
+		   "BreakTest", "break_test", "MultipleBreakTest", "multiple_breaks", "ardl_breaks", "break_dummies",
+		   "diagnostic_tests", "partial_sums", "decompose", "NARDL", "NARDLResults",
+		   "DynamicResponses", "dynamic_responses", "dynamic_multipliers",
+		   "FourierARDL", "FourierARDLResults", "fourier_bounds_test",
+		   "FourierUnitRootTest", "fourier_adf", "fourier_kpss", "fourier_screen",
+		   "MIDAS", "MIDASResults", "midas_lags", "midas_weights"]
@@ -0,0 +1,389 @@
+"""Conditional bootstrap of the bounds test (McNown, Sam and Goh, 2018).
+
+Each statistic is bootstrapped under its own null: the unrestricted ECM is re-estimated
+without the tested terms, its centred residuals are resampled, and the dependent series
+is regenerated recursively conditional on the observed regressors and initial values.
+Residuals are resampled i.i.d., in moving or stationary blocks, or by a wild bootstrap.
+All replicates of a batch share one ``(B, n)`` recursion (a single linear filter along
+the time axis) and one batched least-squares solve on their Gram matrices.
+
+Batches are independent given their seeds, so they can run in a process pool and a
+statistic can stop early once its critical values are estimated precisely enough.
+Each distribution is accumulated batch by batch, optionally in a streaming sketch only.
+"""
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+import numpy as np
+
+from ardl.bounds import CASE_TERMS, CASES, DEFAULT_CASE, LEVELS, _subset_fit
+from ardl.sketch import TDigest
+
+# F: كل المستويات المتباطئة، t: معامل y(-1)، F_exog: مستويات المتغيرات المستقلة فقط
+STATISTICS = ("f", "t", "f_exog")
+SCHEMES = ("iid", "block", "stationary", "rademacher", "mammen")
+# أسماء طرق إعادة المعاينة كما تظهر في الصفحات
+SCHEME_LABELS = {
+	"iid": "إعادة معاينة مستقلة (i.i.d.)",
+	"block": "البلوكات المتداخلة (Moving Block)",
+	"stationary": "البلوكات الثابتة (Stationary)",
+	"rademacher": "Wild (Rademacher)",
+	"mammen": "Wild (Mammen)"
+}
+
+
+class BootstrapBounds:
+	"""Observed bounds statistics with their bootstrap null distributions."""
+
+	def __init__(self, case, nobs, observed, distributions, scheme="iid", levels=LEVELS):
+		self.case = case
+		self.scheme = scheme
+		self.nobs = nobs
+		self.observed = observed
+		self.distributions = distributions
+		self.levels = levels
+
+	@property
+	def draws(self):
+		"""Bootstrap draws per statistic, ``None`` when only the sketch was kept."""
+		return {stat: dist.draws() for stat, dist in self.distributions.items()}
+
+	@property
+	def reps(self):
+		"""Replicates per statistic (they differ when sampling stopped early)."""
+		return {stat: dist.count for stat, dist in self.distributions.items()}
+
+	def critical_values(self, stat="f"):
+		"""Bootstrap critical values ``{level: value}``: upper tail for F, lower tail for t."""
+		return self.distributions[stat].critical_values(self.levels)
+
+	def pvalue(self, stat="f"):
+		return self.distributions[stat].pvalue()
+
+	def decision(self, level=0.05, stat="f"):
+		return "reject" if self.pvalue(stat) <= level else "accept"
+
+	def standard_errors(self, stat="f"):
+		"""Monte Carlo standard errors of :meth:`critical_values`, ``{level: se}``."""
+		return self.distributions[stat].standard_errors(self.levels)
+
+
+class _NullModel:
+	"""The unrestricted ECM of a fitted ARDL, ready to regenerate ``y`` under a null.
+
+	Columns are ``[det, y(-1), x(-1), Δy(-1..p-1), Δx(-0..q-1)]``, with ``x_t`` in place of
+	``x(-1)`` and no ``Δx`` terms for regressors without lags.
+	"""
+
+	def __init__(self, results, case):
+		model = results.model
+		self.y = model.y
+		self.maxlag = m = model.maxlag
+		self.p = model.p
+		end = len(self.y)
+
+		def diff(series, lag):
+			return series[m - lag:end - lag] - series[m - lag - 1:end - lag - 1]
+
+		n_det = len(results.params) - model.p - int(model.q.sum()) - len(model.q)
+		columns = [results.exog[:, i] for i in range(n_det)] + [self.y[m - 1:-1]]
+		# المتغير ذو q = 0 يدخل بمستواه الحالي x_t فقط لأن معاملي x(-1) وΔx متساويان في النموذج
+		columns += [x[m - int(q > 0):end - int(q > 0)] for x, q in zip(model.x.T, model.q)]
+		columns += [diff(self.y, i) for i in range(1, model.p)]
+		columns += [diff(x, l) for x, q in zip(model.x.T, model.q) for l in range(q)]
+		self.design = np.column_stack(columns)
+		self.dendog = self.y[m:] - self.y[m - 1:-1]
+
+		k = len(model.q)
+		self.y_columns = [n_det] + list(range(n_det + 1 + k, n_det + k + model.p))
+		level_x = list(range(n_det + 1, n_det + 1 + k))
+		det_names = results.names[:n_det]
+		restricted = [det_names.index(name) for name in CASE_TERMS[case][1]]
+		self.tested = {"f": restricted + [n_det] + level_x}
+		if not restricted:
+			self.tested["t"] = [n_det]
+		if level_x:
+			self.tested["f_exog"] = level_x
+		self._scale = np.sqrt(np.sum(self.design ** 2, axis=0))
+
+	def statistic(self, gram, stat):
+		"""F or t of ``stat`` for a batch of ``[Z, Δy]`` Gram matrices, shape ``(B, k + 1, k + 1)``."""
+		tested = self.tested[stat]
+		k = self.design.shape[1]
+		full = list(range(k))
+		df_resid = len(self.dendog) - k
+		ssr_u, beta, inv = _subset_fit(gram, full)
+		if stat == "t":
+			i = tested[0]
+			return beta[:, i] / np.sqrt(ssr_u / df_resid * inv[:, i, i])
+		kept = [col for col in full if col not in tested]
+		ssr_r = _subset_fit(gram, kept)[0] if kept else gram[:, -1, -1]
+		return (ssr_r - ssr_u) / len(tested) / (ssr_u / df_resid)
+
+	def gram(self, design, dendog):
+		# تطبيع الأعمدة بمقاييس البيانات الأصلية لتحسين حالة المصفوفات في الحل الدفعي
+		W = np.concatenate([design / self._scale, dendog[..., None]], axis=-1)
+		return np.swapaxes(W, -1, -2) @ W
+
+	def null_fit(self, stat):
+		"""Coefficients (zero on the tested terms) and centred residuals of the restricted ECM."""
+		kept = [col for col in range(self.design.shape[1]) if col not in self.tested[stat]]
+		params = np.zeros(self.design.shape[1])
+		params[kept] = np.linalg.lstsq(self.design[:, kept], self.dendog, rcond=None)[0]
+		resid = self.dendog - self.design @ params
+		# إعادة تحجيم البواقي لتعويض درجات الحرية المستهلكة في التقدير
+		resid = (resid - resid.mean()) * np.sqrt(len(resid) / (len(resid) - len(kept)))
+		return params, resid
+
+	def regenerate(self, params, innovations):
+		"""Bootstrap samples of ``y`` from ``(B, n)`` innovations; returns ``(B, n + maxlag)``.
+
+		The ECM with coefficients ``params`` is written as the levels recursion
+		``y_t = c_t + Σ a_i y_{t-i} + e_t`` with ``c_t`` fixed by the observed regressors,
+		and run for all replicates at once as one IIR filter with shared initial state.
+		"""
+		from scipy import signal
+
+		phi = params[self.y_columns[0]]
+		psi = params[self.y_columns[1:]]
+		y_part = self.design[:, self.y_columns] @ params[self.y_columns]
+		fixed = self.design @ params - y_part
+		# Δy_t = φ y_{t-1} + Σ ψ_i Δy_{t-i} + ... ⇒ معاملات الصيغة المستوى a_1..a_p
+		a = np.zeros(self.p)
+		a[0] = 1 + phi
+		a[:len(psi)] += psi
+		a[1:len(psi) + 1] -= psi
+		denominator = np.concatenate([[1.0], -a])
+		start = self.y[:self.maxlag]
+		zi = signal.lfiltic([1.0], denominator, start[::-1][:self.p])
+		sample = signal.lfilter([1.0], denominator, fixed + innovations, axis=1,
+								zi=np.broadcast_to(zi, (len(innovations), len(zi))))[0]
+		return np.concatenate([np.broadcast_to(start, (len(sample), self.maxlag)), sample], axis=1)
+
+	def resample_design(self, y):
+		"""ECM regressand and design for a batch of regenerated series ``y``, shape ``(B, N)``."""
+		m = self.maxlag
+		end = y.shape[1]
+		dendog = y[:, m:] - y[:, m - 1:-1]
+		design = np.repeat(self.design[None], len(y), axis=0)
+		design[:, :, self.y_columns[0]] = y[:, m - 1:-1]
+		for i, col in enumerate(self.y_columns[1:], start=1):
+			design[:, :, col] = y[:, m - i:end - i] - y[:, m - i - 1:end - i - 1]
+		return design, dendog
+
+
+class Resampler:
+	"""Bootstrap innovations from the null-model residuals.
+
+	``"iid"`` draws residuals with replacement; ``"block"`` (moving blocks) and
+	``"stationary"`` (Politis-Romano, geometric block lengths with mean
+	``block_length``, wrapping circularly) keep the short-run dependence of the
+	residuals; ``"rademacher"`` and ``"mammen"`` are wild bootstraps that multiply
+	each residual by an independent two-point weight and keep its heteroskedasticity.
+	Index-based schemes build a ``(B, n)`` index array from precomputed offsets and
+	gather the residuals once per batch.
+	"""
+
+	def __init__(self, scheme, nobs, block_length=None):
+		if scheme not in SCHEMES:
+			raise ValueError(f"scheme must be one of {SCHEMES}, got {scheme!r}")
+		self.scheme = scheme
+		self.nobs = nobs
+		self.block_length = max(1, round(nobs ** (1 / 3))) if block_length is None else int(block_length)
+		if not 1 <= self.block_length <= nobs:
+			raise ValueError(f"block_length must be between 1 and {nobs}")
+		self._offsets = np.arange(self.block_length)
+		self._times = np.arange(nobs)
+
+	def indices(self, rng, size):
+		n, length = self.nobs, self.block_length
+		if self.scheme == "iid":
+			return rng.integers(0, n, (size, n))
+		if self.scheme == "block":
+			starts = rng.integers(0, n - length + 1, (size, -(-n // length)))
+			return (starts[:, :, None] + self._offsets).reshape(size, -1)[:, :n]
+		# بداية كتلة جديدة باحتمال 1/length عند كل فترة، ثم الاستمرار من موضع البداية
+		new = rng.random((size, n)) < 1 / length
+		new[:, 0] = True
+		block_start = np.maximum.accumulate(np.where(new, self._times, 0), axis=1)
+		starts = np.take_along_axis(rng.integers(0, n, (size, n)), block_start, axis=1)
+		return (starts + self._times - block_start) % n
+
+	def innovations(self, rng, resid, size):
+		if self.scheme == "rademacher":
+			return resid * rng.choice(np.array([-1.0, 1.0]), (size, self.nobs))
+		if self.scheme == "mammen":
+			root5 = np.sqrt(5)
+			low = rng.random((size, self.nobs)) < (root5 + 1) / (2 * root5)
+			return resid * np.where(low, -(root5 - 1) / 2, (root5 + 1) / 2)
+		return resid[self.indices(rng, size)]
+
+
+def quantile_se(quantile, reps, probs, z=1.959964):
+	"""Distribution-free Monte Carlo standard errors of the sample quantiles at ``probs``.
+
+	Half the width of the order-statistic confidence interval for each quantile,
+	divided by ``z``; ``quantile`` maps probabilities to sample quantiles.
+	"""
+	probs = np.asarray(probs)
+	half = z * np.sqrt(probs * (1 - probs) / reps)
+	return (quantile(np.clip(probs + half, 0, 1)) - quantile(np.clip(probs - half, 0, 1))) / (2 * z)
+
+
+def _replicate(null, resampler, stat, params, resid, seed, size):
+	# دفعة واحدة من التكرارات بتيار عشوائي خاص بها، فالنتيجة لا تعتمد على العامل الذي ينفذها
+	rng = np.random.default_rng(seed)
+	innovations = resampler.innovations(rng, resid, size)
+	design, dendog = null.resample_design(null.regenerate(params, innovations))
+	return null.statistic(null.gram(design, dendog), stat)
+
+
+_NULL = None
+
+
+def _init_worker(null):
+	global _NULL
+	_NULL = null
+
+
+def _worker_replicate(*args):
+	return _replicate(_NULL, *args)
+
+
+class BootstrapDistribution:
+	"""Running bootstrap distribution of one statistic, fed batch by batch in order.
+
+	Quantiles come from a t-digest sketch, so memory does not grow with the number of
+	replicates; with ``keep_draws`` the draws are also kept and quantiles are exact.
+	The p-value is exact either way, from a running count of draws at least as
+	extreme as the observed statistic.
+	"""
+
+	def __init__(self, stat, observed, tol=None, keep_draws=True, compression=200):
+		self.stat = stat
+		self.observed = observed
+		self.tol = tol
+		self.sketch = TDigest(compression)
+		self.parts = [] if keep_draws else None
+		self.count = 0
+		self.extreme = 0
+		self.batches = 0
+
+	def _probs(self, levels):
+		# F يرفض في الذيل الأيمن، وt في الذيل الأيسر
+		return np.array(levels) if self.stat == "t" else 1 - np.array(levels)
+
+	def add(self, part):
+		"""Absorb the next batch; returns True when sampling can stop."""
+		self.sketch.update(part)
+		if self.parts is not None:
+			self.parts.append(part)
+		self.count += len(part)
+		if self.stat == "t":
+			self.extreme += np.count_nonzero(part <= self.observed)
+		else:
+			self.extreme += np.count_nonzero(part >= self.observed)
+		self.batches += 1
+		if self.tol is None or self.batches < 2:
+			return False
+		return max(self.standard_errors().values()) < self.tol
+
+	def draws(self):
+		return None if self.parts is None else np.concatenate(self.parts)
+
+	def quantile(self, probs):
+		if self.parts is None:
+			return self.sketch.quantile(probs)
+		return np.quantile(self.draws(), probs, method="inverted_cdf")
+
+	def critical_values(self, levels=LEVELS):
+		return dict(zip(levels, self.quantile(self._probs(levels)).tolist()))
+
+	def standard_errors(self, levels=LEVELS):
+		return dict(zip(levels, quantile_se(self.quantile, self.count, self._probs(levels)).tolist()))
+
+	def pvalue(self):
+		return (self.extreme + 1) / (self.count + 1)
+
+
+def _consume(distribution, part, progress):
+	stop = distribution.add(part)
+	if progress is not None:
+		progress(distribution.stat, distribution.count, distribution.critical_values())
+	return stop
+
+
+def _run_parallel(null, jobs, max_workers, progress):
+	with ProcessPoolExecutor(max_workers, initializer=_init_worker, initargs=(null,)) as pool:
+		for args, distribution in jobs:
+			# نافذة محدودة من الدفعات الجارية، وتُستهلك النتائج بترتيب الدفعات لا بترتيب انتهائها
+			args = iter(args)
+			pending = deque(pool.submit(_worker_replicate, *a) for a in islice(args, 2 * max_workers))
+			while pending:
+				if _consume(distribution, pending.popleft().result(), progress):
+					for future in pending:
+						future.cancel()
+					break
+				for a in islice(args, 1):
+					pending.append(pool.submit(_worker_replicate, *a))
+
+
+def bootstrap_bounds(results, case=None, reps=1999, seed=None, batch=500, stats=STATISTICS, tol=None,
+					 max_workers=None, scheme="iid", block_length=None, keep_draws=True, progress=None):
+	"""Conditional bootstrap of the bounds F, t and exogenous-F statistics.
+
+	Parameters
+	----------
+	results : ARDLResults
+	case : {"I", "II", "III", "IV", "V"}, default matches the model trend
+	reps : int, maximum bootstrap replicates per statistic
+	seed : int or SeedSequence, optional
+	batch : int, replicates regenerated and re-estimated together
+	stats : statistics to bootstrap; those undefined for the case (t in cases II and
+		IV, the exogenous F without regressors) are skipped
+	tol : float, optional
+		Stop a statistic once the Monte Carlo standard error of its critical values at
+		every level in ``LEVELS`` is below ``tol`` (checked after every batch, from the second).
+	max_workers : int, optional
+		Run batches in a process pool. Every batch draws from its own child of
+		``SeedSequence(seed)`` and batches are consumed in order, so the draws are
+		identical for any number of workers.
+	scheme : {"iid", "block", "stationary", "rademacher", "mammen"}
+		Resampling of the null-model residuals, see :class:`Resampler`.
+	block_length : int, optional
+		(Mean) block length of the block schemes, ``round(n ** (1 / 3))`` by default.
+	keep_draws : bool
+		Keep every draw (exact quantiles and histograms). Otherwise each statistic only
+		keeps a t-digest sketch and memory is constant in ``reps`` (early stopping then
+		uses the sketch quantiles, so it may stop at a different batch).
+	progress : callable, optional
+		``progress(stat, reps_done, critical_values)`` after every batch, with the
+		critical values of the replicates so far.
+	"""
+	trend = results.model.trend
+	case = DEFAULT_CASE[trend] if case is None else case
+	if case not in CASES or CASE_TERMS[case][0] != trend:
+		raise ValueError(f"case {case!r} does not match the model trend {trend!r}")
+	null = _NullModel(results, case)
+	resampler = Resampler(scheme, len(null.dendog), block_length)
+	stats = [stat for stat in stats if stat in null.tested]
+	observed_gram = null.gram(null.design, null.dendog)[None]
+	observed = {stat: float(null.statistic(observed_gram, stat)[0]) for stat in stats}
+
+	sizes = [min(batch, reps - start) for start in range(0, reps, batch)]
+	jobs = []
+	for stat, stream in zip(stats, np.random.SeedSequence(seed).spawn(len(stats))):
+		params, resid = null.null_fit(stat)
+		args = [(resampler, stat, params, resid, child, size) for child, size in zip(stream.spawn(len(sizes)), sizes)]
+		jobs.append((args, BootstrapDistribution(stat, observed[stat], tol, keep_draws)))
+
+	if max_workers is not None and max_workers > 1:
+		_run_parallel(null, jobs, max_workers, progress)
+	else:
+		for args, distribution in jobs:
+			for a in args:
+				if _consume(distribution, _replicate(null, *a), progress):
+					break
+	distributions = {stat: distribution for stat, (_, distribution) in zip(stats, jobs)}
+	return BootstrapBounds(case, len(null.dendog), observed, distributions, scheme)
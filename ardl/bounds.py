@@ -0,0 +1,359 @@
+"""Pesaran-Shin-Smith (2001) bounds test with response-surface critical values.
+
+The null distributions follow the design of Pesaran, Shin and Smith (2001) and the
+small-sample tables of Narayan (2005): ``y`` is a driftless random walk and the ``k``
+regressors are either white noise (the I(0) bound) or independent random walks (the
+I(1) bound); the statistics are the Wald F on the lagged levels (and the t statistic
+on ``y(-1)``) in
+
+	Δy_t = det_t + φ y_{t-1} + π' x_{t-1} + u_t
+
+for cases I-V and k = 0..10. As in Kripfganz and Schneider (2020), every simulated
+quantile is then fitted across sample sizes by a response surface
+
+	q_p(n) = θ_0 + θ_1 / n + θ_2 / n² + θ_3 / n³
+
+so critical values for any n are a dot product with the stored coefficients, and
+p-values interpolate the quantile function in normal scores. :class:`CriticalValueTable`
+holds the surface evaluated at the simulated sizes for direct lookups. The coefficients are
+shipped as one array and can be regenerated with::
+
+	python -m ardl.bounds           # rewrite ardl/bounds_cv.npz
+"""
+import argparse
+import sys
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+
+CASES = ("I", "II", "III", "IV", "V")
+STATS = ("f", "t")
+LEVELS = (0.10, 0.05, 0.025, 0.01)
+SIZES = (30, 35, 40, 45, 50, 55, 60, 65, 70, 75, 80, 100, 150, 200, 500, 1000)
+KMAX = 10
+DEGREE = 3
+TABLE_PATH = Path(__file__).with_name("bounds_cv.npz")
+
+# لكل حالة: المكونات المحددة في النموذج والمكونات المقيدة التي تدخل في فرضية العدم
+CASE_TERMS = {
+	"I": ("n", ()),
+	"II": ("c", ("C",)),
+	"III": ("c", ()),
+	"IV": ("ct", ("trend",)),
+	"V": ("ct", ())
+}
+DEFAULT_CASE = {"n": "I", "c": "III", "ct": "V"}
+
+
+def probability_grid():
+	"""Probabilities of the tabulated quantiles: a normal-score grid plus the test levels."""
+	from scipy import special
+
+	grid = special.ndtr(np.linspace(-3.5, 3.5, 57))
+	return np.unique(np.round(np.concatenate([grid, LEVELS, 1 - np.array(LEVELS)]), 10))
+
+
+def quantile_cdf(quantiles, probs, value):
+	"""CDF at ``value`` of distributions tabulated by ``quantiles`` at ``probs`` (last axis).
+
+	The quantile function is interpolated linearly in normal scores and extended
+	linearly beyond the tabulated tails; ``value`` broadcasts against ``quantiles[..., 0]``.
+	"""
+	from scipy import special
+
+	z = special.ndtri(probs)
+	v = np.asarray(value, dtype=float)[..., None]
+	j = np.clip((quantiles <= v).sum(axis=-1) - 1, 0, len(z) - 2)
+	q0 = np.take_along_axis(quantiles, j[..., None], -1)[..., 0]
+	q1 = np.take_along_axis(quantiles, j[..., None] + 1, -1)[..., 0]
+	slope = (z[j + 1] - z[j]) / np.maximum(q1 - q0, 1e-12)
+	return special.ndtr(z[j] + (v[..., 0] - q0) * slope)
+
+
+def _subset_fit(gram, columns):
+	# انحدار آخر عمود في مصفوفات Gram (واحدة لكل تكرار) على الأعمدة المختارة
+	A = gram[:, columns][:, :, columns]
+	b = gram[:, columns, -1]
+	inv = np.linalg.inv(A)
+	beta = np.einsum("rij,rj->ri", inv, b)
+	ssr = gram[:, -1, -1] - np.einsum("ri,ri->r", beta, b)
+	return ssr, beta, inv
+
+
+def _statistics(gram, nobs):
+	"""F and t statistics of every case and k for a batch of simulated Gram matrices.
+
+	Columns of the Gram are ``[1, t, y(-1), x_1(-1), ..., x_KMAX(-1), Δy]``.
+	"""
+	reps = gram.shape[0]
+	scale = np.sqrt(np.einsum("rii->ri", gram))
+	gram = gram / (scale[:, :, None] * scale[:, None, :])
+	f = np.full((len(CASES), KMAX + 1, reps), np.nan)
+	t = np.full((len(CASES), KMAX + 1, reps), np.nan)
+	det_columns = {"C": 0, "trend": 1}
+	for c, case in enumerate(CASES):
+		trend, restricted = CASE_TERMS[case]
+		det = [0] * ("c" in trend) + [1] * ("t" in trend)
+		for k in range(KMAX + 1):
+			levels = [2] + list(range(3, 3 + k))
+			full = det + levels
+			tested = [det_columns[name] for name in restricted] + levels
+			kept = [col for col in full if col not in tested]
+			ssr_u, beta, inv = _subset_fit(gram, full)
+			ssr_r = _subset_fit(gram, kept)[0] if kept else gram[:, -1, -1]
+			df_resid = nobs - len(full)
+			f[c, k] = (ssr_r - ssr_u) / len(tested) / (ssr_u / df_resid)
+			if not restricted:
+				i = full.index(2)
+				t[c, k] = beta[:, i] / np.sqrt(ssr_u / df_resid * inv[:, i, i])
+	return f, t
+
+
+def simulate_quantiles(reps=40000, sizes=SIZES, probs=None, seed=20010501, batch=1000):
+	"""Simulate the null quantiles for every case, k, sample size and probability.
+
+	Returns an array of shape ``(stat, case, k, size, bound, prob)`` with the I(0) bound
+	first; the t quantiles are NaN for cases II and IV.
+	"""
+	probs = probability_grid() if probs is None else np.asarray(probs)
+	streams = np.random.SeedSequence(seed).spawn(len(sizes) * 2)
+	quantiles = np.full((len(STATS), len(CASES), KMAX + 1, len(sizes), 2, len(probs)), np.nan)
+	for s, nobs in enumerate(sizes):
+		for bound in (0, 1):
+			rng = np.random.default_rng(streams[2 * s + bound])
+			f_draws, t_draws = [], []
+			for start in range(0, reps, batch):
+				size = min(batch, reps - start)
+				e = rng.standard_normal((size, nobs + 1, KMAX + 1))
+				y = np.cumsum(e[..., 0], axis=1)
+				x = np.cumsum(e[..., 1:], axis=1) if bound else e[..., 1:]
+				trend = np.arange(1, nobs + 1, dtype=float)
+				Z = np.concatenate([
+					np.ones((size, nobs, 1)),
+					np.broadcast_to(trend[None, :, None], (size, nobs, 1)),
+					y[:, :-1, None],
+					x[:, :-1],
+					np.diff(y, axis=1)[..., None]
+				], axis=2)
+				f, t = _statistics(Z.transpose(0, 2, 1) @ Z, nobs)
+				f_draws.append(f)
+				t_draws.append(t)
+			for i, draws in enumerate((f_draws, t_draws)):
+				draws = np.concatenate(draws, axis=-1)
+				quantiles[i, :, :, s, bound] = np.moveaxis(np.quantile(draws, probs, axis=-1), 0, -1)
+	return quantiles, probs
+
+
+def _powers(nobs):
+	return (1 / np.asarray(nobs, dtype=float))[..., None] ** np.arange(DEGREE + 1)
+
+
+def fit_response_surface(quantiles, sizes=SIZES):
+	"""Least-squares coefficients of every quantile on powers of 1/n, shape ``(..., prob, degree + 1)``."""
+	X = _powers(sizes)
+	Y = np.moveaxis(quantiles, 3, 0)
+	missing = np.isnan(Y).any(axis=0)
+	theta = np.linalg.lstsq(X, np.nan_to_num(Y).reshape(len(sizes), -1), rcond=None)[0]
+	theta = np.moveaxis(theta.reshape(X.shape[1], *Y.shape[1:]), 0, -1)
+	theta[missing] = np.nan
+	return theta
+
+
+class ResponseSurface:
+	"""Response-surface quantiles of the bounds statistics.
+
+	``theta`` has shape ``(stat, case, k, bound, prob, degree + 1)``.
+	"""
+
+	def __init__(self, theta, probs, sizes=SIZES):
+		self.theta = np.asarray(theta, dtype=float)
+		self.probs = np.asarray(probs, dtype=float)
+		self.sizes = np.asarray(sizes, dtype=float)
+
+	@classmethod
+	def load(cls, path=TABLE_PATH):
+		with np.load(path) as data:
+			return cls(data["theta"], data["probs"], data["sizes"])
+
+	def save(self, path=TABLE_PATH):
+		np.savez_compressed(path, theta=self.theta.astype(np.float32), probs=self.probs, sizes=self.sizes)
+
+	def _coefficients(self, stat, case, k):
+		if stat not in STATS:
+			raise ValueError(f"stat must be one of {STATS}, got {stat!r}")
+		if case not in CASES:
+			raise ValueError(f"case must be one of {CASES}, got {case!r}")
+		if not 0 <= k <= KMAX:
+			raise ValueError(f"critical values are available for k = 0..{KMAX}, got {k}")
+		if stat == "t" and CASE_TERMS[case][1]:
+			raise ValueError(f"the t statistic is not defined for case {case}")
+		return self.theta[STATS.index(stat), CASES.index(case), k]
+
+	def quantiles(self, stat, case, k, nobs):
+		"""Quantiles at :attr:`probs` for each ``nobs``: shape ``(..., bound, prob)``.
+
+		``nobs`` below the smallest simulated size is clamped to it, so the surface is
+		never extrapolated into very small samples.
+		"""
+		powers = _powers(np.maximum(nobs, self.sizes[0]))
+		q = np.einsum("...d,bpd->...bp", powers, self._coefficients(stat, case, k))
+		# فرض رتابة دالة القيم الكمية بعد التقريب
+		return np.maximum.accumulate(q, axis=-1)
+
+	def critical_values(self, stat, case, k, nobs, levels=LEVELS):
+		"""Critical values ``(..., level, bound)``: upper-tail for F, lower-tail for t."""
+		probs = 1 - np.asarray(levels) if stat == "f" else np.asarray(levels)
+		index = np.searchsorted(self.probs, np.round(probs, 10))
+		if not np.allclose(self.probs[np.minimum(index, len(self.probs) - 1)], probs):
+			raise ValueError("levels must be on the tabulated probability grid")
+		return np.swapaxes(self.quantiles(stat, case, k, nobs)[..., index], -1, -2)
+
+	def pvalues(self, stat, case, k, nobs, value):
+		"""Approximate p-values ``(..., bound)`` of ``value`` under the I(0) and I(1) bounds.
+
+		The quantile function is interpolated linearly in normal scores and extended
+		linearly beyond the simulated tails; ``nobs`` and ``value`` broadcast. The I(1)
+		p-value is never below the I(0) one, which the separate tail extrapolations of the
+		two bounds do not guarantee far beyond the tabulated probabilities.
+		"""
+		value, nobs = np.broadcast_arrays(np.asarray(value, dtype=float), np.asarray(nobs, dtype=float))
+		cdf = quantile_cdf(self.quantiles(stat, case, k, nobs), self.probs, value[..., None])
+		return np.maximum.accumulate(1 - cdf if stat == "f" else cdf, axis=-1)
+
+
+@lru_cache(maxsize=None)
+def response_surface(path=TABLE_PATH):
+	return ResponseSurface.load(path)
+
+
+class CriticalValueTable:
+	"""Bounds indexed by case, k, sample size and significance level.
+
+	``f`` and ``t`` have shape ``(case, k, size, level, bound)`` with the I(0) bound
+	first; the t table is NaN for cases II and IV. :meth:`from_surface` evaluates a
+	:class:`ResponseSurface` once at the tabulated sizes, after which a lookup is an
+	index into the array and an interpolation between two sizes.
+	"""
+
+	def __init__(self, f, t, sizes=SIZES, levels=LEVELS):
+		self.f = np.asarray(f, dtype=float)
+		self.t = np.asarray(t, dtype=float)
+		self.sizes = np.asarray(sizes, dtype=float)
+		self.levels = tuple(float(level) for level in levels)
+
+	@classmethod
+	def from_surface(cls, surface, sizes=SIZES, levels=LEVELS):
+		tables = np.full((len(STATS), len(CASES), KMAX + 1, len(sizes), len(levels), 2), np.nan)
+		for s, stat in enumerate(STATS):
+			for c, case in enumerate(CASES):
+				if stat == "t" and CASE_TERMS[case][1]:
+					continue
+				for k in range(KMAX + 1):
+					tables[s, c, k] = surface.critical_values(stat, case, k, np.asarray(sizes), levels)
+		return cls(tables[0], tables[1], sizes, levels)
+
+	def lookup(self, case, k, nobs, stat="f"):
+		"""``(level, bound)`` array of critical values, interpolated linearly in 1/n.
+
+		Sample sizes outside the table are clamped to its first and last sizes.
+		"""
+		if case not in CASES:
+			raise ValueError(f"case must be one of {CASES}, got {case!r}")
+		if not 0 <= k <= KMAX:
+			raise ValueError(f"critical values are tabulated for k = 0..{KMAX}, got {k}")
+		table = (self.f if stat == "f" else self.t)[CASES.index(case), k]
+		inv = 1 / self.sizes
+		x = 1 / np.clip(nobs, self.sizes[0], self.sizes[-1])
+		i = int(np.clip(np.searchsorted(-inv, -x), 1, len(inv) - 1))
+		w = (x - inv[i]) / (inv[i - 1] - inv[i])
+		return w * table[i - 1] + (1 - w) * table[i]
+
+
+@lru_cache(maxsize=None)
+def critical_value_table(path=TABLE_PATH):
+	return CriticalValueTable.from_surface(response_surface(path))
+
+
+class BoundsTest:
+	"""Result of :func:`bounds_test`."""
+
+	def __init__(self, case, k, nobs, fstat, tstat, surface):
+		self.case = case
+		self.k = k
+		self.nobs = nobs
+		self.fstat = fstat
+		self.tstat = tstat
+		self.levels = LEVELS
+		self.f_bounds = surface.critical_values("f", case, k, nobs)
+		self.f_pvalues = surface.pvalues("f", case, k, nobs, fstat)
+		self.t_bounds = self.t_pvalues = None
+		if tstat is not None:
+			self.t_bounds = surface.critical_values("t", case, k, nobs)
+			self.t_pvalues = surface.pvalues("t", case, k, nobs, tstat)
+
+	def bounds(self, stat="f"):
+		"""Critical values as ``{level: (I(0), I(1))}``."""
+		table = self.f_bounds if stat == "f" else self.t_bounds
+		return {level: tuple(float(v) for v in table[i]) for i, level in enumerate(self.levels)}
+
+	def pvalue(self, stat="f"):
+		"""Approximate p-values ``(I(0), I(1))`` of the statistic."""
+		return tuple(float(p) for p in (self.f_pvalues if stat == "f" else self.t_pvalues))
+
+	def decision(self, level=0.05, stat="f"):
+		"""``"reject"`` (levels relationship), ``"accept"`` or ``"inconclusive"``.
+
+		The null is rejected when even the I(1) p-value is below ``level`` and accepted
+		when even the I(0) p-value is above it, which is the critical-value rule with
+		exact-sample bounds.
+		"""
+		p0, p1 = self.pvalue(stat)
+		if p1 < level:
+			return "reject"
+		if p0 > level:
+			return "accept"
+		return "inconclusive"
+
+
+def _statistics_of(results, case):
+	# إحصاءة F على المستويات المتباطئة (والحد المحدد المقيد) وإحصاءة t لـ y(-1) في UECM
+	uecm = results.uecm
+	level_names = [f"{results.model.endog_name}(-1)"] + [f"{name}(-1)" for name in results.model.exog_names]
+	tested = [uecm.names.index(name) for name in CASE_TERMS[case][1] + tuple(level_names)]
+	beta = uecm.params[tested]
+	fstat = float(beta @ np.linalg.solve(uecm.cov_params[np.ix_(tested, tested)], beta) / len(tested))
+	tstat = None if CASE_TERMS[case][1] else float(uecm.tvalues[uecm.names.index(level_names[0])])
+	return fstat, tstat
+
+
+def bounds_test(results, case=None, surface=None):
+	"""PSS bounds test on a fitted :class:`ardl.model.ARDLResults`.
+
+	The F statistic is the Wald test that the lagged levels (and, in cases II and IV,
+	the restricted deterministic term) are zero in the unrestricted ECM; the t statistic
+	is that of ``y(-1)`` and is only defined for cases I, III and V.
+	"""
+	trend = results.model.trend
+	case = DEFAULT_CASE[trend] if case is None else case
+	if case not in CASES or CASE_TERMS[case][0] != trend:
+		raise ValueError(f"case {case!r} does not match the model trend {trend!r}")
+	surface = response_surface() if surface is None else surface
+	fstat, tstat = _statistics_of(results, case)
+	return BoundsTest(case, len(results.model.exog_names), results.nobs, fstat, tstat, surface)
+
+
+def main(argv=None):
+	parser = argparse.ArgumentParser(prog="python -m ardl.bounds", description=__doc__.splitlines()[0])
+	parser.add_argument("--reps", type=int, default=40000)
+	parser.add_argument("--path", default=TABLE_PATH, type=Path)
+	args = parser.parse_args(argv)
+
+	quantiles, probs = simulate_quantiles(args.reps)
+	ResponseSurface(fit_response_surface(quantiles), probs).save(args.path)
+	print(f"{args.path}: {args.reps} replications, {len(SIZES)} sample sizes, {len(probs)} quantiles")
+	return 0
+
+
+if __name__ == "__main__":
+	sys.exit(main())
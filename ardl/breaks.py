@@ -0,0 +1,387 @@
+"""Tests for a structural break at an unknown date.
+
+The Chow F statistic for a break in some or all coefficients is evaluated at every
+candidate date in the trimmed range ``[π₀ n, (1 - π₀) n]``. With ``e`` the full-sample
+residuals, ``Z`` the breaking columns and ``Q`` an orthonormal basis of the regressors,
+the gain in fit from letting ``Z`` shift at date ``τ`` is
+
+	g' S⁻¹ g,    g = Σ_{t≥τ} z_t e_t,    S = Σ_{t≥τ} z_t z_t' - (Σ_{t≥τ} z_t q_t')(Σ_{t≥τ} q_t z_t')
+
+so the whole sequence follows from cumulative sums of cross products, ``O(n k²)`` in
+total instead of one regression per date. The sequence is summarized by the sup-F of
+Andrews (1993) and the mean-F and exp-F of Andrews and Ploberger (1994). Their limits
+are functionals of a squared tied-down Bessel process; they are simulated once for
+p = 1..20 breaking coefficients and the usual trims, and shipped as quantiles::
+
+	python -m ardl.breaks           # rewrite ardl/breaks_cv.npz
+
+Several breaks are estimated as in Bai and Perron (1998, 2003): a dynamic program
+finds the partitions with the smallest SSR for each number of breaks, which is then
+chosen by sequential sup-F(l+1|l) tests or by the BIC/LWZ criteria.
+"""
+import argparse
+import sys
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from ardl.bounds import probability_grid, quantile_cdf
+from ardl.model import _as_frame
+
+STATS = ("sup", "mean", "exp")
+LEVELS = (0.10, 0.05, 0.025, 0.01)
+TRIMS = (0.05, 0.10, 0.15, 0.20, 0.25)
+PMAX = 20
+TABLE_PATH = Path(__file__).with_name("breaks_cv.npz")
+
+
+def _reverse_cumsum(x):
+	return np.cumsum(x[::-1], axis=0)[::-1]
+
+
+def _summaries(wald, p, axis=-1):
+	# الإحصاءات الثلاث من متتالية Wald (= p مضروبا في F)
+	half = wald / 2
+	top = half.max(axis=axis, keepdims=True)
+	exp = np.squeeze(top, axis) + np.log(np.mean(np.exp(half - top), axis=axis))
+	return wald.max(axis=axis) / p, wald.mean(axis=axis) / p, exp
+
+
+def simulate_quantiles(reps=20000, steps=2000, probs=None, seed=19930701, batch=500):
+	"""Quantiles of the sup/mean/exp limits, shape ``(stat, trim, p, prob)``.
+
+	A p-dimensional Brownian bridge ``B`` is simulated on ``steps`` points; the Wald
+	process is ``|B(r)|² / (r (1 - r))`` and grows by one independent coordinate per p,
+	so a single simulation serves every p and every trim.
+	"""
+	probs = probability_grid() if probs is None else probs
+	rng = np.random.default_rng(seed)
+	r = np.arange(1, steps) / steps
+	ranges = [(r >= trim) & (r <= 1 - trim) for trim in TRIMS]
+	draws = np.empty((len(STATS), len(TRIMS), PMAX, reps))
+	for start in range(0, reps, batch):
+		size = min(batch, reps - start)
+		wald = np.zeros((size, steps - 1))
+		for p in range(1, PMAX + 1):
+			walk = np.cumsum(rng.standard_normal((size, steps)), axis=1) / np.sqrt(steps)
+			bridge = walk[:, :-1] - r * walk[:, -1:]
+			wald += bridge ** 2 / (r * (1 - r))
+			for i, inside in enumerate(ranges):
+				draws[:, i, p - 1, start:start + size] = _summaries(wald[:, inside], p)
+	return np.quantile(draws, probs, axis=-1).transpose(1, 2, 3, 0), probs
+
+
+class BreakTable:
+	"""Asymptotic quantiles of the sup/mean/exp statistics, shape ``(stat, trim, p, prob)``."""
+
+	def __init__(self, quantiles, probs):
+		self.quantiles = np.asarray(quantiles, dtype=float)
+		self.probs = np.asarray(probs, dtype=float)
+
+	@classmethod
+	def load(cls, path=TABLE_PATH):
+		with np.load(path) as data:
+			return cls(data["quantiles"], data["probs"])
+
+	def save(self, path=TABLE_PATH):
+		np.savez_compressed(path, quantiles=self.quantiles.astype(np.float32), probs=self.probs)
+
+	def _row(self, stat, trim, p):
+		if stat not in STATS:
+			raise ValueError(f"stat must be one of {STATS}")
+		if not np.any(np.isclose(trim, TRIMS)):
+			raise ValueError(f"trim must be one of {TRIMS}")
+		if not 1 <= p <= PMAX:
+			raise ValueError(f"the tables cover 1 to {PMAX} breaking coefficients")
+		return self.quantiles[STATS.index(stat), int(np.argmin(np.abs(np.subtract(TRIMS, trim)))), p - 1]
+
+	def critical_values(self, stat, trim, p, levels=LEVELS, segments=1):
+		"""Upper-tail critical values ``{level: value}``.
+
+		``segments > 1`` gives those of the largest of that many independent statistics.
+		"""
+		from scipy import special
+
+		probs = (1 - np.asarray(levels)) ** (1 / segments)
+		values = np.interp(special.ndtri(probs), special.ndtri(self.probs), self._row(stat, trim, p))
+		return dict(zip(levels, values.tolist()))
+
+	def pvalue(self, stat, trim, p, value, segments=1):
+		return float(1 - quantile_cdf(self._row(stat, trim, p), self.probs, value) ** segments)
+
+
+@lru_cache(maxsize=None)
+def break_table(path=TABLE_PATH):
+	return BreakTable.load(path)
+
+
+def f_sequence(exog, endog, trim=0.15, columns=None):
+	"""Chow F statistics for a break in ``columns`` (default all) at every trimmed date.
+
+	Returns the candidate dates, as row positions of the first observation of the new
+	regime, and the F statistics with ``p = len(columns)`` and ``n - k - p`` degrees of freedom.
+	"""
+	X = np.asarray(exog, dtype=float)
+	y = np.asarray(endog, dtype=float)
+	n, k = X.shape
+	columns = np.arange(k) if columns is None else np.asarray(columns)
+	p = len(columns)
+	# كل نظام يحتوي على ما يكفي من المشاهدات لتقدير المعاملات المتغيرة
+	lo = max(int(np.ceil(trim * n)), p)
+	if n - lo <= lo:
+		raise ValueError("the sample is too short for this trim")
+	q, _ = np.linalg.qr(X)
+	e = y - q @ (q.T @ y)
+	Z = X[:, columns] / np.linalg.norm(X[:, columns], axis=0)
+	g = _reverse_cumsum(Z * e[:, None])
+	M = _reverse_cumsum(Z[:, :, None] * q[:, None, :])
+	S = _reverse_cumsum(Z[:, :, None] * Z[:, None, :]) - M @ M.transpose(0, 2, 1)
+	dates = np.arange(lo, n - lo + 1)
+	g, S = g[dates], S[dates]
+	gain = np.einsum("ti,ti->t", g, np.linalg.solve(S, g[..., None])[..., 0])
+	ssr = e @ e
+	return dates, (gain / p) / ((ssr - gain) / (n - k - p))
+
+
+class BreakTest:
+	"""Sup-F, mean-F and exp-F tests of a break in ``p`` coefficients at an unknown date."""
+
+	def __init__(self, dates, fstats, nparams, trim, table):
+		self.dates = np.asarray(dates)
+		self.fstats = np.asarray(fstats)
+		self.nparams = nparams
+		self.trim = trim
+		self.table = table
+		self.sup, self.mean, self.exp = (float(s) for s in _summaries(self.fstats * nparams, nparams))
+		self.break_date = self.dates[int(np.argmax(self.fstats))]
+
+	@property
+	def statistics(self):
+		return {"sup": self.sup, "mean": self.mean, "exp": self.exp}
+
+	def critical_values(self, stat="sup", levels=LEVELS):
+		return self.table.critical_values(stat, self.trim, self.nparams, levels)
+
+	def pvalue(self, stat="sup"):
+		return self.table.pvalue(stat, self.trim, self.nparams, self.statistics[stat])
+
+	def decision(self, level=0.05, stat="sup"):
+		return "reject" if self.pvalue(stat) <= level else "accept"
+
+
+def break_test(results, trim=0.15, columns=None, table=None):
+	"""Unknown-date break tests on a fitted :class:`ardl.model.ARDLResults`.
+
+	``columns`` names the coefficients allowed to shift (default all, a pure
+	structural change); dates are positions in the original series.
+	"""
+	table = break_table() if table is None else table
+	columns = None if columns is None else [results.names.index(name) for name in columns]
+	dates, fstats = f_sequence(results.exog, results.endog, trim, columns)
+	nparams = results.exog.shape[1] if columns is None else len(columns)
+	return BreakTest(dates + results.model.maxlag, fstats, nparams, trim, table)
+
+
+def _prefix_sums(X, y):
+	# مجاميع تراكمية لـ X'X وX'y وy'y بحيث يعطي فرق عنصرين مجاميع أي مقطع
+	k = X.shape[1]
+	gram = np.concatenate([np.zeros((1, k, k)), np.cumsum(X[:, :, None] * X[:, None, :], axis=0)])
+	cross = np.concatenate([np.zeros((1, k)), np.cumsum(X * y[:, None], axis=0)])
+	squares = np.concatenate([[0.0], np.cumsum(y * y)])
+	return gram, cross, squares
+
+
+def _segment_fit(sums, start, stop):
+	"""Inverse Gram, coefficients and SSR of the segments ``[start, stop)`` (vectorized)."""
+	gram, cross, squares = sums
+	inverse = np.linalg.inv(gram[stop] - gram[start])
+	c = cross[stop] - cross[start]
+	beta = np.einsum("...ij,...j->...i", inverse, c)
+	return inverse, beta, squares[stop] - squares[start] - np.einsum("...i,...i->...", c, beta)
+
+
+def optimal_partitions(exog, endog, max_breaks, h):
+	"""Bai-Perron global minimizers of the SSR with ``0..max_breaks`` breaks.
+
+	Every coefficient shifts at each break and regimes hold at least ``h`` observations.
+	The dynamic program runs over the triangular array of segment SSRs
+	``SSR(i, j)`` for ``[i, j)``, ``i`` = 0 or a candidate date: one forward pass over
+	``j`` extends all segments by observation ``j - 1`` at once with rank-one
+	(Sherman-Morrison) updates, and each column ``SSR(·, j)`` is consumed by the
+	recursion as soon as it is produced, so memory stays ``O(n (k² + m))``.
+
+	Returns the minimal SSRs, shape ``(max_breaks + 1,)``, and the break dates for
+	each number of breaks, as row positions of the first observation of each new regime.
+	"""
+	X = np.asarray(exog, dtype=float)
+	y = np.asarray(endog, dtype=float)
+	n, k = X.shape
+	if h < k:
+		raise ValueError("the minimal regime length must be at least the number of regressors")
+	if (max_breaks + 1) * h > n:
+		raise ValueError(f"at most {n // h - 1} breaks fit regimes of {h} observations")
+	X = X / np.linalg.norm(X, axis=0)
+	sums = _prefix_sums(X, y)
+	# بدايات المقاطع الممكنة: 0 ثم كل تاريخ انكسار مرشح h..n-h؛ يبدأ كل مقطع بأول h مشاهدة
+	starts = np.concatenate([[0], np.arange(h, n - h + 1)])
+	inverse, beta, ssr = _segment_fit(sums, starts, starts + h)
+	inverse, beta = np.ascontiguousarray(inverse.transpose(1, 2, 0)), np.ascontiguousarray(beta.T)
+	# best[l, s]: أصغر SSR لـ [0, starts[s]) مع l انكسارات؛ back[l, s]: بداية المقطع الأخير
+	best = np.full((max_breaks, len(starts)), np.inf)
+	back = np.zeros((max_breaks + 1, len(starts)), dtype=int)
+	final = np.full(max_breaks + 1, np.inf)
+	for j in range(h, n + 1):
+		if j > h:
+			# إضافة المشاهدة j - 1 إلى كل المقاطع النشطة دفعة واحدة
+			u = 1 + min(max(j - 2 * h, 0), len(starts) - 1)
+			x = X[j - 1]
+			P = inverse[:, :, :u]
+			K = np.tensordot(x, P, axes=(0, 0))
+			f = 1 + x @ K
+			error = (y[j - 1] - x @ beta[:, :u]) / f
+			beta[:, :u] += K * error
+			P -= K[:, None, :] * (K / f)
+			ssr[:u] += error * error * f
+		if h < j <= n - h or j == n:
+			a = 1 + min(max(j - 2 * h + 1, 0), len(starts) - 1)
+			values = np.full(max_breaks + 1, np.inf)
+			values[0] = ssr[0]
+			if a > 1:
+				candidates = best[:, 1:a] + ssr[1:a]
+				last = np.argmin(candidates, axis=1)
+				values[1:] = candidates[np.arange(max_breaks), last]
+			if j == n:
+				final = values
+				if a > 1:
+					back[1:, 0] = last + 1
+			else:
+				best[:, j - h + 1] = values[:-1]
+				if a > 1:
+					back[1:, j - h + 1] = last + 1
+		elif j == h:
+			best[0, 1] = ssr[0]
+
+	dates = [[]]
+	for count in range(1, max_breaks + 1):
+		path, s = [], back[count, 0]
+		for level in range(count, 0, -1):
+			path.append(int(starts[s]))
+			s = back[level - 1, s] if level > 1 else 0
+		dates.append(path[::-1])
+	return final, dates
+
+
+def _best_split(sums, start, stop, h):
+	# أفضل انكسار إضافي داخل المقطع [start, stop) وما يحققه من انخفاض في SSR
+	if stop - start < 2 * h:
+		return 0.0, None
+	dates = np.arange(start + h, stop - h + 1)
+	_, _, whole = _segment_fit(sums, start, stop)
+	_, _, left = _segment_fit(sums, np.full_like(dates, start), dates)
+	_, _, right = _segment_fit(sums, dates, np.full_like(dates, stop))
+	i = int(np.argmin(left + right))
+	return float(whole - left[i] - right[i]), int(dates[i])
+
+
+class MultipleBreakTest:
+	"""Bai-Perron estimates with ``0..max_breaks`` breaks and the break-count choice.
+
+	``fstats[l]`` is sup-F(l+1|l): the largest fall in SSR from one more break in any
+	regime of the ``l``-break fit, scaled like a Chow F in the ``k`` shifting
+	coefficients. Its critical values treat the ``l + 1`` regime statistics as
+	independent sup-F variables, ``P(max ≤ c) = F_sup(c)^(l+1)`` (Bai and Perron, 1998).
+	"""
+
+	def __init__(self, ssr, dates, fstats, nobs, nparams, trim, table, offset=0):
+		self.ssr = np.asarray(ssr)
+		self.dates = [[int(d) + offset for d in path] for path in dates]
+		self.fstats = np.asarray(fstats)
+		self.nobs = nobs
+		self.nparams = nparams
+		self.trim = trim
+		self.table = table
+		self.max_breaks = len(self.ssr) - 1
+		n, counts = nobs, np.arange(self.max_breaks + 1)
+		size = (counts + 1) * nparams + counts
+		self.bic = np.log(self.ssr / n) + size * np.log(n) / n
+		# معيار Liu-Wu-Zidek بثوابت Bai وPerron (2003): c₀ = 0.299 وδ₀ = 0.1
+		self.lwz = np.log(self.ssr / (n - size)) + size * 0.299 * np.log(n) ** 2.1 / n
+
+	def pvalues(self):
+		return np.array([self.table.pvalue("sup", self.trim, self.nparams, f, segments=l + 1)
+						 for l, f in enumerate(self.fstats)])
+
+	def critical_values(self, level=0.05):
+		return np.array([self.table.critical_values("sup", self.trim, self.nparams, (level,), segments=l + 1)[level]
+						 for l in range(len(self.fstats))])
+
+	def nbreaks(self, method="sequential", level=0.05):
+		"""Number of breaks chosen by ``"sequential"`` sup-F(l+1|l) tests, ``"bic"`` or ``"lwz"``."""
+		if method == "bic":
+			return int(np.argmin(self.bic))
+		if method == "lwz":
+			return int(np.argmin(self.lwz))
+		if method != "sequential":
+			raise ValueError("method must be 'sequential', 'bic' or 'lwz'")
+		rejected = self.pvalues() <= level
+		return int(np.argmin(rejected)) if not rejected.all() else self.max_breaks
+
+
+def multiple_breaks(exog, endog, max_breaks=5, trim=0.15, table=None, offset=0):
+	"""Bai-Perron multiple-break estimation and tests for a pure structural change.
+
+	``trim`` sets the minimal regime length ``h = ⌊trim n⌋``; ``offset`` shifts the
+	reported dates (e.g. by the ARDL's ``maxlag`` to index the original series).
+	"""
+	table = break_table() if table is None else table
+	X = np.asarray(exog, dtype=float)
+	y = np.asarray(endog, dtype=float)
+	n, k = X.shape
+	h = int(np.floor(trim * n))
+	ssr, dates = optimal_partitions(X, y, max_breaks, h)
+	sums = _prefix_sums(X / np.linalg.norm(X, axis=0), y)
+	fstats = []
+	for count in range(max_breaks):
+		edges = [0] + dates[count] + [n]
+		gain = max(_best_split(sums, a, b, h)[0] for a, b in zip(edges[:-1], edges[1:]))
+		fstats.append((gain / k) / (ssr[count] / (n - (count + 1) * k)))
+	return MultipleBreakTest(ssr, dates, fstats, n, k, trim, table, offset)
+
+
+def ardl_breaks(results, max_breaks=5, trim=0.15):
+	"""Bai-Perron estimation on the design of a fitted :class:`ardl.model.ARDLResults`."""
+	return multiple_breaks(results.exog, results.endog, max_breaks, trim, offset=results.model.maxlag)
+
+
+def break_dummies(nobs, dates, exog=None):
+	"""Step dummies ``D_j`` (1 from ``dates[j]`` on) and their products with ``exog``.
+
+	Returns a DataFrame ready to pass as ``fixed`` to :class:`ardl.model.ARDL`.
+	"""
+	t = np.arange(nobs)
+	frame = pd.DataFrame({f"D{j}": (t >= date).astype(float) for j, date in enumerate(dates, start=1)})
+	if exog is not None:
+		exog = _as_frame(exog, "x")
+		for j in range(1, len(dates) + 1):
+			for name in exog.columns:
+				frame[f"D{j}×{name}"] = frame[f"D{j}"] * exog[name].to_numpy(dtype=float)
+	return frame
+
+
+def main(argv=None):
+	parser = argparse.ArgumentParser(prog="python -m ardl.breaks", description=__doc__.splitlines()[0])
+	parser.add_argument("--reps", type=int, default=20000)
+	parser.add_argument("--steps", type=int, default=2000)
+	parser.add_argument("--path", default=TABLE_PATH, type=Path)
+	args = parser.parse_args(argv)
+
+	quantiles, probs = simulate_quantiles(args.reps, args.steps)
+	BreakTable(quantiles, probs).save(args.path)
+	print(f"{args.path}: {args.reps} replications, {args.steps} steps, {len(probs)} quantiles")
+	return 0
+
+
+if __name__ == "__main__":
+	sys.exit(main())
@@ -0,0 +1,173 @@
+"""Deploy-time bundle of the pre-built demo figures.
+
+The bundle is a single file: a magic string, a length-prefixed JSON header holding the
+source hash and an index of ``repr(cache_key) -> (offset, length)``, then one
+zlib-compressed JSON blob per entry. The file is memory-mapped and entries are decoded
+lazily, so a cold worker only pays for the figures it serves.
+
+Build or check it with::
+
+	python -m ardl.bundle           # regenerate ardl/figures.bundle
+	python -m ardl.bundle --check   # exit 1 if the bundle is missing or stale
+"""
+import argparse
+import hashlib
+import importlib
+import io
+import json
+import logging
+import mmap
+import struct
+import sys
+import zlib
+from importlib import metadata
+from pathlib import Path
+
+import plotly.graph_objects as go
+import plotly.io as pio
+import pandas as pd
+from plotly.basedatatypes import BaseFigure
+
+MAGIC = b"ARDLFIG1"
+BUNDLE_PATH = Path(__file__).with_name("figures.bundle")
+# المكتبات التي تحدد ناتج دوال البناء
+DEPENDENCIES = ("plotly", "numpy", "scipy", "statsmodels")
+
+logger = logging.getLogger(__name__)
+
+
+def source_hash():
+	# بصمة كل ملفات الحزمة وجداول البيانات المرفقة، مع إصدارات المكتبات التي تحسب الرسوم، لاكتشاف الحزمة القديمة دون استيراد الصفحات
+	package = Path(__file__).parent
+	digest = hashlib.sha256()
+	for name in DEPENDENCIES:
+		digest.update(f"{name}=={metadata.version(name)}".encode())
+	paths = sorted(package.rglob("*.py")) + sorted(package.glob("*.npz"))
+	for path in paths:
+		digest.update(path.relative_to(package).as_posix().encode())
+		digest.update(path.read_bytes())
+	return digest.hexdigest()
+
+
+def _encode_part(part):
+	if isinstance(part, BaseFigure):
+		return {"figure": json.loads(pio.to_json(part, validate=False))}
+	if isinstance(part, pd.DataFrame):
+		return {"table": part.to_json(orient="split", force_ascii=False)}
+	return {"value": part}
+
+
+def _decode_part(part):
+	if "figure" in part:
+		# الرسوم تحققت منها plotly عند البناء، فلا حاجة لإعادة التحقق عند التحميل
+		return go.Figure(part["figure"], _validate=False)
+	if "table" in part:
+		return pd.read_json(io.StringIO(part["table"]), orient="split", dtype=False)
+	return part["value"]
+
+
+def _encode(value):
+	parts = value if isinstance(value, tuple) else (value,)
+	entry = {"tuple": isinstance(value, tuple), "parts": [_encode_part(p) for p in parts]}
+	return zlib.compress(json.dumps(entry, ensure_ascii=False).encode("utf-8"), 9)
+
+
+def _decode(blob):
+	entry = json.loads(zlib.decompress(blob))
+	parts = [_decode_part(p) for p in entry["parts"]]
+	return tuple(parts) if entry["tuple"] else parts[0]
+
+
+class FigureBundle:
+	"""Read-only view over a memory-mapped bundle file."""
+
+	def __init__(self, path):
+		with open(path, "rb") as f:
+			self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+		if self._map[:len(MAGIC)] != MAGIC:
+			raise ValueError(f"{path} is not a figure bundle")
+		(header_len,) = struct.unpack_from("<I", self._map, len(MAGIC))
+		start = len(MAGIC) + 4
+		header = json.loads(self._map[start:start + header_len])
+		self.source_hash = header["source_hash"]
+		self._base = start + header_len
+		self._index = header["entries"]
+
+	def __contains__(self, key):
+		return repr(key) in self._index
+
+	def __len__(self):
+		return len(self._index)
+
+	def get(self, key):
+		offset, length = self._index[repr(key)]
+		return _decode(self._map[self._base + offset:self._base + offset + length])
+
+
+def load_bundle(path=BUNDLE_PATH):
+	"""Open the bundle at ``path``; return None when it is missing, unreadable or stale."""
+	path = Path(path)
+	if not path.exists():
+		return None
+	try:
+		bundle = FigureBundle(path)
+	except (OSError, ValueError, KeyError) as exc:
+		logger.warning("Ignoring unreadable figure bundle %s: %s", path, exc)
+		return None
+	if bundle.source_hash != source_hash():
+		logger.warning("Ignoring stale figure bundle %s; rebuild it with `python -m ardl.bundle`", path)
+		return None
+	return bundle
+
+
+def build_bundle(path=BUNDLE_PATH):
+	"""Build every registered figure with its default parameters and write the bundle."""
+	from ardl.figures import BUILDERS, cache_key
+	from ardl.sections import SECTIONS
+
+	for module in sorted(set(SECTIONS.values())):
+		importlib.import_module(f"ardl.sections.{module}")
+
+	index = {}
+	blobs = []
+	offset = 0
+	for name in sorted(BUILDERS):
+		blob = _encode(BUILDERS[name]())
+		index[repr(cache_key(name, {}))] = (offset, len(blob))
+		blobs.append(blob)
+		offset += len(blob)
+
+	header = json.dumps({"source_hash": source_hash(), "entries": index}).encode("utf-8")
+	path = Path(path)
+	tmp = path.with_suffix(".tmp")
+	with open(tmp, "wb") as f:
+		f.write(MAGIC)
+		f.write(struct.pack("<I", len(header)))
+		f.write(header)
+		for blob in blobs:
+			f.write(blob)
+	tmp.replace(path)
+	return len(index), path.stat().st_size
+
+
+def main(argv=None):
+	parser = argparse.ArgumentParser(prog="python -m ardl.bundle", description=__doc__.splitlines()[0])
+	parser.add_argument("--check", action="store_true", help="only verify that the bundle is up to date")
+	parser.add_argument("--path", default=BUNDLE_PATH, type=Path)
+	args = parser.parse_args(argv)
+
+	if args.check:
+		bundle = load_bundle(args.path)
+		if bundle is None:
+			print(f"{args.path}: missing or stale", file=sys.stderr)
+			return 1
+		print(f"{args.path}: {len(bundle)} figures, up to date")
+		return 0
+
+	count, size = build_bundle(args.path)
+	print(f"{args.path}: wrote {count} figures ({size / 1024:.1f} KiB)")
+	return 0
+
+
+if __name__ == "__main__":
+	sys.exit(main())
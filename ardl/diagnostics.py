@@ -0,0 +1,118 @@
+"""Residual diagnostics of a fitted ARDL from its stored QR factorization.
+
+Every auxiliary regression contains the model's own regressors, so only the extra
+columns are new: they are orthogonalized against ``Q`` and the fit of the auxiliary
+regression follows from the residuals' projection on them, without refitting the
+model's design.
+"""
+import numpy as np
+import pandas as pd
+
+
+def _chi2_pvalue(stat, df):
+	from scipy import special
+
+	return float(special.chdtrc(df, stat))
+
+
+def _added_fit(q, Z, target):
+	"""Explained sum of squares of ``target`` (orthogonal to ``Q``) on the columns ``Z``.
+
+	Returns the ESS and the number of linearly independent columns ``Z`` adds.
+	"""
+	Z = Z / np.linalg.norm(Z, axis=0)
+	Z = Z - q @ (q.T @ Z)
+	coef, _, rank, _ = np.linalg.lstsq(Z, target, rcond=None)
+	return float(target @ (Z @ coef)), int(rank)
+
+
+def _lm_statistic(target, ess, nobs):
+	# n R² للانحدار المساعد مع ثابت: المجموع المفسر غير المركزي ناقص n ȳ² على المجموع الكلي المركزي
+	return nobs * (ess - nobs * target.mean() ** 2) / float(np.sum((target - target.mean()) ** 2))
+
+
+def _with_constant(results, Z):
+	# الانحدار المساعد يتضمن ثابتاً دائماً، حتى لو كان النموذج بدون ثابت (كما في statsmodels)
+	if results.k_constant:
+		return Z
+	ones = np.ones((results.nobs, 1))
+	return ones if Z is None else np.column_stack([ones, Z])
+
+
+def breusch_godfrey(results, lags=2):
+	"""Breusch-Godfrey LM test of residual autocorrelation up to ``lags``: ``(LM, p-value, df)``.
+
+	Lagged residuals are padded with zeros so the auxiliary regression keeps all ``n`` rows.
+	"""
+	e = results.resid
+	Z = np.column_stack([np.concatenate([np.zeros(l), e[:-l]]) for l in range(1, lags + 1)])
+	ess, _ = _added_fit(results.q, _with_constant(results, Z), e)
+	stat = _lm_statistic(e, ess, results.nobs)
+	return stat, _chi2_pvalue(stat, lags), lags
+
+
+def _variance_test(results, Z=None):
+	# انحدار مربعات البواقي على ثابت ومتغيرات النموذج (وأعمدة إضافية لاختبار White)، صيغة Koenker
+	u = results.resid ** 2
+	q = results.q
+	fitted = q @ (q.T @ u)
+	ess = float(fitted @ fitted)
+	rank = q.shape[1]
+	Z = _with_constant(results, Z)
+	if Z is not None:
+		added, added_rank = _added_fit(q, Z, u - fitted)
+		ess += added
+		rank += added_rank
+	stat = _lm_statistic(u, ess, results.nobs)
+	# درجات الحرية: عدد الأعمدة المستقلة في الانحدار المساعد عدا الثابت
+	return stat, _chi2_pvalue(stat, rank - 1), rank - 1
+
+
+def breusch_pagan(results):
+	"""Breusch-Pagan-Godfrey (Koenker) LM test of heteroskedasticity: ``(LM, p-value, df)``."""
+	return _variance_test(results)
+
+
+def white(results):
+	"""White's test: squares and cross products of the regressors join the BP regression."""
+	X = results.exog
+	rows, cols = np.triu_indices(X.shape[1])
+	return _variance_test(results, X[:, rows] * X[:, cols])
+
+
+def jarque_bera(results):
+	"""Jarque-Bera normality test of the residuals: ``(JB, p-value, df)``."""
+	e = results.resid - results.resid.mean()
+	m2 = np.mean(e ** 2)
+	skew = np.mean(e ** 3) / m2 ** 1.5
+	kurtosis = np.mean(e ** 4) / m2 ** 2
+	stat = results.nobs / 6 * (skew ** 2 + (kurtosis - 3) ** 2 / 4)
+	return float(stat), _chi2_pvalue(stat, 2), 2
+
+
+def reset(results, power=3):
+	"""Ramsey RESET F test with powers ``2..power`` of the fitted values: ``(F, p-value, (df1, df2))``."""
+	from scipy import special
+
+	fitted = results.fittedvalues
+	# تحجيم القيم المقدرة قبل رفعها للقوى لتفادي سوء الحالة العددية
+	Z = np.column_stack([(fitted / np.abs(fitted).max()) ** j for j in range(2, power + 1)])
+	ess, rank = _added_fit(results.q, Z, results.resid)
+	df_resid = results.df_resid - rank
+	stat = (ess / rank) / ((results.ssr - ess) / df_resid)
+	return stat, float(special.fdtrc(rank, df_resid, stat)), (rank, df_resid)
+
+
+def diagnostic_tests(results, lags=2, power=3):
+	"""All diagnostics of ``results`` in one table indexed by test."""
+	tests = {
+		f"Breusch-Godfrey LM ({lags})": breusch_godfrey(results, lags),
+		"Breusch-Pagan-Godfrey": breusch_pagan(results),
+		"White": white(results),
+		"Jarque-Bera": jarque_bera(results),
+		f"Ramsey RESET ({power})": reset(results, power)
+	}
+	frame = pd.DataFrame([(stat, df, pvalue) for stat, pvalue, df in tests.values()],
+						 index=list(tests), columns=["statistic", "df", "pvalue"])
+	frame["distribution"] = ["chi2", "chi2", "chi2", "chi2", "F"]
+	return frame
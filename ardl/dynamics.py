@@ -0,0 +1,173 @@
+"""Dynamic responses of a fitted ARDL from the companion form of its lag polynomial.
+
+With ``a(L) y_t = b(L)' x_t + ...`` the impulse responses to the regressors solve
+``λ_h = Σ_i a_i λ_{h-i} + b_h``; stacking ``(λ_h, ..., λ_{h-p+1})`` turns this into
+the first-order recursion ``s_h = A s_{h-1} + e_1 b_h`` with the companion matrix
+``A``. Coefficient arrays may carry leading batch dimensions (bootstrap draws), so
+responses of every draw come from one recursion over the horizon.
+"""
+import numpy as np
+import pandas as pd
+
+from ardl.bootstrap import Resampler
+
+
+def companion_matrix(ar):
+	"""Companion matrices of the AR coefficients ``ar`` with shape ``(..., p)``."""
+	ar = np.asarray(ar, dtype=float)
+	p = ar.shape[-1]
+	A = np.zeros(ar.shape + (p,))
+	A[..., 0, :] = ar
+	A[..., 1:, :-1] = np.eye(p - 1)
+	return A
+
+
+def impulse_responses(ar, lags, horizon=20):
+	"""Impulse responses ``λ_h = ∂y_{t+h}/∂x_t``, ``h = 0..horizon``.
+
+	``ar`` has shape ``(..., p)`` and ``lags``, the distributed-lag coefficients
+	``b_0..b_q`` of ``k`` regressors, shape ``(..., q + 1, k)``; batch dimensions
+	broadcast. Returns shape ``(..., horizon + 1, k)``.
+	"""
+	lags = np.asarray(lags, dtype=float)
+	A = companion_matrix(ar)
+	batch = np.broadcast_shapes(A.shape[:-2], lags.shape[:-2])
+	state = np.zeros(batch + (A.shape[-1], lags.shape[-1]))
+	responses = np.empty(batch + (horizon + 1, lags.shape[-1]))
+	for h in range(horizon + 1):
+		state = A @ state
+		if h < lags.shape[-2]:
+			state[..., 0, :] += lags[..., h, :]
+		responses[..., h, :] = state[..., 0, :]
+	return responses
+
+
+def dynamic_multipliers(ar, lags, horizon=20):
+	"""Cumulative dynamic multipliers ``m_h = Σ_{j≤h} ∂y_{t+j}/∂x_t``, ``h = 0..horizon``.
+
+	Arguments as in :func:`impulse_responses`. Returns shape ``(..., horizon + 1, k)``;
+	``m_h`` tends to the long-run coefficient ``Σ b / (1 - Σ a)`` when the model is
+	stable.
+	"""
+	return np.cumsum(impulse_responses(ar, lags, horizon), axis=-2)
+
+
+def persistence_profile(ar, horizon=20):
+	"""Share of a unit shock to the equilibrium relation left after ``h = 0..horizon`` periods.
+
+	With weakly exogenous regressors a shock to the equation moves the equilibrium
+	error ``y - θ'x`` by the response ``ψ_h`` of ``y`` to its own innovation, the first
+	element of ``A^h e_1``; the variance form of Pesaran and Shin (1996) is ``ψ_h²``.
+	For an ARDL(1, ...) this is ``(1 + φ)^h`` with the adjustment coefficient ``φ``.
+	Returns shape ``(..., horizon + 1)``.
+	"""
+	return impulse_responses(ar, np.ones((1, 1)), horizon)[..., 0]
+
+
+def bootstrap_params(results, reps=999, seed=None, scheme="iid", block_length=None, batch=250):
+	"""Coefficients of a fitted ARDL re-estimated on ``reps`` bootstrap samples, shape ``(reps, k)``.
+
+	Samples are regenerated from the fit with resampled residuals (any scheme of
+	:class:`ardl.bootstrap.Resampler`) and the observed regressors, a batch at a time
+	as one IIR filter, and refitted by batched normal equations.
+	"""
+	from scipy import signal
+
+	model = results.model
+	X, m = results.exog, model.maxlag
+	ar_index = [results.names.index(f"{model.endog_name}(-{i})") for i in range(1, model.p + 1)]
+	a = results.params[ar_index]
+	fixed = X @ results.params - X[:, ar_index] @ a
+	resid = (results.resid - results.resid.mean()) * np.sqrt(results.nobs / results.df_resid)
+	denominator = np.concatenate([[1.0], -a])
+	start = model.y[:m]
+	zi = signal.lfiltic([1.0], denominator, start[::-1][:model.p])
+	scale = np.linalg.norm(X, axis=0)
+	resampler = Resampler(scheme, results.nobs, block_length)
+	rng = np.random.default_rng(seed)
+	draws = []
+	for begin in range(0, reps, batch):
+		size = min(batch, reps - begin)
+		innovations = resampler.innovations(rng, resid, size)
+		sample = signal.lfilter([1.0], denominator, fixed + innovations, axis=1,
+								zi=np.broadcast_to(zi, (size, len(zi))))[0]
+		y = np.concatenate([np.broadcast_to(start, (size, m)), sample], axis=1)
+		design = np.repeat(X[None] / scale, size, axis=0)
+		for i, col in enumerate(ar_index, start=1):
+			design[:, :, col] = y[:, m - i:y.shape[1] - i] / scale[col]
+		gram = np.swapaxes(design, 1, 2) @ design
+		cross = np.swapaxes(design, 1, 2) @ sample[..., None]
+		draws.append(np.linalg.solve(gram, cross)[..., 0] / scale)
+	return np.concatenate(draws)
+
+
+class DynamicResponses:
+	"""Impulse responses, cumulative multipliers and persistence profile of a fitted ARDL.
+
+	Every regressor's ``b_0..b_q`` is padded with zeros to the longest lag, so the
+	responses of all regressors, and of all bootstrap draws, share one recursion.
+	"""
+
+	def __init__(self, results, horizon=20):
+		self.results = results
+		self.horizon = int(horizon)
+		model = results.model
+		names = results.names
+		self.names = list(model.exog_names)
+		self._ar = np.array([names.index(f"{model.endog_name}(-{i})") for i in range(1, model.p + 1)])
+		# مواقع b_l لكل متغير بالشكل (q_max + 1, k)، و -1 للفجوات بعد q_j
+		q = model.q
+		self._lags = np.full((int(q.max()) + 1, len(self.names)), -1)
+		for j, name in enumerate(self.names):
+			self._lags[:q[j] + 1, j] = [names.index(name if l == 0 else f"{name}(-{l})") for l in range(q[j] + 1)]
+		self.irf, self.cumulative, self.profile = self.responses(results.params)
+
+	def coefficients(self, params):
+		"""AR coefficients ``(..., p)`` and zero-padded lag coefficients ``(..., q_max + 1, k)``."""
+		params = np.asarray(params, dtype=float)
+		return params[..., self._ar], np.where(self._lags >= 0, params[..., self._lags], 0.0)
+
+	def responses(self, params):
+		"""Impulse responses, cumulative multipliers and persistence profile of ``params`` of shape ``(..., K)``."""
+		ar, lags = self.coefficients(params)
+		# عمود إضافي لصدمة الخطأ نفسه يعطي ملف الاستمرارية من نفس التكرار
+		shock = np.zeros(lags.shape[:-1] + (1,))
+		shock[..., 0, :] = 1.0
+		irf = impulse_responses(ar, np.concatenate([lags, shock], axis=-1), self.horizon)
+		return irf[..., :-1], np.cumsum(irf[..., :-1], axis=-2), irf[..., -1]
+
+	@property
+	def impulse_responses(self):
+		return pd.DataFrame(self.irf, columns=self.names)
+
+	@property
+	def multipliers(self):
+		return pd.DataFrame(self.cumulative, columns=self.names)
+
+	@property
+	def persistence(self):
+		return pd.Series(self.profile, name="persistence")
+
+	@property
+	def long_run(self):
+		"""Limits ``Σ b / (1 - Σ a)`` of the cumulative multipliers."""
+		ar, lags = self.coefficients(self.results.params)
+		return pd.Series(lags.sum(axis=0) / (1 - ar.sum()), index=self.names)
+
+	def bootstrap(self, reps=999, seed=None, scheme="iid", block_length=None, cumulative=True):
+		"""Multipliers (or impulse responses) of ``reps`` bootstrap refits, shape ``(reps, horizon + 1, k)``."""
+		irf, multipliers, _ = self.responses(bootstrap_params(self.results, reps, seed, scheme, block_length))
+		return multipliers if cumulative else irf
+
+	def bands(self, reps=999, level=0.95, seed=None, scheme="iid", block_length=None, cumulative=True):
+		"""Percentile bootstrap bands at ``level``: ``{regressor: frame of estimate, lower, upper}``."""
+		draws = self.bootstrap(reps, seed, scheme, block_length, cumulative)
+		lower, upper = np.quantile(draws, [(1 - level) / 2, (1 + level) / 2], axis=0)
+		estimate = self.cumulative if cumulative else self.irf
+		return {name: pd.DataFrame({"estimate": estimate[:, j], "lower": lower[:, j], "upper": upper[:, j]})
+				for j, name in enumerate(self.names)}
+
+
+def dynamic_responses(results, horizon=20):
+	"""Dynamic responses of a fitted :class:`ardl.model.ARDLResults` over ``horizon`` periods."""
+	return DynamicResponses(results, horizon)
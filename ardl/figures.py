@@ -0,0 +1,89 @@
+import inspect
+import threading
+from collections import OrderedDict
+
+import streamlit as st
+
+# دوال بناء الرسوم الحتمية (لا تعتمد على مدخلات المستخدم) مسجلة بالاسم
+BUILDERS = {}
+
+
+def figure(name):
+	"""Register a deterministic figure builder under ``name``.
+
+	A builder returns a Plotly figure, or a tuple of figures and the tables computed
+	from the same data. The returned objects are shared by every session and must be
+	treated as read-only.
+	"""
+	def register(builder):
+		BUILDERS[name] = builder
+		return builder
+
+	return register
+
+
+def _freeze(value):
+	if isinstance(value, dict):
+		return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+	if isinstance(value, (list, tuple)):
+		return tuple(_freeze(v) for v in value)
+	return value
+
+
+def cache_key(name, params):
+	# ربط المعاملات بتوقيع الدالة حتى يتطابق المفتاح سواء مُررت القيم الافتراضية صراحة أم لا
+	bound = inspect.signature(BUILDERS[name]).bind(**params)
+	bound.apply_defaults()
+	return name, _freeze(bound.arguments)
+
+
+class FigureCache:
+	"""Bounded LRU of built figures keyed by builder name and parameters."""
+
+	def __init__(self, maxsize=64, bundle=None):
+		self.maxsize = maxsize
+		self.bundle = bundle
+		self.hits = 0
+		self.misses = 0
+		self._entries = OrderedDict()
+		# البناء يتم داخل القفل لأن بعض الرسوم تعتمد على np.random.seed العامة
+		self._lock = threading.RLock()
+
+	def get(self, name, **params):
+		key = cache_key(name, params)
+		with self._lock:
+			if key in self._entries:
+				self.hits += 1
+				self._entries.move_to_end(key)
+				return self._entries[key]
+			self.misses += 1
+			if self.bundle is not None and key in self.bundle:
+				value = self.bundle.get(key)
+			else:
+				value = BUILDERS[name](**params)
+			self._entries[key] = value
+			while len(self._entries) > self.maxsize:
+				self._entries.popitem(last=False)
+			return value
+
+	def stats(self):
+		with self._lock:
+			return {"hits": self.hits, "misses": self.misses,
+					"size": len(self._entries), "maxsize": self.maxsize}
+
+	def clear(self):
+		with self._lock:
+			self._entries.clear()
+			self.hits = 0
+			self.misses = 0
+
+
+@st.cache_resource
+def figure_cache(maxsize=64):
+	from ardl.bundle import load_bundle
+
+	return FigureCache(maxsize, bundle=load_bundle())
+
+
+def get_figure(name, **params):
+	return figure_cache().get(name, **params)
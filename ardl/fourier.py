@@ -0,0 +1,281 @@
+"""Fourier ARDL: smooth structural change through a trigonometric pair.
+
+As in Banerjee, Arčabić and Lee (2017) and Yilanci, Bozoklu and Gorus (2020), the
+terms ``sin(2πkt/T)`` and ``cos(2πkt/T)`` enter the ARDL next to the deterministic
+terms, so gradual breaks of unknown number and form shift the intercept. The
+frequency ``k``, integer or fractional (Omay, 2015), is the one with the smallest SSR
+on a grid. The basis of a grid is built once per sample size and cached, and every
+pair is appended to the fitted ARDL by a block update of its QR factors,
+
+	B̃ = B - Q Q'B,    SSR(k) = SSR - e'B̃ (B̃'B̃)⁻¹ B̃'e,
+
+so the whole grid costs one product with ``Q`` and a 2×2 solve per frequency.
+
+The bounds statistics of the Fourier ARDL have null distributions that depend on
+``k``. They are simulated on a grid of frequencies for cases III and V as in
+:mod:`ardl.bounds`, fitted by the same response surface in the sample size and
+interpolated linearly in ``k``; the coefficients are shipped and regenerated with::
+
+	python -m ardl.fourier          # rewrite ardl/fourier_cv.npz
+"""
+import argparse
+import sys
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from ardl.bounds import (CASE_TERMS, CASES, DEFAULT_CASE, STATS, BoundsTest, ResponseSurface, _statistics_of,
+						 _subset_fit, fit_response_surface, probability_grid)
+from ardl.model import ARDL, _as_frame
+
+FREQUENCIES = (0.5, 1.0, 1.5, 2.0, 2.5, 3.0, 3.5, 4.0, 4.5, 5.0)
+# شبكة البحث داخل مدى الترددات المجدولة حتى لا تُستقرأ القيم الحرجة
+GRID = tuple(np.round(np.arange(FREQUENCIES[0], FREQUENCIES[-1] + 0.05, 0.1), 1).tolist())
+FOURIER_CASES = ("III", "V")
+TRENDS = ("c", "ct")
+KMAX = 5
+SIZES = (40, 50, 60, 80, 100, 150, 200, 300, 500)
+TABLE_PATH = Path(__file__).with_name("fourier_cv.npz")
+
+
+@lru_cache(maxsize=32)
+def _basis(nobs, frequencies):
+	t = np.arange(1, nobs + 1) / nobs
+	angle = 2 * np.pi * np.multiply.outer(t, frequencies)
+	basis = np.stack([np.sin(angle), np.cos(angle)], axis=-1)
+	basis.flags.writeable = False
+	return basis
+
+
+def fourier_basis(nobs, frequencies=GRID):
+	"""Read-only ``(nobs, G, 2)`` array of ``sin, cos(2πkt/T)``, ``t = 1..T``, for every ``k`` of the grid.
+
+	Cached per sample size and grid, so repeated searches and the screening tests of a
+	series share one basis.
+	"""
+	return _basis(int(nobs), tuple(float(k) for k in np.atleast_1d(frequencies)))
+
+
+def frequency_search(results, frequencies=GRID):
+	"""SSR of a fitted :class:`ardl.model.ARDLResults` with the pair of each frequency added, shape ``(G,)``."""
+	model = results.model
+	B = fourier_basis(len(model.y), frequencies)[model.maxlag:]
+	n, G, _ = B.shape
+	# الجزء من كل زوج المتعامد على أعمدة النموذج: تحديث كتلي لعوامل QR دون إعادة التقدير
+	B = B.reshape(n, 2 * G)
+	B = (B - results.q @ (results.q.T @ B)).reshape(n, G, 2)
+	gram = np.einsum("tgi,tgj->gij", B, B)
+	cross = np.einsum("tgi,t->gi", B, results.resid)
+	return results.ssr - np.einsum("gi,gi->g", cross, np.linalg.solve(gram, cross[..., None])[..., 0])
+
+
+class FourierARDL:
+	"""ARDL(p, q_1, ..., q_k) with the Fourier pair at the frequency of minimum SSR.
+
+	Parameters are those of :class:`ardl.model.ARDL`, with ``trend`` "c" or "ct", plus
+
+	frequencies : grid searched for ``k``; fractional values are allowed
+	"""
+
+	def __init__(self, endog, exog, p, q, trend="c", frequencies=GRID):
+		if trend not in TRENDS:
+			raise ValueError(f"trend must be one of {TRENDS}, got {trend!r}")
+		self.endog = _as_frame(endog, "y")
+		self.exog = _as_frame(exog, "x")
+		self.p = p
+		self.q = q
+		self.trend = trend
+		self.frequencies = np.asarray(frequencies, dtype=float)
+		self.ardl = ARDL(self.endog, self.exog, p, q, trend)
+
+	def terms(self, frequency):
+		"""The Fourier pair at ``frequency`` over the full sample."""
+		basis = fourier_basis(len(self.endog), frequency)[:, 0]
+		return pd.DataFrame(basis, index=self.endog.index, columns=[f"sin_k{frequency:g}", f"cos_k{frequency:g}"])
+
+	def fit(self):
+		base = self.ardl.fit()
+		ssr = frequency_search(base, self.frequencies)
+		frequency = float(self.frequencies[np.argmin(ssr)])
+		results = ARDL(self.endog, self.exog, self.p, self.q, self.trend, fixed=self.terms(frequency)).fit()
+		return FourierARDLResults(self, results, frequency, ssr, base)
+
+
+class FourierARDLResults:
+	"""Fitted Fourier ARDL with its frequency search.
+
+	``results`` is the ordinary :class:`ardl.model.ARDLResults` with the selected pair,
+	so its UECM, long-run coefficients and diagnostics apply unchanged; ``base`` is the
+	fit without the pair.
+	"""
+
+	def __init__(self, model, results, frequency, ssr, base):
+		self.model = model
+		self.results = results
+		self.frequency = frequency
+		self.base = base
+		self.ssr = pd.Series(ssr, index=model.frequencies, name="ssr")
+
+	@property
+	def fourier(self):
+		"""The fitted Fourier component over the estimation sample."""
+		columns = [self.results.names.index(name) for name in self.results.model.fixed_names]
+		return self.results.exog[:, columns] @ self.results.params[columns]
+
+	def fourier_test(self):
+		"""F test that the Fourier pair is zero: ``(statistic, (df1, df2), pvalue)``.
+
+		The p-value uses the F distribution; with ``k`` chosen by the search and
+		nonstationary regressors it is only indicative.
+		"""
+		from scipy import special
+
+		results = self.results
+		fstat = (self.base.ssr - results.ssr) / 2 / results.scale
+		return float(fstat), (2, results.df_resid), float(special.fdtrc(2, results.df_resid, fstat))
+
+	def bounds_test(self, table=None):
+		return fourier_bounds_test(self.results, self.frequency, table)
+
+
+def _statistics(gram, nobs):
+	"""F and t statistics of cases III and V for every tabulated frequency and k.
+
+	Columns of the Gram are ``[1, t, sin_1, cos_1, ..., sin_G, cos_G, y(-1), x_1(-1), ..., x_KMAX(-1), Δy]``.
+	"""
+	reps = gram.shape[0]
+	scale = np.sqrt(np.einsum("rii->ri", gram))
+	gram = gram / (scale[:, :, None] * scale[:, None, :])
+	stats = np.full((len(STATS), len(FOURIER_CASES), len(FREQUENCIES), KMAX + 1, reps), np.nan)
+	first = 2 + 2 * len(FREQUENCIES)
+	for c, case in enumerate(FOURIER_CASES):
+		det = [0] + [1] * ("t" in CASE_TERMS[case][0])
+		for i in range(len(FREQUENCIES)):
+			kept = det + [2 + 2 * i, 3 + 2 * i]
+			ssr_r = _subset_fit(gram, kept)[0]
+			for k in range(KMAX + 1):
+				full = kept + list(range(first, first + k + 1))
+				ssr_u, beta, inv = _subset_fit(gram, full)
+				df_resid = nobs - len(full)
+				stats[0, c, i, k] = (ssr_r - ssr_u) / (k + 1) / (ssr_u / df_resid)
+				j = len(kept)
+				stats[1, c, i, k] = beta[:, j] / np.sqrt(ssr_u / df_resid * inv[:, j, j])
+	return stats
+
+
+def simulate_quantiles(reps=20000, sizes=SIZES, probs=None, seed=20200301, batch=1000):
+	"""Simulate the null quantiles, shape ``(stat, case, frequency, k, size, bound, prob)``.
+
+	The design is that of :func:`ardl.bounds.simulate_quantiles` with the Fourier pair
+	added; all frequencies share the simulated series and one Gram matrix per draw.
+	"""
+	probs = probability_grid() if probs is None else np.asarray(probs)
+	streams = np.random.SeedSequence(seed).spawn(len(sizes) * 2)
+	quantiles = np.full((len(STATS), len(FOURIER_CASES), len(FREQUENCIES), KMAX + 1, len(sizes), 2, len(probs)),
+						np.nan)
+	for s, nobs in enumerate(sizes):
+		trend = np.arange(1, nobs + 1, dtype=float)
+		basis = fourier_basis(nobs, FREQUENCIES).reshape(nobs, -1)
+		for bound in (0, 1):
+			rng = np.random.default_rng(streams[2 * s + bound])
+			draws = []
+			for start in range(0, reps, batch):
+				size = min(batch, reps - start)
+				e = rng.standard_normal((size, nobs + 1, KMAX + 1))
+				y = np.cumsum(e[..., 0], axis=1)
+				x = np.cumsum(e[..., 1:], axis=1) if bound else e[..., 1:]
+				Z = np.concatenate([
+					np.ones((size, nobs, 1)),
+					np.broadcast_to(trend[None, :, None], (size, nobs, 1)),
+					np.broadcast_to(basis, (size,) + basis.shape),
+					y[:, :-1, None],
+					x[:, :-1],
+					np.diff(y, axis=1)[..., None]
+				], axis=2)
+				draws.append(_statistics(Z.transpose(0, 2, 1) @ Z, nobs))
+			draws = np.concatenate(draws, axis=-1)
+			quantiles[..., s, bound, :] = np.moveaxis(np.quantile(draws, probs, axis=-1), 0, -1)
+	return quantiles, probs
+
+
+class FourierTable:
+	"""Response-surface coefficients of the Fourier bounds statistics.
+
+	``theta`` has shape ``(stat, case, frequency, k, bound, prob, degree + 1)`` for the
+	cases III and V and the tabulated :data:`FREQUENCIES`.
+	"""
+
+	def __init__(self, theta, probs, frequencies=FREQUENCIES, sizes=SIZES):
+		self.theta = np.asarray(theta, dtype=float)
+		self.probs = np.asarray(probs, dtype=float)
+		self.frequencies = np.asarray(frequencies, dtype=float)
+		self.sizes = np.asarray(sizes, dtype=float)
+
+	@classmethod
+	def load(cls, path=TABLE_PATH):
+		with np.load(path) as data:
+			return cls(data["theta"], data["probs"], data["frequencies"], data["sizes"])
+
+	def save(self, path=TABLE_PATH):
+		np.savez_compressed(path, theta=self.theta.astype(np.float32), probs=self.probs,
+							frequencies=self.frequencies, sizes=self.sizes)
+
+	def surface(self, frequency):
+		"""A :class:`ardl.bounds.ResponseSurface` at ``frequency``.
+
+		The coefficients are interpolated linearly between the tabulated frequencies and
+		held constant beyond them; cases other than III and V are undefined (NaN).
+		"""
+		nodes = self.frequencies
+		frequency = float(np.clip(frequency, nodes[0], nodes[-1]))
+		j = min(int(np.searchsorted(nodes, frequency, side="right")) - 1, len(nodes) - 2)
+		w = (frequency - nodes[j]) / (nodes[j + 1] - nodes[j])
+		theta = np.full((len(STATS), len(CASES)) + self.theta.shape[3:], np.nan)
+		theta[:, [CASES.index(case) for case in FOURIER_CASES]] = ((1 - w) * self.theta[:, :, j]
+																	+ w * self.theta[:, :, j + 1])
+		return ResponseSurface(theta, self.probs, self.sizes)
+
+
+@lru_cache(maxsize=None)
+def fourier_table(path=TABLE_PATH):
+	return FourierTable.load(path)
+
+
+def fourier_bounds_test(results, frequency, table=None):
+	"""Bounds test of a fitted ARDL that contains the Fourier pair at ``frequency``.
+
+	The statistics are those of :func:`ardl.bounds.bounds_test` in case III (trend "c")
+	or V (trend "ct"); the critical values and p-values come from the Fourier tables,
+	conditional on the frequency as in Yilanci, Bozoklu and Gorus (2020).
+	"""
+	trend = results.model.trend
+	if trend not in TRENDS:
+		raise ValueError(f"the Fourier bounds test needs trend in {TRENDS}, got {trend!r}")
+	k = len(results.model.exog_names)
+	if k > KMAX:
+		raise ValueError(f"Fourier critical values are available for k = 0..{KMAX}, got {k}")
+	table = fourier_table() if table is None else table
+	case = DEFAULT_CASE[trend]
+	fstat, tstat = _statistics_of(results, case)
+	return BoundsTest(case, k, results.nobs, fstat, tstat, table.surface(frequency))
+
+
+def main(argv=None):
+	parser = argparse.ArgumentParser(prog="python -m ardl.fourier", description=__doc__.splitlines()[0])
+	parser.add_argument("--reps", type=int, default=20000)
+	parser.add_argument("--path", default=TABLE_PATH, type=Path)
+	args = parser.parse_args(argv)
+
+	quantiles, probs = simulate_quantiles(args.reps)
+	shape = quantiles.shape
+	# دمج محوري الحالة والتردد ليأخذ محور حجم العينة موقعه في سطح الاستجابة
+	theta = fit_response_surface(quantiles.reshape(shape[0], -1, *shape[3:]), SIZES)
+	FourierTable(theta.reshape(*shape[:4], *theta.shape[3:]), probs).save(args.path)
+	print(f"{args.path}: {args.reps} replications, {len(SIZES)} sample sizes, {len(FREQUENCIES)} frequencies")
+	return 0
+
+
+if __name__ == "__main__":
+	sys.exit(main())
@@ -0,0 +1,229 @@
+"""ARDL-MIDAS: a low-frequency ARDL with high-frequency regressors (Ghysels et al., 2007).
+
+``y_t = det_t + Σ_{i=1..p} a_i y_{t-i} + Σ_j γ_j Σ_{l=0..mJ_j-1} w(l; θ_j) x^{(j)}_{tm-l} + ε_t``
+
+Regressor ``j`` enters through its ``m·J_j`` most recent high-frequency observations up
+to the end of period ``t`` (``J_j`` low-frequency periods of ``m`` observations), held as
+one contiguous ``(T, m·J_j)`` lag matrix, and a weight function of a few parameters.
+The weight functions here are log-linear in their parameters,
+
+	w(θ) = softmax(Φ (θ - θ₀)),    ∂w/∂θ = diag(w) (Φ - 1 w'Φ),
+
+with features ``Φ`` of the lag position ``x ∈ (0, 1)``: ``[log x, log(1 - x)]`` for the
+normalized beta polynomial (``θ₀ = 1``), ``[x, x²]`` for the exponential Almon polynomial
+and ``[-x]`` for an exponential decay. The weights and their Jacobian for any number of
+parameter vectors therefore come from one matrix product: a grid of them gives the
+starting values, and the nonlinear least-squares fit gets analytic derivatives.
+"""
+from functools import cached_property
+
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+from ardl.model import Estimates, _as_frame, _GoodnessOfFit, deterministic_terms, lag_matrix
+
+WEIGHTS = ("beta", "almon", "exp")
+PARAM_NAMES = {"beta": ("a", "b"), "almon": ("θ1", "θ2"), "exp": ("λ",)}
+# شبكات القيم الابتدائية لكل دالة وزن
+START_GRIDS = {
+	"beta": np.stack(np.meshgrid([1.0, 1.5, 2.0, 3.0, 5.0], [1.0, 1.5, 2.0, 3.0, 5.0, 10.0]), -1).reshape(-1, 2),
+	"almon": np.stack(np.meshgrid(np.linspace(-10, 10, 9), np.linspace(-20, 10, 7)), -1).reshape(-1, 2),
+	"exp": np.linspace(-5, 30, 36)[:, None]
+}
+BOUNDS = {"beta": (1e-3, np.inf), "almon": (-np.inf, np.inf), "exp": (-np.inf, np.inf)}
+
+
+def weight_features(kind, nlags):
+	"""Features ``Φ`` (nlags, n_params) and offset ``θ₀`` of a weight function."""
+	x = (np.arange(nlags) + 0.5) / nlags
+	if kind == "beta":
+		return np.column_stack([np.log(x), np.log1p(-x)]), np.ones(2)
+	if kind == "almon":
+		return np.column_stack([x, x ** 2]), np.zeros(2)
+	if kind == "exp":
+		return -x[:, None], np.zeros(1)
+	raise ValueError(f"weights must be one of {WEIGHTS}, got {kind!r}")
+
+
+def midas_weights(kind, theta, nlags, jacobian=False):
+	"""Weights ``(..., nlags)`` summing to one for parameter vectors ``theta`` ``(..., n_params)``.
+
+	With ``jacobian`` also returns ``∂w/∂θ`` of shape ``(..., nlags, n_params)``.
+	"""
+	features, offset = weight_features(kind, nlags)
+	score = (np.asarray(theta, dtype=float) - offset) @ features.T
+	w = np.exp(score - score.max(axis=-1, keepdims=True))
+	w /= w.sum(axis=-1, keepdims=True)
+	if not jacobian:
+		return w
+	return w, w[..., None] * (features - (w @ features)[..., None, :])
+
+
+def midas_lags(x, m, periods):
+	"""Lag matrix ``(T - periods + 1, m·periods)`` of a high-frequency series of length ``m·T``.
+
+	Row ``i`` belongs to low-frequency period ``t = i + periods - 1`` and holds
+	``x_{tm + m - 1 - l}`` for ``l = 0..m·periods - 1``, the most recent observation first.
+	"""
+	x = np.asarray(x, dtype=float)
+	if len(x) % m:
+		raise ValueError("the high-frequency series must have m observations per period")
+	window = sliding_window_view(x, m * periods)[::m]
+	return np.ascontiguousarray(window[:, ::-1])
+
+
+class MIDAS:
+	"""ARDL-MIDAS(p, J_1, ..., J_k) estimated by nonlinear least squares.
+
+	Parameters
+	----------
+	endog : array-like or Series, length T (low frequency)
+	exog : array-like or DataFrame, shape (m·T, k) (high frequency, the last ``m`` rows
+		belonging to the last low-frequency period)
+	p : int, lags of the dependent variable (>= 0)
+	m : int, high-frequency observations per low-frequency period
+	lags : int or sequence of int, low-frequency periods ``J`` of high-frequency lags of
+		each regressor (``m·J`` lags)
+	weights : {"beta", "almon", "exp"} or a sequence of them, one per regressor
+	trend : {"n", "c", "ct"}
+	"""
+
+	def __init__(self, endog, exog, p, m, lags, weights="beta", trend="c"):
+		endog = _as_frame(endog, "y")
+		exog = _as_frame(exog, "x")
+		if len(exog) != m * len(endog):
+			raise ValueError("exog must have m observations for every observation of endog")
+		self.endog_name = str(endog.columns[0])
+		self.exog_names = [str(c) for c in exog.columns]
+		self.y = endog.iloc[:, 0].to_numpy(dtype=float)
+		self.x = exog.to_numpy(dtype=float)
+		if np.isnan(self.y).any() or np.isnan(self.x).any():
+			raise ValueError("the data contain missing values")
+		k = self.x.shape[1]
+		self.p = int(p)
+		self.m = int(m)
+		self.lags = np.broadcast_to(np.asarray(lags, dtype=int), (k,)).copy()
+		self.weights = [weights] * k if isinstance(weights, str) else list(weights)
+		if len(self.weights) != k or not set(self.weights) <= set(WEIGHTS):
+			raise ValueError(f"weights must be one of {WEIGHTS} for each regressor")
+		if self.p < 0 or (self.lags < 1).any():
+			raise ValueError("p must be >= 0 and every lag count must be >= 1")
+		self.trend = trend
+		self.maxlag = max(self.p, int(self.lags.max()) - 1)
+		n_params = len(trend.strip("n")) + self.p + sum(1 + len(PARAM_NAMES[w]) for w in self.weights)
+		if len(self.y) - self.maxlag <= n_params:
+			raise ValueError("not enough observations for the requested lag orders")
+
+	def design(self):
+		"""Regressand, the linear part ``[det, y lags]`` and the high-frequency lag matrices."""
+		m = self.maxlag
+		index = np.arange(m + 1, len(self.y) + 1)
+		columns, names = deterministic_terms(self.trend, index)
+		if self.p:
+			columns.append(lag_matrix(self.y, self.p, start=1, trim=m))
+			names += [f"{self.endog_name}(-{i})" for i in range(1, self.p + 1)]
+		Z = np.column_stack([np.reshape(c, (len(index), -1)) for c in columns]) if columns else np.empty((len(index), 0))
+		X = [midas_lags(self.x[:, j], self.m, int(J))[m - int(J) + 1:] for j, J in enumerate(self.lags)]
+		return self.y[m:], Z, X, names
+
+	def _start(self, y, Z, X):
+		# لكل متغير: أوزان كل نقاط الشبكة دفعة واحدة، وأفضلها بأقل SSR مع تثبيت أوزان المتغيرات الأخرى
+		thetas = [START_GRIDS[w][0] for w in self.weights]
+		for _ in range(2):
+			for j, kind in enumerate(self.weights):
+				others = [X[i] @ midas_weights(self.weights[i], thetas[i], X[i].shape[1]) for i in range(len(X)) if i != j]
+				q, _ = np.linalg.qr(np.column_stack([Z] + others))
+				e = y - q @ (q.T @ y)
+				A = X[j] @ midas_weights(kind, START_GRIDS[kind], X[j].shape[1]).T
+				A = A - q @ (q.T @ A)
+				gain = (A.T @ e) ** 2 / np.einsum("tg,tg->g", A, A)
+				thetas[j] = START_GRIDS[kind][np.argmax(gain)]
+		aggregates = [X[j] @ midas_weights(w, thetas[j], X[j].shape[1]) for j, w in enumerate(self.weights)]
+		linear = np.linalg.lstsq(np.column_stack([Z] + aggregates), y, rcond=None)[0]
+		return np.concatenate([linear] + thetas)
+
+	def fit(self, start=None):
+		"""Nonlinear least squares by ``scipy.optimize.least_squares`` with the analytic Jacobian.
+
+		``start`` is the full parameter vector; by default the weight parameters come from
+		a grid search and the linear coefficients from OLS given those weights.
+		"""
+		from scipy import optimize
+
+		y, Z, X, names = self.design()
+		d, k = Z.shape[1], len(X)
+		sizes = [len(PARAM_NAMES[w]) for w in self.weights]
+		split = np.cumsum([d + k] + sizes)[:-1]
+
+		def unpack(params):
+			return params[:d], params[d:d + k], np.split(params[d + k:], split[1:] - d - k)
+
+		def residuals(params):
+			beta, gamma, thetas = unpack(params)
+			fitted = Z @ beta
+			for j, (kind, theta) in enumerate(zip(self.weights, thetas)):
+				fitted += gamma[j] * (X[j] @ midas_weights(kind, theta, X[j].shape[1]))
+			return fitted - y
+
+		def jacobian(params):
+			_, gamma, thetas = unpack(params)
+			blocks, curvature = [Z], []
+			for j, (kind, theta) in enumerate(zip(self.weights, thetas)):
+				w, dw = midas_weights(kind, theta, X[j].shape[1], jacobian=True)
+				blocks.append((X[j] @ w)[:, None])
+				curvature.append(gamma[j] * (X[j] @ dw))
+			return np.column_stack(blocks + curvature)
+
+		x0 = self._start(y, Z, X) if start is None else np.asarray(start, dtype=float)
+		lower = np.concatenate([np.full(d + k, -np.inf)] + [np.full(s, BOUNDS[w][0]) for s, w in zip(sizes, self.weights)])
+		upper = np.concatenate([np.full(d + k, np.inf)] + [np.full(s, BOUNDS[w][1]) for s, w in zip(sizes, self.weights)])
+		solution = optimize.least_squares(residuals, np.clip(x0, lower, upper), jac=jacobian, bounds=(lower, upper),
+										  method="trf", x_scale="jac")
+		names = names + self.exog_names + [f"{name}[{p}]" for name, w in zip(self.exog_names, self.weights)
+										   for p in PARAM_NAMES[w]]
+		return MIDASResults(self, names, solution, y, X)
+
+
+class MIDASResults(Estimates, _GoodnessOfFit):
+	"""Results of :meth:`MIDAS.fit`; the covariance is the Gauss-Newton ``s² (J'J)⁻¹``."""
+
+	def __init__(self, model, names, solution, endog, lags):
+		self.model = model
+		self.endog = endog
+		self.resid = -solution.fun
+		self.fittedvalues = endog - self.resid
+		self.nobs = len(endog)
+		self.ssr = float(self.resid @ self.resid)
+		self.k_constant = int("c" in model.trend)
+		self.df_model = len(solution.x) - self.k_constant
+		self.scale = self.ssr / (self.nobs - len(solution.x))
+		self.converged = bool(solution.success)
+		self.nfev = solution.nfev
+		_, r = np.linalg.qr(solution.jac)
+		r_inv = np.linalg.inv(r)
+		super().__init__(names, solution.x, self.scale * (r_inv @ r_inv.T), self.nobs - len(solution.x))
+		if self.k_constant:
+			self.tss = float(np.sum((endog - endog.mean()) ** 2))
+		else:
+			self.tss = float(endog @ endog)
+		# الأوزان المقدرة وأثر كل فجوة عالية التردد (γ مضروبة في الوزن)
+		self.weights, self.lag_effects = {}, {}
+		for j, (name, kind) in enumerate(zip(model.exog_names, model.weights)):
+			theta = [self.params[self.names.index(f"{name}[{p}]")] for p in PARAM_NAMES[kind]]
+			w = midas_weights(kind, theta, lags[j].shape[1])
+			self.weights[name] = pd.Series(w, name=name)
+			self.lag_effects[name] = pd.Series(self.params[self.names.index(name)] * w, name=name)
+
+	@cached_property
+	def llf(self):
+		n = self.nobs
+		return -n / 2 * (np.log(2 * np.pi) + np.log(self.ssr / n) + 1)
+
+	@cached_property
+	def aic(self):
+		return -2 * self.llf + 2 * len(self.params)
+
+	@cached_property
+	def bic(self):
+		return -2 * self.llf + np.log(self.nobs) * len(self.params)
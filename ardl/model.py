@@ -0,0 +1,345 @@
+from functools import cached_property
+
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+TRENDS = ("n", "c", "ct")
+
+
+def lag_matrix(x, maxlag, start=0, trim=None):
+	"""Columns ``x[t-start], ..., x[t-maxlag]`` for every ``t >= trim``.
+
+	Built as a strided view of ``x`` (no per-lag copies); ``trim`` defaults to ``maxlag``
+	and lets series with fewer lags share the sample of the longest lag in the model.
+	"""
+	x = np.asarray(x, dtype=float)
+	trim = maxlag if trim is None else trim
+	window = sliding_window_view(x, maxlag + 1, axis=0)[trim - maxlag:]
+	return window[..., maxlag - start::-1]
+
+
+def _as_frame(data, prefix):
+	if isinstance(data, pd.DataFrame):
+		return data
+	if isinstance(data, pd.Series):
+		return data.to_frame()
+	data = np.asarray(data, dtype=float)
+	if data.ndim == 1:
+		data = data[:, None]
+	return pd.DataFrame(data, columns=[f"{prefix}{i + 1}" for i in range(data.shape[1])])
+
+
+def deterministic_terms(trend, index):
+	"""Constant and linear-trend columns for the observation numbers in ``index``."""
+	if trend not in TRENDS:
+		raise ValueError(f"trend must be one of {TRENDS}, got {trend!r}")
+	columns, names = [], []
+	if "c" in trend:
+		columns.append(np.ones(len(index)))
+		names.append("C")
+	if "t" in trend:
+		columns.append(np.asarray(index, dtype=float))
+		names.append("trend")
+	return columns, names
+
+
+def ols_qr(X, y):
+	"""Least squares by a single reduced QR factorization; returns (params, q, r)."""
+	q, r = np.linalg.qr(X)
+	diag = np.abs(np.diag(r))
+	if diag.size and diag.min() <= diag.max() * X.shape[0] * np.finfo(float).eps:
+		raise ValueError("the design matrix is rank deficient")
+	params = np.linalg.solve(r, q.T @ y)
+	return params, q, r
+
+
+class Estimates:
+	"""Coefficient estimates with their covariance matrix and t-based inference."""
+
+	def __init__(self, names, params, cov, df_resid):
+		self.names = list(names)
+		self.params = np.asarray(params, dtype=float)
+		self.cov_params = np.asarray(cov, dtype=float)
+		self.df_resid = df_resid
+
+	@cached_property
+	def bse(self):
+		return np.sqrt(np.diag(self.cov_params))
+
+	@cached_property
+	def tvalues(self):
+		return self.params / self.bse
+
+	@cached_property
+	def pvalues(self):
+		from scipy import special
+
+		return 2 * special.stdtr(self.df_resid, -np.abs(self.tvalues))
+
+	def summary_frame(self):
+		return pd.DataFrame({
+			"coef": self.params,
+			"std err": self.bse,
+			"t": self.tvalues,
+			"P>|t|": self.pvalues
+		}, index=self.names)
+
+
+class _GoodnessOfFit:
+	# تتطلب ssr وtss وdf_model وdf_resid وnobs
+
+	@cached_property
+	def rsquared(self):
+		return 1 - self.ssr / self.tss
+
+	@cached_property
+	def rsquared_adj(self):
+		return 1 - (1 - self.rsquared) * (self.nobs - self.k_constant) / self.df_resid
+
+	@cached_property
+	def fvalue(self):
+		return (self.rsquared / self.df_model) / ((1 - self.rsquared) / self.df_resid)
+
+	@cached_property
+	def f_pvalue(self):
+		from scipy import special
+
+		return special.fdtrc(self.df_model, self.df_resid, self.fvalue)
+
+
+class UECMResults(Estimates, _GoodnessOfFit):
+	"""The fitted ARDL written as an unrestricted error-correction model.
+
+	``Δy_t = det + φ y_{t-1} + Σ π_j x_{j,t-1} + Σ ψ_i Δy_{t-i} + Σ ω_{jl} Δx_{j,t-l} + ε_t``
+	"""
+
+	def __init__(self, names, params, cov, df_resid, ssr, dendog, k_constant):
+		super().__init__(names, params, cov, df_resid)
+		self.ssr = ssr
+		self.nobs = len(dendog)
+		self.k_constant = k_constant
+		self.df_model = len(self.params) - k_constant
+		self.tss = np.sum((dendog - dendog.mean()) ** 2) if k_constant else dendog @ dendog
+
+
+class ECMResults(Estimates):
+	"""The error-correction form implied by a fitted ARDL.
+
+	``Δy_t = φ EC_{t-1} + Σ ψ_i Δy_{t-i} + Σ ω_{jl} Δx_{j,t-l} + ε_t`` with
+	``EC_{t-1} = y_{t-1} - θ' z_{t-1}`` built from the long-run coefficients ``θ``;
+	the coefficients and their covariance are those of the UECM.
+	"""
+
+	def __init__(self, names, params, cov, df_resid, ec, long_run):
+		super().__init__(names, params, cov, df_resid)
+		self.ec = ec
+		self.long_run = long_run
+		self.speed = float(params[0])
+
+	@property
+	def half_life(self):
+		"""Periods until half of a deviation from equilibrium is corrected."""
+		return self.adjustment_periods(0.5)
+
+	def adjustment_periods(self, share=0.95):
+		"""Periods until ``share`` of a deviation is corrected (``nan`` if ``φ`` is outside (-1, 0))."""
+		if not -1 < self.speed < 0:
+			return np.nan
+		return float(np.log(1 - share) / np.log(1 + self.speed))
+
+	def adjustment_path(self, periods):
+		"""Share of an initial deviation remaining after ``0..periods - 1`` periods."""
+		return (1 + self.speed) ** np.arange(periods)
+
+
+class ARDL:
+	"""Autoregressive distributed-lag model ARDL(p, q_1, ..., q_k) estimated by OLS.
+
+	``y_t = det + Σ_{i=1..p} a_i y_{t-i} + Σ_j Σ_{l=0..q_j} b_{jl} x_{j,t-l} + ε_t``
+
+	Parameters
+	----------
+	endog : array-like or Series
+	exog : array-like or DataFrame, shape (n, k)
+	p : int, lags of the dependent variable (>= 1)
+	q : int or sequence of int, lags of each regressor (>= 0)
+	trend : {"n", "c", "ct"}
+	fixed : array-like or DataFrame, shape (n, r), optional
+		Extra regressors entered without lags next to the deterministic terms,
+		e.g. break dummies and their interactions.
+	"""
+
+	def __init__(self, endog, exog, p, q, trend="c", fixed=None):
+		endog = _as_frame(endog, "y")
+		exog = _as_frame(exog, "x")
+		fixed = _as_frame(np.empty((len(endog), 0)) if fixed is None else fixed, "f")
+		if len(endog) != len(exog) or len(endog) != len(fixed):
+			raise ValueError("endog, exog and fixed must have the same number of observations")
+		self.endog_name = str(endog.columns[0])
+		self.exog_names = [str(c) for c in exog.columns]
+		self.y = endog.iloc[:, 0].to_numpy(dtype=float)
+		self.x = exog.to_numpy(dtype=float)
+		self.fixed_names = [str(c) for c in fixed.columns]
+		self.fixed = fixed.to_numpy(dtype=float)
+		if np.isnan(self.y).any() or np.isnan(self.x).any() or np.isnan(self.fixed).any():
+			raise ValueError("the data contain missing values")
+		k = self.x.shape[1]
+		q = np.broadcast_to(np.asarray(q, dtype=int), (k,)).copy()
+		if p < 1 or (q < 0).any():
+			raise ValueError("p must be >= 1 and every q must be >= 0")
+		self.p = int(p)
+		self.q = q
+		self.trend = trend
+		self.maxlag = max(self.p, int(q.max()))
+		n_det = len(trend.strip("n")) + self.fixed.shape[1]
+		if len(self.y) - self.maxlag <= 1 + self.p + int(q.sum()) + k + n_det:
+			raise ValueError("not enough observations for the requested lag orders")
+
+	@property
+	def order(self):
+		return (self.p, *self.q.tolist())
+
+	def design(self):
+		"""Regressand ``y_t`` and the lagged-level design matrix on the common sample."""
+		m = self.maxlag
+		index = np.arange(m + 1, len(self.y) + 1)
+		columns, names = deterministic_terms(self.trend, index)
+		if self.fixed_names:
+			columns.append(self.fixed[m:])
+			names += self.fixed_names
+		columns.append(lag_matrix(self.y, self.p, start=1, trim=m))
+		names += [f"{self.endog_name}(-{i})" for i in range(1, self.p + 1)]
+		for j, name in enumerate(self.exog_names):
+			columns.append(lag_matrix(self.x[:, j], int(self.q[j]), trim=m))
+			names += [name] + [f"{name}(-{l})" for l in range(1, self.q[j] + 1)]
+		X = np.column_stack([np.reshape(c, (len(index), -1)) for c in columns])
+		return self.y[m:], X, names
+
+	def fit(self):
+		y, X, names = self.design()
+		params, q, r = ols_qr(X, y)
+		return ARDLResults(self, names, params, y, X, q, r)
+
+
+class ARDLResults(Estimates, _GoodnessOfFit):
+	"""Results of :meth:`ARDL.fit` in the levels parametrization."""
+
+	def __init__(self, model, names, params, endog, exog, q, r):
+		self.model = model
+		self.endog = endog
+		self.exog = exog
+		# عوامل QR محفوظة لإعادة استخدامها في الاختبارات اللاحقة دون إعادة التقدير
+		self.q = q
+		self.r = r
+		self.nobs, k = exog.shape
+		self.k_constant = int("c" in model.trend)
+		self.df_model = k - self.k_constant
+		self.fittedvalues = exog @ params
+		self.resid = endog - self.fittedvalues
+		self.ssr = float(self.resid @ self.resid)
+		df_resid = self.nobs - k
+		self.scale = self.ssr / df_resid
+		r_inv = np.linalg.inv(r)
+		super().__init__(names, params, self.scale * (r_inv @ r_inv.T), df_resid)
+		if self.k_constant:
+			self.tss = float(np.sum((endog - endog.mean()) ** 2))
+		else:
+			self.tss = float(endog @ endog)
+
+	@cached_property
+	def llf(self):
+		n = self.nobs
+		return -n / 2 * (np.log(2 * np.pi) + np.log(self.ssr / n) + 1)
+
+	@cached_property
+	def aic(self):
+		return -2 * self.llf + 2 * len(self.params)
+
+	@cached_property
+	def bic(self):
+		return -2 * self.llf + np.log(self.nobs) * len(self.params)
+
+	@cached_property
+	def hqic(self):
+		return -2 * self.llf + 2 * np.log(np.log(self.nobs)) * len(self.params)
+
+	@cached_property
+	def uecm(self):
+		"""The same fit reparametrized as an unrestricted ECM (exact, no refit)."""
+		model = self.model
+		n_det = len(self.params) - model.p - int(model.q.sum()) - len(model.q)
+		det_names = self.names[:n_det]
+		y_name = model.endog_name
+		blocks = [(y_name, model.p, n_det, True)]
+		start = n_det + model.p
+		for j, name in enumerate(model.exog_names):
+			blocks.append((name, int(model.q[j]), start, False))
+			start += int(model.q[j]) + 1
+
+		k = len(self.params)
+		level_rows, level_names, diff_rows, diff_names = [], [], [], []
+		for name, lags, first, is_endog in blocks:
+			# معاملات المتغير في الصيغة المستوى: a_1..a_p للمتغير التابع، b_0..b_q للمستقل
+			n_coef = lags if is_endog else lags + 1
+			row = np.zeros(k)
+			row[first:first + n_coef] = 1
+			level_rows.append(row)
+			level_names.append(f"{name}(-1)")
+			# معاملات الفروق: -(a_{i+1} + ... + a_p)، ولـ Δx_t المعامل b_0
+			if not is_endog:
+				row = np.zeros(k)
+				row[first] = 1
+				diff_rows.append(row)
+				diff_names.append(f"Δ{name}")
+			tail = np.tril(np.ones((n_coef, n_coef)), -1).T
+			if is_endog:
+				tail = tail[:lags - 1]
+			else:
+				tail = tail[1:lags]
+			for i, weights in enumerate(tail, start=1):
+				row = np.zeros(k)
+				row[first:first + n_coef] = -weights
+				diff_rows.append(row)
+				diff_names.append(f"Δ{name}(-{i})")
+		T = np.vstack([np.eye(k)[:n_det]] + level_rows + diff_rows)
+		offset = np.zeros(len(T))
+		offset[n_det] = -1.0  # φ = Σ a_i - 1
+		names = det_names + level_names + diff_names
+		dendog = self.endog - model.y[model.maxlag - 1:-1]
+		return UECMResults(names, T @ self.params + offset, T @ self.cov_params @ T.T, self.df_resid,
+						   self.ssr, dendog, self.k_constant)
+
+	@cached_property
+	def long_run(self):
+		"""Long-run coefficients ``θ = -β/φ`` of the deterministic terms and regressors.
+
+		Standard errors by the delta method: with ``J = ∂θ/∂(β, φ)`` the covariance is
+		``J V Jᵀ`` for the UECM covariance ``V``.
+		"""
+		uecm = self.uecm
+		model = self.model
+		i_phi = uecm.names.index(f"{model.endog_name}(-1)")
+		level = list(range(i_phi)) + list(range(i_phi + 1, i_phi + 1 + len(model.exog_names)))
+		phi = uecm.params[i_phi]
+		beta = uecm.params[level]
+		J = np.zeros((len(level), len(uecm.params)))
+		J[np.arange(len(level)), level] = -1 / phi
+		J[:, i_phi] = beta / phi ** 2
+		names = uecm.names[:i_phi] + model.exog_names
+		return Estimates(names, -beta / phi, J @ uecm.cov_params @ J.T, self.df_resid)
+
+	@cached_property
+	def ecm(self):
+		"""The error-correction model with the EC term built from :attr:`long_run`."""
+		uecm = self.uecm
+		model = self.model
+		m = model.maxlag
+		i_phi = uecm.names.index(f"{model.endog_name}(-1)")
+		# الحدود المحددة عند t كما في UECM، والمستويات المتباطئة لفترة واحدة
+		z = np.column_stack([self.exog[:, :i_phi], model.x[m - 1:-1]])
+		ec = model.y[m - 1:-1] - z @ self.long_run.params
+		short = [i_phi] + list(range(i_phi + 1 + len(model.exog_names), len(uecm.names)))
+		names = ["EC(-1)"] + [uecm.names[i] for i in short[1:]]
+		return ECMResults(names, uecm.params[short], uecm.cov_params[np.ix_(short, short)], self.df_resid, ec,
+						  self.long_run)
@@ -0,0 +1,178 @@
+"""Nonlinear (asymmetric) ARDL of Shin, Yu and Greenwood-Nimmo (2014).
+
+A regressor enters through the partial sums of its positive and negative changes,
+or more generally of its changes in several regimes split by thresholds, so that
+increases and decreases may have different short- and long-run effects. The model
+is an ordinary ARDL in those components; asymmetry is tested by Wald tests on its
+UECM form and traced by the cumulative dynamic multipliers of each regime.
+"""
+import numpy as np
+import pandas as pd
+
+from ardl.dynamics import bootstrap_params, dynamic_multipliers
+from ardl.model import ARDL, _as_frame
+
+
+def partial_sums(x, threshold=0.0, quantiles=None):
+	"""Partial-sum decomposition of every column of ``x`` into regimes of its changes.
+
+	Regime ``j`` collects the changes ``Δx_t`` in ``(c_{j-1}, c_j]`` for the cut points
+	``c`` (``-inf`` and ``inf`` at the ends), and its component is their running sum from
+	zero, so the components add up to ``x_t - x_0``. The cut points are ``threshold``
+	(a scalar or an increasing sequence, the same for every column) or, if
+	``quantiles`` is given, those quantiles of each column's changes. With the defaults
+	this is the classic ``(x⁻, x⁺)`` split at zero.
+
+	Returns an array of shape ``x.shape + (regimes,)``, regimes ordered from the lowest
+	changes to the highest.
+	"""
+	x = np.asarray(x, dtype=float)
+	changes = np.diff(x, axis=0, prepend=x[:1])
+	if quantiles is not None:
+		cuts = np.moveaxis(np.quantile(changes[1:], np.atleast_1d(quantiles), axis=0), 0, -1)
+	else:
+		cuts = np.broadcast_to(np.atleast_1d(np.asarray(threshold, dtype=float)), x.shape[1:] + (np.size(threshold),))
+	if np.any(np.diff(cuts, axis=-1) < 0):
+		raise ValueError("thresholds must be increasing")
+	inf = np.full(x.shape[1:] + (1,), np.inf)
+	lower = np.concatenate([-inf, cuts], axis=-1)
+	upper = np.concatenate([cuts, inf], axis=-1)
+	# كل تغير يذهب إلى نظام واحد فقط، ثم تجمع التغيرات تراكميا لكل نظام
+	inside = (changes[..., None] > lower) & (changes[..., None] <= upper)
+	return np.cumsum(np.where(inside, changes[..., None], 0.0), axis=0)
+
+
+def decompose(exog, threshold=0.0, quantiles=None):
+	"""Partial sums of the columns of ``exog`` as a DataFrame named ``x⁻``/``x⁺`` (or ``x_r1..``)."""
+	frame = _as_frame(exog, "x")
+	parts = partial_sums(frame.to_numpy(dtype=float), threshold, quantiles)
+	regimes = parts.shape[-1]
+	suffixes = ["⁻", "⁺"] if regimes == 2 else [f"_r{j}" for j in range(1, regimes + 1)]
+	columns = [f"{name}{suffix}" for name in frame.columns for suffix in suffixes]
+	return pd.DataFrame(parts.reshape(len(frame), -1), index=frame.index, columns=columns)
+
+
+def _wald(estimates, R):
+	# اختبار Wald لقيود خطية Rβ = 0 بتوزيع كاي مربع
+	from scipy import special
+
+	value = R @ estimates.params
+	stat = float(value @ np.linalg.solve(R @ estimates.cov_params @ R.T, value))
+	return stat, len(R), float(special.chdtrc(len(R), stat))
+
+
+class NARDL:
+	"""NARDL(p, q_1, ..., q_k): an ARDL in the partial sums of the asymmetric regressors.
+
+	Parameters are those of :class:`ardl.model.ARDL`, plus
+
+	asymmetric : names of the ``exog`` columns to decompose (default all)
+	threshold, quantiles : cut points of the decomposition, see :func:`partial_sums`
+
+	Each component of a regressor gets that regressor's lag order.
+	"""
+
+	def __init__(self, endog, exog, p, q, trend="c", asymmetric=None, threshold=0.0, quantiles=None):
+		exog = _as_frame(exog, "x")
+		names = [str(c) for c in exog.columns]
+		self.asymmetric = names if asymmetric is None else [str(c) for c in asymmetric]
+		if not set(self.asymmetric) <= set(names):
+			raise ValueError(f"asymmetric must name columns of exog: {names}")
+		q = np.broadcast_to(np.asarray(q, dtype=int), (len(names),))
+		frames, orders, self.components = [], [], {}
+		for j, name in enumerate(names):
+			column = exog.iloc[:, [j]].set_axis([name], axis=1)
+			if name in self.asymmetric:
+				column = decompose(column, threshold, quantiles)
+				self.components[name] = list(column.columns)
+			frames.append(column)
+			orders += [int(q[j])] * column.shape[1]
+		self.exog = pd.concat(frames, axis=1)
+		self.ardl = ARDL(endog, self.exog, p, orders, trend)
+
+	def fit(self):
+		return NARDLResults(self, self.ardl.fit())
+
+
+class NARDLResults:
+	"""Fitted NARDL: the underlying :class:`ardl.model.ARDLResults` plus asymmetry analysis.
+
+	``results`` is the ordinary ARDL fit, so the bounds and diagnostic tests apply to it
+	unchanged.
+	"""
+
+	def __init__(self, model, results):
+		self.model = model
+		self.results = results
+		ardl = model.ardl
+		names = results.names
+		self._ar = [names.index(f"{ardl.endog_name}(-{i})") for i in range(1, ardl.p + 1)]
+		# مواقع معاملات b_0..b_q لمكونات كل متغير غير متماثل، بالشكل (q + 1, regimes)
+		self._lags = {}
+		for name, components in model.components.items():
+			q = int(ardl.q[ardl.exog_names.index(components[0])])
+			self._lags[name] = np.array([[names.index(c if l == 0 else f"{c}(-{l})") for c in components]
+										 for l in range(q + 1)])
+
+	@property
+	def long_run(self):
+		"""Long-run coefficients of every regressor component, with delta-method errors."""
+		return self.results.long_run
+
+	def asymmetry_tests(self):
+		"""Wald tests that the regimes of each asymmetric regressor share their effects.
+
+		Long run: equal coefficients on the lagged levels in the UECM (with a common
+		``φ`` this is the equality of the long-run coefficients ``-π/φ``). Short run:
+		equal sums of the coefficients on the current and lagged differences.
+		"""
+		uecm = self.results.uecm
+		k = len(uecm.names)
+		rows = {}
+		for name, components in self.model.components.items():
+			q = self._lags[name].shape[0] - 1
+			level = np.zeros((len(components), k))
+			short = np.zeros((len(components), k))
+			for j, c in enumerate(components):
+				level[j, uecm.names.index(f"{c}(-1)")] = 1
+				for term in [f"Δ{c}"] + [f"Δ{c}(-{i})" for i in range(1, q)]:
+					short[j, uecm.names.index(term)] = 1
+			rows[f"long-run ({name})"] = _wald(uecm, np.diff(level, axis=0))
+			rows[f"short-run ({name})"] = _wald(uecm, np.diff(short, axis=0))
+		frame = pd.DataFrame(list(rows.values()), index=list(rows), columns=["statistic", "df", "pvalue"])
+		frame["distribution"] = "chi2"
+		return frame
+
+	def _curves(self, params, name, horizon):
+		return dynamic_multipliers(params[..., self._ar], params[..., self._lags[name]], horizon)
+
+	def multipliers(self, horizon=20):
+		"""Cumulative dynamic multipliers of each regime and the asymmetry (highest minus lowest)."""
+		curves = {}
+		for name, components in self.model.components.items():
+			m = self._curves(self.results.params, name, horizon)
+			frame = pd.DataFrame(m, columns=components)
+			frame["asymmetry"] = m[:, -1] - m[:, 0]
+			curves[name] = frame
+		return curves
+
+	def bootstrap_params(self, reps=999, seed=None, scheme="iid", block_length=None, batch=250):
+		"""Coefficients re-estimated on ``reps`` bootstrap samples, shape ``(reps, k)``.
+
+		See :func:`ardl.dynamics.bootstrap_params`; the NARDL is an ordinary ARDL in the
+		components, so its fit is resampled as is.
+		"""
+		return bootstrap_params(self.results, reps, seed, scheme, block_length, batch)
+
+	def bootstrap_multipliers(self, horizon=20, reps=999, level=0.95, seed=None, scheme="iid", block_length=None):
+		"""Asymmetry curves with percentile bootstrap bands at ``level``.
+
+		All draws go through :func:`ardl.dynamics.dynamic_multipliers` in one call.
+		"""
+		draws = self.bootstrap_params(reps, seed, scheme, block_length)
+		bands = {}
+		for name, frame in self.multipliers(horizon).items():
+			m = self._curves(draws, name, horizon)
+			lower, upper = np.quantile(m[..., -1] - m[..., 0], [(1 - level) / 2, (1 + level) / 2], axis=0)
+			bands[name] = pd.DataFrame({"asymmetry": frame["asymmetry"], "lower": lower, "upper": upper})
+		return bands
@@ -0,0 +1,23 @@
+import importlib
+
+# ربط كل عنصر في الشريط الجانبي بوحدة الصفحة الخاصة به. لا تُستورد الوحدة (ومكتباتها الثقيلة
+# مثل statsmodels وscipy) إلا عند اختيار القسم لأول مرة، ثم تبقى محفوظة في sys.modules
+SECTIONS = {
+	"🏠 الصفحة الرئيسية": "home",
+	"📝 تعريف نموذج ARDL": "definition",
+	"🎯 أهداف ARDL": "objectives",
+	"📋 فرضيات النموذج": "assumptions",
+	"✅ مميزات ARDL": "advantages",
+	"🔍 خطوات تطبيق ARDL": "steps",
+	"🧮 الصيغ الرياضية": "pending",
+	"⚠️ انتقادات ومشاكل": "critiques",
+	"🛠️ حلول المشاكل": "solutions",
+	"📊 التغيرات الهيكلية وARDL-Fourier": "pending",
+	"📑 ملخص": "pending",
+	"❓ أسئلة وأجوبة": "pending"
+}
+
+
+def render_section(section):
+	module = importlib.import_module(f"{__name__}.{SECTIONS[section]}")
+	module.render()
@@ -0,0 +1,173 @@
+import streamlit as st
+import plotly.graph_objects as go
+import plotly.express as px
+import pandas as pd
+
+from ardl.figures import figure, get_figure
+
+
+@figure("advantages.methods_comparison")
+def _methods_comparison():
+	# إنشاء مخطط شريطي للمقارنة مع طرق أخرى
+	methods = ['ARDL', 'Johansen', 'Engle-Granger', 'VECM']
+	flexibility = [9, 5, 3, 6]
+	small_sample = [8, 4, 5, 4]
+	simplicity = [7, 4, 6, 3]
+
+	fig = go.Figure()
+
+	fig.add_trace(go.Bar(
+		x=methods,
+		y=flexibility,
+		name='المرونة',
+		marker_color='royalblue'
+	))
+
+	fig.add_trace(go.Bar(
+		x=methods,
+		y=small_sample,
+		name='الكفاءة في العينات الصغيرة',
+		marker_color='tomato'
+	))
+
+	fig.add_trace(go.Bar(
+		x=methods,
+		y=simplicity,
+		name='سهولة التطبيق',
+		marker_color='gold'
+	))
+
+	fig.update_layout(
+		title="مقارنة نموذج ARDL مع طرق التكامل المشترك الأخرى",
+		xaxis_title="طريقة التحليل",
+		yaxis_title="التقييم (10 = الأفضل)",
+		barmode='group',
+		height=300,
+		legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
+		margin=dict(l=0, r=0, t=40, b=0),
+		template="plotly_white"
+	)
+
+	return fig
+
+
+@figure("advantages.advantages_treemap")
+def _advantages_treemap():
+	# إنشاء رسم توضيحي ببيانات نصية
+	advantages = [
+		{"category": "المرونة", "description": "العمل مع متغيرات ذات رتب تكامل مختلفة I(0) و I(1)"},
+		{"category": "الكفاءة", "description": "نتائج أفضل في العينات الصغيرة"},
+		{"category": "الشمولية", "description": "تقدير العلاقات طويلة وقصيرة الأجل معاً"},
+		{"category": "المنهجية", "description": "اختبار الحدود للتكامل المشترك"},
+		{"category": "الديناميكية", "description": "فجوات زمنية مختلفة لكل متغير"},
+		{"category": "التفسير", "description": "سهولة التفسير الاقتصادي للنتائج"},
+		{"category": "المرونة", "description": "إمكانية التوسع لمعالجة مشاكل مختلفة"}
+	]
+
+	df = pd.DataFrame(advantages)
+
+	fig = px.treemap(df, path=['category'], values=[10] * len(advantages),
+					 color_discrete_sequence=px.colors.qualitative.Pastel,
+					 hover_data=['description'])
+
+	fig.update_traces(textinfo="label", hovertemplate='<b>%{label}</b><br>%{customdata[0]}')
+
+	fig.update_layout(
+		title="مميزات نموذج ARDL",
+		margin=dict(l=0, r=0, t=30, b=0),
+		height=400,
+		template="plotly_white"
+	)
+
+	return fig
+
+
+# مميزات ARDL
+def render():
+	st.title("مميزات نموذج ARDL")
+	st.markdown("---")
+
+	col1, col2 = st.columns([2, 1])
+
+	with col1:
+		st.markdown("""
+        ## المميزات الرئيسية لنموذج ARDL وطريقة اختبار الحدود
+
+        ### 1. المرونة في رتب تكامل المتغيرات
+
+        على عكس طرق التكامل المشترك التقليدية (مثل Johansen وEngle-Granger) التي تتطلب أن تكون جميع المتغيرات متكاملة من نفس الرتبة، يمكن تطبيق نموذج ARDL على مجموعة من المتغيرات المتكاملة من رتب مختلفة:
+
+        - يمكن استخدامه مع المتغيرات المتكاملة من الرتبة صفر I(0)
+        - يمكن استخدامه مع المتغيرات المتكاملة من الرتبة الأولى I(1)
+        - يمكن استخدامه مع مزيج من المتغيرات المتكاملة من الرتب I(0) وI(1)
+
+        **شرط أساسي**: لا يمكن استخدامه مع المتغيرات المتكاملة من الرتبة الثانية I(2) أو أعلى.
+
+        ### 2. الكفاءة في العينات الصغيرة
+
+        يتفوق نموذج ARDL في حالة العينات صغيرة الحجم:
+
+        - يعطي تقديرات أكثر دقة للمعلمات في العينات الصغيرة
+        - يوفر استدلالات إحصائية أكثر موثوقية
+        - يمكن تطبيقه على السلاسل الزمنية القصيرة (على عكس طرق التكامل المشترك التقليدية التي تتطلب عينات كبيرة)
+
+        ### 3. تقدير العلاقات طويلة وقصيرة الأجل في آن واحد
+
+        يمكّن نموذج ARDL من:
+
+        - تقدير علاقات التوازن طويلة الأجل (التكامل المشترك)
+        - تقدير ديناميكيات قصيرة الأجل (نموذج تصحيح الخطأ)
+        - الحصول على تقديرات متناسقة للعلاقات طويلة وقصيرة الأجل في معادلة واحدة
+        """)
+
+	with col2:
+		st.image("https://miro.medium.com/v2/resize:fit:1400/1*oKXZnp4fu_vUxGa-6uWQ2g.jpeg", use_column_width=True,
+				 caption="صورة توضيحية - العلاقات الديناميكية في نموذج ARDL")
+
+		fig = get_figure("advantages.methods_comparison")
+		st.plotly_chart(fig, use_container_width=True)
+
+	st.markdown("---")
+
+	col1, col2 = st.columns([1, 1])
+
+	with col1:
+		st.markdown("""
+        ### 4. مرونة في اختيار الفجوات الزمنية المثلى
+
+        يتيح نموذج ARDL:
+
+        - اختيار عدد الفجوات الزمنية المثلى لكل متغير بشكل مستقل
+        - استخدام معايير المعلومات المختلفة (مثل AIC، BIC، HQ) لاختيار النموذج الأمثل
+        - الحصول على هيكل فجوات زمنية أكثر كفاءة يعكس الديناميكيات الحقيقية للعلاقات بين المتغيرات
+
+        ### 5. اختبار الحدود لتحديد التكامل المشترك
+
+        منهجية اختبار الحدود (Bound Testing Approach) توفر:
+
+        - إطاراً بسيطاً وفعالاً لاختبار وجود علاقة توازنية طويلة الأجل
+        - تحديد التكامل المشترك من خلال مقارنة إحصائية F المحسوبة بالقيم الحرجة (الحدود العليا والدنيا)
+        - اختباراً أكثر قوة للتكامل المشترك مقارنة بالطرق التقليدية، خاصة في العينات الصغيرة
+        """)
+
+	with col2:
+		st.markdown("""
+        ### 6. سهولة التفسير والتطبيق
+
+        يتميز نموذج ARDL بـ:
+
+        - البساطة النسبية في التقدير والتفسير مقارنة بنماذج VAR/VECM المعقدة
+        - إمكانية تطبيقه باستخدام طرق المربعات الصغرى العادية (OLS)
+        - توفير تفسيرات مباشرة للعلاقات الاقتصادية والمرونات
+
+        ### 7. القدرة على معالجة المشاكل الاقتصادية القياسية
+
+        يمكن تعديل نموذج ARDL لمعالجة المشاكل المختلفة:
+
+        - معالجة التغيرات الهيكلية من خلال نماذج ARDL-Fourier
+        - معالجة اللاخطية من خلال نماذج NARDL
+        - التعامل مع العينات الصغيرة من خلال تقنيات Bootstrap-ARDL
+        """)
+
+	fig = get_figure("advantages.advantages_treemap")
+	st.plotly_chart(fig, use_container_width=True)
@@ -0,0 +1,141 @@
+import streamlit as st
+import plotly.graph_objects as go
+import numpy as np
+import pandas as pd
+
+from ardl.figures import figure, get_figure
+
+
+@figure("assumptions.integration_orders")
+def _integration_orders():
+	# توليد بيانات للرسم البياني
+	np.random.seed(42)
+	t = np.linspace(0, 100, 101)
+
+	# سلسلة متكاملة من الرتبة صفر I(0) - مستقرة
+	i0_series = np.random.normal(10, 1, 101)
+
+	# سلسلة متكاملة من الرتبة الأولى I(1) - السير العشوائي
+	i1_series = np.cumsum(np.random.normal(0, 1, 101)) + 20
+
+	# سلسلة متكاملة من الرتبة الثانية I(2)
+	i2_series = np.cumsum(np.cumsum(np.random.normal(0, 0.1, 101))) + 30
+
+	fig = go.Figure()
+
+	fig.add_trace(go.Scatter(x=t, y=i0_series, mode='lines', name='I(0) - مستقرة',
+							 line=dict(color='green', width=2)))
+
+	fig.add_trace(go.Scatter(x=t, y=i1_series, mode='lines', name='I(1) - سير عشوائي',
+							 line=dict(color='blue', width=2)))
+
+	fig.add_trace(go.Scatter(x=t, y=i2_series, mode='lines', name='I(2) - متكاملة من الرتبة الثانية',
+							 line=dict(color='red', width=2)))
+
+	fig.update_layout(
+		title="مقارنة بين السلاسل الزمنية ذات رتب التكامل المختلفة",
+		xaxis_title="الزمن",
+		yaxis_title="القيمة",
+		legend_title="رتبة التكامل",
+		height=450,
+		template="plotly_white"
+	)
+
+	return fig
+
+
+# فرضيات النموذج
+def render():
+	st.title("فرضيات نموذج ARDL")
+	st.markdown("---")
+
+	st.markdown("""
+    ## الفرضيات الأساسية لنموذج ARDL واختبار الحدود
+
+    لكي يعطي نموذج ARDL نتائج صحيحة وموثوقة، يجب التحقق من عدة فرضيات أساسية:
+    """)
+
+	col1, col2 = st.columns([1, 1])
+
+	with col1:
+		st.markdown("""
+        ### 1. رتبة تكامل المتغيرات
+
+        - **المتطلب**: يجب أن تكون المتغيرات متكاملة من الرتبة صفر I(0)، أو من الرتبة الأولى I(1)، أو مزيج منهما.
+        - **القيد الأساسي**: لا يمكن تطبيق نموذج ARDL إذا كانت أي من المتغيرات متكاملة من الرتبة الثانية I(2) أو أعلى.
+        - **الاختبار**: يتم اختبار جذر الوحدة باستخدام اختبارات مثل ADF، PP، KPSS قبل تطبيق نموذج ARDL.
+
+        ### 2. استقرار النموذج
+
+        - **المتطلب**: يجب أن يكون النموذج مستقراً هيكلياً.
+        - **الاختبارات**: تستخدم اختبارات CUSUM وCUSUM of Squares للتحقق من استقرار معلمات النموذج عبر الزمن.
+        - **النتيجة**: عدم استقرار النموذج قد يشير إلى وجود تغيرات هيكلية تتطلب معالجة خاصة.
+
+        ### 3. الارتباط الذاتي للبواقي
+
+        - **المتطلب**: يجب أن تكون البواقي خالية من الارتباط الذاتي.
+        - **الاختبارات**: اختبار Breusch-Godfrey LM للارتباط الذاتي.
+        - **الحل**: في حالة وجود ارتباط ذاتي، قد يلزم زيادة عدد الفجوات الزمنية في النموذج.
+        """)
+
+	with col2:
+		st.markdown("""
+        ### 4. التوزيع الطبيعي للبواقي
+
+        - **المتطلب**: يفضل أن تتبع البواقي التوزيع الطبيعي.
+        - **الاختبارات**: اختبار Jarque-Bera للتوزيع الطبيعي.
+        - **الملاحظات**: هذه الفرضية أقل إلزامية في العينات الكبيرة بسبب نظرية النهاية المركزية.
+
+        ### 5. تجانس التباين
+
+        - **المتطلب**: يجب أن يكون تباين البواقي متجانساً (عدم وجود تغاير في التباين).
+        - **الاختبارات**: اختبار Breusch-Pagan-Godfrey لتجانس التباين.
+        - **الحل**: في حالة عدم تجانس التباين، يمكن استخدام الأخطاء المعيارية المتينة.
+
+        ### 6. عدم وجود مشكلة الارتباط المتعدد الخطي الحاد
+
+        - **المتطلب**: عدم وجود ارتباط خطي قوي بين المتغيرات المستقلة.
+        - **المؤشرات**: معامل تضخم التباين (VIF) ومصفوفة الارتباط.
+        - **الحل**: إعادة صياغة النموذج أو حذف بعض المتغيرات المرتبطة بشدة.
+        """)
+
+	st.markdown("---")
+
+	# إنشاء رسم توضيحي يبين رتب التكامل المختلفة
+	st.subheader("توضيح بصري لرتب التكامل المختلفة")
+
+	fig = get_figure("assumptions.integration_orders")
+	st.plotly_chart(fig, use_container_width=True)
+
+	# جدول يلخص الفرضيات واختباراتها
+	st.subheader("ملخص الفرضيات واختباراتها")
+
+	data = {
+		'الفرضية': [
+			'رتبة تكامل المتغيرات',
+			'استقرار النموذج',
+			'الارتباط الذاتي للبواقي',
+			'التوزيع الطبيعي للبواقي',
+			'تجانس التباين',
+			'الارتباط المتعدد الخطي'
+		],
+		'الاختبارات المستخدمة': [
+			'ADF, PP, KPSS',
+			'CUSUM, CUSUM of Squares',
+			'Breusch-Godfrey LM',
+			'Jarque-Bera',
+			'Breusch-Pagan-Godfrey',
+			'VIF, مصفوفة الارتباط'
+		],
+		'الآثار المترتبة على المخالفة': [
+			'نتائج غير صحيحة وغير قابلة للاعتماد عليها',
+			'تحيز في المعلمات المقدرة',
+			'أخطاء معيارية متحيزة وتنبؤات غير دقيقة',
+			'اختبارات الفرضيات غير موثوقة',
+			'أخطاء معيارية غير دقيقة وانخفاض كفاءة المقدرات',
+			'تقديرات غير مستقرة وزيادة التباين'
+		]
+	}
+
+	df = pd.DataFrame(data)
+	st.table(df)
@@ -0,0 +1,678 @@
+import streamlit as st
+import plotly.graph_objects as go
+import numpy as np
+import pandas as pd
+import statsmodels.api as sm
+
+from ardl.breaks import STATS, BreakTest, break_table, f_sequence
+from ardl.figures import figure, get_figure
+
+
+@figure("critiques.sample_size")
+def _sample_size():
+	# توضيح العلاقة بين حجم العينة ودقة التقديرات
+	sample_sizes = [20, 30, 40, 50, 75, 100, 150, 200]
+	bias = [0.35, 0.28, 0.22, 0.17, 0.12, 0.09, 0.06, 0.05]
+	std_errors = [0.42, 0.34, 0.28, 0.24, 0.19, 0.15, 0.12, 0.10]
+
+	fig = go.Figure()
+
+	fig.add_trace(go.Scatter(
+		x=sample_sizes,
+		y=bias,
+		mode='lines+markers',
+		name='التحيز',
+		line=dict(color='red', width=2)
+	))
+
+	fig.add_trace(go.Scatter(
+		x=sample_sizes,
+		y=std_errors,
+		mode='lines+markers',
+		name='الخطأ المعياري',
+		line=dict(color='blue', width=2)
+	))
+
+	fig.update_layout(
+		title="العلاقة بين حجم العينة وجودة التقديرات",
+		xaxis_title="حجم العينة",
+		yaxis_title="القيمة",
+		legend_title="المؤشر",
+		height=400,
+		template="plotly_white"
+	)
+
+	return fig
+
+
+@figure("critiques.structural_break")
+def _structural_break(nobs=100, true_break=60, trim=0.15, seed=42):
+	# إنشاء رسم توضيحي للتغيرات الهيكلية عند تاريخ غير معروف مسبقا
+	np.random.seed(seed)
+	x = np.linspace(0, 10, nobs)
+
+	# إنشاء متغير تابع مع تغير هيكلي
+	e = np.random.normal(0, 1, nobs)
+	y = np.where(np.arange(nobs) < true_break, 2 + 0.5 * x, 3 + 0.8 * x) + e
+
+	# مسح إحصاءة Chow عند كل تاريخ مرشح في المدى المقتطع (Quandt-Andrews)
+	X = sm.add_constant(x)
+	dates, fstats = f_sequence(X, y, trim)
+	test = BreakTest(dates, fstats, X.shape[1], trim, break_table())
+	tau = int(test.break_date)
+
+	# تقدير نموذج بدون اعتبار التغير الهيكلي
+	y_pred_full = sm.OLS(y, X).fit().predict()
+
+	# تقدير نموذجين منفصلين قبل وبعد تاريخ الانكسار المقدر
+	y_pred1 = sm.OLS(y[:tau], X[:tau]).fit().predict()
+	y_pred2 = sm.OLS(y[tau:], X[tau:]).fit().predict()
+
+	# إنشاء رسم توضيحي
+	fig = go.Figure()
+
+	# البيانات الأصلية
+	fig.add_trace(go.Scatter(
+		x=x,
+		y=y,
+		mode='markers',
+		name='البيانات الفعلية',
+		marker=dict(color='gray', size=8)
+	))
+
+	# النموذج الكامل (بدون مراعاة التغير الهيكلي)
+	fig.add_trace(go.Scatter(
+		x=x,
+		y=y_pred_full,
+		mode='lines',
+		name='النموذج بدون اعتبار التغير الهيكلي',
+		line=dict(color='red', width=2)
+	))
+
+	# النموذجين المنفصلين (مع مراعاة التغير الهيكلي المقدر)
+	fig.add_trace(go.Scatter(
+		x=x[:tau],
+		y=y_pred1,
+		mode='lines',
+		name='النموذج للفترة الأولى',
+		line=dict(color='green', width=2)
+	))
+
+	fig.add_trace(go.Scatter(
+		x=x[tau:],
+		y=y_pred2,
+		mode='lines',
+		name='النموذج للفترة الثانية',
+		line=dict(color='blue', width=2)
+	))
+
+	# خط رأسي عند تاريخ الانكسار المقدر
+	fig.add_vline(x=x[tau], line=dict(color="black", width=2, dash="dash"),
+				  annotation_text="نقطة التغير المقدرة (sup-F)", annotation_position="top left")
+
+	fig.update_layout(
+		title="تأثير التغيرات الهيكلية على تقدير النموذج",
+		xaxis_title="المتغير المستقل X",
+		yaxis_title="المتغير التابع Y",
+		height=500,
+		template="plotly_white"
+	)
+
+	# متتالية إحصاءات F مع القيم الحرجة لإحصاءة sup-F عند مستويات المعنوية المختلفة
+	fig_f = go.Figure()
+	fig_f.add_trace(go.Scatter(
+		x=x[dates],
+		y=fstats,
+		mode='lines',
+		name='إحصاءة F لاختبار Chow',
+		line=dict(color='purple', width=2)
+	))
+	for (level, value), color in zip(test.critical_values("sup", (0.10, 0.05, 0.01)).items(), ['orange', 'red', 'darkred']):
+		fig_f.add_hline(y=value, line=dict(color=color, width=1.5, dash="dash"),
+						annotation_text=f"القيمة الحرجة {level:.0%}", annotation_position="top left")
+	fig_f.add_vline(x=x[tau], line=dict(color="black", width=1, dash="dot"))
+	fig_f.update_layout(
+		title="مسح Quandt-Andrews: إحصاءة F عند كل تاريخ انكسار مرشح",
+		xaxis_title="تاريخ الانكسار المرشح (قيمة X)",
+		yaxis_title="F",
+		height=400,
+		template="plotly_white"
+	)
+
+	df_test = pd.DataFrame({
+		'الاختبار': ['sup-F (Andrews)', 'mean-F (Andrews-Ploberger)', 'exp-F (Andrews-Ploberger)'],
+		'القيمة': [round(test.statistics[stat], 3) for stat in STATS],
+		'القيمة الحرجة 5%': [round(test.critical_values(stat)[0.05], 3) for stat in STATS],
+		'القيمة الاحتمالية': [round(test.pvalue(stat), 4) for stat in STATS]
+	})
+
+	return fig, fig_f, df_test
+
+
+@figure("critiques.nonlinearity")
+def _nonlinearity():
+	# إنشاء رسم توضيحي للعلاقات غير الخطية
+	np.random.seed(42)
+	nobs = 100
+	x = np.linspace(-5, 5, nobs)
+
+	# العلاقة غير الخطية (مربعة)
+	y_nonlinear = 2 + 0.5 * x + 0.5 * x ** 2 + np.random.normal(0, 2, nobs)
+
+	# تقدير نموذج خطي
+	X_linear = sm.add_constant(x)
+	model_linear = sm.OLS(y_nonlinear, X_linear)
+	results_linear = model_linear.fit()
+	y_pred_linear = results_linear.predict()
+
+	# تقدير نموذج غير خطي (متعدد الحدود من الدرجة الثانية)
+	X_nonlinear = sm.add_constant(np.column_stack((x, x ** 2)))
+	model_nonlinear = sm.OLS(y_nonlinear, X_nonlinear)
+	results_nonlinear = model_nonlinear.fit()
+	y_pred_nonlinear = results_nonlinear.predict()
+
+	# إنشاء الرسم البياني
+	fig = go.Figure()
+
+	# البيانات الأصلية
+	fig.add_trace(go.Scatter(
+		x=x,
+		y=y_nonlinear,
+		mode='markers',
+		name='البيانات الفعلية',
+		marker=dict(color='gray', size=8)
+	))
+
+	# النموذج الخطي
+	fig.add_trace(go.Scatter(
+		x=x,
+		y=y_pred_linear,
+		mode='lines',
+		name='النموذج الخطي',
+		line=dict(color='red', width=2)
+	))
+
+	# النموذج غير الخطي
+	fig.add_trace(go.Scatter(
+		x=x,
+		y=y_pred_nonlinear,
+		mode='lines',
+		name='النموذج غير الخطي',
+		line=dict(color='green', width=2)
+	))
+
+	fig.update_layout(
+		title="مقارنة بين النموذج الخطي والنموذج غير الخطي",
+		xaxis_title="المتغير المستقل X",
+		yaxis_title="المتغير التابع Y",
+		height=500,
+		template="plotly_white"
+	)
+
+
+	# الرسم البياني للبواقي
+	residuals_linear = y_nonlinear - y_pred_linear
+	residuals_nonlinear = y_nonlinear - y_pred_nonlinear
+
+	fig2 = go.Figure()
+
+	fig2.add_trace(go.Scatter(
+		x=x,
+		y=residuals_linear,
+		mode='markers',
+		name='بواقي النموذج الخطي',
+		marker=dict(color='red', size=8)
+	))
+
+	fig2.add_trace(go.Scatter(
+		x=x,
+		y=residuals_nonlinear,
+		mode='markers',
+		name='بواقي النموذج غير الخطي',
+		marker=dict(color='green', size=8)
+	))
+
+	# إضافة خط أفقي عند صفر
+	fig2.add_shape(
+		type="line",
+		x0=min(x),
+		y0=0,
+		x1=max(x),
+		y1=0,
+		line=dict(color="black", width=1, dash="dash")
+	)
+
+	fig2.update_layout(
+		title="مقارنة بين بواقي النموذج الخطي والنموذج غير الخطي",
+		xaxis_title="المتغير المستقل X",
+		yaxis_title="البواقي",
+		height=400,
+		template="plotly_white"
+	)
+
+	return fig, fig2
+
+
+@figure("critiques.integration_orders")
+def _integration_orders():
+	# إنشاء رسم توضيحي للمتغيرات من مختلف رتب التكامل
+	np.random.seed(42)
+	nobs = 200
+	t = np.arange(nobs)
+
+	# متغير I(0) - مستقر
+	i0_series = 5 + np.random.normal(0, 1, nobs)
+
+	# متغير I(1) - سير عشوائي
+	i1_shock = np.random.normal(0, 1, nobs)
+	i1_series = 10 + np.cumsum(i1_shock)
+
+	# متغير I(2) - سير عشوائي متكامل مرتين
+	i2_shock = np.random.normal(0, 0.1, nobs)
+	i2_series = 15 + np.cumsum(np.cumsum(i2_shock))
+
+	# الفروق الأولى
+	i0_diff1 = np.diff(i0_series)
+	i1_diff1 = np.diff(i1_series)
+	i2_diff1 = np.diff(i2_series)
+
+	# الفروق الثانية
+	i0_diff2 = np.diff(i0_diff1)
+	i1_diff2 = np.diff(i1_diff1)
+	i2_diff2 = np.diff(i2_diff1)
+
+	# الرسم البياني للمستويات
+	fig = go.Figure()
+
+	fig.add_trace(go.Scatter(
+		x=t,
+		y=i0_series,
+		mode='lines',
+		name='I(0) - مستقر',
+		line=dict(color='green', width=2)
+	))
+
+	fig.add_trace(go.Scatter(
+		x=t,
+		y=i1_series,
+		mode='lines',
+		name='I(1) - سير عشوائي',
+		line=dict(color='blue', width=2)
+	))
+
+	fig.add_trace(go.Scatter(
+		x=t,
+		y=i2_series,
+		mode='lines',
+		name='I(2) - متكامل مرتين',
+		line=dict(color='red', width=2)
+	))
+
+	fig.update_layout(
+		title="مقارنة بين المتغيرات من مختلف رتب التكامل (المستويات)",
+		xaxis_title="الزمن",
+		yaxis_title="القيمة",
+		height=400,
+		template="plotly_white"
+	)
+
+
+	# الرسم البياني للفروق الأولى
+	fig2 = go.Figure()
+
+	fig2.add_trace(go.Scatter(
+		x=t[1:],
+		y=i0_diff1,
+		mode='lines',
+		name='I(0) - الفرق الأول',
+		line=dict(color='green', width=2)
+	))
+
+	fig2.add_trace(go.Scatter(
+		x=t[1:],
+		y=i1_diff1,
+		mode='lines',
+		name='I(1) - الفرق الأول',
+		line=dict(color='blue', width=2)
+	))
+
+	fig2.add_trace(go.Scatter(
+		x=t[1:],
+		y=i2_diff1,
+		mode='lines',
+		name='I(2) - الفرق الأول',
+		line=dict(color='red', width=2)
+	))
+
+	fig2.update_layout(
+		title="مقارنة بين المتغيرات من مختلف رتب التكامل (الفروق الأولى)",
+		xaxis_title="الزمن",
+		yaxis_title="القيمة",
+		height=400,
+		template="plotly_white"
+	)
+
+	return fig, fig2
+
+
+# انتقادات ومشاكل
+def render():
+	st.title("انتقادات ومشاكل نموذج ARDL")
+	st.markdown("---")
+
+	st.markdown("""
+    ## الانتقادات الرئيسية والمشاكل المنهجية لنموذج ARDL
+
+    على الرغم من المزايا العديدة لنموذج ARDL، إلا أنه يواجه عدداً من الانتقادات والتحديات المنهجية التي يجب أخذها في الاعتبار:
+    """)
+
+	tabs = st.tabs([
+		"مشكلة العينات الصغيرة",
+		"التغيرات الهيكلية",
+		"العلاقات غير الخطية",
+		"المتغيرات I(2)",
+		"مشاكل التحديد",
+		"قيود النموذج"
+	])
+
+	with tabs[0]:
+		st.markdown("""
+        ## مشكلة العينات الصغيرة
+
+        ### المشكلة:
+
+        على الرغم من أن ARDL أفضل أداءً في العينات الصغيرة مقارنة بطرق التكامل المشترك الأخرى، إلا أنه لا يزال يواجه تحديات مع العينات الصغيرة جداً.
+
+        ### الآثار:
+
+        1. **تحيز المعلمات المقدرة**:
+           - في العينات الصغيرة، قد تكون التقديرات متحيزة، خاصة عند استخدام عدد كبير من الفجوات الزمنية
+
+        2. **انخفاض قوة اختبار الحدود**:
+           - قد لا تكون القيم الحرجة المقدمة من Pesaran وآخرون دقيقة بما يكفي للعينات الصغيرة جداً
+           - قد يؤدي ذلك إلى زيادة احتمالية خطأ النوع الأول أو الثاني
+
+        3. **مشاكل في اختيار الفجوات الزمنية المثلى**:
+           - محدودية درجات الحرية تجعل من الصعب تحديد هيكل الفجوات الزمنية الأمثل
+
+        ### كيف تظهر المشكلة في التطبيق:
+
+        - عدم استقرار النتائج عند تغيير طفيف في المواصفات
+        - معلمات ذات أخطاء معيارية كبيرة
+        - صعوبة في الحصول على نتائج معنوية في اختبار الحدود
+        """)
+
+		fig = get_figure("critiques.sample_size")
+		st.plotly_chart(fig, use_container_width=True)
+
+		st.info("""
+        **ملاحظة**: يوضح الرسم البياني أعلاه كيف ينخفض التحيز والخطأ المعياري مع زيادة حجم العينة. في العينات التي تقل عن 50 مشاهدة، يكون التحيز والخطأ المعياري كبيرين نسبياً، مما يؤثر على موثوقية نتائج نموذج ARDL.
+        """)
+
+	with tabs[1]:
+		st.markdown("""
+        ## مشكلة التغيرات الهيكلية
+
+        ### المشكلة:
+
+        نموذج ARDL التقليدي يفترض استقرار العلاقة بين المتغيرات عبر الزمن، لكن في الواقع، قد تتغير هذه العلاقات بسبب:
+        - التغيرات في السياسات الاقتصادية
+        - الأزمات الاقتصادية والمالية
+        - التغيرات التكنولوجية الكبيرة
+        - التحولات الهيكلية في الاقتصاد
+
+        ### الآثار:
+
+        1. **تحيز في تقديرات المعلمات**:
+           - إذا تم تجاهل التغيرات الهيكلية، فإن المعلمات المقدرة تعكس متوسط العلاقة عبر الفترات المختلفة
+
+        2. **نتائج خاطئة في اختبار التكامل المشترك**:
+           - قد يفشل اختبار الحدود في اكتشاف العلاقة التكاملية الحقيقية بسبب التغيرات الهيكلية
+
+        3. **استنتاجات مضللة**:
+           - قد تؤدي التغيرات الهيكلية غير المحسوبة إلى استنتاجات خاطئة حول العلاقات الاقتصادية
+
+        ### كيف تظهر المشكلة في التطبيق:
+
+        - فشل اختبارات استقرار النموذج مثل CUSUM و CUSUM of Squares
+        - تغيرات مفاجئة في البواقي
+        - اختلاف النتائج عند تقسيم العينة إلى فترات فرعية
+        """)
+
+		fig, fig_f, df_test = get_figure("critiques.structural_break")
+		st.plotly_chart(fig, use_container_width=True)
+		st.plotly_chart(fig_f, use_container_width=True)
+		st.dataframe(df_test, hide_index=True)
+
+		st.info("""
+        **التفسير**: تاريخ التغير الهيكلي غير معروف مسبقا، لذلك تحسب إحصاءة Chow عند كل تاريخ مرشح بين 15% و85% من العينة، ويقدر تاريخ الانكسار عند أكبر قيمة لها. لا تتبع أكبر إحصاءة (sup-F) توزيع F المعتاد لأن التاريخ اختير من البيانات، لذلك تقارن بالقيم الحرجة لـ Andrews (1993) الأعلى بكثير، ومعها إحصاءتا المتوسط (mean-F) والأسي (exp-F) لـ Andrews وPloberger (1994). يظهر الخط الأحمر النموذج المقدر دون مراعاة التغير الهيكلي، بينما يظهر الخطان الأخضر والأزرق تقديرات أكثر دقة للعلاقة قبل وبعد تاريخ الانكسار المقدر.
+        """)
+
+	with tabs[2]:
+		st.markdown("""
+        ## مشكلة العلاقات غير الخطية
+
+        ### المشكلة:
+
+        يفترض نموذج ARDL التقليدي أن العلاقة بين المتغيرات خطية، لكن العلاقات الاقتصادية في الواقع غالباً ما تكون غير خطية.
+
+        ### أمثلة للعلاقات غير الخطية:
+
+        - **العلاقة بين التضخم والنمو**: إيجابية في المعدلات المنخفضة، سلبية في المعدلات المرتفعة
+        - **منحنى لافر الضريبي**: زيادة الإيرادات الضريبية مع زيادة معدلات الضرائب حتى نقطة معينة، ثم انخفاضها
+        - **عتبات في النمو الاقتصادي**: اختلاف تأثير الاستثمار على النمو حسب مستوى التنمية
+
+        ### الآثار:
+
+        1. **سوء تحديد النموذج**:
+           - تقريب خطي للعلاقة الحقيقية غير الخطية قد يكون غير دقيق
+
+        2. **تحيز في المعلمات المقدرة**:
+           - المعلمات تعكس متوسط التأثير عبر مدى البيانات، وليس التأثير الحقيقي المتغير
+
+        3. **التنبؤات غير الدقيقة**:
+           - النموذج الخطي قد يفشل في التنبؤ بنقاط التحول أو التغيرات الهيكلية
+
+        ### كيف تظهر المشكلة في التطبيق:
+
+        - أنماط منتظمة في البواقي
+        - اختبارات التحديد الصحيح (مثل Ramsey RESET) تشير إلى سوء التحديد
+        - البواقي مرتبطة بالقيم المربعة أو التكعيبية للمتغيرات المستقلة
+        """)
+
+		fig, fig2 = get_figure("critiques.nonlinearity")
+		st.plotly_chart(fig, use_container_width=True)
+		st.plotly_chart(fig2, use_container_width=True)
+
+		st.info("""
+        **التفسير**: تظهر الرسوم البيانية أعلاه مشكلة استخدام نموذج خطي لوصف علاقة غير خطية. الخط الأحمر (النموذج الخطي) لا يلتقط الشكل الحقيقي للعلاقة، بينما الخط الأخضر (النموذج غير الخطي) يوفر تقريباً أفضل بكثير. يظهر رسم البواقي أن بواقي النموذج الخطي تظهر نمطاً منتظماً، مما يشير إلى سوء تحديد النموذج.
+        """)
+
+	with tabs[3]:
+		st.markdown("""
+        ## مشكلة المتغيرات المتكاملة من الرتبة I(2)
+
+        ### المشكلة:
+
+        نموذج ARDL واختبار الحدود مصممان للعمل فقط مع المتغيرات المتكاملة من الرتبة I(0) أو I(1) أو مزيج منهما. تفشل المنهجية إذا كانت أي من المتغيرات متكاملة من الرتبة I(2) أو أعلى.
+
+        ### مفهوم المتغيرات I(2):
+
+        - متغير I(2) هو متغير يحتاج إلى أخذ الفرق الأول مرتين ليصبح مستقراً
+        - أمثلة: بعض متغيرات الأسعار في فترات التضخم المرتفع، بعض المتغيرات المالية
+
+        ### الآثار:
+
+        1. **نتائج زائفة في اختبار الحدود**:
+           - القيم الحرجة المقدمة من Pesaran وآخرون غير صالحة للمتغيرات I(2)
+           - قد يؤدي ذلك إلى استنتاجات خاطئة حول وجود علاقة تكامل مشترك
+
+        2. **تحيز شديد في المعلمات المقدرة**:
+           - المعلمات المقدرة لا تعكس العلاقة الحقيقية بين المتغيرات
+
+        3. **مشاكل في الاستقرار الإحصائي**:
+           - النموذج قد يظهر عدم استقرار كبير
+
+        ### كيف تظهر المشكلة في التطبيق:
+
+        - اختبارات جذر الوحدة تشير إلى أن المتغير غير مستقر حتى بعد أخذ الفرق الأول
+        - قيم F المحسوبة في اختبار الحدود قد تكون عالية بشكل غير طبيعي
+        - نتائج غير منطقية اقتصادياً
+        """)
+
+		fig, fig2 = get_figure("critiques.integration_orders")
+		st.plotly_chart(fig, use_container_width=True)
+		st.plotly_chart(fig2, use_container_width=True)
+
+		st.info("""
+        **التفسير**: تظهر الرسوم البيانية أعلاه سلوك المتغيرات من مختلف رتب التكامل. المتغير I(0) (باللون الأخضر) مستقر في مستواه. المتغير I(1) (باللون الأزرق) غير مستقر في مستواه ولكنه يصبح مستقراً بعد أخذ الفرق الأول. المتغير I(2) (باللون الأحمر) غير مستقر حتى بعد أخذ الفرق الأول (لاحظ الاتجاه المتزايد في الرسم الثاني)، ويحتاج إلى أخذ الفرق مرتين ليصبح مستقراً. نموذج ARDL لا يمكن تطبيقه إذا كان أي من المتغيرات من الرتبة I(2).
+        """)
+
+	with tabs[4]:
+		st.markdown("""
+        ## مشاكل التحديد والتخصيص
+
+        ### المشكلة:
+
+        يمكن أن تواجه نماذج ARDL مشاكل التحديد الناتجة عن إغفال متغيرات مهمة أو إدراج متغيرات غير مناسبة.
+
+        ### أنواع مشاكل التحديد:
+
+        1. **إغفال متغيرات مهمة (Omitted Variable Bias)**:
+           - عدم تضمين متغيرات مؤثرة في النموذج
+           - يؤدي إلى تحيز في المعلمات المقدرة
+
+        2. **إدراج متغيرات غير ضرورية (Irrelevant Variables)**:
+           - تضمين متغيرات لا علاقة لها بالمتغير التابع
+           - يؤدي إلى زيادة تباين المقدرات وانخفاض كفاءتها
+
+        3. **التحديد الخاطئ للعلاقة الوظيفية**:
+           - افتراض علاقة خطية بينما العلاقة غير خطية
+           - عدم تضمين التفاعلات بين المتغيرات
+
+        ### الآثار:
+
+        1. **معلمات متحيزة**:
+           - تقديرات لا تعكس التأثيرات الحقيقية للمتغيرات
+
+        2. **استنتاجات خاطئة**:
+           - استنتاجات مضللة حول العلاقات السببية
+           - توصيات سياساتية غير مناسبة
+
+        3. **ضعف القدرة التنبؤية**:
+           - تنبؤات أقل دقة خارج العينة
+
+        ### كيف تظهر المشكلة في التطبيق:
+
+        - فشل اختبار Ramsey RESET
+        - ارتباط كبير بين البواقي والمتغيرات المحذوفة
+        - معاملات غير متسقة مع النظرية الاقتصادية
+        """)
+
+		# توضيح مشكلة إغفال متغيرات مهمة
+		np.random.seed(42)
+		nobs = 100
+
+		x1 = np.random.normal(0, 1, nobs)
+		x2 = 0.5 * x1 + np.random.normal(0, 1, nobs)  # متغير مرتبط بـ x1
+
+		# العلاقة الحقيقية: y depends on both x1 and x2
+		y = 1 + 2 * x1 + 3 * x2 + np.random.normal(0, 1, nobs)
+
+		# تقدير نموذج بدون x2 (متغير مهم محذوف)
+		X_misspecified = sm.add_constant(x1)
+		model_misspecified = sm.OLS(y, X_misspecified)
+		results_misspecified = model_misspecified.fit()
+
+		# تقدير النموذج الصحيح (مع x1 و x2)
+		X_correct = sm.add_constant(np.column_stack((x1, x2)))
+		model_correct = sm.OLS(y, X_correct)
+		results_correct = model_correct.fit()
+
+		# عرض النتائج
+		st.subheader("مثال توضيحي: مشكلة إغفال متغيرات مهمة")
+
+		col1, col2 = st.columns(2)
+
+		with col1:
+			st.markdown("**النموذج الناقص (بدون المتغير x2)**")
+			st.write(f"معامل الثابت: {results_misspecified.params[0]:.3f}")
+			st.write(f"معامل x1: {results_misspecified.params[1]:.3f}")
+			st.write(f"معامل التحديد R²: {results_misspecified.rsquared:.3f}")
+
+		with col2:
+			st.markdown("**النموذج الصحيح (مع المتغيرين x1 و x2)**")
+			st.write(f"معامل الثابت: {results_correct.params[0]:.3f}")
+			st.write(f"معامل x1: {results_correct.params[1]:.3f}")
+			st.write(f"معامل x2: {results_correct.params[2]:.3f}")
+			st.write(f"معامل التحديد R²: {results_correct.rsquared:.3f}")
+
+		st.info(f"""
+        **ملاحظة هامة**: 
+
+        في المثال التوضيحي، نلاحظ أن التحيز في تقدير معامل x1 كبير. القيمة الحقيقية للمعامل هي 2، ولكن في النموذج الناقص تم تقديره بـ {results_misspecified.params[1]:.3f} (بزيادة حوالي {((results_misspecified.params[1] - 2) / 2 * 100):.1f}%). هذا لأن المتغير المحذوف x2 مرتبط بـ x1، وبالتالي يتحمل x1 جزءاً من تأثير x2 في النموذج الناقص.
+
+        هذا يوضح مدى أهمية تضمين جميع المتغيرات ذات الصلة في نموذج ARDL لتجنب تحيز المعلمات واستخلاص استنتاجات خاطئة.
+        """)
+
+	with tabs[5]:
+		st.markdown("""
+        ## قيود نظرية وتطبيقية أخرى
+
+        ### 1. الاعتماد على الافتراض الإحصائي للاستقلال:
+
+        - نموذج ARDL يفترض استقلال المتغيرات المستقلة عن حد الخطأ
+        - في الواقع، قد تكون هناك علاقات تغذية عكسية (feedback) بين المتغيرات
+        - المعلمات المقدرة قد تكون متحيزة بسبب مشكلة الارتباط الداخلي (endogeneity)
+
+        ### 2. فرضية العلاقة في اتجاه واحد:
+
+        - نموذج ARDL يفترض ضمنياً أن هناك متغير تابع ومتغيرات مستقلة
+        - في الاقتصاد، العديد من العلاقات متبادلة ومتعددة الاتجاهات
+        - نماذج VAR أو VECM قد تكون أكثر ملاءمة لدراسة هذه العلاقات المتبادلة
+
+        ### 3. الحساسية لاختيار الفجوات الزمنية:
+
+        - النتائج قد تختلف باختلاف معايير تحديد الفجوات الزمنية (AIC, SC, HQ)
+        - تحديد الحد الأقصى للفجوات الزمنية قد يكون ذاتياً
+        - مشكلة "grid search" عند وجود العديد من المتغيرات والفجوات
+
+        ### 4. صعوبات تفسير المعلمات:
+
+        - في النماذج ذات الفجوات الزمنية المتعددة، يصعب تفسير المعلمات الفردية
+        - المعاملات قصيرة الأجل قد تكون صعبة التفسير اقتصادياً
+        - تفسير المعاملات يتطلب فهماً عميقاً للنظرية الاقتصادية
+
+        ### 5. قيود حسابية:
+
+        - تقدير النماذج ذات العديد من المتغيرات والفجوات الزمنية قد يكون مكلفاً حسابياً
+        - مشكلة تقليص عدد المشاهدات بسبب الفجوات الزمنية
+        - حساسية للقيم المتطرفة والمفقودة
+        """)
+
+		# إنشاء جدول يلخص الانتقادات والحلول المقترحة
+		criticisms_solutions = {
+			'الانتقاد/المشكلة': [
+				'العينات الصغيرة',
+				'التغيرات الهيكلية',
+				'العلاقات غير الخطية',
+				'متغيرات I(2)',
+				'إغفال متغيرات مهمة',
+				'الارتباط الداخلي (Endogeneity)',
+				'حساسية لاختيار الفجوات الزمنية'
+			],
+			'الحل المقترح': [
+				'استخدام تقنيات Bootstrap ARDL',
+				'تطبيق نماذج ARDL-Fourier أو ARDL مع متغيرات وهمية للتغيرات الهيكلية',
+				'استخدام نماذج NARDL (Nonlinear ARDL)',
+				'تحويل المتغيرات I(2) إلى I(1) باستخدام الفروق الأولى',
+				'إجراء اختبارات حساسية وإضافة متغيرات تحكم',
+				'استخدام متغيرات آلية (IV) أو طرق GMM',
+				'اختبار مجموعة من المواصفات المختلفة وتطبيق اختبارات قوة'
+			]
+		}
+
+		df_criticisms = pd.DataFrame(criticisms_solutions)
+
+		st.subheader("ملخص الانتقادات والحلول المقترحة لنموذج ARDL")
+		st.table(df_criticisms)
@@ -0,0 +1,120 @@
+import streamlit as st
+import plotly.graph_objects as go
+
+
+# تعريف نموذج ARDL
+def render():
+	st.title("تعريف نموذج ARDL")
+	st.markdown("---")
+
+	col1, col2 = st.columns([3, 2])
+
+	with col1:
+		st.markdown("""
+        ## ما هو نموذج ARDL؟
+
+        **نموذج الانحدار الذاتي ذو الفجوات الزمنية الموزعة** (Autoregressive Distributed Lag - ARDL) هو أحد نماذج الاقتصاد القياسي الديناميكية التي تستخدم للكشف عن العلاقات بين المتغيرات الاقتصادية عبر الزمن.
+
+        ### المكونات الأساسية للنموذج:
+
+        1. **المكون الانحداري الذاتي (Autoregressive - AR)**: يشير إلى استخدام القيم المتأخرة (lagged values) للمتغير التابع كمتغيرات مستقلة في النموذج.
+
+        2. **مكون الفجوات الزمنية الموزعة (Distributed Lag - DL)**: يشير إلى استخدام القيم الحالية والمتأخرة للمتغيرات المستقلة.
+
+        ### الخلفية التاريخية:
+
+        تم تطوير منهجية ARDL وطريقة اختبار الحدود (Bound Testing Approach) بواسطة **Pesaran وShin وSmith** في عامي 1996 و2001، وذلك بهدف التغلب على مشاكل نماذج التكامل المشترك التقليدية المستخدمة في تحليل العلاقات طويلة الأجل بين المتغيرات.
+
+        ### استخدامات ARDL:
+
+        - دراسة العلاقات قصيرة وطويلة الأجل بين المتغيرات الاقتصادية
+        - اختبار التكامل المشترك (Cointegration) بين المتغيرات
+        - نمذجة العلاقات الديناميكية بين المتغيرات
+        - التنبؤ بالقيم المستقبلية
+        """)
+
+	with col2:
+		# إنشاء رسم توضيحي لهيكل نموذج ARDL
+		nodes = ['Y(t)', 'Y(t-1)', 'Y(t-2)', 'X(t)', 'X(t-1)', 'X(t-2)']
+		positions = [(0, 0), (-0.5, -1), (-0.5, -2), (0.5, -1), (0.5, -2), (0.5, -3)]
+		edges = [(1, 0), (2, 0), (3, 0), (4, 0), (5, 0)]
+
+		edge_x = []
+		edge_y = []
+
+		for edge in edges:
+			x0, y0 = positions[edge[0]]
+			x1, y1 = positions[edge[1]]
+			edge_x.append(x0)
+			edge_x.append(x1)
+			edge_x.append(None)
+			edge_y.append(y0)
+			edge_y.append(y1)
+			edge_y.append(None)
+
+		edge_trace = go.Scatter(
+			x=edge_x, y=edge_y,
+			line=dict(width=1.5, color='#888'),
+			hoverinfo='none',
+			mode='lines')
+
+		node_x = []
+		node_y = []
+		node_text = []
+
+		for i, (x, y) in enumerate(positions):
+			node_x.append(x)
+			node_y.append(y)
+			node_text.append(nodes[i])
+
+		colors = ['blue', 'blue', 'blue', 'red', 'red', 'red']
+		node_trace = go.Scatter(
+			x=node_x, y=node_y,
+			mode='markers+text',
+			text=node_text,
+			textposition="top center",
+			marker=dict(
+				showscale=False,
+				colorscale='YlGnBu',
+				size=30,
+				color=[{'Y': 'royalblue', 'X': 'tomato'}[n[0]] for n in nodes],
+				line_width=2))
+
+		fig = go.Figure(data=[edge_trace, node_trace],
+						layout=go.Layout(
+							title=dict(text='هيكل نموذج ARDL(2,2)', font=dict(size=16)),
+							showlegend=False,
+							hovermode='closest',
+							margin=dict(b=20, l=5, r=5, t=40),
+							xaxis=dict(showgrid=False, zeroline=False, showticklabels=False),
+							yaxis=dict(showgrid=False, zeroline=False, showticklabels=False),
+							height=400,
+							template="plotly_white"
+						))
+
+		st.plotly_chart(fig, use_container_width=True)
+
+		st.markdown("""
+        <div class="highlight">
+        <strong>ملاحظة توضيحية:</strong><br>
+        في الرسم التوضيحي أعلاه، يشير ARDL(2,2) إلى نموذج ARDL مع فجوتين زمنيتين للمتغير التابع Y ومتغير مستقل X مع فجوتين زمنيتين أيضاً.
+        </div>
+        """, unsafe_allow_html=True)
+
+	st.markdown("---")
+
+	st.markdown("""
+    ## منهجية اختبار الحدود (Bound Testing Approach)
+
+    منهجية اختبار الحدود هي طريقة مطورة خصيصاً لنموذج ARDL تستخدم لاختبار وجود علاقة توازنية طويلة الأجل (علاقة تكامل مشترك) بين المتغيرات، بغض النظر عن كون هذه المتغيرات متكاملة من الرتبة صفر I(0) أو من الرتبة الأولى I(1) أو مزيج منهما.
+
+    ### خصائص منهجية اختبار الحدود:
+
+    1. **المرونة**: تسمح باختبار العلاقات بين المتغيرات ذات رتب تكامل مختلفة (عدم الحاجة أن تكون جميع المتغيرات من نفس رتبة التكامل).
+
+    2. **أكثر كفاءة للعينات الصغيرة**: تعطي نتائج أفضل في حالة العينات الصغيرة مقارنة بطرق التكامل المشترك التقليدية.
+
+    3. **نموذج تصحيح الخطأ غير المقيد (UECM)**: تستخدم نموذج تصحيح الخطأ غير المقيد لاختبار التكامل المشترك.
+
+    4. **اختبار F الإحصائي**: تعتمد على مقارنة إحصائية F المحسوبة مع القيم الحرجة (الحدود العليا والدنيا) لتحديد وجود تكامل مشترك.
+    """)
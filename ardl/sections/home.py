@@ -0,0 +1,65 @@
+import streamlit as st
+import plotly.graph_objects as go
+import numpy as np
+
+
+# الصفحة الرئيسية
+def render():
+	st.title("نموذج ARDL وطريقة Bound Testing Approach")
+	st.markdown("---")
+
+	col1, col2 = st.columns([2, 1])
+
+	with col1:
+		st.markdown("""
+        ## مرحباً بك في الدليل النظري الشامل لنموذج ARDL
+
+        يقدم هذا التطبيق شرحاً نظرياً مفصلاً لنموذج الانحدار الذاتي ذو الفجوات الزمنية الموزعة 
+        (Autoregressive Distributed Lag - ARDL) وطريقة اختبار الحدود (Bound Testing Approach).
+
+        هذا الدليل مصمم لمساعدة الباحثين والطلاب في فهم الجوانب النظرية لنموذج ARDL دون الدخول في التطبيقات العملية.
+
+        ### المواضيع الرئيسية:
+        - تعريف نموذج ARDL وخلفيته النظرية
+        - أهداف استخدام النموذج
+        - الفرضيات الأساسية
+        - المزايا والفوائد
+        - خطوات التطبيق النظرية
+        - الصيغ الرياضية
+        - الانتقادات والمشاكل
+        - الحلول المقترحة للمشاكل
+        - التطورات الحديثة مثل ARDL-Fourier
+        """)
+
+	with col2:
+		# إنشاء رسم بياني توضيحي بسيط باستخدام Plotly
+		fig = go.Figure()
+
+		x = np.linspace(0, 10, 100)
+		y1 = np.sin(x) + np.random.normal(0, 0.1, 100)
+		y2 = np.sin(x) + 0.5 + np.random.normal(0, 0.1, 100)
+
+		fig.add_trace(go.Scatter(x=x, y=y1, mode='lines', name='سلسلة Y', line=dict(color='blue')))
+		fig.add_trace(go.Scatter(x=x, y=y2, mode='lines', name='سلسلة X', line=dict(color='red')))
+
+		fig.update_layout(
+			title="مثال توضيحي للعلاقة بين متغيرات النموذج",
+			xaxis_title="الزمن",
+			yaxis_title="القيمة",
+			legend_title="المتغيرات",
+			height=300,
+			margin=dict(l=0, r=0, t=40, b=0),
+			template="plotly_white"
+		)
+
+		st.plotly_chart(fig, use_container_width=True)
+
+	st.markdown("---")
+
+	cols = st.columns(3)
+	with cols[0]:
+		st.info("📚 محتوى نظري شامل")
+	with cols[1]:
+		st.info("📊 رسومات توضيحية باستخدام Plotly")
+	with cols[2]:
+		st.info("🧮 صيغ رياضية مفصلة")
@@ -0,0 +1,157 @@
+import streamlit as st
+import plotly.graph_objects as go
+import plotly.express as px
+import pandas as pd
+
+from ardl.figures import figure, get_figure
+
+
+@figure("objectives.objectives_pie")
+def _objectives_pie():
+	# إنشاء مخطط دائري يوضح أهداف ARDL
+	labels = ['تحليل العلاقات طويلة<br>وقصيرة الأجل', 'اختبار التكامل المشترك',
+			  'نمذجة تصحيح الخطأ', 'التنبؤ الاقتصادي', 'تحليل السببية']
+	values = [30, 25, 20, 15, 10]
+	colors = ['royalblue', 'tomato', 'gold', 'mediumseagreen', 'mediumpurple']
+
+	fig = go.Figure(data=[go.Pie(labels=labels, values=values, hole=.4,
+								 textinfo='label+percent',
+								 marker=dict(colors=colors),
+								 textposition='outside',
+								 pull=[0.1, 0, 0, 0, 0])])
+
+	fig.update_layout(
+		title="أهداف استخدام نموذج ARDL",
+		height=400,
+		margin=dict(l=0, r=0, t=40, b=0),
+		template="plotly_white"
+	)
+
+	return fig
+
+
+@figure("objectives.application_fields")
+def _application_fields():
+	# مخطط إحصائي للمجالات التطبيقية
+	fields = ['الاقتصاد الكلي', 'الاقتصاد المالي', 'اقتصاديات الطاقة', 'التنمية الاقتصادية', 'التجارة الدولية']
+	percentages = [35, 25, 20, 12, 8]
+
+	fig = go.Figure(go.Bar(
+		x=percentages,
+		y=fields,
+		orientation='h',
+		marker=dict(
+			color=['rgba(30, 136, 229, 0.8)', 'rgba(30, 136, 229, 0.7)',
+				   'rgba(30, 136, 229, 0.6)', 'rgba(30, 136, 229, 0.5)',
+				   'rgba(30, 136, 229, 0.4)']
+		)
+	))
+
+	fig.update_layout(
+		title="المجالات التطبيقية الرئيسية لنموذج ARDL (النسبة المئوية للأبحاث)",
+		xaxis_title="النسبة المئوية %",
+		height=350,
+		margin=dict(l=0, r=0, t=40, b=0),
+		template="plotly_white"
+	)
+
+	return fig
+
+
+# أهداف ARDL
+def render():
+	st.title("أهداف استخدام نموذج ARDL")
+	st.markdown("---")
+
+	col1, col2 = st.columns([3, 2])
+
+	with col1:
+		st.markdown("""
+        ## الأهداف الرئيسية لاستخدام نموذج ARDL
+
+        ### 1. تحليل العلاقات طويلة وقصيرة الأجل
+
+        الهدف الأساسي لنموذج ARDL هو دراسة العلاقات بين المتغيرات الاقتصادية على المدى القصير والطويل في آن واحد. هذا يمكّن الباحثين من:
+
+        - تحديد التأثيرات الآنية بين المتغيرات
+        - فهم التأثيرات المستمرة عبر الزمن
+        - قياس سرعة التكيف نحو التوازن طويل الأجل
+
+        ### 2. اختبار التكامل المشترك بين المتغيرات
+
+        يستخدم نموذج ARDL للتحقق من وجود علاقة توازنية طويلة الأجل بين المتغيرات، حتى عندما تكون رتب تكاملها مختلفة:
+
+        - التغلب على قيود طرق التكامل المشترك التقليدية (مثل Johansen وEngle-Granger)
+        - الكشف عن التكامل المشترك بين المتغيرات المتكاملة من الرتب I(0) وI(1)
+
+        ### 3. نمذجة تصحيح الخطأ
+
+        يتيح نموذج ARDL اشتقاق نموذج تصحيح الخطأ (ECM) مباشرةً، مما يسمح:
+
+        - بقياس سرعة تصحيح الانحرافات عن التوازن طويل الأجل
+        - بدراسة آلية التكيف نحو التوازن
+        - بتحديد اتجاه العلاقة السببية بين المتغيرات
+
+        ### 4. التنبؤ الاقتصادي
+
+        يمكن استخدام نموذج ARDL في:
+
+        - التنبؤ بالقيم المستقبلية للمتغيرات الاقتصادية
+        - تحليل السيناريوهات المستقبلية
+        - صياغة السياسات الاقتصادية المبنية على النماذج الكمية
+        """)
+
+	with col2:
+		fig = get_figure("objectives.objectives_pie")
+		st.plotly_chart(fig, use_container_width=True)
+
+		# إضافة خط زمني للتطبيقات
+		applications = [
+			{"year": 1970, "event": "بداية استخدام نماذج الفجوات الزمنية الموزعة في الاقتصاد"},
+			{"year": 1996, "event": "تطوير منهجية ARDL بواسطة Pesaran و Shin"},
+			{"year": 2001, "event": "تطوير اختبار الحدود Bound Test بواسطة Pesaran وآخرون"},
+			{"year": 2010, "event": "توسع استخدام ARDL في دراسات النمو الاقتصادي"},
+			{"year": 2015, "event": "دمج ARDL مع تقنيات Fourier للتغيرات الهيكلية"}
+		]
+
+		df = pd.DataFrame(applications)
+
+		# خط زمني بالسنوات: نقاط على محور السنة (px.timeline يتطلب تاريخي بداية ونهاية)
+		fig = px.scatter(df, x="year", y="event", color_discrete_sequence=['royalblue'])
+		fig.update_traces(mode="lines+markers", marker=dict(size=12))
+		fig.update_layout(
+			title="التطور التاريخي لتطبيقات ARDL",
+			xaxis=dict(title="السنة"),
+			yaxis=dict(title=""),
+			height=300,
+			margin=dict(l=0, r=0, t=40, b=0)
+		)
+
+		fig.update_yaxes(autorange="reversed")
+		st.plotly_chart(fig, use_container_width=True)
+
+	st.markdown("---")
+
+	st.markdown("""
+    ## أهمية نموذج ARDL في مجالات التطبيق المختلفة
+
+    نموذج ARDL له أهمية كبيرة في مختلف المجالات التطبيقية، خاصة في:
+
+    ### الاقتصاد الكلي
+    - نمذجة النمو الاقتصادي والعلاقة بين المتغيرات الاقتصادية الكلية
+    - تحليل علاقات الاستهلاك والاستثمار على المدى الطويل
+    - دراسة تأثيرات السياسات النقدية والمالية
+
+    ### الاقتصاد المالي
+    - دراسة العلاقات بين أسواق الأسهم والمتغيرات الاقتصادية
+    - تحليل العلاقة بين أسعار الصرف وميزان المدفوعات
+    - نمذجة التضخم وأسعار الفائدة
+
+    ### اقتصاديات الطاقة والبيئة
+    - تحليل العلاقة بين استهلاك الطاقة والنمو الاقتصادي
+    - دراسة العلاقة بين التلوث البيئي والنشاط الاقتصادي
+    - نمذجة العلاقة بين أسعار النفط والمتغيرات الاقتصادية الكلية
+    """)
+
+	fig = get_figure("objectives.application_fields")
+	st.plotly_chart(fig, use_container_width=True)
@@ -0,0 +1,6 @@
+import streamlit as st
+
+
+# قسم لم يُضف محتواه بعد
+def render():
+	st.info("محتوى هذا القسم قيد الإعداد.")
@@ -0,0 +1,1379 @@
+import streamlit as st
+import plotly.graph_objects as go
+import numpy as np
+import pandas as pd
+import statsmodels.api as sm
+from plotly.subplots import make_subplots
+
+from ardl.bootstrap import SCHEME_LABELS, bootstrap_bounds
+from ardl.bounds import bounds_test
+from ardl.breaks import break_dummies, multiple_breaks
+from ardl.figures import figure, get_figure
+from ardl.fourier import FourierARDL, fourier_basis
+from ardl.midas import MIDAS, midas_lags, midas_weights
+from ardl.model import ARDL
+from ardl.nardl import NARDL, partial_sums
+from ardl.unitroot import fourier_screen
+
+
+@figure("solutions.bootstrap")
+def _bootstrap(nobs=30, reps=10000, seed=42, tol=0.25, scheme="iid"):
+	# عينة صغيرة توضيحية بعلاقة تكامل مشترك ضعيفة بين y وx
+	rng = np.random.default_rng(seed)
+	x = np.cumsum(rng.normal(0, 1, nobs))
+	y = np.zeros(nobs)
+	for t in range(1, nobs):
+		y[t] = 0.7 * y[t - 1] + 0.3 * x[t] + rng.normal(0, 1)
+
+	results = ARDL(y, x, 1, 1, trend="c").fit()
+	# يتوقف كل اختبار عندما يصبح الخطأ المعياري لمونت كارلو للقيم الحرجة أقل من tol
+	boot = bootstrap_bounds(results, case="III", reps=reps, seed=seed, tol=tol, scheme=scheme)
+	test = bounds_test(results, case="III")
+	original_f = boot.observed["f"]
+	critical_values = boot.critical_values("f")
+
+	# إنشاء الرسم البياني
+	fig = go.Figure()
+
+	# إضافة التوزيع التكراري
+	fig.add_trace(go.Histogram(
+		x=boot.draws["f"],
+		nbinsx=60,
+		marker_color='lightblue',
+		opacity=0.7,
+		name='توزيع Bootstrap لإحصائية F'
+	))
+
+	# إضافة خطوط رأسية للقيم الحرجة
+	for level, color in [(0.01, 'red'), (0.05, 'orange')]:
+		fig.add_vline(x=critical_values[level], line=dict(color=color, width=2, dash='dash'))
+		fig.add_trace(go.Scatter(
+			x=[None],
+			y=[None],
+			mode='lines',
+			name=f'القيمة الحرجة عند {level:.0%}',
+			line=dict(color=color, width=2, dash='dash')
+		))
+
+	# الحد الأعلى الجدولي عند 5% للمقارنة
+	fig.add_vline(x=test.bounds("f")[0.05][1], line=dict(color='gray', width=2, dash='dot'))
+	fig.add_trace(go.Scatter(
+		x=[None],
+		y=[None],
+		mode='lines',
+		name='الحد الأعلى I(1) لـ PSS عند 5%',
+		line=dict(color='gray', width=2, dash='dot')
+	))
+
+	# إضافة خط رأسي للإحصائية الأصلية
+	fig.add_vline(x=original_f, line=dict(color='green', width=3))
+	fig.add_trace(go.Scatter(
+		x=[None],
+		y=[None],
+		mode='lines',
+		name='إحصائية F الأصلية',
+		line=dict(color='green', width=3)
+	))
+
+	fig.update_layout(
+		title=f"Bootstrap ARDL المشروط ({SCHEME_LABELS[scheme]}): توزيع إحصائية F تحت فرضية العدم (n={boot.nobs}، B={boot.reps['f']})",
+		xaxis_title="قيمة إحصائية F",
+		yaxis_title="التكرار",
+		height=500,
+		template="plotly_white",
+		showlegend=True
+	)
+
+	names = {"f": "F (جميع المستويات)", "t": "t (المتغير التابع)", "f_exog": "F (المتغيرات المستقلة)"}
+	df_cv = pd.DataFrame({
+		'الإحصائية': [names[stat] for stat in boot.draws],
+		'القيمة المحسوبة': [round(boot.observed[stat], 3) for stat in boot.draws],
+		**{f'القيمة الحرجة {level:.0%}': [round(boot.critical_values(stat)[level], 3) for stat in boot.draws]
+		   for level in (0.10, 0.05, 0.01)},
+		'القيمة الاحتمالية (Bootstrap)': [round(boot.pvalue(stat), 3) for stat in boot.draws],
+		'عدد التكرارات B': [boot.reps[stat] for stat in boot.draws],
+		'الخطأ المعياري للقيمة الحرجة 5%': [round(boot.standard_errors(stat)[0.05], 3) for stat in boot.draws]
+	})
+
+	return fig, df_cv
+
+
+@figure("solutions.dummy_variables")
+def _dummy_variables(nobs=100, max_breaks=3, trim=0.15, seed=42):
+	# إنشاء رسم توضيحي للتغير الهيكلي ومعالجته
+	np.random.seed(seed)
+
+	# توليد بيانات بتغير هيكلي
+	x = np.linspace(0, 10, nobs)
+
+	# نقطة التغير الهيكلي الحقيقية (غير معروفة عند التقدير)
+	break_point = nobs // 2
+
+	# توليد متغير تابع مع تغير هيكلي
+	e = np.random.normal(0, 0.5, nobs)
+	y = np.zeros(nobs)
+	y[:break_point] = 2 + 0.5 * x[:break_point] + e[:break_point]  # قبل التغير
+	y[break_point:] = 4 + 1.5 * x[break_point:] + e[break_point:]  # بعد التغير
+
+	# تقدير عدد الانكسارات وتواريخها بطريقة Bai-Perron واختيار العدد بمعيار BIC
+	X_no_dummy = sm.add_constant(x)
+	breaks = multiple_breaks(X_no_dummy, y, max_breaks, trim)
+	dates = breaks.dates[breaks.nbreaks("bic")]
+
+	# إنشاء المتغيرات الوهمية وتفاعلاتها مع X تلقائيا عند التواريخ المقدرة
+	dummies = break_dummies(nobs, dates, pd.Series(x, name="X"))
+	level_dummies = dummies[[f"D{j}" for j in range(1, len(dates) + 1)]]
+
+	# تقدير نموذج بدون متغير وهمي
+	model_no_dummy = sm.OLS(y, X_no_dummy)
+	results_no_dummy = model_no_dummy.fit()
+	y_pred_no_dummy = results_no_dummy.predict()
+
+	# تقدير نموذج مع متغير وهمي للمستوى
+	X_level_dummy = sm.add_constant(np.column_stack((x, level_dummies)))
+	model_level_dummy = sm.OLS(y, X_level_dummy)
+	results_level_dummy = model_level_dummy.fit()
+	y_pred_level_dummy = results_level_dummy.predict()
+
+	# تقدير نموذج مع متغير وهمي للمستوى والميل
+	X_full_dummy = sm.add_constant(np.column_stack((x, dummies)))
+	model_full_dummy = sm.OLS(y, X_full_dummy)
+	results_full_dummy = model_full_dummy.fit()
+	y_pred_full_dummy = results_full_dummy.predict()
+
+	# إنشاء الرسم البياني
+	fig = go.Figure()
+
+	# البيانات الفعلية
+	fig.add_trace(go.Scatter(
+		x=x,
+		y=y,
+		mode='markers',
+		name='البيانات الفعلية',
+		marker=dict(color='gray', size=8)
+	))
+
+	# النموذج بدون متغير وهمي
+	fig.add_trace(go.Scatter(
+		x=x,
+		y=y_pred_no_dummy,
+		mode='lines',
+		name='النموذج بدون متغير وهمي',
+		line=dict(color='red', width=2)
+	))
+
+	# النموذج مع متغير وهمي للمستوى
+	fig.add_trace(go.Scatter(
+		x=x,
+		y=y_pred_level_dummy,
+		mode='lines',
+		name='النموذج مع متغير وهمي للمستوى',
+		line=dict(color='blue', width=2)
+	))
+
+	# النموذج مع متغير وهمي للمستوى والميل
+	fig.add_trace(go.Scatter(
+		x=x,
+		y=y_pred_full_dummy,
+		mode='lines',
+		name='النموذج مع متغير وهمي للمستوى والميل',
+		line=dict(color='green', width=2)
+	))
+
+	# إضافة خط رأسي عند كل نقطة تغير هيكلي مقدرة
+	for date in dates:
+		fig.add_shape(
+			type="line",
+			x0=x[date - 1],
+			y0=min(y),
+			x1=x[date - 1],
+			y1=max(y),
+			line=dict(color="black", width=2, dash="dash")
+		)
+
+		fig.add_annotation(
+			x=x[date - 1],
+			y=max(y),
+			text="نقطة التغير الهيكلي المقدرة",
+			showarrow=True,
+			arrowhead=2,
+			ax=40,
+			ay=-40
+		)
+
+	fig.update_layout(
+		title="معالجة التغير الهيكلي باستخدام المتغيرات الوهمية",
+		xaxis_title="المتغير المستقل X",
+		yaxis_title="المتغير التابع Y",
+		height=500,
+		template="plotly_white"
+	)
+
+
+	# جدول يلخص المعلمات المقدرة
+
+	model_comparison = {
+		'النموذج': [
+			'بدون متغير وهمي',
+			'مع متغير وهمي للمستوى',
+			'مع متغير وهمي للمستوى والميل'
+		],
+		'معامل التحديد R²': [
+			f"{results_no_dummy.rsquared:.3f}",
+			f"{results_level_dummy.rsquared:.3f}",
+			f"{results_full_dummy.rsquared:.3f}"
+		],
+		'الثابت': [
+			f"{results_no_dummy.params[0]:.3f}",
+			f"{results_level_dummy.params[0]:.3f}",
+			f"{results_full_dummy.params[0]:.3f}"
+		],
+		'معامل X': [
+			f"{results_no_dummy.params[1]:.3f}",
+			f"{results_level_dummy.params[1]:.3f}",
+			f"{results_full_dummy.params[1]:.3f}"
+		],
+		'معامل المتغير الوهمي': [
+			"-",
+			", ".join(f"{v:.3f}" for v in results_level_dummy.params[2:]),
+			", ".join(f"{v:.3f}" for v in results_full_dummy.params[2:2 + len(dates)])
+		],
+		'معامل (X × المتغير الوهمي)': [
+			"-",
+			"-",
+			", ".join(f"{v:.3f}" for v in results_full_dummy.params[2 + len(dates):])
+		]
+	}
+
+	df_model_comparison = pd.DataFrame(model_comparison)
+
+	# جدول اختيار عدد الانكسارات: المعايير واختبارات sup-F(l+1|l) المتتابعة
+	pvalues = breaks.pvalues()
+	df_breaks = pd.DataFrame({
+		'عدد الانكسارات': np.arange(max_breaks + 1),
+		'تواريخ الانكسار (X)': [", ".join(f"{x[d - 1]:.2f}" for d in dates_l) or "-" for dates_l in breaks.dates],
+		'BIC': np.round(breaks.bic, 4),
+		'LWZ': np.round(breaks.lwz, 4),
+		'sup-F(l+1|l)': [f"{f:.2f}" for f in breaks.fstats] + ["-"],
+		'القيمة الاحتمالية': [f"{p:.4f}" for p in pvalues] + ["-"]
+	})
+
+	return fig, df_model_comparison, df_breaks
+
+
+@figure("solutions.nardl")
+def _nardl(nobs=200, horizon=20, reps=499, seed=42):
+	# إنشاء رسم توضيحي للعلاقات غير المتماثلة
+	np.random.seed(seed)
+
+	# توليد متغير مستقل
+	x = np.random.normal(0, 1, nobs)
+	x = np.cumsum(x)  # لجعله غير مستقر
+
+	# تجزئة المتغير المستقل إلى المجاميع الجزئية للتغيرات السالبة والموجبة
+	x_neg, x_pos = partial_sums(x).T
+
+	# توليد متغير تابع من نموذج NARDL(1, 0): معاملات الأجل الطويل 0.8 للزيادات و1.5- للانخفاضات
+	e = np.random.normal(0, 0.5, nobs)
+	y = np.zeros(nobs)
+	y[0] = 2 + 0.8 * x_pos[0] - 1.5 * x_neg[0] + e[0]
+	for t in range(1, nobs):
+		y[t] = 1 + 0.5 * y[t - 1] + 0.4 * x_pos[t] - 0.75 * x_neg[t] + e[t]
+
+	# تقدير نموذج ARDL خطي ونموذج NARDL بنفس الفجوات
+	results_linear = ARDL(pd.Series(y, name="Y"), pd.Series(x, name="X"), 1, 1).fit()
+	nardl = NARDL(pd.Series(y, name="Y"), pd.Series(x, name="X"), 1, 1).fit()
+	results_nonlinear = nardl.results
+	time_index = list(range(results_linear.model.maxlag, nobs))
+	y_pred_linear = results_linear.fittedvalues
+	y_pred_nonlinear = results_nonlinear.fittedvalues
+
+	# الرسم البياني للبيانات وتقديرات النماذج المختلفة
+	fig = make_subplots(rows=2, cols=1,
+						subplot_titles=("المتغير المستقل الأصلي وتجزئته",
+										"مقارنة النموذج الخطي والنموذج غير المتماثل"),
+						vertical_spacing=0.15,
+						row_heights=[0.4, 0.6])
+
+	# المتغير المستقل وتجزئته
+	fig.add_trace(
+		go.Scatter(x=list(range(nobs)), y=x, mode='lines', name='المتغير الأصلي X',
+				   line=dict(color='black', width=2)),
+		row=1, col=1
+	)
+
+	fig.add_trace(
+		go.Scatter(x=list(range(nobs)), y=x_pos, mode='lines', name='X⁺ (التغيرات الإيجابية)',
+				   line=dict(color='green', width=2)),
+		row=1, col=1
+	)
+
+	fig.add_trace(
+		go.Scatter(x=list(range(nobs)), y=x_neg, mode='lines', name='X⁻ (التغيرات السلبية)',
+				   line=dict(color='red', width=2)),
+		row=1, col=1
+	)
+
+	# البيانات والتنبؤات
+	fig.add_trace(
+		go.Scatter(x=list(range(nobs)), y=y, mode='markers', name='البيانات الفعلية',
+				   marker=dict(color='gray', size=8)),
+		row=2, col=1
+	)
+
+	fig.add_trace(
+		go.Scatter(x=time_index, y=y_pred_linear, mode='lines', name='النموذج الخطي',
+				   line=dict(color='blue', width=2)),
+		row=2, col=1
+	)
+
+	fig.add_trace(
+		go.Scatter(x=time_index, y=y_pred_nonlinear, mode='lines', name='النموذج غير المتماثل',
+				   line=dict(color='purple', width=2)),
+		row=2, col=1
+	)
+
+	fig.update_layout(
+		title="توضيح لنموذج NARDL: التأثيرات غير المتماثلة",
+		height=700,
+		template="plotly_white",
+		legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
+	)
+
+	fig.update_xaxes(title_text="الزمن", row=2, col=1)
+	fig.update_yaxes(title_text="القيمة", row=1, col=1)
+	fig.update_yaxes(title_text="المتغير التابع Y", row=2, col=1)
+
+	# المضاعفات الديناميكية التراكمية ومنحنى عدم التماثل مع نطاق ثقة Bootstrap بنسبة 95%
+	curves = nardl.multipliers(horizon)["X"]
+	bands = nardl.bootstrap_multipliers(horizon, reps, seed=seed)["X"]
+	fig_multipliers = go.Figure()
+	fig_multipliers.add_trace(go.Scatter(
+		x=np.concatenate([bands.index, bands.index[::-1]]),
+		y=np.concatenate([bands["upper"], bands["lower"][::-1]]),
+		fill='toself', fillcolor='rgba(128, 0, 128, 0.15)', line=dict(width=0),
+		name='نطاق الثقة 95% لعدم التماثل'
+	))
+	fig_multipliers.add_trace(go.Scatter(x=curves.index, y=curves["X⁺"], mode='lines', name='المضاعف التراكمي لـ X⁺',
+										 line=dict(color='green', width=2)))
+	fig_multipliers.add_trace(go.Scatter(x=curves.index, y=curves["X⁻"], mode='lines', name='المضاعف التراكمي لـ X⁻',
+										 line=dict(color='red', width=2)))
+	fig_multipliers.add_trace(go.Scatter(x=curves.index, y=curves["asymmetry"], mode='lines', name='عدم التماثل (X⁺ - X⁻)',
+										 line=dict(color='purple', width=2, dash='dash')))
+	fig_multipliers.add_hline(y=0, line=dict(color='gray', width=1))
+	fig_multipliers.update_layout(
+		title="المضاعفات الديناميكية التراكمية غير المتماثلة",
+		xaxis_title="الأفق (فترات بعد الصدمة)",
+		yaxis_title="الأثر التراكمي على Y",
+		height=450,
+		template="plotly_white"
+	)
+
+	# ملخص النتائج المعروضة في الصفحة
+	long_run = nardl.long_run.summary_frame()["coef"]
+	summary = {
+		'linear': {'long_run': float(results_linear.long_run.params[-1]),
+				   'rsquared': float(results_linear.rsquared)},
+		'nonlinear': {'long_run': [float(long_run["X⁺"]), float(long_run["X⁻"])],
+					  'rsquared': float(results_nonlinear.rsquared)}
+	}
+	df_tests = nardl.asymmetry_tests().round(4)
+	df_tests.index = ['عدم التماثل في الأجل الطويل', 'عدم التماثل في الأجل القصير']
+
+	return fig, fig_multipliers, summary, df_tests
+
+
+@figure("solutions.fourier")
+def _fourier(nobs=100, seed=42):
+	# إنشاء رسم توضيحي لدوال فورييه ودورها في التقاط التغيرات الهيكلية
+	rng = np.random.default_rng(seed)
+	t = np.arange(1, nobs + 1)
+
+	# دوال فورييه لقيم k = 1 و 2 من المصفوفة المخزنة مؤقتاً
+	(sin_k1, cos_k1), (sin_k2, cos_k2) = fourier_basis(nobs, [1, 2]).transpose(1, 2, 0)
+
+	# تغير هيكلي تدريجي (غير حاد) في ثابت العلاقة طويلة الأجل بتردد كسري k = 0.7
+	structural_change = 2 + 3 * np.sin(2 * np.pi * 0.7 * t / nobs) + 1.5 * np.cos(2 * np.pi * 0.7 * t / nobs)
+
+	# توليد بيانات من نموذج تصحيح خطأ نحو التوازن y = ثابت متغير + 0.5 x
+	x = np.cumsum(rng.normal(0, 1, nobs))
+	y = np.zeros(nobs)
+	y[0] = structural_change[0] + 0.5 * x[0]
+	for i in range(1, nobs):
+		gap = y[i - 1] - structural_change[i - 1] - 0.5 * x[i - 1]
+		y[i] = y[i - 1] - 0.4 * gap + 0.3 * (x[i] - x[i - 1]) + rng.normal(0, 0.5)
+	endog, exog = pd.Series(y, name="Y"), pd.Series(x, name="X")
+
+	# البحث عن التردد k (بما فيه الكسري) بأقل مجموع مربعات بواقٍ، ونماذج k = 1 و 2 للمقارنة
+	model = FourierARDL(endog, exog, 1, 1)
+	fourier = model.fit()
+	results_no_fourier = fourier.base
+	results_fourier_k1 = ARDL(endog, exog, 1, 1, fixed=model.terms(1)).fit()
+	results_fourier_k2 = ARDL(endog, exog, 1, 1, fixed=pd.concat([model.terms(1), model.terms(2)], axis=1)).fit()
+
+	# الرسم البياني للدوال الأساسية
+	fig1 = go.Figure()
+
+	fig1.add_trace(go.Scatter(
+		x=t,
+		y=sin_k1,
+		mode='lines',
+		name='sin(2πt/T)',
+		line=dict(color='royalblue', width=2)
+	))
+
+	fig1.add_trace(go.Scatter(
+		x=t,
+		y=cos_k1,
+		mode='lines',
+		name='cos(2πt/T)',
+		line=dict(color='tomato', width=2)
+	))
+
+	fig1.add_trace(go.Scatter(
+		x=t,
+		y=sin_k2,
+		mode='lines',
+		name='sin(4πt/T)',
+		line=dict(color='green', width=2)
+	))
+
+	fig1.add_trace(go.Scatter(
+		x=t,
+		y=cos_k2,
+		mode='lines',
+		name='cos(4πt/T)',
+		line=dict(color='purple', width=2)
+	))
+
+	fig1.update_layout(
+		title="دوال فورييه الأساسية المستخدمة في ARDL-Fourier",
+		xaxis_title="الزمن",
+		yaxis_title="القيمة",
+		height=400,
+		template="plotly_white"
+	)
+
+	# الثابت طويل الأجل المقدر: (الثابت + مكون فورييه) / (1 - معامل y(-1))
+	def long_run_intercept(results):
+		terms = 1 + len(results.model.fixed_names)
+		shift = results.exog[:, :terms] @ results.params[:terms]
+		return shift / (1 - results.params[results.names.index("Y(-1)")])
+
+	time_index = t[1:]
+
+	# الرسم البياني للتغير الهيكلي الفعلي والمقدر
+	fig2 = go.Figure()
+
+	fig2.add_trace(go.Scatter(
+		x=time_index,
+		y=structural_change[1:],
+		mode='lines',
+		name='الثابت طويل الأجل الفعلي',
+		line=dict(color='gray', width=3)
+	))
+
+	fig2.add_trace(go.Scatter(
+		x=time_index,
+		y=np.full(len(time_index), results_no_fourier.long_run.params[0]),
+		mode='lines',
+		name='النموذج بدون فورييه',
+		line=dict(color='red', width=2)
+	))
+
+	fig2.add_trace(go.Scatter(
+		x=time_index,
+		y=long_run_intercept(results_fourier_k1),
+		mode='lines',
+		name='النموذج مع فورييه (k=1)',
+		line=dict(color='blue', width=2, dash='dash')
+	))
+
+	fig2.add_trace(go.Scatter(
+		x=time_index,
+		y=long_run_intercept(fourier.results),
+		mode='lines',
+		name=f'النموذج مع فورييه (k={fourier.frequency:g})',
+		line=dict(color='green', width=2)
+	))
+
+	fig2.update_layout(
+		title="الثابت طويل الأجل المتغير تدريجياً: الفعلي والمقدر بنماذج ARDL-Fourier",
+		xaxis_title="الزمن",
+		yaxis_title="الثابت طويل الأجل",
+		height=500,
+		template="plotly_white"
+	)
+
+	# منحنى مجموع مربعات البواقي على شبكة الترددات
+	fig3 = go.Figure()
+
+	fig3.add_trace(go.Scatter(
+		x=fourier.ssr.index,
+		y=fourier.ssr,
+		mode='lines+markers',
+		name='SSR(k)',
+		marker=dict(size=5),
+		line=dict(color='royalblue', width=2)
+	))
+
+	fig3.add_vline(x=fourier.frequency, line=dict(color='green', width=2, dash='dash'),
+				   annotation_text=f"k* = {fourier.frequency:g}")
+
+	fig3.update_layout(
+		title="اختيار تردد فورييه k بأقل مجموع مربعات بواقٍ (ترددات صحيحة وكسرية)",
+		xaxis_title="التردد k",
+		yaxis_title="مجموع مربعات البواقي",
+		height=400,
+		template="plotly_white"
+	)
+
+	# جدول مقارنة النماذج
+	models = [results_no_fourier, results_fourier_k1, results_fourier_k2, fourier.results]
+	models_comparison = {
+		'النموذج': [
+			'بدون فورييه',
+			'فورييه (k=1)',
+			'فورييه (k=1، 2)',
+			f'فورييه (k*={fourier.frequency:g})'
+		],
+		'معامل التحديد R²': [f"{results.rsquared:.3f}" for results in models],
+		'AIC': [f"{results.aic:.2f}" for results in models],
+		'BIC': [f"{results.bic:.2f}" for results in models],
+		'عدد المعلمات': [str(len(results.params)) for results in models]
+	}
+
+	df_models_comparison = pd.DataFrame(models_comparison)
+
+	# اختبار الحدود بقيم Fourier الحرجة مقارنة بقيم PSS التقليدية (5%)
+	test = fourier.bounds_test()
+	pss = bounds_test(fourier.results)
+	rows = []
+	for stat, name, value in [("f", "F", test.fstat), ("t", "t", test.tstat)]:
+		fourier_bounds, pss_bounds = test.bounds(stat)[0.05], pss.bounds(stat)[0.05]
+		rows.append({
+			'الإحصاءة': name,
+			'القيمة': f"{value:.3f}",
+			'حدود Fourier عند 5% (I(0)، I(1))': f"{fourier_bounds[0]:.2f}، {fourier_bounds[1]:.2f}",
+			'حدود PSS عند 5% (I(0)، I(1))': f"{pss_bounds[0]:.2f}، {pss_bounds[1]:.2f}",
+			'القيمة الاحتمالية I(1) (Fourier)': f"{test.pvalue(stat)[1]:.4f}",
+			'القرار (Fourier)': {"reject": "رفض عدم التكامل المشترك", "accept": "قبول عدم التكامل المشترك",
+								 "inconclusive": "غير حاسم"}[test.decision(0.05, stat)]
+		})
+	df_bounds = pd.DataFrame(rows)
+
+	return fig1, fig2, fig3, df_models_comparison, df_bounds
+
+
+@figure("solutions.fourier_screen")
+def _fourier_screen(nobs=150, seed=42):
+	# مجموعة سلاسل برتب تكامل مختلفة، بعضها بتغيرات هيكلية تدريجية، تُفحص كلها دفعة واحدة
+	rng = np.random.default_rng(seed)
+	t = np.arange(1, nobs + 1)
+	smooth_break = 3 * np.sin(2 * np.pi * 1.5 * t / nobs)
+	noise = rng.normal(0, 1, (nobs, 6))
+	stationary = np.zeros(nobs)
+	for i in range(1, nobs):
+		stationary[i] = 0.5 * stationary[i - 1] + noise[i, 0]
+	series = pd.DataFrame({
+		'I(0)': stationary,
+		'I(0) مع تغير تدريجي': stationary + smooth_break,
+		'I(1)': np.cumsum(noise[:, 1]),
+		'I(1) مع تغير تدريجي': np.cumsum(noise[:, 2]) + smooth_break,
+		'I(2)': np.cumsum(np.cumsum(noise[:, 3])) / 10,
+		'I(2) مع تغير تدريجي': np.cumsum(np.cumsum(noise[:, 4])) / 10 + smooth_break
+	})
+
+	screen = fourier_screen(series)
+
+	fig = go.Figure()
+	colors = ['green', 'seagreen', 'royalblue', 'navy', 'red', 'darkred']
+	for name, color in zip(series.columns, colors):
+		fig.add_trace(go.Scatter(x=t, y=series[name], mode='lines', name=name, line=dict(color=color, width=1.5)))
+	fig.update_layout(
+		title="سلاسل برتب تكامل مختلفة تُفحص معاً باختبارات Fourier",
+		xaxis_title="الزمن",
+		yaxis_title="القيمة",
+		height=400,
+		template="plotly_white"
+	)
+
+	df_screen = pd.DataFrame({
+		'السلسلة': screen.index,
+		'FADF (المستوى)': screen[('FADF', 'levels', 'statistic')].map('{:.2f}'.format),
+		'k (المستوى)': screen[('FADF', 'levels', 'frequency')].map('{:g}'.format),
+		'القيمة الاحتمالية (المستوى)': screen[('FADF', 'levels', 'pvalue')].map('{:.3f}'.format),
+		'FADF (الفرق الأول)': screen[('FADF', 'differences', 'statistic')].map('{:.2f}'.format),
+		'القيمة الاحتمالية (الفرق الأول)': screen[('FADF', 'differences', 'pvalue')].map('{:.3f}'.format),
+		'FKPSS p (المستوى)': screen[('FKPSS', 'levels', 'pvalue')].map('{:.3f}'.format),
+		'رتبة التكامل': screen['order'].map({0: 'I(0)', 1: 'I(1)', 2: 'I(2) أو أعلى'})
+	}).reset_index(drop=True)
+
+	return fig, df_screen
+
+
+@figure("solutions.midas_weights")
+def _midas_weights(nlags=21):
+	# أوزان كل متجهات المعلمات لكل دالة وزن تُحسب باستدعاء واحد (مصفوفة متجهات × عدد الفجوات)
+	curves = [
+		("beta", [[1, 3], [2, 5], [6, 2]], [
+			('Beta(1,3) - انحياز للفجوات القريبة', 'royalblue'),
+			('Beta(2,5) - توزيع جرسي', 'tomato'),
+			('Beta(6,2) - انحياز للفجوات البعيدة', 'green')
+		]),
+		("almon", [[-1, -3]], [('Almon الأسية - متناقصة تدريجياً', 'purple')]),
+		("exp", [[4]], [('Exponential - تناقص أسي', 'orange')])
+	]
+
+	# الرسم البياني لدوال الوزن
+	fig = go.Figure()
+
+	for kind, theta, styles in curves:
+		weights = midas_weights(kind, theta, nlags)
+		for w, (name, color) in zip(weights, styles):
+			fig.add_trace(go.Scatter(
+				x=np.arange(nlags),
+				y=w,
+				mode='lines+markers',
+				name=name,
+				line=dict(color=color, width=2)
+			))
+
+	fig.update_layout(
+		title="أمثلة لدوال الوزن المستخدمة في نماذج ARDL-MIDAS",
+		xaxis_title="الفجوة الزمنية",
+		yaxis_title="الوزن",
+		height=500,
+		template="plotly_white"
+	)
+
+	return fig
+
+
+@figure("solutions.midas")
+def _midas(nquarters=120, seed=42):
+	# بيانات شهرية (التضخم والتغير في البطالة) وناتج فصلي، بثلاث مشاهدات شهرية لكل ربع
+	rng = np.random.default_rng(seed)
+	m, periods = 3, 4
+	nlags = m * periods
+	nmonths = m * nquarters
+
+	inflation = np.zeros(nmonths)
+	unemployment = np.zeros(nmonths)
+	for i in range(1, nmonths):
+		inflation[i] = 0.6 * inflation[i - 1] + rng.normal(0, 1)
+		unemployment[i] = 0.3 * unemployment[i - 1] + rng.normal(0, 0.5)
+	monthly = pd.DataFrame({"CPI": inflation, "UNEMP": unemployment})
+
+	# الأوزان الحقيقية: التضخم يؤثر بسرعة ويتلاشى، والبطالة بتأثير متأخر على شكل جرس
+	true_effects = {
+		"CPI": -0.8 * midas_weights("beta", [1, 4], nlags),
+		"UNEMP": -1.5 * midas_weights("beta", [2, 4], nlags)
+	}
+	cpi_lags = midas_lags(inflation, m, periods)
+	unemp_lags = midas_lags(unemployment, m, periods)
+	gdp = np.zeros(nquarters)
+	for t in range(periods - 1, nquarters):
+		i = t - periods + 1
+		gdp[t] = (0.5 + 0.3 * gdp[t - 1] + cpi_lags[i] @ true_effects["CPI"]
+				  + unemp_lags[i] @ true_effects["UNEMP"] + rng.normal(0, 0.3))
+	endog = pd.Series(gdp, name="GDP")
+
+	midas = MIDAS(endog, monthly, 1, m, periods, weights="beta").fit()
+
+	# للمقارنة: ARDL على المتوسطات الفصلية بنفس عدد الأرباع المتأخرة
+	quarterly = monthly.groupby(np.arange(nmonths) // m).mean()
+	averaged = ARDL(endog, quarterly, 1, periods - 1).fit()
+
+	# الأوزان الشهرية المقدرة مقابل الحقيقية، والأوزان الضمنية للمتوسط الفصلي (ثابتة داخل كل ربع)
+	fig = make_subplots(rows=1, cols=2, subplot_titles=["التضخم الشهري (CPI)", "التغير في البطالة (UNEMP)"])
+	for col, name in enumerate(["CPI", "UNEMP"], start=1):
+		b = [averaged.params[averaged.names.index(name if l == 0 else f"{name}(-{l})")] for l in range(periods)]
+		fig.add_trace(go.Scatter(
+			x=np.arange(nlags), y=true_effects[name],
+			mode='lines', name='الأثر الحقيقي', line=dict(color='black', dash='dash'), showlegend=col == 1
+		), row=1, col=col)
+		fig.add_trace(go.Scatter(
+			x=np.arange(nlags), y=midas.lag_effects[name],
+			mode='lines+markers', name='ARDL-MIDAS', line=dict(color='royalblue', width=2), showlegend=col == 1
+		), row=1, col=col)
+		fig.add_trace(go.Scatter(
+			x=np.arange(nlags), y=np.repeat(b, m) / m,
+			mode='lines', name='ARDL على المتوسط الفصلي', line=dict(color='tomato', width=2, shape='hv'),
+			showlegend=col == 1
+		), row=1, col=col)
+	fig.update_layout(
+		title="أثر كل فجوة شهرية على الناتج الفصلي: المقدر مقابل الحقيقي",
+		height=450,
+		template="plotly_white"
+	)
+	fig.update_xaxes(title_text="الفجوة الشهرية")
+
+	# مصفوفة الفجوات الشهرية: صف لكل ربع وعمود لكل شهر متأخر (أحدث شهر أولاً)
+	df_lags = pd.DataFrame(cpi_lags[:6, :6].round(2), columns=[f"CPI(-{l})" for l in range(6)])
+	df_lags.insert(0, 'الربع', [f"Q{(t % 4) + 1}-{2000 + t // 4}" for t in range(periods - 1, periods + 5)])
+	df_lags.insert(1, 'GDP', gdp[periods - 1:periods + 5].round(2))
+
+	# جدول التقديرات
+	estimates = midas.summary_frame()
+	df_estimates = pd.DataFrame({
+		'المعلمة': midas.names,
+		'التقدير': [f"{v:.3f}" for v in estimates["coef"]],
+		'الخطأ المعياري': [f"{v:.3f}" for v in estimates["std err"]],
+		'قيمة t': [f"{v:.2f}" for v in estimates["t"]]
+	})
+
+	# مقارنة النموذجين
+	models = [averaged, midas]
+	df_models_comparison = pd.DataFrame({
+		'النموذج': ['ARDL على المتوسطات الفصلية', 'ARDL-MIDAS (Beta)'],
+		'معامل التحديد R²': [f"{results.rsquared:.3f}" for results in models],
+		'AIC': [f"{results.aic:.2f}" for results in models],
+		'BIC': [f"{results.bic:.2f}" for results in models],
+		'عدد المعلمات': [str(len(results.params)) for results in models]
+	})
+
+	return fig, df_lags, df_estimates, df_models_comparison
+
+
+# حلول المشاكل
+def render():
+	st.title("حلول مشاكل نموذج ARDL")
+	st.markdown("---")
+	st.markdown("""
+    ## الحلول المنهجية لمعالجة مشاكل نموذج ARDL
+
+    هناك العديد من التطورات المنهجية التي تم اقتراحها لمعالجة مختلف مشاكل نموذج ARDL التقليدي. سنناقش أهم هذه الحلول:
+    """)
+
+	tabs = st.tabs([
+		"Bootstrap ARDL",
+		"ARDL مع متغيرات وهمية",
+		"NARDL",
+		"ARDL-Fourier",
+		"ARDL-MIDAS",
+		"حلول أخرى"
+	])
+
+	with tabs[0]:
+		st.markdown("""
+        ## Bootstrap ARDL: حل لمشكلة العينات الصغيرة
+
+        ### المشكلة المستهدفة:
+
+        تحسين دقة النتائج وقوة اختبار الحدود في حالة العينات الصغيرة.
+
+        ### المفهوم الأساسي:
+
+        تقنية Bootstrap ARDL تعتمد على إعادة المعاينة (resampling) للحصول على توزيع تجريبي للإحصاءات المستخدمة في اختبار الحدود، بدلاً من الاعتماد على القيم الحرجة الجدولية.
+
+        ### الخطوات الأساسية:
+
+        1. **تقدير نموذج ARDL** باستخدام البيانات الأصلية
+
+        2. **حساب إحصائية F أو t** من النموذج المقدر
+
+        3. **توليد عينات Bootstrap** من خلال:
+           - تقدير نموذج تحت فرضية العدم (عدم وجود تكامل مشترك)
+           - استخراج البواقي المقدرة
+           - إعادة المعاينة العشوائية للبواقي
+           - توليد متغير تابع جديد باستخدام المعلمات المقدرة والبواقي المعاد معاينتها
+
+        4. **تقدير نموذج ARDL** لكل عينة Bootstrap
+
+        5. **حساب إحصائية F أو t** لكل عينة Bootstrap
+
+        6. **بناء التوزيع التجريبي** للإحصائية تحت فرضية العدم
+
+        7. **تحديد القيم الحرجة** من التوزيع التجريبي
+
+        8. **مقارنة إحصائية العينة الأصلية** مع القيم الحرجة المستندة إلى Bootstrap
+
+        ### المزايا:
+
+        1. **قيم حرجة أكثر دقة** خاصة للعينات الصغيرة
+
+        2. **تحسين قوة اختبار الحدود** وتقليل احتمالية أخطاء النوع الأول والثاني
+
+        3. **عدم الاعتماد على افتراضات توزيعية قوية**
+
+        4. **مرونة في التعامل مع خصائص البيانات المختلفة**
+
+        ### التنفيذ:
+
+        تم اقتراح عدة إصدارات من Bootstrap ARDL، منها:
+
+        - **Bootstrap ذو البلوكات المتداخلة** (Block Bootstrap): إعادة معاينة كتل متتالية من البواقي بطول ثابت أو عشوائي (Stationary Bootstrap) للحفاظ على الارتباط الذاتي قصير الأجل
+        - **Wild Bootstrap**: ضرب كل باقٍ بوزن عشوائي (Rademacher أو Mammen) للحفاظ على عدم تجانس التباين
+        - **Bootstrap المشروط** (Conditional Bootstrap)
+        - **Bootstrap المحاكاة** (Simulation Bootstrap)
+        """)
+
+		# رسم توضيحي لتقنية Bootstrap
+		st.subheader("تمثيل بياني لفكرة Bootstrap ARDL")
+
+		scheme = st.selectbox("طريقة إعادة معاينة البواقي", list(SCHEME_LABELS), format_func=SCHEME_LABELS.get)
+		fig, df_cv = get_figure("solutions.bootstrap", scheme=scheme)
+		st.plotly_chart(fig, use_container_width=True)
+		st.table(df_cv)
+
+		st.info("""
+        **التفسير**: 
+
+        يوضح الرسم البياني أعلاه Bootstrap ARDL المشروط (McNown وآخرون، 2018) على عينة صغيرة. بدلاً من الاعتماد على القيم الحرجة العامة من جداول Pesaran وآخرون، يُقدَّر النموذج تحت فرضية العدم، وتُعاد معاينة بواقيه، ويُولَّد المتغير التابع من جديد بشكل تكراري مع تثبيت المتغيرات المستقلة، ثم يُعاد حساب إحصائية F لكل عينة. النتيجة توزيع تجريبي لإحصائية F تحت فرضية العدم (الهيستوجرام الأزرق) خاص بالبيانات المستخدمة.
+
+        الخطوط المتقطعة تمثل القيم الحرجة المشتقة من هذا التوزيع، والخط المنقط هو الحد الأعلى الجدولي لـ PSS عند 5% للمقارنة. إحصائية F الأصلية (الخط الأخضر) تُقارن مع القيم الحرجة المخصصة. يعرض الجدول أيضاً إحصائية t واختبار F للمتغيرات المستقلة، وكل منها بتوزيع Bootstrap تحت فرضية العدم الخاصة به، مما يميز حالات التكامل المشترك المنحلة التي لا يكشفها اختبار F وحده.
+
+        لا يلزم دائماً العدد الأقصى من التكرارات: يتوقف توليد العينات لكل إحصائية بمجرد أن يصبح الخطأ المعياري لمونت كارلو لقيمها الحرجة أقل من حد مسموح، ويبين الجدول عدد التكرارات المستخدم فعلاً لكل منها.
+        """)
+
+	with tabs[1]:
+		st.markdown("""
+        ## ARDL مع متغيرات وهمية: حل للتغيرات الهيكلية
+
+        ### المشكلة المستهدفة:
+
+        معالجة التغيرات الهيكلية والانكسارات الهيكلية في السلاسل الزمنية.
+
+        ### المفهوم الأساسي:
+
+        تضمين متغيرات وهمية (Dummy Variables) في نموذج ARDL للتعامل مع التغيرات الهيكلية المعروفة أو المكتشفة في البيانات.
+
+        ### أنواع المتغيرات الوهمية المستخدمة:
+
+        1. **متغير وهمي للمستوى (Level Dummy)**:
+           - يأخذ قيمة 0 قبل نقطة التغير الهيكلي و 1 بعدها
+           - يستخدم للتغيرات الهيكلية في متوسط السلسلة
+
+        2. **متغير وهمي للميل (Slope Dummy)**:
+           - يتفاعل مع متغير مستقل لتعكس تغير تأثيره قبل وبعد نقطة التغير
+           - يستخدم للتغيرات في العلاقة بين المتغيرات
+
+        3. **متغير وهمي للنبضة (Pulse Dummy)**:
+           - يأخذ قيمة 1 عند نقطة زمنية معينة فقط و 0 في غيرها
+           - يستخدم للأحداث الفردية المؤثرة (مثل الأزمات أو الكوارث)
+
+        ### الصيغة الرياضية:
+        """)
+
+		st.markdown(r'''
+        <div class="formula">
+        $\Delta y_t = \alpha_0 + \alpha_1 t + \alpha_2 D_t + \delta_1 y_{t-1} + \delta_2 x_{t-1} + \delta_3 (D_t \times x_{t-1}) + \sum_{i=1}^{p} \beta_i \Delta y_{t-i} + \sum_{j=0}^{q} \gamma_j \Delta x_{t-j} + \sum_{k=0}^{q} \theta_k (D_t \times \Delta x_{t-k}) + \varepsilon_t$
+        </div>
+        ''', unsafe_allow_html=True)
+
+		st.markdown("""
+        حيث:
+        - D_t هو المتغير الوهمي للتغير الهيكلي
+        - D_t × x_{t-1} هو متغير وهمي للميل يعكس التغير في العلاقة طويلة الأجل
+        - D_t × Δx_{t-k} يعكس التغير في العلاقة قصيرة الأجل
+
+        ### خطوات التطبيق:
+
+        1. **تحديد نقاط التغير الهيكلي**:
+           - باستخدام الاختبارات الإحصائية مثل Bai-Perron أو CUSUM
+           - استناداً إلى أحداث اقتصادية أو سياسية معروفة
+
+        2. **إنشاء المتغيرات الوهمية المناسبة**
+
+        3. **تضمين المتغيرات الوهمية في نموذج ARDL**:
+           - في جزء المستويات (العلاقة طويلة الأجل)
+           - في جزء الفروق (العلاقات قصيرة الأجل)
+           - كمتغيرات مستقلة إضافية
+
+        4. **اختبار الحدود المعدل**:
+           - استخدام القيم الحرجة المعدلة التي تأخذ في الاعتبار المتغيرات الوهمية
+
+        ### المزايا:
+
+        1. **زيادة دقة تقديرات المعلمات** من خلال السماح بتغير العلاقات عبر الزمن
+
+        2. **تحسين أداء اختبار الحدود** من خلال مراعاة التغيرات الهيكلية
+
+        3. **تحليل أكثر تفصيلاً** للتغيرات في العلاقات الاقتصادية
+
+        4. **معالجة مشكلة عدم استقرار المعلمات**
+        """)
+
+		fig, df_model_comparison, df_breaks = get_figure("solutions.dummy_variables")
+
+		# تقدير تواريخ الانكسار بدلا من افتراضها
+		st.subheader("تقدير عدد الانكسارات وتواريخها (Bai-Perron)")
+		st.dataframe(df_breaks, hide_index=True)
+		st.markdown("""
+        تقدر تواريخ الانكسار بتقليل مجموع مربعات البواقي على كل التقسيمات الممكنة للعينة (البرمجة الديناميكية لـ Bai وPerron)، ويختار عددها بمعيار BIC أو LWZ أو باختبارات sup-F(l+1|l) المتتابعة، ثم تبنى المتغيرات الوهمية وتفاعلاتها تلقائيا عند التواريخ المقدرة.
+        """)
+
+		st.plotly_chart(fig, use_container_width=True)
+
+		# جدول يلخص المعلمات المقدرة
+		st.subheader("مقارنة نتائج النماذج المختلفة")
+		st.table(df_model_comparison)
+
+		st.info("""
+        **التفسير**:
+
+        الرسم البياني والجدول أعلاه يوضحان أهمية استخدام المتغيرات الوهمية لمعالجة التغيرات الهيكلية:
+
+        1. **النموذج بدون متغير وهمي (الخط الأحمر)**: يفشل في التقاط التغير الهيكلي، مما يؤدي إلى ضعف في المطابقة وتحيز في المعلمات المقدرة.
+
+        2. **النموذج مع متغير وهمي للمستوى (الخط الأزرق)**: يلتقط التغير في مستوى العلاقة (التقاطع)، لكنه لا يلتقط التغير في ميل العلاقة.
+
+        3. **النموذج مع متغير وهمي للمستوى والميل (الخط الأخضر)**: يوفر أفضل مطابقة للبيانات، حيث يلتقط التغير في كل من مستوى وميل العلاقة.
+
+        معامل التحديد R² يزداد بشكل كبير عند تضمين المتغيرات الوهمية المناسبة، مما يؤكد أهمية مراعاة التغيرات الهيكلية في نموذج ARDL.
+        """)
+
+	with tabs[2]:
+		st.markdown("""
+        ## النموذج غير الخطي NARDL: حل للعلاقات غير الخطية
+
+        ### المشكلة المستهدفة:
+
+        معالجة العلاقات غير الخطية بين المتغيرات الاقتصادية، خاصة عدم التماثل في التأثيرات.
+
+        ### المفهوم الأساسي:
+
+        نموذج NARDL (Nonlinear ARDL) هو امتداد لنموذج ARDL يسمح بالتأثيرات غير المتماثلة (Asymmetric Effects)، حيث قد يكون للزيادات والانخفاضات في المتغير المستقل تأثيرات مختلفة على المتغير التابع.
+
+        ### التجزئة الإيجابية والسلبية للمتغيرات:
+
+        الفكرة الأساسية في NARDL هي تجزئة المتغير المستقل إلى مكونين:
+        """)
+
+		st.markdown(r'''
+        <div class="formula">
+        $x_t^+ = \sum_{j=1}^{t} \Delta x_j^+ = \sum_{j=1}^{t} \max(\Delta x_j, 0)$
+        </div>
+
+        <div class="formula">
+        $x_t^- = \sum_{j=1}^{t} \Delta x_j^- = \sum_{j=1}^{t} \min(\Delta x_j, 0)$
+        </div>
+        ''', unsafe_allow_html=True)
+
+		st.markdown("""
+        حيث:
+        - x_t^+ هو المجموع التراكمي للتغيرات الإيجابية
+        - x_t^- هو المجموع التراكمي للتغيرات السلبية
+
+        ### الصيغة الرياضية لنموذج NARDL:
+        """)
+
+		st.markdown(r'''
+        <div class="formula">
+        $\Delta y_t = \alpha_0 + \delta_1 y_{t-1} + \delta_2^+ x_{t-1}^+ + \delta_2^- x_{t-1}^- + \sum_{i=1}^{p} \beta_i \Delta y_{t-i} + \sum_{j=0}^{q} (\gamma_j^+ \Delta x_{t-j}^+ + \gamma_j^- \Delta x_{t-j}^-) + \varepsilon_t$
+        </div>
+        ''', unsafe_allow_html=True)
+
+		st.markdown("""
+        ### خطوات تطبيق NARDL:
+
+        1. **اختبار رتبة تكامل المتغيرات** (كما في ARDL التقليدي)
+
+        2. **تجزئة المتغيرات المستقلة** إلى مكونات إيجابية وسلبية
+
+        3. **تقدير نموذج NARDL** باستخدام المربعات الصغرى العادية
+
+        4. **إجراء اختبار الحدود المعدل** للتحقق من وجود تكامل مشترك
+
+        5. **اختبار عدم التماثل** في العلاقات طويلة وقصيرة الأجل:
+           - H₀: δ₂⁺ = δ₂⁻ (تماثل في العلاقة طويلة الأجل)
+           - H₀: γⱼ⁺ = γⱼ⁻ (تماثل في العلاقة قصيرة الأجل)
+
+        6. **تقدير المضاعفات التراكمية غير المتماثلة**
+
+        ### مجالات التطبيق:
+
+        NARDL مفيد بشكل خاص في دراسة:
+
+        1. **العلاقة بين أسعار النفط والناتج المحلي الإجمالي**:
+           - تأثيرات ارتفاع وانخفاض أسعار النفط قد تكون غير متماثلة
+
+        2. **انتقال أسعار الصرف إلى أسعار المستهلك**:
+           - تأثير ارتفاع وانخفاض سعر الصرف قد يكون مختلفاً
+
+        3. **العلاقة بين أسعار الفائدة والاستثمار**:
+           - تأثير رفع وخفض أسعار الفائدة قد يختلف
+
+        4. **العلاقة بين الإنفاق الحكومي والنمو الاقتصادي**:
+           - تأثير زيادة وخفض الإنفاق الحكومي قد يكون غير متماثل
+
+        ### المزايا:
+
+        1. **التقاط العلاقات غير الخطية** بين المتغيرات الاقتصادية
+
+        2. **اكتشاف عدم التماثل** في التأثيرات الاقتصادية
+
+        3. **زيادة الواقعية** في النمذجة الاقتصادية
+
+        4. **الاحتفاظ بمزايا ARDL** مع إضافة المرونة في النمذجة
+        """)
+
+		fig, fig_multipliers, summary, df_tests = get_figure("solutions.nardl")
+		results_linear, results_nonlinear = summary['linear'], summary['nonlinear']
+		st.plotly_chart(fig, use_container_width=True)
+
+		# عرض نتائج النماذج
+		st.subheader("مقارنة نتائج النموذج الخطي والنموذج غير المتماثل")
+
+		col1, col2 = st.columns(2)
+
+		with col1:
+			st.markdown("**النموذج الخطي (ARDL التقليدي)**")
+			st.write(f"معامل الأجل الطويل لـ X: {results_linear['long_run']:.3f}")
+			st.write(f"معامل التحديد R²: {results_linear['rsquared']:.3f}")
+
+		with col2:
+			st.markdown("**النموذج غير المتماثل (NARDL)**")
+			st.write(f"معامل الأجل الطويل لـ X⁺: {results_nonlinear['long_run'][0]:.3f}")
+			st.write(f"معامل الأجل الطويل لـ X⁻: {results_nonlinear['long_run'][1]:.3f}")
+			st.write(f"معامل التحديد R²: {results_nonlinear['rsquared']:.3f}")
+
+		# اختبارات Wald لعدم التماثل (H₀: تساوي أثر X⁺ وX⁻)
+		st.subheader("اختبارات Wald لعدم التماثل")
+		st.table(df_tests)
+
+		st.plotly_chart(fig_multipliers, use_container_width=True)
+
+		st.info("""
+        **التفسير**:
+
+        الرسم البياني والنتائج أعلاه توضح مفهوم NARDL وأهميته:
+
+        1. **الجزء العلوي**: يوضح كيفية تجزئة المتغير المستقل X إلى مكونين: X⁺ (التراكم الإيجابي) و X⁻ (التراكم السلبي).
+
+        2. **الجزء السفلي**: يقارن بين النموذج الخطي التقليدي والنموذج غير المتماثل. نلاحظ أن النموذج غير المتماثل (NARDL) يوفر مطابقة أفضل للبيانات، كما يتضح من زيادة معامل التحديد R².
+
+        3. **النتائج**: تظهر اختلافاً كبيراً بين معامل الأجل الطويل لـ X⁺ (0.8 في النموذج المولد) ومعامل X⁻ (1.5-)، ويرفض اختبار Wald لعدم التماثل في الأجل الطويل فرضية تساويهما. التغيرات الإيجابية في X لها تأثير إيجابي أقل من التأثير السلبي للتغيرات السلبية في X (بالقيمة المطلقة).
+
+        4. **المضاعفات الديناميكية**: تتبع المنحنيات الأثر التراكمي لزيادة أو انخفاض دائم بوحدة واحدة في X حتى تستقر عند معاملات الأجل الطويل، ويعد عدم التماثل معنوياً عند الآفاق التي لا يتضمن فيها نطاق الثقة (Bootstrap) الصفر.
+
+        هذا يوضح أهمية NARDL في التقاط العلاقات غير المتماثلة التي لا يستطيع نموذج ARDL التقليدي التقاطها.
+        """)
+
+	with tabs[3]:
+		st.markdown("""
+        ## ARDL-Fourier: حل للتغيرات الهيكلية المتعددة والتدريجية
+
+        ### المشكلة المستهدفة:
+
+        معالجة التغيرات الهيكلية المتعددة والتدريجية والناعمة في العلاقات الاقتصادية، التي يصعب التقاطها بالمتغيرات الوهمية التقليدية.
+
+        ### المفهوم الأساسي:
+
+        نموذج ARDL-Fourier يدمج دوال فورييه الجيبية وجيب التمام في نموذج ARDL لالتقاط التغيرات الهيكلية التدريجية والدورية.
+
+        ### توسيع نموذج ARDL باستخدام دوال فورييه:
+
+        يتم إدخال دوال فورييه في نموذج ARDL الأساسي كما يلي:
+        """)
+
+		st.markdown(r'''
+        <div class="formula">
+        $\Delta y_t = \alpha_0 + \alpha_1 t + \alpha_2 \sin\left(\frac{2\pi kt}{T}\right) + \alpha_3 \cos\left(\frac{2\pi kt}{T}\right) + \delta_1 y_{t-1} + \delta_2 x_{t-1} + \sum_{i=1}^{p} \beta_i \Delta y_{t-i} + \sum_{j=0}^{q} \gamma_j \Delta x_{t-j} + \varepsilon_t$
+        </div>
+        ''', unsafe_allow_html=True)
+
+		st.markdown("""
+        حيث:
+        - sin(2πkt/T) و cos(2πkt/T) هما مكونات فورييه
+        - k هو عدد الدورات (عادة بين 1 و5)
+        - T هو طول العينة
+
+        ### خصائص دوال فورييه:
+
+        1. **المرونة في التقاط التغيرات**:
+           - تلتقط التغيرات السلسة والتدريجية
+           - تلتقط التغيرات المتعددة دون الحاجة لتحديدها مسبقاً
+
+        2. **التقريب الأمثل**:
+           - يمكن تقريب أي دالة مستمرة بدقة عالية باستخدام مجموعة من دوال فورييه
+
+        3. **الحد من فقدان درجات الحرية**:
+           - استخدام عدد قليل من مكونات فورييه (غالباً 1-3) يمكن أن يلتقط العديد من التغيرات
+
+        ### خطوات تطبيق ARDL-Fourier:
+
+        1. **تحديد تردد فورييه k المناسب**:
+           - يتم اختياره بأقل مجموع مربعات بواقٍ على شبكة من الترددات الصحيحة والكسرية (من 0.5 إلى 5 بخطوة 0.1)
+
+        2. **إنشاء مكونات فورييه** وإضافتها إلى النموذج
+
+        3. **تقدير النموذج** باستخدام المربعات الصغرى العادية
+
+        4. **اختبار الحدود المعدل**:
+           - استخدام القيم الحرجة المعدلة لوجود مكونات فورييه، وهي تعتمد على التردد k وعدد المتغيرات المستقلة وحجم العينة
+
+        5. **اختبار معنوية مكونات فورييه**:
+           - اختبار F لمعنوية المعلمات α₂ و α₃
+
+        ### المزايا:
+
+        1. **اكتشاف تلقائي للتغيرات الهيكلية**:
+           - لا حاجة لتحديد مسبق لعدد أو مواقع التغيرات الهيكلية
+
+        2. **التقاط التغيرات التدريجية**:
+           - مناسب للتغيرات السلسة التي تحدث تدريجياً
+
+        3. **مرونة أكبر**:
+           - يمكن التقاط أنماط معقدة من التغيرات باستخدام عدد قليل من المعلمات
+
+        4. **تحسين أداء اختبار الحدود**:
+           - زيادة قوة اختبار التكامل المشترك
+        """)
+
+		fig1, fig2, fig3, df_models_comparison, df_bounds = get_figure("solutions.fourier")
+		st.plotly_chart(fig1, use_container_width=True)
+		st.plotly_chart(fig3, use_container_width=True)
+		st.plotly_chart(fig2, use_container_width=True)
+
+		# جدول مقارنة النماذج
+		st.table(df_models_comparison)
+
+		# الفحص المسبق لرتب التكامل باختبارات جذر الوحدة والاستقرار مع مكونات فورييه
+		st.subheader("الفحص المسبق: اختبارات Fourier ADF وFourier KPSS")
+		st.markdown("""
+        قبل اختبار الحدود يجب التأكد من أن أياً من المتغيرات ليس متكاملاً من الرتبة I(2). الاختبارات التقليدية قد تخلط بين التغير الهيكلي التدريجي وجذر الوحدة، لذلك تضيف اختبارات Enders وLee (FADF) وBecker وEnders وLee (FKPSS) مكونات فورييه نفسها:
+
+        - **FADF**: فرضية العدم وجود جذر وحدة، ويُختار التردد k بأقل مجموع مربعات بواقٍ
+        - **FKPSS**: فرضية العدم استقرار السلسلة حول مكونات فورييه
+        - تُطبق الاختبارات على المستوى والفرق الأول لكل السلاسل والترددات دفعة واحدة، فيمكن فحص مئات السلاسل (مثلاً بيانات الدول) في ثوانٍ
+        """)
+		fig_screen, df_screen = get_figure("solutions.fourier_screen")
+		st.plotly_chart(fig_screen, use_container_width=True)
+		st.table(df_screen)
+		st.markdown("""
+        رتبة التكامل تُحدد من FADF: I(0) إذا رُفض جذر الوحدة في المستوى، وI(1) إذا رُفض في الفرق الأول فقط، وإلا فالسلسلة I(2) أو أعلى ولا يصلح معها اختبار الحدود. القيم الاحتمالية تأخذ في الحسبان البحث عن التردد k، لأن استخدام القيم الحرجة للتردد المختار وكأنه معروف مسبقاً يؤدي إلى رفض زائد لفرضية العدم.
+        """)
+
+		# اختبار الحدود لنموذج ARDL-Fourier بقيمه الحرجة الخاصة
+		st.subheader("اختبار الحدود لنموذج ARDL-Fourier عند التردد المختار")
+		st.table(df_bounds)
+
+		st.info("""
+        **التفسير**:
+
+        الرسوم البيانية والجدولان أعلاه توضح مفهوم وفوائد نموذج ARDL-Fourier:
+
+        1. **دوال فورييه الأساسية**: الرسم الأول يوضح دوال الجيب وجيب التمام الأساسية المستخدمة في النموذج، والتي تسمح بالتقاط أنماط مختلفة من التغيرات الهيكلية.
+
+        2. **اختيار التردد**: الرسم الثاني يعرض مجموع مربعات البواقي لكل تردد في الشبكة، ويُختار التردد الذي يحقق أقل قيمة. البيانات مولدة بتغير هيكلي بتردد كسري (k = 0.7) لا تلتقطه الترددات الصحيحة بدقة.
+
+        3. **التغير الهيكلي المقدر**: الرسم الثالث يقارن الثابت طويل الأجل الفعلي المتغير تدريجياً بما يقدره كل نموذج. النموذج بدون فورييه يفترض ثابتاً واحداً، بينما يتتبع النموذج بالتردد المختار التغير التدريجي.
+
+        4. **مؤشرات جودة النموذج**: يظهر جدول المقارنة تحسن R² ومعايير المعلومات عند إضافة مكونات فورييه، وأن زوجاً واحداً بالتردد المختار قد يتفوق على عدة أزواج بترددات صحيحة.
+
+        5. **اختبار الحدود**: القيم الحرجة لنموذج ARDL-Fourier أعلى من قيم PSS التقليدية، لذلك يجب استخدامها عند الحكم على وجود التكامل المشترك بعد إضافة مكونات فورييه.
+        """)
+
+	with tabs[4]:
+		st.markdown("""
+        ## ARDL-MIDAS: حل لبيانات ذات ترددات مختلفة
+
+        ### المشكلة المستهدفة:
+
+        التعامل مع متغيرات ذات ترددات زمنية مختلفة (مثل بيانات سنوية مع بيانات فصلية أو شهرية أو يومية).
+
+        ### المفهوم الأساسي:
+
+        نموذج ARDL-MIDAS (Mixed Data Sampling) يمتد نموذج ARDL للسماح بدمج بيانات من ترددات زمنية مختلفة في نفس النموذج.
+
+        ### التحدي الرئيسي:
+
+        في الاقتصاد القياسي التقليدي، عندما نتعامل مع ترددات مختلفة، علينا إما:
+
+        - **تجميع البيانات ذات التردد الأعلى** (مثلاً تحويل البيانات الشهرية إلى سنوية)، مما يؤدي إلى فقدان معلومات
+        - **تكرار البيانات ذات التردد الأقل** (مثلاً تكرار البيانات السنوية لكل شهر)، مما قد يؤدي إلى مشاكل إحصائية
+
+        ### الفكرة العامة لنموذج MIDAS:
+
+        - السماح بالاستفادة المباشرة من المتغيرات ذات الترددات الأعلى
+        - استخدام دالة وزن (weight function) لتوزيع تأثير المتغيرات ذات التردد الأعلى
+        - تقليل عدد المعلمات المقدرة مقارنة بالنماذج التقليدية
+
+        ### الصيغة الرياضية:
+
+        صيغة مبسطة لنموذج ARDL-MIDAS مع متغير تابع ذو تردد منخفض y_t وعدة متغيرات مستقلة:
+        """)
+
+		st.markdown(r'''
+        <div class="formula">
+        $y_t = \alpha + \beta y_{t-1} + \gamma \sum_{j=0}^{J} w(j; \theta) x_{tm-j}^{(m)} + \varepsilon_t$
+        </div>
+        ''', unsafe_allow_html=True)
+
+		st.markdown("""
+        حيث:
+        - y_t هو المتغير التابع ذو التردد المنخفض (مثلاً سنوي)
+        - x_{tm-j}^{(m)} هو المتغير المستقل ذو التردد الأعلى (مثلاً شهري)، حيث m هو نسبة الترددات (مثلاً m=12 للسنوي-شهري)
+        - w(j; θ) هي دالة الوزن التي تحدد أوزان الفجوات المختلفة
+        - J هو عدد الفجوات الزمنية للمتغير ذي التردد الأعلى
+
+        ### دوال الوزن المستخدمة:
+
+        1. **دالة متعددة الحدود من الدرجة الثانية (Almon lag)**:
+           - w(j; θ) يتم تحديدها من خلال دالة متعددة الحدود من الدرجة الثانية
+
+        2. **دالة توزيع بيتا (Beta distribution)**:
+           - توفر مرونة أكبر في أشكال الأوزان
+           - تتطلب معلمتين فقط لتحديد الأوزان لعدد كبير من الفجوات
+
+        3. **دالة أسية (Exponential)**:
+           - تفترض تناقصاً أسياً في تأثير الفجوات البعيدة
+
+        ### مزايا ARDL-MIDAS:
+
+        1. **الاستفادة من المعلومات عالية التردد**:
+           - تحسين دقة النماذج والتنبؤات
+           - الاحتفاظ بالمعلومات المفيدة في البيانات عالية التردد
+
+        2. **اقتصاد في المعلمات**:
+           - تقليل عدد المعلمات المقدرة مقارنة بالنماذج التقليدية
+
+        3. **مرونة في نمذجة العلاقات الديناميكية**:
+           - التقاط أنماط معقدة من التأخيرات الزمنية
+
+        4. **تحسين التنبؤات**:
+           - تحسين دقة التنبؤات قصيرة وطويلة الأجل
+
+        ### مجالات التطبيق:
+
+        1. **النمذجة الاقتصادية الكلية**:
+           - استخدام مؤشرات اقتصادية شهرية للتنبؤ بالنمو الاقتصادي الفصلي أو السنوي
+
+        2. **التمويل**:
+           - نمذجة العلاقة بين البيانات اليومية لأسواق الأسهم والمتغيرات الاقتصادية الفصلية
+
+        3. **النمذجة البيئية**:
+           - دمج بيانات يومية أو ساعية للعوامل البيئية مع بيانات اقتصادية أقل تواتراً
+        """)
+
+		fig = get_figure("solutions.midas_weights")
+		st.plotly_chart(fig, use_container_width=True)
+
+		# توضيح مفهوم MIDAS
+		st.subheader("توضيح لمفهوم دمج بيانات ذات ترددات مختلفة في ARDL-MIDAS")
+
+		fig, df_lags, df_estimates, df_models_comparison = get_figure("solutions.midas")
+
+		st.markdown("""
+        تُرتب البيانات الشهرية في مصفوفة فجوات: صف لكل ربع يقابل مشاهدة الناتج، وعمود لكل شهر متأخر بدءاً من آخر شهر في الربع. مع m = 3 أشهر لكل ربع وJ = 4 أرباع يصبح لكل متغير شهري 12 فجوة، وتُختصر معاملاتها في معلمتي دالة الوزن:
+        """)
+		st.table(df_lags)
+
+		st.plotly_chart(fig, use_container_width=True)
+
+		# تقديرات المربعات الصغرى غير الخطية ومقارنتها بنموذج المتوسطات
+		st.table(df_estimates)
+		st.table(df_models_comparison)
+
+		st.markdown("""
+        يُقدر النموذج بالمربعات الصغرى غير الخطية: تُحسب أوزان شبكة من القيم الابتدائية دفعة واحدة ويُختار أفضلها، ثم يُستخدم المشتق التحليلي لدوال الوزن بدلاً من الفروق المنتهية، فيستغرق التقدير أجزاء من الثانية. أما ARDL على المتوسطات الفصلية فيفرض أوزاناً متساوية داخل كل ربع ويحتاج معاملاً لكل ربع متأخر.
+        """)
+
+		st.markdown("""
+        <div class="highlight">
+        <strong>مثال توضيحي:</strong><br>
+
+        في نموذج ARDL-MIDAS، يمكن نمذجة الناتج المحلي الإجمالي الفصلي كدالة للبيانات الشهرية للبطالة ومؤشر أسعار المستهلك كما يلي:
+
+        $GDP_t = \alpha + \beta GDP_{t-1} + \gamma_1 \sum_{j=0}^{J_1} w_1(j; \theta_1) CPI_{tm-j}^{(m)} + \gamma_2 \sum_{j=0}^{J_2} w_2(j; \theta_2) Unemployment_{tm-j}^{(m)} + \varepsilon_t$
+
+        حيث:
+        <ul>
+        <li>GDP_t هو الناتج المحلي الإجمالي الفصلي (تردد منخفض)</li>
+        <li>CPI_{tm-j}^{(m)} هو مؤشر أسعار المستهلك الشهري (تردد مرتفع)</li>
+        <li>Unemployment_{tm-j}^{(m)} هو معدل البطالة الشهري (تردد مرتفع)</li>
+        <li>w_1 و w_2 هما دالتا الوزن لكل متغير</li>
+        </ul>
+
+        المزايا الرئيسية:
+        <ul>
+        <li>الاستفادة من المعلومات الشهرية بدلاً من مجرد المتوسط الفصلي</li>
+        <li>إمكانية تحديد الأنماط المختلفة لتأثير البيانات الشهرية على الناتج المحلي الإجمالي الفصلي</li>
+        <li>تقليل عدد المعلمات المقدرة من خلال استخدام دوال الوزن</li>
+        </ul>
+        </div>
+        """, unsafe_allow_html=True)
+
+	with tabs[5]:
+		st.markdown("""
+        ## حلول منهجية أخرى لمشاكل نموذج ARDL
+
+        هناك العديد من التطورات المنهجية الأخرى التي تم اقتراحها لمعالجة مختلف مشاكل نموذج ARDL التقليدي. فيما يلي بعض هذه الحلول:
+
+        ### 1. Quantile ARDL (QARDL)
+
+        #### المشكلة المستهدفة:
+        الاقتصار على تحليل العلاقة عند متوسط المتغير التابع فقط، وعدم التقاط العلاقات المختلفة عبر مختلف توزيع المتغير التابع.
+
+        #### الحل:
+        - يطبق تقنية انحدار الكمي (Quantile Regression) على نموذج ARDL
+        - يسمح بتقدير العلاقات عند كميات مختلفة من توزيع المتغير التابع
+        - يكشف عن تأثيرات غير متماثلة للمتغيرات المستقلة عبر مختلف مستويات المتغير التابع
+
+        #### الفوائد:
+        - صورة أكثر شمولاً للعلاقات الاقتصادية
+        - الكشف عن العلاقات التي قد تختلف في الأوقات العادية عن الأوقات المتطرفة
+        - مناسب بشكل خاص للبيانات المالية ذات المشاهدات المتطرفة
+
+        ### 2. Panel ARDL
+
+        #### المشكلة المستهدفة:
+        محدودية البيانات المتاحة لبلد أو منطقة واحدة، وعدم القدرة على التقاط الاختلافات بين الوحدات المختلفة.
+
+        #### الحل:
+        - توسيع نموذج ARDL ليشمل بيانات مقطعية (cross-sectional) وزمنية (time series)
+        - يسمح بتقدير العلاقات طويلة وقصيرة الأجل مع الاستفادة من معلومات مقطعية متعددة
+        - يمكن تقدير نماذج مع آثار ثابتة (fixed effects) أو عشوائية (random effects)
+
+        #### الفوائد:
+        - زيادة حجم العينة وتحسين كفاءة التقديرات
+        - إمكانية اختبار التجانس بين الوحدات المختلفة
+        - تحسين قوة اختبارات التكامل المشترك
+
+        ### 3. Spatial ARDL
+
+        #### المشكلة المستهدفة:
+        تجاهل التبعيات المكانية والتفاعلات بين الوحدات الاقتصادية المختلفة.
+
+        #### الحل:
+        - دمج الاعتماد المكاني (spatial dependence) في نموذج ARDL
+        - السماح بتأثيرات الانتشار (spillover effects) بين المناطق أو البلدان
+        - نمذجة التفاعلات المكانية-الزمنية (spatiotemporal interactions)
+
+        #### الفوائد:
+        - التقاط تأثيرات الجوار والتبعية المكانية
+        - تحسين دقة التنبؤات من خلال تضمين المعلومات المكانية
+        - فهم أفضل لعمليات الانتشار الاقتصادي
+
+        ### 4. ARDL مع متغير مستقل داخلي (Endogenous ARDL)
+
+        #### المشكلة المستهدفة:
+        مشكلة الارتباط الداخلي (endogeneity) التي تؤدي إلى تحيز في المعلمات المقدرة.
+
+        #### الحل:
+        - استخدام منهجيات المتغيرات الآلية (IV) مع نموذج ARDL
+        - تطبيق طريقة GMM (Generalized Method of Moments)
+        - استخدام معادلات متعددة لحل مشكلة العلاقات المتبادلة
+
+        #### الفوائد:
+        - تقديرات غير متحيزة للمعلمات في وجود ارتباط داخلي
+        - معالجة مشكلة العلاقات السببية المتبادلة
+        - تحسين دقة اختبار الحدود
+
+        ### 5. Bayesian ARDL
+
+        #### المشكلة المستهدفة:
+        عدم اليقين في اختيار المواصفات وهيكل الفجوات الزمنية، وتحديات العينات الصغيرة.
+
+        #### الحل:
+        - تطبيق منهجية بايزية على نموذج ARDL
+        - السماح بإدراج المعرفة المسبقة من خلال التوزيعات القبلية
+        - متوسط النماذج البايزي (Bayesian Model Averaging) للتعامل مع عدم اليقين في المواصفات
+
+        #### الفوائد:
+        - تحسين التقديرات في العينات الصغيرة
+        - تضمين المعرفة المسبقة والنظرية الاقتصادية
+        - توفير توزيعات احتمالية كاملة للمعلمات بدلاً من مجرد تقديرات نقطية
+        """)
@@ -0,0 +1,1712 @@
+import io
+import os
+
+import streamlit as st
+import plotly.graph_objects as go
+import numpy as np
+import pandas as pd
+
+from ardl.figures import figure, get_figure
+from ardl.bootstrap import SCHEME_LABELS, bootstrap_bounds
+from ardl.bounds import CASE_TERMS, CASES, DEFAULT_CASE, LEVELS, bounds_test, critical_value_table, response_surface
+from ardl.diagnostics import diagnostic_tests
+from ardl.dynamics import dynamic_responses, persistence_profile
+from ardl.model import ARDL
+from ardl.selection import select_order
+from ardl.stability import stability_test
+
+
+# الخطوات الرئيسية لتطبيق نموذج ARDL
+STEPS = [
+	"اختبار رتبة تكامل المتغيرات",
+	"تحديد صيغة نموذج ARDL",
+	"اختيار الفجوات الزمنية المثلى",
+	"تقدير النموذج",
+	"اختبار الحدود (Bound Test)",
+	"تقدير العلاقات طويلة الأجل",
+	"تقدير نموذج تصحيح الخطأ",
+	"التشخيص والتحقق من النموذج",
+	"التفسير الاقتصادي والاستنتاجات"
+]
+
+# حالات المكونات المحددة في اختبار الحدود
+CASE_LABELS = {
+	"I": "الحالة I: بدون ثابت ولا اتجاه",
+	"II": "الحالة II: ثابت مقيد",
+	"III": "الحالة III: ثابت غير مقيد",
+	"IV": "الحالة IV: ثابت غير مقيد واتجاه مقيد",
+	"V": "الحالة V: ثابت واتجاه غير مقيدين"
+}
+
+# طرق البحث عن الفجوات المثلى
+SEARCH_METHODS = {
+	"exhaustive": "شامل (كل النماذج)",
+	"bnb": "التفرع والتقييد (نتيجة مطابقة للشامل)",
+	"greedy": "النزول الإحداثي (تقريبي وسريع)"
+}
+
+
+@figure("steps.pipeline")
+def _pipeline(steps=STEPS):
+	# إنشاء رسم مسار الخطوات
+	fig = go.Figure()
+
+	for i, step in enumerate(steps):
+		fig.add_trace(go.Scatter(
+			x=[i],
+			y=[0],
+			mode='markers+text',
+			marker=dict(size=30, color='royalblue'),
+			text=str(i + 1),
+			textposition="middle center",
+			textfont=dict(color='white', size=14),
+			hoverinfo='text',
+			hovertext=step,
+			name=step
+		))
+
+	# إضافة خطوط تربط المراحل
+	for i in range(len(steps) - 1):
+		fig.add_shape(
+			type="line",
+			x0=i,
+			y0=0,
+			x1=i + 1,
+			y1=0,
+			line=dict(color="royalblue", width=2)
+		)
+
+	fig.update_layout(
+		title="المراحل الرئيسية لتطبيق نموذج ARDL",
+		showlegend=True,
+		plot_bgcolor='rgba(0,0,0,0)',
+		xaxis=dict(showticklabels=False, showgrid=False, zeroline=False),
+		yaxis=dict(showticklabels=False, showgrid=False, zeroline=False),
+		margin=dict(l=0, r=0, t=40, b=0),
+		height=150,
+		legend=dict(orientation="h", yanchor="bottom", y=-1, xanchor="center", x=0.5),
+		template="plotly_white"
+	)
+
+	return fig
+
+
+def _lag_selection(selection):
+	# أفضل قيمة لكل معيار عند كل عدد من فجوات المتغير التابع (على كل توليفات فجوات المتغيرات المستقلة)
+	# أثناء البحث تبقى قيم p التي لم تُقدّر بعد فارغة
+	aic_values, bic_values, hq_values = (
+		np.where(np.isfinite(selection.profile(ic)), selection.profile(ic), np.nan) for ic in ("aic", "bic", "hqic"))
+	max_lag = len(aic_values)
+
+	lags = list(range(1, max_lag + 1))
+
+	fig = go.Figure()
+
+	fig.add_trace(go.Scatter(
+		x=lags,
+		y=aic_values,
+		mode='lines+markers',
+		name='AIC',
+		line=dict(color='royalblue', width=2),
+		marker=dict(size=10)
+	))
+
+	fig.add_trace(go.Scatter(
+		x=lags,
+		y=bic_values,
+		mode='lines+markers',
+		name='BIC',
+		line=dict(color='tomato', width=2),
+		marker=dict(size=10)
+	))
+
+	fig.add_trace(go.Scatter(
+		x=lags,
+		y=hq_values,
+		mode='lines+markers',
+		name='HQ',
+		line=dict(color='gold', width=2),
+		marker=dict(size=10)
+	))
+
+	# إضافة نقاط للقيم الدنيا
+	fig.add_trace(go.Scatter(
+		x=[lags[np.nanargmin(aic_values)]],
+		y=[np.nanmin(aic_values)],
+		mode='markers',
+		marker=dict(color='royalblue', size=15, symbol='star'),
+		name='AIC الأمثل',
+		showlegend=False
+	))
+
+	fig.add_trace(go.Scatter(
+		x=[lags[np.nanargmin(bic_values)]],
+		y=[np.nanmin(bic_values)],
+		mode='markers',
+		marker=dict(color='tomato', size=15, symbol='star'),
+		name='BIC الأمثل',
+		showlegend=False
+	))
+
+	fig.add_trace(go.Scatter(
+		x=[lags[np.nanargmin(hq_values)]],
+		y=[np.nanmin(hq_values)],
+		mode='markers',
+		marker=dict(color='gold', size=15, symbol='star'),
+		name='HQ الأمثل',
+		showlegend=False
+	))
+
+	fig.update_layout(
+		title=f"اختيار الفجوات الزمنية المثلى: {selection.n_candidates:,} نموذجاً على {selection.nobs} مشاهدة مشتركة",
+		xaxis_title="عدد فجوات المتغير التابع p (أفضل قيمة على فجوات المتغيرات المستقلة)",
+		yaxis_title="قيمة المعيار",
+		xaxis=dict(tickmode='array', tickvals=lags),
+		annotations=[
+			dict(
+				x=lags[np.nanargmin(aic_values)],
+				y=np.nanmin(aic_values),
+				text=f"AIC الأمثل: ARDL{selection.best('aic')}",
+				showarrow=True,
+				arrowhead=2,
+				ax=30,
+				ay=-30
+			),
+			dict(
+				x=lags[np.nanargmin(bic_values)],
+				y=np.nanmin(bic_values),
+				text=f"BIC الأمثل: ARDL{selection.best('bic')}",
+				showarrow=True,
+				arrowhead=2,
+				ax=-30,
+				ay=-30
+			),
+			dict(
+				x=lags[np.nanargmin(hq_values)],
+				y=np.nanmin(hq_values),
+				text=f"HQ الأمثل: ARDL{selection.best('hqic')}",
+				showarrow=True,
+				arrowhead=2,
+				ax=0,
+				ay=30
+			)
+		],
+		height=400,
+		template="plotly_white"
+	)
+
+	return fig
+
+
+@figure("steps.bounds_test")
+def _bounds_test(f_stat=6.85, case="III", k=2, nobs=100):
+	# منحنيات القيمة الاحتمالية المستمرة للحدين من سطح الاستجابة بدلاً من مناطق القرار المتقطعة
+	surface = response_surface()
+	upper = critical_value_table().lookup(case, k, nobs)[LEVELS.index(0.01), 1]
+	x_max = max(10, float(upper) * 1.5, f_stat * 1.15)
+	grid = np.linspace(0.05, x_max, 300)
+	curves = surface.pvalues("f", case, k, nobs, grid)
+	p0, p1 = surface.pvalues("f", case, k, nobs, f_stat)
+
+	fig = go.Figure()
+	fig.add_trace(go.Scatter(x=grid, y=curves[:, 0], mode="lines", name="الحد الأدنى I(0)",
+							 line=dict(color="red", width=2)))
+	# المنطقة بين المنحنيين هي مجال الحكم غير الحاسم
+	fig.add_trace(go.Scatter(x=grid, y=curves[:, 1], mode="lines", name="الحد الأعلى I(1)",
+							 line=dict(color="green", width=2), fill="tonexty",
+							 fillcolor="rgba(255, 255, 0, 0.2)"))
+
+	for level in (0.10, 0.05, 0.01):
+		fig.add_hline(y=level, line=dict(color="gray", width=1, dash="dash"),
+					  annotation_text=f"{level:.0%}", annotation_position="top left")
+
+	# إضافة إحصائية F المحسوبة وقيمتيها الاحتماليتين
+	fig.add_vline(x=f_stat, line=dict(color="blue", width=2))
+	fig.add_annotation(
+		x=f_stat,
+		y=np.log10(0.5),
+		text=f"F-stat = {f_stat:.2f}<br>p[I(0)] = {p0:.4f}<br>p[I(1)] = {p1:.4f}",
+		showarrow=True,
+		arrowhead=2,
+		font=dict(size=12, color="blue"),
+		ax=70,
+		ay=0
+	)
+
+	# تعيين العناوين والتنسيق
+	fig.update_layout(
+		title=f"اختبار الحدود (ARDL Bound Test): الحالة {case}، k={k}، n={nobs}",
+		xaxis_title="إحصائية F",
+		yaxis_title="القيمة الاحتمالية",
+		xaxis=dict(range=[0, x_max]),
+		yaxis=dict(type="log", range=[-4, 0]),
+		height=400,
+		margin=dict(l=50, r=50, b=50, t=50),
+		legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
+		template="plotly_white"
+	)
+
+	return fig
+
+
+@figure("steps.ecm_adjustment")
+def _ecm_adjustment(adjustment_speed=0.45, half_life=1.16, periods=8):
+	# عمر النصف يُمرر محسوباً من النموذج، ولا يُرسم إلا إذا كان معامل التكيف داخل المدى (-1، 0)
+	initial_deviation = 1.0
+	adjustments = initial_deviation * persistence_profile([1 - adjustment_speed], periods - 1)
+
+	fig = go.Figure()
+
+	# إضافة مخطط التعديل
+	fig.add_trace(go.Scatter(
+		x=list(range(periods)),
+		y=adjustments,
+		mode='lines+markers',
+		name='الاختلال المتبقي',
+		marker=dict(size=10),
+		line=dict(width=2, color='royalblue')
+	))
+
+	# إضافة خط أفقي عند 50% من الاختلال الأولي
+	fig.add_shape(
+		type="line",
+		x0=0,
+		y0=initial_deviation * 0.5,
+		x1=periods - 1,
+		y1=initial_deviation * 0.5,
+		line=dict(color="red", width=1, dash="dash")
+	)
+
+	# إضافة خط أفقي عند 5% من الاختلال الأولي (تقريباً تصحيح كامل)
+	fig.add_shape(
+		type="line",
+		x0=0,
+		y0=initial_deviation * 0.05,
+		x1=periods - 1,
+		y1=initial_deviation * 0.05,
+		line=dict(color="green", width=1, dash="dash")
+	)
+
+	# إضافة خط رأسي عند عمر النصف
+	fig.add_shape(
+		type="line",
+		x0=half_life,
+		y0=0,
+		x1=half_life,
+		y1=initial_deviation,
+		line=dict(color="red", width=1, dash="dash")
+	)
+
+	# إضافة تعليقات توضيحية
+	fig.add_annotation(
+		x=half_life,
+		y=initial_deviation * 0.25,
+		text=f"عمر النصف = {half_life} فترة",
+		showarrow=True,
+		arrowhead=2,
+		ax=40,
+		ay=0,
+		font=dict(color="red")
+	)
+
+	fig.add_annotation(
+		x=periods - 1,
+		y=initial_deviation * 0.5,
+		text="50% من الاختلال الأولي",
+		showarrow=True,
+		arrowhead=2,
+		ax=0,
+		ay=20,
+		font=dict(color="red")
+	)
+
+	fig.add_annotation(
+		x=periods - 1,
+		y=initial_deviation * 0.05,
+		text="تصحيح شبه كامل (5% من الاختلال الأولي)",
+		showarrow=True,
+		arrowhead=2,
+		ax=0,
+		ay=20,
+		font=dict(color="green")
+	)
+
+	fig.add_annotation(
+		x=periods - 1,
+		y=adjustments[-1],
+		text=f"بعد {periods} فترات، يتبقى {round(adjustments[-1] * 100, 1)}% من الاختلال الأولي",
+		showarrow=True,
+		arrowhead=2,
+		ax=-60,
+		ay=0
+	)
+
+	fig.update_layout(
+		title=f"سرعة التكيف نحو التوازن طويل الأجل (معامل تصحيح الخطأ = {adjustment_speed})",
+		xaxis_title="الفترات الزمنية",
+		yaxis_title="الاختلال المتبقي",
+		height=400,
+		template="plotly_white"
+	)
+
+	return fig
+
+
+def _stability_charts(test):
+	# رسما CUSUM وCUSUM of Squares من البواقي المتكررة مع حدود 5% و1%
+	time = test.index
+	fig = go.Figure()
+	fig.add_trace(go.Scatter(
+		x=time,
+		y=test.cusum,
+		mode='lines',
+		name='CUSUM',
+		line=dict(color='royalblue', width=2)
+	))
+
+	fig2 = go.Figure()
+	fig2.add_trace(go.Scatter(
+		x=time,
+		y=test.cusumsq,
+		mode='lines',
+		name='CUSUM of Squares',
+		line=dict(color='green', width=2)
+	))
+
+	for level, dash in [(0.05, 'dash'), (0.01, 'dot')]:
+		for target, (lower, upper) in [(fig, test.cusum_bounds(level)), (fig2, test.cusumsq_bounds(level))]:
+			target.add_trace(go.Scatter(
+				x=time,
+				y=upper,
+				mode='lines',
+				name=f'الحد الأعلى ({level:.0%})',
+				line=dict(color='red', width=1, dash=dash)
+			))
+			target.add_trace(go.Scatter(
+				x=time,
+				y=lower,
+				mode='lines',
+				name=f'الحد الأدنى ({level:.0%})',
+				line=dict(color='red', width=1, dash=dash)
+			))
+
+	verdict = {True: "مستقر عند 5%", False: "غير مستقر عند 5%"}
+	fig.update_layout(
+		title=f"اختبار CUSUM لاستقرار النموذج ({verdict[test.stable(0.05, 'cusum')]})",
+		xaxis_title="الزمن",
+		yaxis_title="CUSUM",
+		height=400,
+		template="plotly_white"
+	)
+	fig2.update_layout(
+		title=f"اختبار CUSUM of Squares لاستقرار التباين ({verdict[test.stable(0.05, 'cusumsq')]})",
+		xaxis_title="الزمن",
+		yaxis_title="CUSUM of Squares",
+		height=400,
+		template="plotly_white"
+	)
+
+	return fig, fig2
+
+
+@figure("steps.stability_tests")
+def _stability_tests(n=120, seed=42):
+	# نموذج ARDL(1,1) مقدر على بيانات مولدة بمعلمات ثابتة (نموذج مستقر)
+	rng = np.random.default_rng(seed)
+	x = np.cumsum(rng.normal(0, 1, n))
+	y = np.zeros(n)
+	for t in range(1, n):
+		y[t] = 1 + 0.6 * y[t - 1] + 0.3 * x[t] + 0.1 * x[t - 1] + rng.normal(0, 1)
+	results = ARDL(y, x, 1, 1, trend="c").fit()
+	return _stability_charts(stability_test(results))
+
+
+@figure("steps.causal_graph")
+def _causal_graph():
+	# إنشاء مخطط سببي للعلاقات
+	nodes = ['GDP', 'EC', 'CO2', 'التكنولوجيا']
+	edge_source = [1, 2, 3, 0, 0]
+	edge_target = [0, 0, 0, 1, 2]
+	edge_value = [0.65, -0.12, 0.02, 0.2, 0.3]
+	edge_colors = ['green', 'red', 'blue', 'gray', 'gray']
+	edge_label = ['+0.65', '-0.12', '+0.02', '+', '+']
+
+	fig = go.Figure(data=[
+		go.Scatter(
+			x=[0, 1, 1, 0],
+			y=[0, 1, -1, 0],
+			mode='markers+text',
+			marker=dict(size=40, color=['royalblue', 'tomato', 'crimson', 'gray']),
+			text=nodes,
+			textposition="middle center",
+			textfont=dict(color='white', size=12),
+			hoverinfo='text',
+			name='المتغيرات'
+		)
+	])
+
+	# إضافة الأسهم
+	for i in range(len(edge_source)):
+		# احصل على موقع النقطتين
+		x_source = [0, 1, 1, 0][edge_source[i]]
+		y_source = [0, 1, -1, 0][edge_source[i]]
+		x_target = [0, 1, 1, 0][edge_target[i]]
+		y_target = [0, 1, -1, 0][edge_target[i]]
+
+		# ارسم الاتجاه
+		fig.add_annotation(
+			x=x_target,
+			y=y_target,
+			ax=x_source,
+			ay=y_source,
+			xref='x',
+			yref='y',
+			axref='x',
+			ayref='y',
+			showarrow=True,
+			arrowhead=2,
+			arrowsize=1.5,
+			arrowwidth=2,
+			arrowcolor=edge_colors[i]
+		)
+
+		# أضف الملصق
+		mid_x = (x_source + x_target) / 2
+		mid_y = (y_source + y_target) / 2
+
+		fig.add_annotation(
+			x=mid_x,
+			y=mid_y,
+			text=edge_label[i],
+			showarrow=False,
+			font=dict(size=14, color=edge_colors[i])
+		)
+
+	fig.update_layout(
+		title="مخطط العلاقات السببية بين المتغيرات",
+		showlegend=False,
+		xaxis=dict(showgrid=False, zeroline=False, showticklabels=False),
+		yaxis=dict(showgrid=False, zeroline=False, showticklabels=False),
+		height=500,
+		width=700,
+		margin=dict(l=40, r=40, b=40, t=40),
+		template="plotly_white"
+	)
+
+	return fig
+
+
+@st.cache_data
+def _demo_data(n=200, seed=2024):
+	# بيانات توضيحية: متغيران I(1) ومتغير تابع يرتبط بهما بعلاقة تكامل مشترك
+	rng = np.random.default_rng(seed)
+	x = np.cumsum(rng.normal(0, 1, (n, 2)), axis=0)
+	y = np.zeros(n)
+	for t in range(2, n):
+		y[t] = (1.2 + 0.005 * t + 0.55 * y[t - 1] + 0.15 * y[t - 2]
+				+ 0.45 * x[t, 0] - 0.25 * x[t - 1, 0] + 0.3 * x[t, 1] - 0.12 * x[t - 1, 1]
+				+ rng.normal(0, 0.8))
+	return pd.DataFrame({'y': y, 'x₁': x[:, 0], 'x₂': x[:, 1]})
+
+
+@st.cache_data
+def _read_csv(data):
+	df = pd.read_csv(io.BytesIO(data))
+	return df.select_dtypes("number").dropna()
+
+
+def _session_cached(name, key, compute):
+	# ذاكرة الجلسة تحتفظ بآخر ناتج فقط لكل نوع، فلا تنمو مع كل تغيير في عناصر التحكم
+	cached = st.session_state.get(name)
+	if cached is None or cached[0] != key:
+		cached = (key, compute())
+		st.session_state[name] = cached
+	return cached[1]
+
+
+def _order_search(data, endog, exog, maxlag, maxorder, trend, max_workers, method, criterion):
+	# نتيجة البحث محفوظة في الجلسة؛ البحث الجديد يعرض تقدمه مباشرة على رسم المعايير
+	digest = pd.util.hash_pandas_object(data[[endog, *exog]]).sum()
+	target = "all" if method == "exhaustive" else criterion
+	key = (digest, endog, tuple(exog), maxlag, maxorder, trend, method, target)
+
+	def search():
+		bar = st.progress(0.0)
+		chart = st.empty()
+
+		def progress(done, total, partial):
+			bar.progress(done / total, text=f"تم تقدير {done:,} من {total:,} نموذجاً")
+			chart.plotly_chart(_lag_selection(partial), use_container_width=True, key=f"lag_progress_{done}")
+
+		selection = select_order(data[endog], data[exog], maxlag, maxorder, trend, top=100,
+								 max_workers=max_workers, progress=progress, method=method, ic=criterion)
+		bar.empty()
+		chart.empty()
+		return selection
+
+	return _session_cached("lag_search", key, search)
+
+
+def _fit_ardl(data, endog, exog, p, q, trend):
+	# النموذج المقدر محفوظ في الجلسة، فالنتائج المشتقة منه (UECM والأجل الطويل وECM) تحسب مرة واحدة
+	digest = pd.util.hash_pandas_object(data[[endog, *exog]]).sum()
+	key = (digest, endog, tuple(exog), p, tuple(q), trend)
+	return _session_cached("ardl_fit", key, lambda: ARDL(data[endog], data[exog], p, q, trend).fit())
+
+
+def _bootstrap_bounds(results, case, reps, scheme):
+	# نتيجة Bootstrap محفوظة في الجلسة؛ القيم الحرجة المرحلية تُعرض أثناء التوليد
+	digest = hash((results.endog.tobytes(), results.exog.tobytes()))
+	key = (digest, case, reps, scheme)
+
+	def bootstrap():
+		bar = st.progress(0.0)
+		table = st.empty()
+		names = {"f": "F", "t": "t", "f_exog": "F (exog)"}
+		current = {}
+
+		def progress(stat, done, critical_values):
+			current[names[stat]] = {f"{level:.1%}".replace(".0%", "%"): round(value, 3)
+									for level, value in critical_values.items()}
+			bar.progress(done / reps, text=f"{names[stat]}: تم توليد {done:,} من {reps:,} عينة")
+			table.dataframe(pd.DataFrame(current).T)
+
+		# الاحتفاظ بملخص تدفقي فقط، فالذاكرة لا تنمو مع عدد التكرارات
+		boot = bootstrap_bounds(results, case, reps=reps, seed=2024, scheme=scheme, keep_draws=False,
+								progress=progress)
+		bar.empty()
+		table.empty()
+		return boot
+
+	return _session_cached("bootstrap_bounds", key, bootstrap)
+
+
+def _data_panel():
+	# اختيار البيانات المشتركة بين خطوات التطبيق: ملف المستخدم أو البيانات التوضيحية
+	with st.expander("📂 بيانات التطبيق", expanded=False):
+		uploaded = st.file_uploader("ارفع ملف CSV يحتوي على السلاسل الزمنية (أعمدة رقمية)", type=["csv"])
+		data = _demo_data() if uploaded is None else _read_csv(uploaded.getvalue())
+		if uploaded is None:
+			st.caption("يتم استخدام بيانات توضيحية مولدة (200 مشاهدة) إلى أن يتم رفع ملف.")
+		columns = list(data.columns)
+		if len(columns) < 2:
+			st.error("يجب أن يحتوي الملف على عمودين رقميين على الأقل.")
+			return None
+		col1, col2, col3 = st.columns(3)
+		with col1:
+			endog = st.selectbox("المتغير التابع", columns, index=0)
+		with col2:
+			others = [c for c in columns if c != endog]
+			exog = st.multiselect("المتغيرات المستقلة", others, default=others[:2])
+		with col3:
+			trend = st.selectbox("المكونات المحددة", ["ct", "c", "n"],
+								 format_func={"ct": "ثابت واتجاه", "c": "ثابت فقط", "n": "بدون ثابت"}.get)
+		if not exog:
+			st.error("اختر متغيراً مستقلاً واحداً على الأقل.")
+			return None
+	return data, endog, exog, trend
+
+
+def _ec_term(ecm, index):
+	# حد تصحيح الخطأ المتباطئ: انحراف المتغير التابع عن قيمته التوازنية طويلة الأجل
+	fig = go.Figure()
+	fig.add_trace(go.Scatter(x=index, y=ecm.ec, mode='lines', name='EC(-1)', line=dict(color='blue', width=2)))
+	fig.add_hline(y=0, line=dict(color='gray', width=1, dash='dash'))
+	fig.update_layout(
+		title="حد تصحيح الخطأ EC(-1) المحسوب من المعاملات طويلة الأجل المقدرة",
+		xaxis_title="المشاهدة",
+		yaxis_title="الانحراف عن التوازن",
+		height=350,
+		template="plotly_white"
+	)
+	return fig
+
+
+def _dynamic_multipliers(results, horizon=20, reps=199, level=0.95):
+	# المضاعفات الديناميكية التراكمية لكل متغير مستقل بنطاقات Bootstrap، محفوظة في الجلسة
+	digest = hash((results.endog.tobytes(), results.exog.tobytes()))
+
+	def multipliers():
+		responses = dynamic_responses(results, horizon)
+		return responses, responses.bands(reps, level, seed=42)
+
+	responses, bands = _session_cached("dynamic_multipliers", (digest, horizon, reps, level), multipliers)
+
+	colors = ['royalblue', 'darkorange', 'seagreen', 'crimson', 'purple']
+	fig = go.Figure()
+	for j, (name, band) in enumerate(bands.items()):
+		color = colors[j % len(colors)]
+		fig.add_trace(go.Scatter(
+			x=np.r_[band.index, band.index[::-1]],
+			y=np.r_[band['upper'], band['lower'][::-1]],
+			fill='toself',
+			fillcolor=color,
+			opacity=0.15,
+			line=dict(width=0),
+			hoverinfo='skip',
+			showlegend=False
+		))
+		fig.add_trace(go.Scatter(x=band.index, y=band['estimate'], mode='lines', name=name,
+								 line=dict(color=color, width=2)))
+		fig.add_hline(y=responses.long_run[name], line=dict(color=color, width=1, dash='dash'))
+	fig.update_layout(
+		title=f"المضاعفات الديناميكية التراكمية ونطاقات Bootstrap ({level:.0%})، والخطوط المتقطعة للأثر طويل الأجل",
+		xaxis_title="الفترات بعد الصدمة",
+		yaxis_title="الأثر التراكمي على المتغير التابع",
+		height=400,
+		template="plotly_white"
+	)
+	return fig
+
+
+def _results_table(results):
+	# جدول نتائج النموذج بصيغة تصحيح الخطأ غير المقيدة
+	uecm = results.uecm
+	df_results = pd.DataFrame({
+		'المتغير': uecm.names,
+		'المعامل': uecm.params,
+		'الخطأ المعياري': uecm.bse,
+		't-stat': uecm.tvalues,
+		'القيمة الاحتمالية': uecm.pvalues
+	})
+
+	# إضافة نجوم للإشارة إلى المعنوية
+	df_results['المعنوية'] = np.select(
+		[uecm.pvalues < 0.01, uecm.pvalues < 0.05, uecm.pvalues < 0.1], ['***', '**', '*'], '')
+
+	# تنسيق القيم العددية
+	for column in ['المعامل', 'الخطأ المعياري', 't-stat', 'القيمة الاحتمالية']:
+		df_results[column] = df_results[column].map('{:.3f}'.format)
+
+	# تصنيف المتغيرات: الحدود المحددة والمستويات المتباطئة طويلة الأجل، والفروق قصيرة الأجل
+	df_results['النوع'] = np.where(df_results['المتغير'].str.startswith('Δ'), 'قصير الأجل', 'طويل الأجل')
+
+	# إعادة ترتيب الأعمدة
+	return df_results[['المتغير', 'النوع', 'المعامل', 'الخطأ المعياري', 't-stat', 'القيمة الاحتمالية', 'المعنوية']]
+
+
+# خطوات تطبيق ARDL
+def render():
+	st.title("خطوات تطبيق نموذج ARDL")
+	st.markdown("---")
+
+	st.markdown("""
+    ## الخطوات المنهجية لتطبيق نموذج ARDL واختبار الحدود
+
+    يتضمن تطبيق نموذج ARDL مجموعة من الخطوات المتسلسلة، نشرحها بالتفصيل فيما يلي:
+    """)
+
+	# إنشاء رسم للخطوات الرئيسية
+	steps = STEPS
+
+	fig = get_figure("steps.pipeline", steps=steps)
+	st.plotly_chart(fig, use_container_width=True)
+
+	st.markdown("---")
+
+	panel = _data_panel()
+
+	tabs = st.tabs([f"الخطوة {i + 1}: {step}" for i, step in enumerate(steps)])
+
+	with tabs[0]:
+		st.markdown("""
+        ## الخطوة 1: اختبار رتبة تكامل المتغيرات
+
+        ### الهدف:
+        التأكد من أن المتغيرات متكاملة من الرتبة I(0) أو I(1) أو مزيج منهما، وليس من الرتبة I(2) أو أعلى.
+
+        ### الإجراءات:
+
+        1. **اختبار جذر الوحدة للمتغيرات في مستواها**:
+           - اختبار Augmented Dickey-Fuller (ADF)
+           - اختبار Phillips-Perron (PP)
+           - اختبار Kwiatkowski-Phillips-Schmidt-Shin (KPSS)
+
+        2. **اختبار جذر الوحدة للمتغيرات في الفروق الأولى**:
+           - إذا كانت المتغيرات غير مستقرة في مستواها، يتم اختبار استقرارها في الفروق الأولى
+
+        3. **تصنيف المتغيرات حسب رتبة التكامل**:
+           - إذا كان المتغير مستقراً في مستواه، فهو متكامل من الرتبة I(0)
+           - إذا كان المتغير مستقراً في الفرق الأول، فهو متكامل من الرتبة I(1)
+
+        ### المعايير:
+
+        - **فرضية العدم في ADF وPP**: المتغير يحتوي على جذر وحدة (غير مستقر)
+        - **فرضية العدم في KPSS**: المتغير مستقر
+
+        ### ملاحظات هامة:
+
+        - يفضل استخدام مزيج من اختبارات جذر الوحدة للحصول على نتائج أكثر موثوقية
+        - في حالة تضارب النتائج، يمكن الاعتماد على الاختبار الأكثر ملاءمة لخصائص البيانات
+        - إذا كان أي متغير متكاملاً من الرتبة I(2) أو أعلى، يجب استخدام الفروق المناسبة لتحويله إلى I(1) قبل تطبيق نموذج ARDL
+        """)
+
+		# إنشاء مخطط توضيحي لاختبارات جذر الوحدة
+		unit_root_tests = {
+			'اختبار': ['ADF', 'PP', 'KPSS'],
+			'فرضية العدم': ['يوجد جذر وحدة', 'يوجد جذر وحدة', 'المتغير مستقر'],
+			'الفرضية البديلة': ['المتغير مستقر', 'المتغير مستقر', 'يوجد جذر وحدة'],
+			'القرار إذا p < 0.05': ['رفض وجود جذر الوحدة', 'رفض وجود جذر الوحدة', 'قبول وجود جذر الوحدة']
+		}
+
+		df = pd.DataFrame(unit_root_tests)
+		st.table(df)
+
+	with tabs[1]:
+		st.markdown("""
+        ## الخطوة 2: تحديد صيغة نموذج ARDL
+
+        ### الهدف:
+        تحديد الصيغة المناسبة لنموذج ARDL وفقاً لطبيعة البيانات وأهداف الدراسة.
+
+        ### الصيغ الرئيسية:
+
+        1. **نموذج تصحيح الخطأ غير المقيد (UECM)**:
+
+           الصيغة المستخدمة في منهجية اختبار الحدود. تتضمن مستويات المتغيرات المتباطئة لفترة واحدة والفروق الأولى للمتغيرات مع فجوات زمنية.
+
+        2. **الصيغة القياسية**:
+
+           تتضمن المتغير التابع والمتغيرات المستقلة مع فجواتها الزمنية.
+
+        ### الخطوات العملية:
+
+        1. **تحديد المتغير التابع والمتغيرات المستقلة**:
+           - يجب أن تكون العلاقة مدعومة نظرياً
+
+        2. **تحديد نوع النموذج**:
+           - مع ثابت بدون اتجاه زمني
+           - مع ثابت واتجاه زمني
+           - بدون ثابت وبدون اتجاه زمني
+
+        3. **تحديد الحد الأقصى للفجوات الزمنية المحتملة**:
+           - استناداً إلى الخبرة النظرية
+           - استناداً إلى تردد البيانات (سنوية، فصلية، شهرية)
+           - استناداً إلى حجم العينة المتاحة
+
+        ### اعتبارات خاصة:
+
+        - **البيانات السنوية**: عادة ما يكون الحد الأقصى للفجوات الزمنية 1-2 سنة
+        - **البيانات الفصلية**: يمكن النظر في 4-8 فجوات زمنية
+        - **البيانات الشهرية**: قد تتطلب 12-24 فجوة زمنية
+
+        ### مثال على صيغة UECM:
+
+        صيغة UECM لنموذج ARDL مع متغير تابع y ومتغيرين مستقلين x₁ و x₂:
+        """)
+
+		st.markdown(r'''
+        <div class="formula">
+        $\Delta y_t = \alpha_0 + \alpha_1 t + \delta_1 y_{t-1} + \delta_2 x_{1,t-1} + \delta_3 x_{2,t-1} + \sum_{i=1}^{p} \beta_i \Delta y_{t-i} + \sum_{j=0}^{q_1} \gamma_j \Delta x_{1,t-j} + \sum_{k=0}^{q_2} \theta_k \Delta x_{2,t-k} + \varepsilon_t$
+        </div>
+        ''', unsafe_allow_html=True)
+
+		# إنشاء مخطط توضيحي لمكونات نموذج ARDL-UECM
+		components = [
+			{'مكون': 'Δy_t', 'وصف': 'الفرق الأول للمتغير التابع'},
+			{'مكون': 'α₀', 'وصف': 'الثابت'},
+			{'مكون': 'α₁t', 'وصف': 'الاتجاه الزمني'},
+			{'مكون': 'δ₁y_{t-1} + δ₂x₁_{t-1} + δ₃x₂_{t-1}', 'وصف': 'مكونات العلاقة طويلة الأجل'},
+			{'مكون': '∑βᵢΔy_{t-i}', 'وصف': 'الفروق الأولى المتباطئة للمتغير التابع'},
+			{'مكون': '∑γⱼΔx₁_{t-j} + ∑θₖΔx₂_{t-k}', 'وصف': 'الفروق الأولى للمتغيرات المستقلة مع فجوات زمنية'},
+			{'مكون': 'ε_t', 'وصف': 'حد الخطأ العشوائي'}
+		]
+
+		df = pd.DataFrame(components)
+		st.table(df)
+
+	with tabs[2]:
+		st.markdown("""
+        ## الخطوة 3: اختيار الفجوات الزمنية المثلى
+
+        ### الهدف:
+        تحديد عدد الفجوات الزمنية المثلى لكل متغير في النموذج للحصول على أفضل مواءمة للبيانات.
+
+        ### معايير اختيار النموذج:
+
+        1. **معيار معلومات أكايكي (AIC - Akaike Information Criterion)**:
+           - يفضل في العينات الصغيرة
+           - يميل إلى اختيار نماذج أكثر تعقيداً (مع فجوات زمنية أكثر)
+
+        2. **معيار معلومات بايز أو شوارتز (BIC / SBC - Bayesian/Schwarz Information Criterion)**:
+           - يفضل النماذج الأكثر اقتصاداً
+           - يفرض عقوبة أكبر على عدد المعلمات المقدرة
+
+        3. **معيار معلومات هانان-كوين (HQ - Hannan-Quinn Information Criterion)**:
+           - وسط بين AIC و BIC
+
+        4. **معايير أخرى**:
+           - معيار R² المعدل
+           - معيار خطأ التنبؤ النهائي (FPE)
+
+        ### الخطوات العملية:
+
+        1. **تحديد الحد الأقصى للفجوات الزمنية**:
+           - مقيد بحجم العينة وتردد البيانات
+
+        2. **تقدير جميع النماذج الممكنة**:
+           - إذا كان الحد الأقصى هو p للمتغير التابع وq للمتغيرات المستقلة، فسيتم تقدير (p+1)(q+1)^k نموذجاً، حيث k هو عدد المتغيرات المستقلة
+
+        3. **اختيار النموذج الأمثل**:
+           - النموذج الذي يحقق أدنى قيمة للمعيار المختار
+
+        ### التوازن بين الدقة والاقتصاد:
+
+        - **الفجوات الزمنية الكثيرة**: تزيد من دقة النموذج ولكنها تقلل درجات الحرية وتزيد من مخاطر الارتباط المتعدد الخطي
+        - **الفجوات الزمنية القليلة**: تحافظ على درجات الحرية ولكنها قد تؤدي إلى سوء تحديد النموذج
+
+        ### اعتبارات خاصة:
+
+        - **الأفضل عادة**: السماح بعدد فجوات زمنية مختلف لكل متغير
+        - **في حالة العينات الصغيرة**: يفضل استخدام BIC لاختيار نموذج اقتصادي أكثر
+        - **في دراسات التنبؤ**: يفضل AIC
+        """)
+
+		best_order = None
+		if panel is not None:
+			data, endog, exog, trend = panel
+			col1, col2, col3, col4 = st.columns(4)
+			with col1:
+				maxlag = st.number_input("الحد الأقصى لفجوات المتغير التابع", min_value=1, max_value=12, value=4)
+			with col2:
+				maxorder = st.number_input("الحد الأقصى لفجوات المتغيرات المستقلة", min_value=0, max_value=12, value=4)
+			with col3:
+				criterion = st.selectbox("المعيار المعتمد", ["aic", "bic", "hqic", "fpe"],
+										 format_func=str.upper)
+			with col4:
+				max_workers = st.number_input("عدد العمليات المتوازية", min_value=1, max_value=os.cpu_count() or 1,
+											  value=1)
+			method = st.radio("طريقة البحث", list(SEARCH_METHODS), format_func=SEARCH_METHODS.get, horizontal=True)
+
+			try:
+				selection = _order_search(data, endog, exog, maxlag, maxorder, trend, max_workers, method, criterion)
+			except ValueError as exc:
+				st.error(f"تعذر البحث عن الفجوات المثلى: {exc}")
+			else:
+				best_order = selection.best(criterion)
+				fig = _lag_selection(selection)
+				st.plotly_chart(fig, use_container_width=True)
+
+				st.subheader(f"أفضل 5 نماذج وفق معيار {criterion.upper()}")
+				st.dataframe(selection.top(5, criterion), hide_index=True)
+
+				if method == "exhaustive":
+					choices = {ic.upper(): selection.best(ic) for ic in ("aic", "bic", "hqic")}
+				else:
+					choices = {criterion.upper(): best_order}
+				share = selection.n_candidates / selection.grid_size
+				st.markdown(f"""
+        <div class="highlight">
+        <strong>ملاحظة مهمة:</strong><br>
+        تم تقدير {selection.n_candidates:,} نموذجاً من أصل {selection.grid_size:,} ({share:.1%}) في الشبكة (p = 1..{maxlag} وq = 0..{maxorder} لكل متغير مستقل) على العينة نفسها.
+        الرتب المختارة: {"، ".join(f"{ic}: ARDL{order}" for ic, order in choices.items())}.
+        قد تختار المعايير المختلفة رتباً مختلفة، إذ يميل BIC إلى اختيار النماذج الأكثر اقتصاداً في المعلمات.
+        </div>
+        """, unsafe_allow_html=True)
+
+	with tabs[3]:
+		st.markdown("""
+        ## الخطوة 4: تقدير النموذج
+
+        ### الهدف:
+        تقدير معلمات نموذج ARDL باستخدام طريقة المربعات الصغرى العادية (OLS).
+
+        ### صيغة النموذج:
+
+        في هذه المرحلة، يتم تقدير نموذج ARDL بالصيغة التالية:
+        """)
+
+		st.markdown(r'''
+        <div class="formula">
+        $\Delta y_t = \alpha_0 + \alpha_1 t + \delta_1 y_{t-1} + \delta_2 x_{1,t-1} + \delta_3 x_{2,t-1} + \sum_{i=1}^{p} \beta_i \Delta y_{t-i} + \sum_{j=0}^{q_1} \gamma_j \Delta x_{1,t-j} + \sum_{k=0}^{q_2} \theta_k \Delta x_{2,t-k} + \varepsilon_t$
+        </div>
+        ''', unsafe_allow_html=True)
+
+		st.markdown("""
+        حيث:
+        - p هو عدد الفجوات الزمنية للمتغير التابع
+        - q₁ هو عدد الفجوات الزمنية للمتغير المستقل الأول
+        - q₂ هو عدد الفجوات الزمنية للمتغير المستقل الثاني
+
+        ### الخطوات العملية:
+
+        1. **بناء المتغيرات**:
+           - إنشاء متغير للفرق الأول للمتغير التابع Δy_t
+           - إنشاء المتغيرات المستقلة المتباطئة لفترة واحدة y_{t-1}, x₁_{t-1}, x₂_{t-1}
+           - إنشاء متغيرات الفروق الأولى مع الفجوات الزمنية المحددة Δy_{t-i}, Δx₁_{t-j}, Δx₂_{t-k}
+
+        2. **تقدير النموذج**:
+           - استخدام طريقة المربعات الصغرى العادية (OLS)
+           - تطبيق الفجوات الزمنية المثلى التي تم تحديدها في الخطوة السابقة
+
+        3. **تفسير النتائج الأولية**:
+           - تحليل معنوية المعلمات المقدرة
+           - تحليل جودة التوفيق الإجمالية للنموذج (معامل التحديد R²)
+
+        ### اعتبارات مهمة:
+
+        - **حجم العينة**: بعد أخذ الفجوات الزمنية، يجب أن يتبقى عدد كافٍ من المشاهدات للتقدير
+        - **مشكلة الارتباط الذاتي**: يجب اختيار عدد كافٍ من الفجوات الزمنية لإزالة الارتباط الذاتي في البواقي
+        - **مشكلة عدم الاستقرار**: قد تظهر مشاكل في التقدير إذا كانت بعض المتغيرات قريبة من عدم الاستقرار
+
+        ### مخرجات التقدير:
+
+        1. **معلمات النموذج المقدرة**:
+           - المعلمات قصيرة الأجل (معاملات الفروق)
+           - المعلمات طويلة الأجل (معاملات المستويات المتباطئة)
+
+        2. **الأخطاء المعيارية ومستويات المعنوية**:
+           - اختبارات t الإحصائية لكل معلمة
+           - القيم الاحتمالية (p-values)
+
+        3. **إحصاءات جودة التوفيق**:
+           - معامل التحديد R²
+           - معامل التحديد المعدل Adjusted R²
+           - مجموع مربعات البواقي
+           - إحصائية F الإجمالية ومعنويتها
+        """)
+
+		results = None
+		if panel is not None:
+			data, endog, exog, trend = panel
+			st.markdown("#### الفجوات الزمنية للنموذج المقدر")
+			lag_cols = st.columns(len(exog) + 1)
+			# القيم الافتراضية هي الرتبة المختارة في الخطوة السابقة
+			default = best_order or (3, *[2] * len(exog))
+			with lag_cols[0]:
+				p = st.number_input(f"p ({endog})", min_value=1, max_value=12, value=default[0])
+			q = []
+			for j, name in enumerate(exog):
+				with lag_cols[j + 1]:
+					q.append(st.number_input(f"q ({name})", min_value=0, max_value=12, value=default[j + 1]))
+
+			try:
+				results = _fit_ardl(data, endog, exog, p, q, trend)
+			except ValueError as exc:
+				st.error(f"تعذر تقدير النموذج: {exc}")
+			else:
+				# عرض النتائج
+				order = ",".join(str(o) for o in results.model.order)
+				st.subheader(f"نتائج تقدير نموذج ARDL({order}) بصيغة تصحيح الخطأ غير المقيدة")
+				st.table(_results_table(results))
+
+				st.markdown("""
+        <div class="highlight">
+        <strong>ملاحظة:</strong><br>
+        *** معنوي عند مستوى 1%<br>
+        ** معنوي عند مستوى 5%<br>
+        * معنوي عند مستوى 10%
+        </div>
+        """, unsafe_allow_html=True)
+
+				# إضافة إحصاءات النموذج
+				uecm = results.uecm
+				col1, col2, col3 = st.columns(3)
+				with col1:
+					st.metric("معامل التحديد R²", f"{uecm.rsquared:.3f}")
+				with col2:
+					st.metric("معامل التحديد المعدل", f"{uecm.rsquared_adj:.3f}")
+				with col3:
+					st.metric("إحصائية F (القيمة الاحتمالية)", f"{uecm.fvalue:.2f} ({uecm.f_pvalue:.3f})")
+				st.caption(f"عدد المشاهدات المستخدمة: {results.nobs} — مجموع مربعات البواقي: {results.ssr:.3f}")
+
+	with tabs[4]:
+		st.markdown("""
+        ## الخطوة 5: اختبار الحدود (Bound Test)
+
+        ### الهدف:
+        التحقق من وجود علاقة توازنية طويلة الأجل (تكامل مشترك) بين المتغيرات.
+
+        ### المبدأ:
+
+        يستند اختبار الحدود على إحصائية F (أو إحصائية Wald) لاختبار فرضية أن جميع معاملات المستويات المتباطئة تساوي صفراً (أي عدم وجود علاقة طويلة الأجل).
+
+        ### الفرضيات:
+
+        - **فرضية العدم (H₀)**: δ₁ = δ₂ = δ₃ = 0 (لا توجد علاقة تكامل مشترك طويلة الأجل)
+        - **الفرضية البديلة (H₁)**: δ₁ ≠ 0 أو δ₂ ≠ 0 أو δ₃ ≠ 0 (توجد علاقة تكامل مشترك طويلة الأجل)
+
+        حيث δ₁، δ₂، δ₃ هي معاملات المستويات المتباطئة في النموذج.
+
+        ### الخطوات العملية:
+
+        1. **حساب إحصائية F**:
+           - استخدام اختبار Wald لاختبار قيد أن جميع معاملات المستويات المتباطئة تساوي صفراً
+
+        2. **مقارنة إحصائية F المحسوبة بالقيم الحرجة**:
+           - تم توفير القيم الحرجة (الحدود العليا والدنيا) بواسطة Pesaran وآخرون (2001)
+           - تُحسب هنا القيم الحرجة والقيم الاحتمالية لحجم العينة الفعلي من انحدارات سطح الاستجابة (Kripfganz و Schneider، 2020)
+           - تعتمد القيم الحرجة على:
+             * عدد المتغيرات المستقلة (k)
+             * نوع النموذج (مع ثابت، مع اتجاه زمني، إلخ)
+             * حجم العينة
+
+        3. **اتخاذ القرار**:
+           - إذا كانت إحصائية F > الحد الأعلى للقيم الحرجة: ترفض فرضية العدم (يوجد تكامل مشترك)
+           - إذا كانت إحصائية F < الحد الأدنى للقيم الحرجة: لا يمكن رفض فرضية العدم (لا يوجد تكامل مشترك)
+           - إذا كانت الحد الأدنى < إحصائية F < الحد الأعلى: النتيجة غير حاسمة
+        """)
+
+		if results is None:
+			st.info("قم بتقدير النموذج في الخطوة السابقة لإجراء اختبار الحدود.")
+		else:
+			trend = results.model.trend
+			cases = [case for case in CASES if CASE_TERMS[case][0] == trend]
+			case = st.selectbox("حالة المكونات المحددة (Pesaran et al., 2001)", cases,
+								index=cases.index(DEFAULT_CASE[trend]), format_func=CASE_LABELS.get)
+			test = bounds_test(results, case)
+			f_bounds = test.bounds("f")
+
+			fig = get_figure("steps.bounds_test", f_stat=round(test.fstat, 4), case=case, k=test.k, nobs=test.nobs)
+			st.plotly_chart(fig, use_container_width=True)
+
+			# جدول القيم الحرجة للعينة الفعلية من سطح الاستجابة
+			st.subheader(f"القيم الحرجة لاختبار الحدود (الحالة {case}، k={test.k}، n={test.nobs})")
+
+			levels = sorted(test.levels)
+			critical_values = {
+				'مستوى المعنوية': [f"{level:.1%}".replace(".0%", "%") for level in levels],
+				'الحد الأدنى I(0)': [round(f_bounds[level][0], 3) for level in levels],
+				'الحد الأعلى I(1)': [round(f_bounds[level][1], 3) for level in levels]
+			}
+			if test.tstat is not None:
+				t_bounds = test.bounds("t")
+				critical_values['t: الحد الأدنى I(0)'] = [round(t_bounds[level][0], 3) for level in levels]
+				critical_values['t: الحد الأعلى I(1)'] = [round(t_bounds[level][1], 3) for level in levels]
+
+			df_cv = pd.DataFrame(critical_values)
+			st.table(df_cv)
+
+			verdicts = {
+				"reject": "أكبر من الحد الأعلى للقيم الحرجة عند مستوى 5%، مما يشير إلى وجود علاقة تكامل مشترك طويلة الأجل بين المتغيرات",
+				"accept": "أقل من الحد الأدنى للقيم الحرجة عند مستوى 5%، فلا يمكن رفض فرضية عدم وجود علاقة طويلة الأجل",
+				"inconclusive": "تقع بين الحدين الأدنى والأعلى عند مستوى 5%، فالنتيجة غير حاسمة"
+			}
+			t_note = ""
+			if test.tstat is not None:
+				# إحصائية t سالبة، فتُقارن بالحدود بالقيمة المطلقة
+				t_verdict = verdicts[test.decision(0.05, 't')].replace("من الحد", "بالقيمة المطلقة من الحد")
+				t_p0, t_p1 = test.pvalue("t")
+				t_note = (f"<br>إحصائية t لمعامل المتغير التابع المتباطئ هي {test.tstat:.3f} "
+						  f"(p = {t_p0:.4f} لـ I(0) و{t_p1:.4f} لـ I(1))، وهي {t_verdict}.")
+			f_p0, f_p1 = test.pvalue("f")
+			st.markdown(f"""
+        <div class="highlight">
+        <strong>تفسير النتيجة:</strong><br>
+        إحصائية F المحسوبة (اختبار Wald) هي {test.fstat:.3f} (p = {f_p0:.4f} لـ I(0) و{f_p1:.4f} لـ I(1))، وهي {verdicts[test.decision(0.05)]}.{t_note}
+        </div>
+        """, unsafe_allow_html=True)
+
+			with st.expander("القيم الحرجة بطريقة Bootstrap المشروط (McNown وآخرون، 2018)"):
+				col1, col2 = st.columns(2)
+				with col1:
+					reps = st.number_input("عدد تكرارات Bootstrap", 1000, 100000, 5000, step=1000)
+				with col2:
+					scheme = st.selectbox("طريقة إعادة معاينة البواقي", list(SCHEME_LABELS),
+										  format_func=SCHEME_LABELS.get)
+				if st.checkbox("حساب القيم الحرجة بطريقة Bootstrap"):
+					boot = _bootstrap_bounds(results, case, int(reps), scheme)
+					names = {"f": "F", "t": "t", "f_exog": "F (exog)"}
+					st.table(pd.DataFrame({
+						'الإحصائية': [names[stat] for stat in boot.observed],
+						'القيمة المحسوبة': [round(boot.observed[stat], 3) for stat in boot.observed],
+						**{f'القيمة الحرجة {level:.0%}': [round(boot.critical_values(stat)[level], 3)
+														  for stat in boot.observed]
+						   for level in (0.10, 0.05, 0.01)},
+						'القيمة الاحتمالية': [round(boot.pvalue(stat), 4) for stat in boot.observed]
+					}))
+
+		st.markdown("""
+        ### ملاحظات إضافية:
+
+        1. **اختبار بديل**: يمكن أيضاً استخدام إحصائية t لاختبار δ₁ = 0 (معامل المتغير التابع المتباطئ) كاختبار بديل أو مكمل
+
+        2. **القيم الحرجة لعينات صغيرة**: يمكن استخدام تقنية Bootstrap لتوليد قيم حرجة أكثر دقة للعينات الصغيرة
+
+        3. **تفسير النتائج**:
+           - إذا كانت النتيجة غير حاسمة، يمكن الاعتماد على اختبارات تكامل مشترك أخرى أو على معنوية معامل تصحيح الخطأ (EC) في الخطوة القادمة
+        """)
+
+	with tabs[5]:
+		st.markdown("""
+        ## الخطوة 6: تقدير العلاقات طويلة الأجل
+
+        ### الهدف:
+        استخراج معاملات العلاقة طويلة الأجل (التوازنية) بين المتغيرات من نموذج ARDL.
+
+        ### شرط أساسي:
+        يتم تقدير العلاقات طويلة الأجل فقط في حالة وجود تكامل مشترك (نتيجة إيجابية في اختبار الحدود).
+
+        ### حساب المعاملات طويلة الأجل:
+
+        تُحسب المعاملات طويلة الأجل باستخدام المعادلة التالية:
+        """)
+
+		st.latex(r"\theta_i = -\frac{\delta_{i+1}}{\delta_1}")
+
+
+		st.markdown("""
+        حيث:
+        - θᵢ هو المعامل طويل الأجل للمتغير المستقل i
+        - δ₁ هو معامل المتغير التابع المتباطئ y_{t-1}
+        - δᵢ₊₁ هو معامل المتغير المستقل المتباطئ x_{i,t-1}
+
+        ### الخطوات العملية:
+
+        1. **استخراج معاملات المستويات المتباطئة** من تقدير نموذج ARDL:
+           - δ₁: معامل y_{t-1}
+           - δ₂: معامل x₁_{t-1}
+           - δ₃: معامل x₂_{t-1}
+           - إلخ...
+
+        2. **حساب المعاملات طويلة الأجل**:
+           - θ₁ = -δ₂/δ₁ (معامل x₁ في العلاقة طويلة الأجل)
+           - θ₂ = -δ₃/δ₁ (معامل x₂ في العلاقة طويلة الأجل)
+           - الثابت في العلاقة طويلة الأجل = -α₀/δ₁
+           - معامل الاتجاه الزمني في العلاقة طويلة الأجل = -α₁/δ₁
+
+        3. **حساب الأخطاء المعيارية** للمعاملات طويلة الأجل:
+           - عادة ما يتم استخدام طريقة دلتا (Delta method) لحساب الأخطاء المعيارية
+
+        ### صياغة العلاقة طويلة الأجل:
+
+        بعد حساب المعاملات، يمكن صياغة العلاقة طويلة الأجل كما يلي:
+        """)
+
+		st.markdown(r'''
+        <div class="formula">
+        $y_t = \alpha + \beta t + \theta_1 x_{1,t} + \theta_2 x_{2,t} + \nu_t$
+        </div>
+        ''', unsafe_allow_html=True)
+
+		st.markdown("""
+        حيث:
+        - α هو الثابت في العلاقة طويلة الأجل
+        - β هو معامل الاتجاه الزمني في العلاقة طويلة الأجل
+        - θ₁ و θ₂ هما المعاملات طويلة الأجل للمتغيرات المستقلة
+        - νₜ هو المتغير العشوائي في العلاقة طويلة الأجل
+
+        ### تفسير المعاملات طويلة الأجل:
+
+        - **المعاملات الموجبة**: تشير إلى علاقة طردية في المدى الطويل
+        - **المعاملات السالبة**: تشير إلى علاقة عكسية في المدى الطويل
+        - **حجم المعاملات**: يعكس المرونة طويلة الأجل إذا كانت المتغيرات في صيغة لوغاريتمية
+        """)
+
+		# المعاملات طويلة الأجل للنموذج المقدر في الخطوة 3 بأخطاء معيارية بطريقة دلتا، أو مثال توضيحي
+		if results is not None:
+			long_run = results.long_run
+			st.subheader("المعاملات طويلة الأجل المقدرة (الأخطاء المعيارية بطريقة دلتا)")
+			df_long_run = pd.DataFrame({
+				'المتغير': long_run.names,
+				'المعامل طويل الأجل': long_run.params,
+				'الخطأ المعياري': long_run.bse,
+				't-stat': long_run.tvalues,
+				'القيمة الاحتمالية': long_run.pvalues
+			})
+			for column in ['المعامل طويل الأجل', 'الخطأ المعياري', 't-stat', 'القيمة الاحتمالية']:
+				df_long_run[column] = df_long_run[column].map('{:.3f}'.format)
+			st.table(df_long_run)
+
+			terms = " ".join(f"{'+' if value >= 0 else '-'} {abs(value):.3f}{'' if name == 'C' else ' ' + name}"
+							 for name, value in zip(long_run.names, long_run.params))
+			errors = " ".join(f"({se:.3f})" for se in long_run.bse)
+			st.markdown(f"""
+        <div class="highlight">
+        <strong>المعادلة طويلة الأجل المقدرة:</strong>
+
+        {results.model.endog_name} = {terms.lstrip('+ ')}
+          {errors}
+
+        حيث القيم بين الأقواس تمثل الأخطاء المعيارية للمعاملات المقدرة.
+        </div>
+        """, unsafe_allow_html=True)
+
+			st.subheader("المسار الزمني للوصول إلى الأثر طويل الأجل")
+			st.plotly_chart(_dynamic_multipliers(results), use_container_width=True)
+		else:
+			# مثال توضيحي لتقدير المعاملات طويلة الأجل
+			long_run_data = {
+				'المعاملات': ['مستوى y₍ₜ₋₁₎', 'مستوى x₁₍ₜ₋₁₎', 'مستوى x₂₍ₜ₋₁₎', 'الثابت', 'الاتجاه الزمني'],
+				'القيمة المقدرة': [-0.45, 0.32, 0.18, 1.25, 0.01],
+				'الخطأ المعياري': [0.09, 0.11, 0.08, 0.42, 0.003]
+			}
+
+			df_coeffs = pd.DataFrame(long_run_data)
+
+			st.subheader("المعاملات المقدرة للمستويات في نموذج ARDL")
+			st.table(df_coeffs)
+
+			st.subheader("المعاملات طويلة الأجل المشتقة")
+
+			# حساب المعاملات طويلة الأجل
+			coef_y_lag = -0.45
+
+			long_run_data2 = {
+				'المتغير': ['x₁', 'x₂', 'الثابت', 'الاتجاه الزمني'],
+				'المعادلة': ['-δ₂/δ₁ = -(0.32/(-0.45))', '-δ₃/δ₁ = -(0.18/(-0.45))', '-α₀/δ₁ = -(1.25/(-0.45))',
+							 '-α₁/δ₁ = -(0.01/(-0.45))'],
+				'المعامل طويل الأجل': [round(0.32 / (-coef_y_lag), 3), round(0.18 / (-coef_y_lag), 3),
+									   round(1.25 / (-coef_y_lag), 3), round(0.01 / (-coef_y_lag), 3)],
+				'الخطأ المعياري': [0.219, 0.163, 0.882, 0.008],
+				't-stat': [round((0.32 / (-coef_y_lag)) / 0.219, 3), round((0.18 / (-coef_y_lag)) / 0.163, 3),
+						   round((1.25 / (-coef_y_lag)) / 0.882, 3), round((0.01 / (-coef_y_lag)) / 0.008, 3)]
+			}
+
+			df_long_run = pd.DataFrame(long_run_data2)
+
+			# تحويل الأرقام إلى تنسيق نصي
+			df_long_run['المعامل طويل الأجل'] = df_long_run['المعامل طويل الأجل'].map('{:.3f}'.format)
+			df_long_run['الخطأ المعياري'] = df_long_run['الخطأ المعياري'].map('{:.3f}'.format)
+			df_long_run['t-stat'] = df_long_run['t-stat'].map('{:.3f}'.format)
+
+			st.table(df_long_run)
+
+			# صياغة المعادلة طويلة الأجل
+			st.markdown("""
+        <div class="highlight">
+        <strong>المعادلة طويلة الأجل المقدرة:</strong>
+
+        y = 2.778 + 0.022 t + 0.711 x₁ + 0.400 x₂
+          (0.882) (0.008) (0.219) (0.163)
+
+        حيث القيم بين الأقواس تمثل الأخطاء المعيارية للمعاملات المقدرة.
+        </div>
+        """, unsafe_allow_html=True)
+
+		st.markdown("""
+        ### ملاحظات مهمة:
+
+        1. **علامة معامل التكيف**: يجب أن يكون معامل y_{t-1} (معامل التكيف) سالباً ومعنوياً لكي تكون العلاقة طويلة الأجل صحيحة
+
+        2. **تفسير اقتصادي**: يجب أن تكون المعاملات طويلة الأجل متوافقة مع النظرية الاقتصادية
+
+        3. **معنوية المعاملات**: يجب اختبار معنوية المعاملات طويلة الأجل باستخدام اختبارات t
+
+        4. **حسابات القيم المتوقعة**: يمكن استخدام المعادلة طويلة الأجل لحساب القيم التوازنية للمتغير التابع
+        """)
+
+	with tabs[6]:
+		st.markdown("""
+        ## الخطوة 7: تقدير نموذج تصحيح الخطأ
+
+        ### الهدف:
+        تقدير ديناميكيات قصيرة الأجل بين المتغيرات وسرعة التكيف نحو التوازن طويل الأجل.
+
+        ### مفهوم نموذج تصحيح الخطأ (ECM):
+
+        نموذج تصحيح الخطأ هو تمثيل بديل لنموذج ARDL يفصل بوضوح بين العلاقات قصيرة الأجل وآلية التكيف نحو التوازن طويل الأجل.
+
+        ### صيغة نموذج تصحيح الخطأ:
+        """)
+
+		st.markdown(r'''
+        <div class="formula">
+        $\Delta y_t = \sum_{i=1}^{p-1} \beta_i^* \Delta y_{t-i} + \sum_{j=0}^{q_1-1} \gamma_j^* \Delta x_{1,t-j} + \sum_{k=0}^{q_2-1} \theta_k^* \Delta x_{2,t-k} + \lambda EC_{t-1} + \varepsilon_t$
+        </div>
+        ''', unsafe_allow_html=True)
+
+		st.markdown("""
+        حيث:
+        - EC_{t-1} هو حد تصحيح الخطأ المتباطئ لفترة واحدة
+        - λ هو معامل سرعة التكيف (يجب أن يكون سالباً ومعنوياً)
+        - β*ᵢ, γ*ⱼ, θ*ₖ هي معاملات العلاقة قصيرة الأجل
+
+        ### حساب حد تصحيح الخطأ:
+
+        يتم حساب حد تصحيح الخطأ (EC) كالتالي:
+        """)
+
+		st.latex(r"EC_t = y_t - (\alpha + \beta t + \theta_1 x_{1,t} + \theta_2 x_{2,t})")
+
+		st.markdown("""
+        حيث:
+        - α, β, θ₁, θ₂ هي المعاملات طويلة الأجل المقدرة في الخطوة السابقة
+
+        ### الخطوات العملية:
+
+        1. **حساب حد تصحيح الخطأ**:
+           - استخدام المعاملات طويلة الأجل لحساب EC_t
+
+        2. **تقدير نموذج تصحيح الخطأ**:
+           - إدراج EC_{t-1} في نموذج يحتوي على الفروق الأولى للمتغيرات مع فجواتها الزمنية
+
+        3. **تفسير النتائج**:
+           - المعاملات قصيرة الأجل: تأثيرات المتغيرات في المدى القصير
+           - معامل سرعة التكيف λ: النسبة المئوية للاختلال التي يتم تصحيحها في كل فترة زمنية
+
+        ### تفسير معامل تصحيح الخطأ:
+
+        - **القيمة المتوقعة**: يجب أن يكون سالباً ومعنوياً
+        - **المدى**: عادة بين -1 و 0
+          * قيمة -1: تعني تصحيح كامل للاختلال في فترة واحدة
+          * قيمة قريبة من 0: تعني تصحيح بطيء للاختلال
+        - **متوسط فترة التكيف**: يمكن حسابه كـ (1 / |λ|)
+        """)
+
+		# نموذج تصحيح الخطأ المشتق من النموذج المقدر في الخطوة 3، أو مثال توضيحي
+		if results is None:
+			ecm_data = {
+				'المتغير': ['EC(-1)', 'Δy(-1)', 'Δy(-2)', 'Δx₁', 'Δx₁(-1)', 'Δx₂', 'Δx₂(-1)'],
+				'المعامل': [-0.45, 0.28, 0.15, 0.55, 0.22, 0.38, 0.12],
+				'الخطأ المعياري': [0.09, 0.11, 0.10, 0.14, 0.13, 0.12, 0.11],
+				't-stat': [-5.00, 2.55, 1.50, 3.93, 1.69, 3.17, 1.09],
+				'القيمة الاحتمالية': [0.000, 0.013, 0.138, 0.000, 0.095, 0.002, 0.279]
+			}
+			adjustment_speed = 0.45
+			half_life = round(np.log(0.5) / np.log(1 - adjustment_speed), 2)
+			full_adjustment = round(np.log(0.05) / np.log(1 - adjustment_speed), 2)
+		else:
+			ecm = results.ecm
+			ecm_data = {
+				'المتغير': ecm.names,
+				'المعامل': ecm.params,
+				'الخطأ المعياري': ecm.bse,
+				't-stat': ecm.tvalues,
+				'القيمة الاحتمالية': ecm.pvalues
+			}
+			adjustment_speed = round(-ecm.speed, 3)
+			half_life = round(ecm.half_life, 2)
+			full_adjustment = round(ecm.adjustment_periods(0.95), 2)
+
+		df_ecm = pd.DataFrame(ecm_data)
+		pvalues = df_ecm['القيمة الاحتمالية'].to_numpy()
+
+		# إضافة نجوم للإشارة إلى المعنوية
+		df_ecm['المعنوية'] = np.select([pvalues < 0.01, pvalues < 0.05, pvalues < 0.1], ['***', '**', '*'], '')
+
+		# تنسيق القيم العددية
+		for column in ['المعامل', 'الخطأ المعياري', 't-stat', 'القيمة الاحتمالية']:
+			df_ecm[column] = df_ecm[column].map('{:.3f}'.format)
+
+		if results is None:
+			st.subheader("مثال توضيحي لنتائج نموذج تصحيح الخطأ")
+			st.info("قم بتقدير النموذج في الخطوة 3 لاشتقاق نموذج تصحيح الخطأ من بياناتك.")
+		else:
+			st.subheader("نتائج تقدير نموذج تصحيح الخطأ المشتق من نموذج ARDL المقدر")
+		st.table(df_ecm)
+
+		if results is not None:
+			st.plotly_chart(_ec_term(ecm, np.arange(results.model.maxlag, len(results.model.y))), use_container_width=True)
+
+		# رسم توضيحي لسرعة التكيف
+		st.subheader("تفسير رسومي لقيمة معامل تصحيح الخطأ")
+
+		periods = 8
+		if np.isfinite(half_life):
+			fig = get_figure("steps.ecm_adjustment", adjustment_speed=adjustment_speed, half_life=half_life,
+							 periods=periods)
+			st.plotly_chart(fig, use_container_width=True)
+		else:
+			st.warning(f"لا يمكن رسم مسار التكيف: معامل تصحيح الخطأ المقدر ({-adjustment_speed}) يقع خارج المدى (-1، 0)، "
+					   "فلا يتقارب الاختلال نحو التوازن بشكل رتيب ولا يُعرّف عمر النصف.")
+
+		if results is None:
+			significant = "سالبة ومعنوية إحصائياً، مما يؤكد وجود علاقة توازنية طويلة الأجل"
+			short_run = ("المتغيرات Δx₁ و Δx₂ لها تأثيرات معنوية في المدى القصير، بينما التأثيرات المتباطئة "
+						 "Δx₁(-1) و Δx₂(-1) أقل معنوية")
+		else:
+			if ecm.speed < 0 and ecm.pvalues[0] < 0.05:
+				significant = "سالبة ومعنوية إحصائياً عند 5%، مما يدعم وجود علاقة توازنية طويلة الأجل"
+			else:
+				significant = "ليست سالبة ومعنوية عند 5%، لذلك لا تدعم آلية تصحيح خطأ مستقرة"
+			effects = [name for name, p in zip(ecm.names[1:], ecm.pvalues[1:]) if p < 0.05]
+			short_run = (f"الحدود المعنوية عند 5% في المدى القصير: {'، '.join(effects)}" if effects
+						 else "لا توجد حدود قصيرة الأجل معنوية عند 5%")
+		if np.isnan(half_life):
+			timing = "غير معرفين لأن معامل التكيف يقع خارج المدى (-1، 0)"
+			half_life_text = full_adjustment_text = timing
+		else:
+			half_life_text = f"يستغرق تصحيح 50% من الاختلال حوالي {half_life} فترة"
+			full_adjustment_text = f"يتطلب تصحيح 95% من الاختلال حوالي {full_adjustment} فترات"
+
+		st.markdown(f"""
+        <div class="highlight">
+        <strong>تفسير نتائج نموذج تصحيح الخطأ:</strong><br>
+
+        1. <strong>معامل تصحيح الخطأ (EC(-1)):</strong> القيمة المقدرة هي {-adjustment_speed}، وهي {significant}.
+
+        2. <strong>سرعة التكيف:</strong> حوالي {adjustment_speed * 100:.1f}% من أي اختلال عن التوازن طويل الأجل يتم تصحيحه في كل فترة زمنية.
+
+        3. <strong>عمر النصف:</strong> {half_life_text}.
+
+        4. <strong>التصحيح الكامل:</strong> {full_adjustment_text}.
+
+        5. <strong>العلاقات قصيرة الأجل:</strong> {short_run}.
+        </div>
+        """, unsafe_allow_html=True)
+
+		st.markdown("""
+        ### العلاقة بين نموذج ARDL ونموذج تصحيح الخطأ:
+
+        - نموذج ARDL ونموذج تصحيح الخطأ المقابل له يتضمنان نفس المعلومات ويعطيان نفس تنبؤات المتغير التابع
+        - يعتبر نموذج تصحيح الخطأ صيغة أكثر تفسيرية ومباشرة لفهم العلاقات قصيرة وطويلة الأجل
+        - معامل تصحيح الخطأ يوفر مؤشراً مباشراً لسرعة التكيف نحو التوازن طويل الأجل
+        """)
+
+	with tabs[7]:
+		st.markdown("""
+        ## الخطوة 8: التشخيص والتحقق من النموذج
+
+        ### الهدف:
+        التأكد من أن النموذج المقدر يستوفي الفرضيات الأساسية للتحليل الاقتصادي القياسي، وأنه موثوق به للتفسير واتخاذ القرارات.
+
+        ### الاختبارات التشخيصية الرئيسية:
+        """)
+
+		col1, col2 = st.columns([1, 1])
+
+		with col1:
+			st.markdown("""
+            ### 1. اختبارات استقرار النموذج
+
+            - **اختبار CUSUM**:
+              * يستخدم لفحص استقرار معلمات النموذج عبر الزمن
+              * يعتمد على المجموع التراكمي للبواقي
+              * إذا بقي المجموع ضمن الحدود الحرجة، يكون النموذج مستقراً
+
+            - **اختبار CUSUM of Squares**:
+              * يركز على استقرار تباين النموذج
+              * يعتمد على المجموع التراكمي لمربعات البواقي
+              * حساس للتغيرات في تباين النموذج
+
+            ### 2. اختبار الارتباط الذاتي للبواقي
+
+            - **اختبار Breusch-Godfrey LM**:
+              * اختبار للكشف عن الارتباط الذاتي من رتب أعلى
+              * فرضية العدم: عدم وجود ارتباط ذاتي
+              * إذا كانت القيمة الاحتمالية > 0.05، فلا يوجد ارتباط ذاتي
+
+            - **اختبار Durbin-Watson**:
+              * يكشف عن الارتباط الذاتي من الرتبة الأولى
+              * القيمة المثلى قريبة من 2
+              * قيم < 1.5 أو > 2.5 تشير عادة إلى وجود ارتباط ذاتي
+            """)
+
+		with col2:
+			st.markdown("""
+            ### 3. اختبار تجانس التباين
+
+            - **اختبار Breusch-Pagan-Godfrey**:
+              * يكشف عن عدم تجانس التباين
+              * فرضية العدم: تباين البواقي متجانس
+              * إذا كانت القيمة الاحتمالية > 0.05، فالتباين متجانس
+
+            - **اختبار White**:
+              * اختبار أكثر مرونة لعدم تجانس التباين
+              * يأخذ في الاعتبار التفاعلات بين المتغيرات المستقلة
+
+            ### 4. اختبار التوزيع الطبيعي للبواقي
+
+            - **اختبار Jarque-Bera**:
+              * يقيس مدى اختلاف توزيع البواقي عن التوزيع الطبيعي
+              * يعتمد على الالتواء والتفلطح
+              * فرضية العدم: البواقي تتبع التوزيع الطبيعي
+
+            ### 5. اختبار التحديد الصحيح للنموذج
+
+            - **اختبار Ramsey RESET**:
+              * يكشف عن أخطاء التحديد مثل إغفال متغيرات مهمة أو الصيغة الوظيفية غير الصحيحة
+              * فرضية العدم: النموذج محدد بشكل صحيح
+            """)
+
+		# اختبارات الاستقرار على النموذج المقدر في الخطوة 3، أو على مثال توضيحي
+		if results is None:
+			st.subheader("مثال توضيحي لاختبارات استقرار النموذج")
+			fig, fig2 = get_figure("steps.stability_tests")
+		else:
+			st.subheader("اختبارات استقرار النموذج المقدر (البواقي المتكررة)")
+			stability = stability_test(results)
+			fig, fig2 = _stability_charts(stability)
+		st.plotly_chart(fig, use_container_width=True)
+		st.plotly_chart(fig2, use_container_width=True)
+
+		st.subheader("جدول ملخص نتائج الاختبارات التشخيصية")
+
+		if results is None:
+			st.info("قم بتقدير النموذج في الخطوة 3 لإجراء الاختبارات التشخيصية على بياناتك.")
+		else:
+			lags = st.number_input("عدد فجوات اختبار Breusch-Godfrey", 1, 12, 2)
+			diagnostics = diagnostic_tests(results, lags=int(lags))
+			names = [
+				f'اختبار Breusch-Godfrey للارتباط الذاتي ({int(lags)} فجوات)',
+				'اختبار Breusch-Pagan-Godfrey لتجانس التباين',
+				'اختبار White لتجانس التباين',
+				'اختبار Jarque-Bera للتوزيع الطبيعي',
+				'اختبار Ramsey RESET للتحديد الصحيح'
+			]
+			verdicts = [
+				('لا يوجد ارتباط ذاتي', 'يوجد ارتباط ذاتي'),
+				('التباين متجانس', 'التباين غير متجانس'),
+				('التباين متجانس', 'التباين غير متجانس'),
+				('البواقي تتبع التوزيع الطبيعي', 'البواقي لا تتبع التوزيع الطبيعي'),
+				('النموذج محدد بشكل صحيح', 'يوجد خطأ في التحديد')
+			]
+			passed = (diagnostics['pvalue'] > 0.05).to_numpy()
+			df_diagnostics = pd.DataFrame({
+				'الاختبار': names,
+				'إحصائية الاختبار': [f"{stat:.3f}" for stat in diagnostics['statistic']],
+				'القيمة الاحتمالية': [f"{p:.3f}" for p in diagnostics['pvalue']],
+				'النتيجة': [ok if flag else bad for (ok, bad), flag in zip(verdicts, passed)]
+			})
+			st.table(df_diagnostics)
+
+			findings = [f"- {name}: {verdict} (p = {p:.3f})" for name, verdict, p in
+						zip(names, df_diagnostics['النتيجة'], diagnostics['pvalue'])]
+			stable = stability.stable(0.05, 'cusum') and stability.stable(0.05, 'cusumsq')
+			summary = "تستوفي" if passed.all() and stable else "لا تستوفي كلها"
+			stability_note = ("يبقى مسارا CUSUM و CUSUM of Squares ضمن حدود 5%، فمعلمات النموذج مستقرة عبر الزمن."
+							  if stable else "يخرج أحد مساري CUSUM أو CUSUM of Squares عن حدود 5%، مما يشير إلى عدم استقرار المعلمات.")
+			findings_text = "<br>".join(findings)
+			st.markdown(f"""
+        <div class="highlight">
+        <strong>تفسير نتائج الاختبارات:</strong><br>
+        الاختبارات التشخيصية عند مستوى 5% {summary} الفرضيات الأساسية للتحليل الإحصائي:<br>
+        {findings_text}<br>
+        {stability_note}
+        </div>
+        """, unsafe_allow_html=True)
+
+		st.markdown("""
+        ### التعامل مع مشاكل التشخيص:
+
+        1. **مشكلة الارتباط الذاتي**:
+           - زيادة عدد الفجوات الزمنية في النموذج
+           - استخدام طرق تقدير قوية للارتباط الذاتي (HAC)
+
+        2. **مشكلة عدم تجانس التباين**:
+           - استخدام الأخطاء المعيارية المتينة (White أو Newey-West)
+           - تحويل المتغيرات (مثل اللوغاريتم)
+
+        3. **عدم التوزيع الطبيعي للبواقي**:
+           - البحث عن القيم المتطرفة ومعالجتها
+           - في العينات الكبيرة، يمكن الاعتماد على نظرية النهاية المركزية
+
+        4. **مشكلة التحديد غير الصحيح**:
+           - إعادة النظر في المتغيرات المدرجة في النموذج
+           - تغيير الصيغة الوظيفية (مثل استخدام اللوغاريتم أو المربعات)
+
+        5. **مشكلة عدم استقرار المعلمات**:
+           - البحث عن نقاط التغير الهيكلي
+           - استخدام نماذج متقدمة مثل ARDL-Fourier
+        """)
+
+	with tabs[8]:
+		st.markdown("""
+        ## الخطوة 9: التفسير الاقتصادي والاستنتاجات
+
+        ### الهدف:
+        تفسير نتائج نموذج ARDL من الناحية الاقتصادية واستخلاص الاستنتاجات والتوصيات.
+
+        ### العناصر الرئيسية للتفسير:
+        """)
+
+		col1, col2 = st.columns([1, 1])
+
+		with col1:
+			st.markdown("""
+            ### 1. تفسير العلاقة طويلة الأجل
+
+            - **اتجاه العلاقة**: ما إذا كانت المتغيرات المستقلة ترتبط طردياً أم عكسياً بالمتغير التابع في المدى الطويل
+
+            - **المرونات**: إذا كانت المتغيرات في صيغة لوغاريتمية، فإن المعاملات تعبر عن المرونات طويلة الأجل:
+              * إذا تغير X بنسبة 1%، فإن Y يتغير بنسبة θ%
+
+            - **الأهمية النسبية**: ترتيب المتغيرات المستقلة حسب حجم تأثيرها على المتغير التابع
+
+            - **المقارنة مع النظرية الاقتصادية**: مدى اتساق النتائج مع النظريات الاقتصادية ذات الصلة
+
+            ### 2. تفسير العلاقة قصيرة الأجل
+
+            - **التأثيرات الفورية**: كيف تؤثر التغيرات في المتغيرات المستقلة على المتغير التابع بشكل فوري
+
+            - **الديناميكيات قصيرة الأجل**: كيف تنتشر التأثيرات عبر الزمن من خلال الفجوات الزمنية المختلفة
+
+            - **الاختلافات بين التأثيرات قصيرة وطويلة الأجل**: قد تختلف العلاقات في المدى القصير عن المدى الطويل
+            """)
+
+		with col2:
+			st.markdown("""
+           ### 3. تفسير آلية تصحيح الخطأ
+
+
+            - **سرعة التكيف**: تفسير معامل تصحيح الخطأ وما يشير إليه عن سرعة عودة النظام إلى التوازن
+            
+            - **عمر النصف**: الوقت اللازم لتصحيح نصف الاختلال عن التوازن طويل الأجل
+            
+            - **التكيف الكامل**: الوقت اللازم للعودة الكاملة تقريباً إلى التوازن طويل الأجل
+            
+            ### 4. الاستنتاجات والتوصيات
+            
+            - **الاستنتاجات الرئيسية**: تلخيص النتائج الأساسية للنموذج
+            
+            - **التوصيات السياسية**: ما هي الإجراءات أو السياسات التي يمكن اقتراحها بناءً على النتائج
+            
+            - **القيود والتحفظات**: الإشارة إلى حدود النموذج وأي تحفظات على النتائج
+            
+            - **اتجاهات البحث المستقبلية**: اقتراح اتجاهات للبحوث المستقبلية
+            """)
+
+		st.markdown("---")
+
+		st.markdown("""
+        ### مثال: تفسير نتائج نموذج ARDL لدراسة العلاقة بين استهلاك الطاقة والنمو الاقتصادي
+
+        نفترض أن لدينا نموذج ARDL يدرس العلاقة بين استهلاك الطاقة (EC) والنمو الاقتصادي (GDP) وانبعاثات الكربون (CO2)، مع المتغير التابع هو النمو الاقتصادي. إليكم تفسيراً اقتصادياً لنتائج هذا النموذج:
+        """)
+
+		st.markdown("""
+        <div class="highlight">
+        <h4>1. تفسير العلاقة طويلة الأجل:</h4>
+
+        <p><strong>المعادلة طويلة الأجل المقدرة:</strong></p>
+        <p>ln(GDP) = 2.34 + 0.65 ln(EC) - 0.12 ln(CO2) + 0.02 trend</p>
+
+        <p><strong>التفسير الاقتصادي:</strong></p>
+        <ul>
+        <li><strong>استهلاك الطاقة (EC):</strong> المرونة طويلة الأجل هي 0.65، مما يعني أن زيادة استهلاك الطاقة بنسبة 1% تؤدي إلى زيادة الناتج المحلي الإجمالي بنسبة 0.65% في المدى الطويل. هذا يؤكد أهمية الطاقة كمحرك أساسي للنمو الاقتصادي.</li>
+
+        <li><strong>انبعاثات الكربون (CO2):</strong> المرونة طويلة الأجل هي -0.12، مما يشير إلى أن زيادة انبعاثات الكربون بنسبة 1% تؤدي إلى انخفاض الناتج المحلي الإجمالي بنسبة 0.12% في المدى الطويل. هذا قد يعكس التكاليف البيئية والصحية للتلوث أو تأثير السياسات البيئية المقيدة.</li>
+
+        <li><strong>الاتجاه الزمني:</strong> المعامل الموجب (0.02) يشير إلى نمو تقني إيجابي بمعدل 2% سنوياً، مما يعني زيادة الإنتاجية بمرور الوقت بسبب التقدم التكنولوجي.</li>
+        </ul>
+
+        <h4>2. تفسير العلاقة قصيرة الأجل:</h4>
+
+        <p>في المدى القصير، وجدنا أن:</p>
+        <ul>
+        <li>التغير في استهلاك الطاقة له تأثير فوري إيجابي على النمو الاقتصادي (معامل Δln(EC) = 0.43)، لكنه أقل من التأثير طويل الأجل.</li>
+
+        <li>التغير في انبعاثات الكربون ليس له تأثير معنوي في المدى القصير، مما يشير إلى أن الآثار السلبية للتلوث تظهر فقط على المدى الطويل.</li>
+        </ul>
+
+        <h4>3. تفسير آلية تصحيح الخطأ:</h4>
+
+        <p>معامل تصحيح الخطأ هو -0.35، وهو سالب ومعنوي إحصائياً، مما يؤكد وجود علاقة توازنية طويلة الأجل.</p>
+        <p>يشير هذا المعامل إلى أن 35% من أي اختلال عن التوازن طويل الأجل يتم تصحيحه خلال سنة واحدة.</p>
+        <p>عمر النصف (الوقت اللازم لتصحيح نصف الاختلال) يبلغ حوالي 1.98 سنة.</p>
+        <p>التكيف الكامل (95%) يتطلب حوالي 8.5 سنوات.</p>
+
+        <h4>4. الاستنتاجات والتوصيات السياساتية:</h4>
+
+        <p><strong>الاستنتاجات الرئيسية:</strong></p>
+        <ul>
+        <li>هناك علاقة توازنية طويلة الأجل بين استهلاك الطاقة والنمو الاقتصادي وانبعاثات الكربون.</li>
+        <li>استهلاك الطاقة محرك أساسي للنمو الاقتصادي، لكن انبعاثات الكربون لها تأثير سلبي طويل الأجل.</li>
+        <li>آلية التكيف نحو التوازن طويل الأجل معتدلة السرعة.</li>
+        </ul>
+
+        <p><strong>التوصيات السياساتية:</strong></p>
+        <ul>
+        <li>تعزيز كفاءة استخدام الطاقة للاستفادة من تأثيرها الإيجابي على النمو مع تقليل الآثار البيئية السلبية.</li>
+        <li>الاستثمار في مصادر الطاقة المتجددة لتقليل انبعاثات الكربون دون التأثير سلباً على النمو الاقتصادي.</li>
+        <li>تبني استراتيجيات للنمو الأخضر تعزز النمو الاقتصادي وتحد من التدهور البيئي.</li>
+        </ul>
+        </div>
+        """, unsafe_allow_html=True)
+
+		# إنشاء رسم توضيحي للتأثير بين المتغيرات
+		st.subheader("تمثيل بياني للعلاقات بين المتغيرات")
+
+		fig = get_figure("steps.causal_graph")
+		st.plotly_chart(fig, use_container_width=True)
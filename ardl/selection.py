@@ -0,0 +1,391 @@
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from multiprocessing import shared_memory
+
+import numpy as np
+import pandas as pd
+
+from ardl.model import ARDL
+
+CRITERIA = ("aic", "bic", "hqic", "fpe")
+METHODS = ("exhaustive", "bnb", "greedy")
+
+
+class GramLayout:
+	"""Gram matrix of ``[X_max, y]`` over the maximal lag set, with its column layout.
+
+	Columns of ``X_max`` are the deterministic terms, ``y(-1..maxlag)`` and, for each
+	regressor, ``x_j(0..maxorder_j)``. Every candidate ARDL(p, q_1, ..., q_k) uses a
+	leading slice of each block, so its normal equations are a sub-block of the Gram.
+	"""
+
+	def __init__(self, gram, n_det, maxlag, maxorder, nobs):
+		self.gram = gram
+		# تطبيع الأعمدة لتحسين حالة المصفوفة؛ مجموع مربعات البواقي لا يتغير بتغيير المقياس
+		scale = np.sqrt(np.diag(gram))
+		scale[scale == 0] = 1
+		self._scaled = gram / np.outer(scale, scale)
+		self._yscale = scale[-1] ** 2
+		self.n_det = n_det
+		self.maxlag = maxlag
+		self.maxorder = np.asarray(maxorder, dtype=int)
+		self.nobs = nobs
+		self.endog_name = "y"
+		self.exog_names = [f"x{j + 1}" for j in range(len(self.maxorder))]
+
+	@property
+	def shape(self):
+		# أبعاد شبكة المرشحين: p = 1..maxlag و q_j = 0..maxorder_j
+		return (self.maxlag, *(self.maxorder + 1).tolist())
+
+	@property
+	def size(self):
+		return int(np.prod(self.shape))
+
+	@classmethod
+	def from_data(cls, endog, exog, maxlag, maxorder, trend="c"):
+		# عينة مشتركة مقتطعة عند أكبر فجوة ممكنة حتى تكون المعايير قابلة للمقارنة
+		model = ARDL(endog, exog, maxlag, maxorder, trend)
+		y, X, _ = model.design()
+		Z = np.column_stack([X, y])
+		gram = Z.T @ Z
+		n_det = X.shape[1] - model.p - int(model.q.sum()) - len(model.q)
+		layout = cls(gram, n_det, model.p, model.q, len(y))
+		layout.endog_name, layout.exog_names = model.endog_name, model.exog_names
+		return layout
+
+	def orders(self, start=0, stop=None):
+		"""Candidate orders ``(p, q_1, ..., q_k)`` for flat grid positions ``start:stop``."""
+		stop = self.size if stop is None else min(stop, self.size)
+		orders = np.column_stack(np.unravel_index(np.arange(start, stop), self.shape))
+		orders[:, 0] += 1
+		return orders
+
+	def column_mask(self, orders):
+		counts = orders + np.r_[0, np.ones(len(self.maxorder), dtype=int)]
+		blocks = [np.ones((len(orders), self.n_det), dtype=bool)]
+		for j, width in enumerate(np.r_[self.maxlag, self.maxorder + 1]):
+			blocks.append(np.arange(width) < counts[:, j, None])
+		return np.hstack(blocks)
+
+	def ssr(self, orders):
+		"""Residual sum of squares and number of parameters of every candidate in ``orders``.
+
+		Candidates that differ only in the order of the last block share a "stem" with
+		that block at its maximum. The Cholesky factor of the stem's Gram sub-block,
+		bordered by ``y``, has the residual of ``y`` on every leading set of its columns
+		in its last row: ``SSR = L_yy² + Σ_{j > m} L_yj²`` for the first ``m`` columns,
+		so one factorization per stem scores every order of the last block.
+		"""
+		gram = self._scaled
+		width = self.shape[-1]
+		# الكتلة الأخيرة هي فجوات y عندما لا توجد متغيرات مستقلة، ورتبتها تبدأ من 1
+		first = int(len(self.maxorder) == 0)
+		# موقع كل مرشح في الكتلة الأخيرة، والجذع المشترك بأكبر رتبة في تلك الكتلة
+		position = orders[:, -1] - first
+		stems, inverse = np.unique(orders[:, :-1], axis=0, return_inverse=True)
+		inverse = inverse.ravel()
+		stems = np.column_stack([stems, np.full(len(stems), width - 1 + first, dtype=stems.dtype)])
+		mask = np.column_stack([self.column_mask(stems), np.ones(len(stems), dtype=bool)])
+		sizes = mask.sum(axis=1) - 1
+		stem_ssr = np.empty((len(stems), width))
+		for size in np.unique(sizes):
+			rows = np.flatnonzero(sizes == size)
+			idx = np.nonzero(mask[rows])[1].reshape(len(rows), size + 1)
+			try:
+				factor = np.linalg.cholesky(gram[idx[:, :, None], idx[:, None, :]])
+			except np.linalg.LinAlgError:
+				raise ValueError("the maximal lag design is rank deficient") from None
+			tail = factor[:, -1, size - width:size] ** 2
+			dropped = np.cumsum(tail[:, ::-1], axis=1)[:, ::-1]
+			stem_ssr[rows] = factor[:, -1, -1, None] ** 2 + np.column_stack([dropped[:, 1:], np.zeros(len(rows))])
+		nparams = sizes[inverse] - width + position + 1
+		return stem_ssr[inverse, position] * self._yscale, nparams
+
+
+def information_criteria(ssr, nparams, nobs):
+	"""AIC, BIC, HQ and FPE for arrays of residual sums of squares and model sizes."""
+	sigma2 = ssr / nobs
+	llf = -nobs / 2 * (np.log(2 * np.pi) + np.log(sigma2) + 1)
+	return {
+		"aic": -2 * llf + 2 * nparams,
+		"bic": -2 * llf + np.log(nobs) * nparams,
+		"hqic": -2 * llf + 2 * np.log(np.log(nobs)) * nparams,
+		"fpe": sigma2 * (nobs + nparams) / (nobs - nparams)
+	}
+
+
+class _Scores:
+	"""Mergeable reduction of scored candidates.
+
+	Keeps the ``top`` best rows for every criterion (all rows when ``top`` is None) and
+	the per-``p`` minimum of each criterion, so memory does not grow with the grid.
+	"""
+
+	def __init__(self, maxlag, nobs, top=None):
+		self.nobs = nobs
+		self.top = top
+		self.count = 0
+		self.parts = []
+		self.profiles = {ic: np.full(maxlag, np.inf) for ic in CRITERIA}
+
+	def add(self, index, orders, ssr, nparams):
+		for ic, values in information_criteria(ssr, nparams, self.nobs).items():
+			np.minimum.at(self.profiles[ic], orders[:, 0] - 1, values)
+		self.count += len(index)
+		self._extend([(index, orders, ssr, nparams)])
+
+	def merge(self, other):
+		for ic, profile in other.profiles.items():
+			np.minimum(self.profiles[ic], profile, out=self.profiles[ic])
+		self.count += other.count
+		self._extend(other.parts)
+
+	def _extend(self, parts):
+		self.parts.extend(parts)
+		if self.top is not None:
+			self.parts = [self.arrays()]
+
+	def arrays(self):
+		"""Kept ``(index, orders, ssr, nparams)`` sorted by grid position."""
+		index, orders, ssr, nparams = (np.concatenate(a) for a in zip(*self.parts))
+		keep = np.argsort(index, kind="stable")
+		if self.top is not None and len(keep) > self.top:
+			# اتحاد أفضل top صفاً لكل معيار؛ الترتيب حسب موقع المرشح يجعل كسر التعادل حتمياً
+			scores = information_criteria(ssr, nparams, self.nobs)
+			keep = np.unique(np.concatenate([np.lexsort((index, v))[:self.top] for v in scores.values()]))
+			keep = keep[np.argsort(index[keep], kind="stable")]
+		return index[keep], orders[keep], ssr[keep], nparams[keep]
+
+
+class OrderSelection:
+	"""Scores of the candidate lag orders, estimated on a common trimmed sample.
+
+	``orders`` holds every candidate, or only the best ``top`` per criterion when the
+	search was run with ``top``, or the models visited by a guided search.
+	``n_candidates`` is the number of models evaluated out of ``grid_size``.
+	"""
+
+	def __init__(self, orders, ssr, nparams, nobs, endog_name, exog_names, n_candidates=None, profiles=None,
+				 grid_size=None):
+		self.orders = orders
+		self.ssr = ssr
+		self.nparams = nparams
+		self.nobs = nobs
+		self.endog_name = endog_name
+		self.exog_names = exog_names
+		self.n_candidates = len(orders) if n_candidates is None else n_candidates
+		self.grid_size = self.n_candidates if grid_size is None else grid_size
+		for name, values in information_criteria(ssr, nparams, nobs).items():
+			setattr(self, name, values)
+		if profiles is None:
+			profiles = _Scores(int(orders[:, 0].max()), nobs)
+			profiles.add(np.arange(len(orders)), orders, ssr, nparams)
+			profiles = profiles.profiles
+		self.profiles = profiles
+
+	def __len__(self):
+		return len(self.orders)
+
+	def best(self, ic="aic"):
+		"""Lag order ``(p, q_1, ..., q_k)`` minimizing ``ic``."""
+		return tuple(int(o) for o in self.orders[np.argmin(getattr(self, ic))])
+
+	def profile(self, ic="aic"):
+		"""Minimum of ``ic`` over the regressor lags for each ``p = 1..maxlag``."""
+		return self.profiles[ic]
+
+	def top(self, n=10, ic="aic"):
+		"""The ``n`` best candidates by ``ic`` as a DataFrame."""
+		return self.frame(np.argsort(getattr(self, ic), kind="stable")[:n])
+
+	def frame(self, rows=slice(None)):
+		columns = ["p"] + [f"q({name})" for name in self.exog_names]
+		df = pd.DataFrame(self.orders[rows], columns=columns)
+		df["k"] = self.nparams[rows]
+		for ic in CRITERIA:
+			df[ic] = getattr(self, ic)[rows]
+		return df
+
+
+def _score_range(layout, start, stop, top):
+	orders = layout.orders(start, stop)
+	ssr, nparams = layout.ssr(orders)
+	scores = _Scores(layout.maxlag, layout.nobs, top)
+	scores.add(np.arange(start, start + len(orders)), orders, ssr, nparams)
+	return scores
+
+
+# حالة العمليات الفرعية: مصفوفة Gram مقروءة من الذاكرة المشتركة مرة واحدة لكل عملية
+_worker = {}
+
+
+def _init_worker(name, shape, n_det, maxlag, maxorder, nobs):
+	shm = shared_memory.SharedMemory(name=name)
+	gram = np.ndarray(shape, dtype=float, buffer=shm.buf)
+	_worker["shm"] = shm
+	_worker["layout"] = GramLayout(gram, n_det, maxlag, maxorder, nobs)
+
+
+def _worker_score(start, stop, top):
+	return _score_range(_worker["layout"], start, stop, top)
+
+
+def _ranges(size, chunksize):
+	for start in range(0, size, chunksize):
+		yield start, min(start + chunksize, size)
+
+
+def _run_parallel(layout, chunksize, top, max_workers, on_chunk):
+	shm = shared_memory.SharedMemory(create=True, size=layout.gram.nbytes)
+	try:
+		np.ndarray(layout.gram.shape, dtype=float, buffer=shm.buf)[:] = layout.gram
+		initargs = (shm.name, layout.gram.shape, layout.n_det, layout.maxlag, layout.maxorder, layout.nobs)
+		with ProcessPoolExecutor(max_workers, initializer=_init_worker, initargs=initargs) as pool:
+			# نافذة محدودة من المهام الجارية حتى لا تُنشأ ملايين الكائنات للشبكات الضخمة
+			ranges = _ranges(layout.size, chunksize)
+			pending = set()
+			for start, stop in ranges:
+				pending.add(pool.submit(_worker_score, start, stop, top))
+				if len(pending) >= 2 * max_workers:
+					break
+			while pending:
+				done, pending = wait(pending, return_when=FIRST_COMPLETED)
+				for future in done:
+					on_chunk(future.result())
+					for start, stop in ranges:
+						pending.add(pool.submit(_worker_score, start, stop, top))
+						break
+	finally:
+		shm.close()
+		shm.unlink()
+
+
+class _GuidedSearch:
+	"""Search of the lag grid for the minimum of one criterion without full enumeration.
+
+	Every criterion increases with both the SSR and the number of parameters, and the
+	candidates are nested: fixing the leading orders, the model with every remaining
+	order at its maximum has the smallest SSR of the subtree, and the one with every
+	remaining order at its minimum the fewest parameters. Their combination bounds
+	the criterion over the subtree from below.
+	"""
+
+	def __init__(self, layout, ic, progress=None):
+		self.layout = layout
+		self.ic = ic
+		self.progress = progress
+		self.shape = np.array(layout.shape)
+		self.scores = _Scores(layout.maxlag, layout.nobs)
+		self.values = {}
+		self.ssr = {}
+		self.best = (np.inf, -1)
+
+	def orders(self, grid):
+		orders = grid.copy()
+		orders[:, 0] += 1
+		return orders
+
+	def evaluate(self, grid):
+		"""Criterion of the candidates at grid coordinates ``grid``, each solved once."""
+		flat = np.ravel_multi_index(grid.T, self.shape)
+		unique, first = np.unique(flat, return_index=True)
+		todo = first[[f not in self.values for f in unique.tolist()]]
+		if len(todo):
+			orders = self.orders(grid[todo])
+			ssr, nparams = self.layout.ssr(orders)
+			self.scores.add(flat[todo], orders, ssr, nparams)
+			values = information_criteria(ssr, nparams, self.layout.nobs)[self.ic]
+			for f, v, e in zip(flat[todo].tolist(), values.tolist(), ssr.tolist()):
+				self.values[f] = v
+				self.ssr[f] = e
+				self.best = min(self.best, (v, f))
+			if self.progress is not None:
+				self.progress(self.scores.count, self.layout.size, self.selection())
+		return np.array([self.values[f] for f in flat.tolist()])
+
+	def branch_and_bound(self, prefix=()):
+		depth = len(prefix)
+		values = np.arange(self.shape[depth])
+		largest = np.tile(np.r_[prefix, 0, self.shape[depth + 1:] - 1], (len(values), 1)).astype(int)
+		largest[:, depth] = values
+		smallest = np.zeros_like(largest)
+		smallest[:, :depth + 1] = largest[:, :depth + 1]
+		# نموذج الحد الأعلى لكل فرع مرشح صالح بحد ذاته، فتقديره يحدّث أفضل قيمة أيضاً
+		self.evaluate(largest)
+		ssr = np.array([self.ssr[f] for f in np.ravel_multi_index(largest.T, self.shape).tolist()])
+		nparams = self.layout.column_mask(self.orders(smallest)).sum(axis=1)
+		bounds = information_criteria(ssr, nparams, self.layout.nobs)[self.ic]
+		for i in np.argsort(bounds, kind="stable"):
+			if bounds[i] > self.best[0]:
+				break
+			if depth + 1 < len(self.shape):
+				self.branch_and_bound((*prefix, int(values[i])))
+
+	def coordinate_descent(self):
+		current = np.zeros(len(self.shape), dtype=int)
+		value = self.evaluate(current[None])[0]
+		improved = True
+		while improved:
+			improved = False
+			for d in range(len(self.shape)):
+				grid = np.tile(current, (self.shape[d], 1))
+				grid[:, d] = np.arange(self.shape[d])
+				values = self.evaluate(grid)
+				i = int(np.argmin(values))
+				if values[i] < value:
+					current, value, improved = grid[i], values[i], True
+
+	def selection(self):
+		_, orders, ssr, nparams = self.scores.arrays()
+		return OrderSelection(orders, ssr, nparams, self.layout.nobs, self.layout.endog_name,
+							  self.layout.exog_names, self.scores.count, self.scores.profiles, self.layout.size)
+
+
+def select_order(endog, exog, maxlag, maxorder, trend="c", top=None, max_workers=None, chunksize=4096,
+				 progress=None, method="exhaustive", ic="aic"):
+	"""ARDL lag-order search over ``p = 1..maxlag`` and ``q_j = 0..maxorder_j``.
+
+	All candidates are scored on the sample trimmed at the largest possible lag, from
+	sub-blocks of one Gram matrix, so the data are read once whatever the grid size.
+
+	``method="exhaustive"`` scores the whole grid. ``"bnb"`` (branch and bound) finds
+	the same minimum of ``ic`` while skipping subtrees whose bound cannot beat it;
+	``"greedy"`` is coordinate descent on the orders and may stop at a local minimum.
+	Both guided methods only score the models they visit.
+
+	``top`` keeps only the best ``top`` models per criterion instead of every score.
+	``max_workers > 1`` scores chunks of the grid in a process pool; the Gram matrix
+	reaches the workers through shared memory. ``progress(done, total, selection)``
+	is called after each chunk with the partial result.
+	"""
+	if method not in METHODS:
+		raise ValueError(f"method must be one of {METHODS}, got {method!r}")
+	if ic not in CRITERIA:
+		raise ValueError(f"ic must be one of {CRITERIA}, got {ic!r}")
+	layout = GramLayout.from_data(endog, exog, maxlag, maxorder, trend)
+	if method != "exhaustive":
+		search = _GuidedSearch(layout, ic, progress)
+		if method == "bnb":
+			search.branch_and_bound()
+		else:
+			search.coordinate_descent()
+		return search.selection()
+
+	scores = _Scores(layout.maxlag, layout.nobs, top)
+
+	def selection():
+		_, orders, ssr, nparams = scores.arrays()
+		return OrderSelection(orders, ssr, nparams, layout.nobs, layout.endog_name, layout.exog_names,
+							  scores.count, scores.profiles, layout.size)
+
+	def on_chunk(chunk):
+		scores.merge(chunk)
+		if progress is not None:
+			progress(scores.count, layout.size, selection())
+
+	if max_workers is not None and max_workers > 1 and layout.size > chunksize:
+		_run_parallel(layout, chunksize, top, max_workers, on_chunk)
+	else:
+		for start, stop in _ranges(layout.size, chunksize):
+			on_chunk(_score_range(layout, start, stop, top))
+	return selection()
@@ -0,0 +1,71 @@
+"""Streaming quantile sketch for bootstrap distributions.
+
+A merging t-digest (Dunning and Ertl, 2019): the sample is summarized by at most
+``O(compression)`` weighted centroids, kept small in the tails by the ``k1`` scale
+function, so extreme quantiles stay accurate while memory does not grow with the
+number of values. Batches are merged in one vectorized pass (sort, assign clusters
+by scale value, reduce), not one value at a time.
+"""
+import numpy as np
+
+
+class TDigest:
+	"""Approximate quantiles and CDF of a stream of values in ``O(compression)`` memory."""
+
+	def __init__(self, compression=200):
+		self.compression = compression
+		self.means = np.empty(0)
+		self.weights = np.empty(0)
+		self.min = np.inf
+		self.max = -np.inf
+
+	@property
+	def count(self):
+		return float(self.weights.sum())
+
+	def _scale(self, q):
+		return self.compression / (2 * np.pi) * np.arcsin(2 * np.clip(q, 0, 1) - 1)
+
+	def update(self, values, weights=None):
+		"""Add a batch of values (or weighted centroids, e.g. of another digest)."""
+		values = np.ravel(np.asarray(values, dtype=float))
+		if not values.size:
+			return self
+		weights = np.ones(values.size) if weights is None else np.ravel(np.asarray(weights, dtype=float))
+		self.min = min(self.min, float(values.min()))
+		self.max = max(self.max, float(values.max()))
+		means = np.concatenate([self.means, values])
+		weights = np.concatenate([self.weights, weights])
+		order = np.argsort(means, kind="stable")
+		means, weights = means[order], weights[order]
+		cumulative = np.cumsum(weights)
+		# كل مجموعة تشغل وحدة واحدة على مقياس k، فتصغر المجموعات قرب الذيلين
+		cluster = np.floor(self._scale((cumulative - weights / 2) / cumulative[-1]))
+		starts = np.flatnonzero(np.diff(cluster, prepend=-np.inf))
+		self.weights = np.add.reduceat(weights, starts)
+		self.means = np.add.reduceat(means * weights, starts) / self.weights
+		return self
+
+	def merge(self, other):
+		"""Absorb another digest, e.g. one built in a different process."""
+		self.update(other.means, other.weights)
+		self.min = min(self.min, other.min)
+		self.max = max(self.max, other.max)
+		return self
+
+	def _knots(self):
+		# مراكز المجموعات على محور الوزن التراكمي، مع القيمتين الصغرى والكبرى عند الطرفين
+		centers = np.cumsum(self.weights) - self.weights / 2
+		return np.concatenate([[0], centers, [self.count]]), np.concatenate([[self.min], self.means, [self.max]])
+
+	def quantile(self, probs):
+		if not self.weights.size:
+			raise ValueError("the digest is empty")
+		ranks, values = self._knots()
+		return np.interp(np.asarray(probs) * self.count, ranks, values)
+
+	def cdf(self, x):
+		if not self.weights.size:
+			raise ValueError("the digest is empty")
+		ranks, values = self._knots()
+		return np.interp(x, values, ranks) / self.count
@@ -0,0 +1,114 @@
+"""Brown-Durbin-Evans recursive residuals with CUSUM and CUSUM-of-squares tests.
+
+The recursive residuals are the standardized one-step-ahead prediction errors of
+the least-squares fit on the first ``t`` observations. They are computed in one
+pass by Sherman-Morrison(-Woodbury) updates of ``(X'X)⁻¹`` and the coefficients,
+``O(n k²)`` in total for fixed block size instead of ``n`` refits.
+"""
+from functools import lru_cache
+
+import numpy as np
+
+LEVELS = (0.10, 0.05, 0.01)
+# ثوابت Brown وDurbin وEvans (1975) لحدود CUSUM الخطية
+CUSUM_CRITICAL = {0.10: 0.850, 0.05: 0.948, 0.01: 1.143}
+
+
+def recursive_residuals(exog, endog, skip=None, block=64):
+	"""Recursive residuals ``w_t`` for ``t = skip..n-1`` (``skip`` defaults to ``k``).
+
+	Observations are added ``block`` rows at a time. Given the fit on the rows before a
+	block, the prediction errors of its rows have covariance ``σ² (I + X_b P X_bᵀ)``
+	with ``P = (XᵀX)⁻¹``; its Cholesky factor whitens them into exactly the sequential
+	recursive residuals, and ``P`` and the coefficients are then updated by the block
+	(Woodbury) form of Sherman-Morrison. ``block=1`` is the classic rank-one recursion.
+	The first ``skip`` observations must identify the coefficients.
+	"""
+	from scipy import linalg
+
+	X = np.asarray(exog, dtype=float)
+	y = np.asarray(endog, dtype=float)
+	n, k = X.shape
+	skip = k if skip is None else skip
+	if not k <= skip < n:
+		raise ValueError(f"skip must be between {k} and {n - 1}")
+	head = X[:skip]
+	if np.linalg.matrix_rank(head) < k:
+		raise ValueError("the first observations do not identify the coefficients")
+	P = np.linalg.inv(head.T @ head)
+	beta = P @ (head.T @ y[:skip])
+	w = np.empty(n - skip)
+	for start in range(skip, n, block):
+		Xb = X[start:start + block]
+		error = y[start:start + block] - Xb @ beta
+		K = P @ Xb.T
+		L = np.linalg.cholesky(np.eye(len(Xb)) + Xb @ K)
+		w[start - skip:start - skip + len(Xb)] = linalg.solve_triangular(L, error, lower=True)
+		# تحديث Sherman-Morrison-Woodbury لمعكوس X'X والمعاملات بإضافة مشاهدات الكتلة
+		G = linalg.solve_triangular(L, K.T, lower=True)
+		beta = beta + G.T @ w[start - skip:start - skip + len(Xb)]
+		P = P - G.T @ G
+	return w
+
+
+@lru_cache(maxsize=None)
+def cusumsq_critical_value(nobs, level=0.05, reps=10000, seed=19750101, batch=1000):
+	"""Two-sided critical value ``c₀`` of ``max |S_t - t/N|`` for ``N = nobs`` recursive residuals.
+
+	Under the null the statistic depends on ``N`` alone (the ``w_t`` are i.i.d. normal), so
+	it is simulated directly for ``N <= 5000`` and taken from its Kolmogorov limit above.
+	"""
+	if nobs > 5000:
+		from scipy import stats
+
+		return float(stats.kstwobign.isf(level) / np.sqrt(nobs / 2))
+	rng = np.random.default_rng(seed)
+	line = np.arange(1, nobs + 1) / nobs
+	draws = []
+	for start in range(0, reps, batch):
+		w2 = rng.standard_normal((min(batch, reps - start), nobs)) ** 2
+		s = np.cumsum(w2, axis=1) / w2.sum(axis=1, keepdims=True)
+		draws.append(np.abs(s - line).max(axis=1))
+	return float(np.quantile(np.concatenate(draws), 1 - level))
+
+
+class StabilityTest:
+	"""CUSUM and CUSUM-of-squares paths of the recursive residuals with their bands."""
+
+	def __init__(self, resid, nparams, index=None):
+		self.resid = resid
+		self.nparams = nparams
+		self.nobs = len(resid)
+		self.index = np.arange(nparams, nparams + self.nobs) if index is None else np.asarray(index)
+		self.sigma = float(np.std(resid, ddof=1))
+		self.cusum = np.cumsum(resid) / self.sigma
+		squares = np.cumsum(resid ** 2)
+		self.cusumsq = squares / squares[-1]
+
+	def cusum_bounds(self, level=0.05):
+		"""Lines ``±a (√N + 2 (t - k) / √N)`` through the sample."""
+		a = CUSUM_CRITICAL[level]
+		upper = a * (np.sqrt(self.nobs) + 2 * np.arange(self.nobs) / np.sqrt(self.nobs))
+		return -upper, upper
+
+	def cusumsq_bounds(self, level=0.05):
+		"""Parallel lines ``(t - k) / N ± c₀`` around the expected path."""
+		line = np.arange(1, self.nobs + 1) / self.nobs
+		c0 = cusumsq_critical_value(self.nobs, level)
+		return line - c0, line + c0
+
+	def stable(self, level=0.05, stat="cusum"):
+		"""Whether the path stays inside its bands at ``level``."""
+		path = self.cusum if stat == "cusum" else self.cusumsq
+		lower, upper = self.cusum_bounds(level) if stat == "cusum" else self.cusumsq_bounds(level)
+		return bool(np.all((path >= lower) & (path <= upper)))
+
+
+def stability_test(results, skip=None):
+	"""Recursive-residual stability tests of a fitted :class:`ardl.model.ARDLResults`."""
+	nparams = results.exog.shape[1]
+	skip = nparams if skip is None else skip
+	resid = recursive_residuals(results.exog, results.endog, skip)
+	# ترقيم المشاهدات في السلسلة الأصلية بعد استبعاد الفجوات الأولى
+	index = np.arange(skip, results.nobs) + results.model.maxlag
+	return StabilityTest(resid, nparams, index)
@@ -0,0 +1,364 @@
+"""Fourier unit-root and stationarity tests for screening many series at once.
+
+The Fourier ADF test of Enders and Lee (2012) adds ``sin, cos(2πkt/T)`` to the
+Dickey-Fuller regression
+
+	Δy_t = det_t + ρ y_{t-1} + γ₁ sin(2πkt/T) + γ₂ cos(2πkt/T) + Σ_{i=1..p} c_i Δy_{t-i} + e_t
+
+and tests ``ρ = 0`` by its t ratio; the Fourier KPSS test of Becker, Enders and Lee
+(2006) computes the KPSS statistic from the residuals of ``y_t`` on the same
+deterministic and trigonometric terms, under the null of stationarity. In both the
+frequency is the one with the smallest SSR.
+
+Every column of a DataFrame and every frequency of the grid are handled together:
+the trigonometric basis is the cached one of :mod:`ardl.fourier`; for the ADF test
+each series' regression is factored once in a batched QR and the pairs of all
+frequencies are appended by the same block update as in
+:func:`ardl.fourier.frequency_search`, and for the KPSS test the regressors are
+common to all series, so one projection per frequency serves every column.
+
+The null distributions depend on the frequency; they are simulated for trends "c"
+and "ct" on the tabulated frequencies of :mod:`ardl.fourier` (interpolated linearly
+in ``k``) and, since selecting ``k`` by the SSR shifts them, for the statistics after
+the search over the default grid. Both are fitted by a response surface in the
+sample size::
+
+	python -m ardl.unitroot         # rewrite ardl/unitroot_cv.npz
+"""
+import argparse
+import sys
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from ardl.bounds import LEVELS, _subset_fit, fit_response_surface, probability_grid, quantile_cdf
+from ardl.fourier import FREQUENCIES, GRID, SIZES, TRENDS, fourier_basis
+from ardl.model import _as_frame, deterministic_terms
+
+TESTS = ("adf", "kpss")
+TABLE_PATH = Path(__file__).with_name("unitroot_cv.npz")
+
+
+def _default_lags(nobs):
+	return int(4 * (nobs / 100) ** 0.25)
+
+
+def _check_trend(trend):
+	if trend not in TRENDS:
+		raise ValueError(f"trend must be one of {TRENDS}, got {trend!r}")
+
+
+def _check_frequencies(frequencies):
+	# توزيع إحصائية البحث محاكى لشبكة GRID فقط، فلا تصح قيمه الحرجة لشبكة أخرى
+	frequencies = np.atleast_1d(np.asarray(frequencies, dtype=float))
+	if len(frequencies) > 1 and (frequencies.shape != np.shape(GRID) or not np.allclose(frequencies, GRID)):
+		raise ValueError("a frequency search is only tabulated over ardl.fourier.GRID; "
+						 "pass GRID or a single frequency")
+	return frequencies
+
+
+def _columns(data):
+	frame = _as_frame(data, "y")
+	values = frame.to_numpy(dtype=float)
+	if np.isnan(values).any():
+		raise ValueError("the data contain missing values")
+	return [str(c) for c in frame.columns], values
+
+
+def _pair(basis, chosen):
+	# زوج sin/cos للتردد المختار لكل سلسلة: (n, G, 2) -> (S, n, 2)
+	return np.moveaxis(basis[:, chosen], 1, 0)
+
+
+def fadf_statistics(Y, trend="c", lags=1, frequencies=GRID):
+	"""Fourier ADF t ratios of the columns of ``Y`` (n, S) at their minimum-SSR frequencies.
+
+	Returns ``(tstat, chosen, ssr, nobs)``: the t ratios ``(S,)``, the index of each
+	series' frequency in the grid, the SSR over the grid ``(S, G)`` and the number of
+	observations in the regressions.
+	"""
+	_check_trend(trend)
+	Y = np.asarray(Y, dtype=float)
+	n = len(Y)
+	dY = np.diff(Y, axis=0)
+	m = n - 1 - lags
+	index = np.arange(lags + 2, n + 1)
+	det, _ = deterministic_terms(trend, index)
+	columns = [np.broadcast_to(np.column_stack(det).T[:, :, None], (len(det), m, Y.shape[1])), Y[None, lags:-1]]
+	columns += [dY[None, lags - i:n - 1 - i] for i in range(1, lags + 1)]
+	X = np.concatenate(columns).transpose(2, 1, 0)
+	target = dY[lags:].T
+	q, _ = np.linalg.qr(X)
+	resid = target - np.einsum("smk,sk->sm", q, np.einsum("smk,sm->sk", q, target))
+
+	# تحديث كتلي لعوامل QR لكل سلسلة بأزواج كل الترددات دفعة واحدة
+	basis = fourier_basis(n, frequencies)[lags + 1:]
+	G = basis.shape[1]
+	B = basis.reshape(m, 2 * G)
+	B = (B - q @ (np.swapaxes(q, 1, 2) @ B)).reshape(-1, m, G, 2)
+	gram = np.einsum("smgi,smgj->sgij", B, B)
+	cross = np.einsum("smgi,sm->sgi", B, resid)
+	ssr = (resid ** 2).sum(axis=1)[:, None] - np.einsum("sgi,sgi->sg", cross,
+														np.linalg.solve(gram, cross[..., None])[..., 0])
+	chosen = np.argmin(ssr, axis=1)
+
+	# الانحدار الكامل عند التردد المختار لكل سلسلة بتحليل QR مجمع
+	design = np.concatenate([X, _pair(basis, chosen)], axis=2)
+	q, r = np.linalg.qr(design)
+	beta = np.linalg.solve(r, np.einsum("smk,sm->sk", q, target)[..., None])[..., 0]
+	e = target - np.einsum("smk,sk->sm", design, beta)
+	scale = (e ** 2).sum(axis=1) / (m - design.shape[2])
+	rho = len(det)
+	r_inv = np.linalg.inv(r)
+	se = np.sqrt(scale * (r_inv[:, rho] ** 2).sum(axis=1))
+	return beta[:, rho] / se, chosen, ssr, m
+
+
+def fkpss_statistics(Y, trend="c", bandwidth=None, frequencies=GRID):
+	"""Fourier KPSS statistics of the columns of ``Y`` (n, S) at their minimum-SSR frequencies.
+
+	The long-run variance uses the Bartlett kernel with ``bandwidth`` lags (default
+	``⌊4 (T/100)^¼⌋``). Returns ``(eta, chosen, ssr, nobs)`` as :func:`fadf_statistics`.
+	"""
+	_check_trend(trend)
+	Y = np.asarray(Y, dtype=float)
+	n = len(Y)
+	bandwidth = _default_lags(n) if bandwidth is None else bandwidth
+	det, _ = deterministic_terms(trend, np.arange(1, n + 1))
+	basis = fourier_basis(n, frequencies)
+	G = basis.shape[1]
+	# المتغيرات المحددة مشتركة بين السلاسل: إسقاط واحد لكل تردد يخدم كل الأعمدة
+	design = np.concatenate([np.broadcast_to(np.column_stack(det), (G, n, len(det))),
+							 basis.transpose(1, 0, 2)], axis=2)
+	q, _ = np.linalg.qr(design)
+	resid = Y[None] - q @ (np.swapaxes(q, 1, 2) @ Y[None])
+	ssr = (resid ** 2).sum(axis=1).T
+	chosen = np.argmin(ssr, axis=1)
+	e = resid[chosen, :, np.arange(Y.shape[1])].T
+	lrv = (e ** 2).sum(axis=0) / n
+	for j in range(1, bandwidth + 1):
+		lrv += 2 * (1 - j / (bandwidth + 1)) * (e[j:] * e[:-j]).sum(axis=0) / n
+	partial = np.cumsum(e, axis=0)
+	return (partial ** 2).sum(axis=0) / (n ** 2 * lrv), chosen, ssr, n
+
+
+def simulate_quantiles(reps=20000, sizes=SIZES, probs=None, seed=20120601, batch=250):
+	"""Simulate the null quantiles at fixed frequencies and with the search over :data:`GRID`.
+
+	ADF: ``y`` is a random walk; KPSS: ``y`` is white noise. Returns the quantiles at
+	the tabulated frequencies, shape ``(test, trend, frequency, size, prob)``, those of
+	the statistics at the minimum-SSR frequency of the grid, ``(test, trend, size, prob)``,
+	and the probabilities. Every frequency shares the simulated series, and the fixed-k
+	ADF statistics come from one Gram matrix per draw.
+	"""
+	probs = probability_grid() if probs is None else np.asarray(probs)
+	streams = np.random.SeedSequence(seed).spawn(len(sizes))
+	F = len(FREQUENCIES)
+	quantiles = np.full((len(TESTS), len(TRENDS), F, len(sizes), len(probs)), np.nan)
+	searched = np.full((len(TESTS), len(TRENDS), len(sizes), len(probs)), np.nan)
+	for s, nobs in enumerate(sizes):
+		rng = np.random.default_rng(streams[s])
+		trend = np.arange(1, nobs + 1, dtype=float)
+		basis = fourier_basis(nobs, FREQUENCIES).reshape(nobs, -1)
+		fixed, search = [], []
+		for start in range(0, reps, batch):
+			size = min(batch, reps - start)
+			e = rng.standard_normal((size, nobs + 1))
+			y = np.cumsum(e, axis=1)
+			Z = np.concatenate([
+				np.ones((size, nobs, 1)),
+				np.broadcast_to(trend[None, :, None], (size, nobs, 1)),
+				np.broadcast_to(basis, (size,) + basis.shape),
+				y[:, :-1, None],
+				np.diff(y, axis=1)[..., None]
+			], axis=2)
+			gram = Z.transpose(0, 2, 1) @ Z
+			stats = np.empty((len(TESTS), len(TRENDS), F, size))
+			best = np.empty((len(TESTS), len(TRENDS), size))
+			for c, name in enumerate(TRENDS):
+				det = [0] + [1] * ("t" in name)
+				for i in range(F):
+					full = det + [2 + 2 * i, 3 + 2 * i, 2 + 2 * F]
+					ssr, beta, inv = _subset_fit(gram, full)
+					stats[0, c, i] = beta[:, -1] / np.sqrt(ssr / (nobs - len(full)) * inv[:, -1, -1])
+					stats[1, c, i] = fkpss_statistics(e[:, 1:].T, name, 0, FREQUENCIES[i])[0]
+				best[0, c] = fadf_statistics(y.T, name, 0)[0]
+				best[1, c] = fkpss_statistics(e[:, 1:].T, name, 0)[0]
+			fixed.append(stats)
+			search.append(best)
+		quantiles[..., s, :] = np.moveaxis(np.quantile(np.concatenate(fixed, axis=-1), probs, axis=-1), 0, -1)
+		searched[..., s, :] = np.moveaxis(np.quantile(np.concatenate(search, axis=-1), probs, axis=-1), 0, -1)
+	return quantiles, searched, probs
+
+
+class UnitRootTable:
+	"""Response-surface coefficients of the Fourier ADF and KPSS statistics.
+
+	``theta`` has shape ``(test, trend, frequency, prob, degree + 1)`` for fixed
+	frequencies and ``search`` ``(test, trend, prob, degree + 1)`` for the statistics at
+	the minimum-SSR frequency of :data:`ardl.fourier.GRID`.
+	"""
+
+	def __init__(self, theta, search, probs, frequencies=FREQUENCIES, sizes=SIZES):
+		self.theta = np.asarray(theta, dtype=float)
+		self.search = np.asarray(search, dtype=float)
+		self.probs = np.asarray(probs, dtype=float)
+		self.frequencies = np.asarray(frequencies, dtype=float)
+		self.sizes = np.asarray(sizes, dtype=float)
+
+	@classmethod
+	def load(cls, path=TABLE_PATH):
+		with np.load(path) as data:
+			return cls(data["theta"], data["search"], data["probs"], data["frequencies"], data["sizes"])
+
+	def save(self, path=TABLE_PATH):
+		np.savez_compressed(path, theta=self.theta.astype(np.float32), search=self.search.astype(np.float32),
+							probs=self.probs, frequencies=self.frequencies, sizes=self.sizes)
+
+	def quantiles(self, test, trend, frequency, nobs):
+		"""Quantiles at :attr:`probs` for each ``frequency`` (array), shape ``(..., prob)``.
+
+		Linear in ``k`` between the tabulated frequencies and held constant beyond them;
+		``frequency=None`` gives those of the grid search, shape ``(prob,)``. ``nobs`` is
+		clamped to the smallest simulated size.
+		"""
+		if test not in TESTS:
+			raise ValueError(f"test must be one of {TESTS}, got {test!r}")
+		_check_trend(trend)
+		powers = (1 / max(nobs, self.sizes[0])) ** np.arange(self.theta.shape[-1])
+		if frequency is None:
+			q = self.search[TESTS.index(test), TRENDS.index(trend)] @ powers
+		else:
+			theta = self.theta[TESTS.index(test), TRENDS.index(trend)]
+			nodes = self.frequencies
+			frequency = np.clip(np.asarray(frequency, dtype=float), nodes[0], nodes[-1])
+			j = np.minimum(np.searchsorted(nodes, frequency, side="right") - 1, len(nodes) - 2)
+			w = ((frequency - nodes[j]) / (nodes[j + 1] - nodes[j]))[..., None, None]
+			q = ((1 - w) * theta[j] + w * theta[j + 1]) @ powers
+		return np.maximum.accumulate(q, axis=-1)
+
+	def critical_values(self, test, trend, frequency, nobs, levels=LEVELS):
+		"""Critical values ``(..., level)``: lower-tail for ADF, upper-tail for KPSS."""
+		probs = np.asarray(levels) if test == "adf" else 1 - np.asarray(levels)
+		index = np.searchsorted(self.probs, np.round(probs, 10))
+		if not np.allclose(self.probs[np.minimum(index, len(self.probs) - 1)], probs):
+			raise ValueError("levels must be on the tabulated probability grid")
+		return self.quantiles(test, trend, frequency, nobs)[..., index]
+
+	def pvalues(self, test, trend, frequency, nobs, value):
+		q = self.quantiles(test, trend, frequency, nobs)
+		cdf = quantile_cdf(np.broadcast_to(q, np.shape(value) + q.shape[-1:]), self.probs, value)
+		return cdf if test == "adf" else 1 - cdf
+
+
+@lru_cache(maxsize=None)
+def unitroot_table(path=TABLE_PATH):
+	return UnitRootTable.load(path)
+
+
+class FourierUnitRootTest:
+	"""Fourier ADF or KPSS statistics of several series with their frequencies and p-values.
+
+	With a grid of frequencies the critical values and p-values are those of the
+	statistic after the minimum-SSR search, simulated for :data:`ardl.fourier.GRID` (the
+	only grid accepted); conditioning on the selected ``k`` instead would over-reject. A
+	single frequency uses the fixed-k tables.
+	"""
+
+	def __init__(self, test, trend, names, statistic, frequencies, chosen, ssr, nobs, table):
+		self.test = test
+		self.trend = trend
+		self.names = names
+		self.statistic = statistic
+		self.frequency = frequencies[chosen]
+		self.ssr = pd.DataFrame(ssr, index=names, columns=frequencies)
+		self.nobs = nobs
+		self.levels = LEVELS
+		fixed = None if len(frequencies) > 1 else self.frequency
+		cv = table.critical_values(test, trend, fixed, nobs)
+		self.critical_values = np.broadcast_to(cv, np.shape(statistic) + cv.shape[-1:])
+		self.pvalues = table.pvalues(test, trend, fixed, nobs, statistic)
+
+	def reject(self, level=0.05):
+		"""Whether the null (unit root for ADF, stationarity for KPSS) is rejected at ``level``."""
+		return self.pvalues < level
+
+	def summary_frame(self):
+		frame = pd.DataFrame({"statistic": self.statistic, "frequency": self.frequency, "pvalue": self.pvalues},
+							 index=self.names)
+		for i, level in enumerate(self.levels):
+			frame[f"cv {level:.1%}".replace(".0%", "%")] = self.critical_values[:, i]
+		return frame
+
+
+def fourier_adf(data, trend="c", lags=None, frequencies=GRID, table=None):
+	"""Fourier ADF test (null: unit root) of every column of ``data``.
+
+	``lags`` augmenting differences are used for every series (default ``⌊4 (T/100)^¼⌋``).
+	``frequencies`` is the searched :data:`ardl.fourier.GRID` or a single frequency.
+	"""
+	names, Y = _columns(data)
+	lags = _default_lags(len(Y)) if lags is None else lags
+	frequencies = _check_frequencies(frequencies)
+	tstat, chosen, ssr, nobs = fadf_statistics(Y, trend, lags, frequencies)
+	table = unitroot_table() if table is None else table
+	return FourierUnitRootTest("adf", trend, names, tstat, frequencies, chosen, ssr, nobs, table)
+
+
+def fourier_kpss(data, trend="c", bandwidth=None, frequencies=GRID, table=None):
+	"""Fourier KPSS test (null: stationarity around the Fourier terms) of every column of ``data``.
+
+	``frequencies`` is the searched :data:`ardl.fourier.GRID` or a single frequency.
+	"""
+	names, Y = _columns(data)
+	frequencies = _check_frequencies(frequencies)
+	eta, chosen, ssr, nobs = fkpss_statistics(Y, trend, bandwidth, frequencies)
+	table = unitroot_table() if table is None else table
+	return FourierUnitRootTest("kpss", trend, names, eta, frequencies, chosen, ssr, nobs, table)
+
+
+def fourier_screen(data, trend="c", level=0.05, lags=None, frequencies=GRID, table=None):
+	"""Order of integration of every column by Fourier ADF tests on levels and first differences.
+
+	``order`` is 0 if the unit root is rejected in levels, 1 if only in the first
+	differences and 2 otherwise (at least I(2), which rules the series out of the
+	bounds test). The Fourier KPSS p-values of both are reported as a cross-check.
+	"""
+	frame = _as_frame(data, "y")
+	differences = frame.diff().iloc[1:]
+	# الفروق الأولى تزيل الاتجاه الخطي، فيكفي الثابت فيها
+	tests = {
+		"levels": (fourier_adf(frame, trend, lags, frequencies, table), fourier_kpss(frame, trend, None, frequencies, table)),
+		"differences": (fourier_adf(differences, "c", lags, frequencies, table),
+						fourier_kpss(differences, "c", None, frequencies, table))
+	}
+	columns = {}
+	for name, (adf, kpss) in tests.items():
+		columns[("FADF", name, "statistic")] = adf.statistic
+		columns[("FADF", name, "frequency")] = adf.frequency
+		columns[("FADF", name, "pvalue")] = adf.pvalues
+		columns[("FKPSS", name, "pvalue")] = kpss.pvalues
+	result = pd.DataFrame(columns, index=tests["levels"][0].names)
+	levels, differences = tests["levels"][0], tests["differences"][0]
+	result["order"] = np.where(levels.reject(level), 0, np.where(differences.reject(level), 1, 2))
+	return result
+
+
+def main(argv=None):
+	parser = argparse.ArgumentParser(prog="python -m ardl.unitroot", description=__doc__.splitlines()[0])
+	parser.add_argument("--reps", type=int, default=20000)
+	parser.add_argument("--path", default=TABLE_PATH, type=Path)
+	args = parser.parse_args(argv)
+
+	quantiles, searched, probs = simulate_quantiles(args.reps)
+	# محور حجم العينة رابع في مصفوفة سطح الاستجابة
+	search = fit_response_surface(searched[:, :, None], SIZES)[:, :, 0]
+	UnitRootTable(fit_response_surface(quantiles, SIZES), search, probs).save(args.path)
+	print(f"{args.path}: {args.reps} replications, {len(SIZES)} sample sizes, {len(FREQUENCIES)} frequencies")
+	return 0
+
+
+if __name__ == "__main__":
+	sys.exit(main())
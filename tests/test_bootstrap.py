@@ -0,0 +1,39 @@
+import numpy as np
+import pytest
+
+from ardl.bootstrap import SCHEMES, bootstrap_bounds
+from ardl.model import ARDL
+
+
+@pytest.fixture(scope="module")
+def results():
+	rng = np.random.default_rng(0)
+	nobs = 80
+	x = np.cumsum(rng.normal(size=(nobs, 2)), axis=0)
+	y = np.zeros(nobs)
+	for t in range(1, nobs):
+		y[t] = 0.3 + 0.6 * y[t - 1] + 0.3 * x[t, 0] - 0.2 * x[t - 1, 1] + rng.normal()
+	return ARDL(y, x, 2, [1, 1], "c").fit()
+
+
+@pytest.mark.parametrize("scheme", SCHEMES)
+def test_draws_do_not_depend_on_workers(results, scheme):
+	# كل دفعة من ابن خاص بها لـ SeedSequence، فالسحوبات لا تتغير مع عدد العمليات
+	kwargs = dict(reps=300, batch=50, seed=7, scheme=scheme)
+	serial = bootstrap_bounds(results, **kwargs)
+	for workers in (2, 3):
+		parallel = bootstrap_bounds(results, max_workers=workers, **kwargs)
+		assert parallel.observed == serial.observed
+		for stat, draws in serial.draws.items():
+			np.testing.assert_array_equal(parallel.draws[stat], draws)
+			assert parallel.pvalue(stat) == serial.pvalue(stat)
+
+
+def test_early_stop_and_sketch_do_not_depend_on_workers(results):
+	kwargs = dict(reps=2000, batch=100, seed=11, tol=0.2, keep_draws=False)
+	serial = bootstrap_bounds(results, **kwargs)
+	parallel = bootstrap_bounds(results, max_workers=2, **kwargs)
+	assert parallel.reps == serial.reps
+	assert min(serial.reps.values()) < 2000
+	for stat in serial.reps:
+		assert parallel.critical_values(stat) == serial.critical_values(stat)
@@ -0,0 +1,58 @@
+import numpy as np
+import pandas as pd
+import pytest
+from statsmodels.tsa.ardl import UECM
+
+from ardl.bounds import CASE_TERMS, CASES, KMAX, SIZES, bounds_test, critical_value_table, response_surface
+from ardl.model import ARDL
+
+
+def _data(seed=0, nobs=120):
+	rng = np.random.default_rng(seed)
+	x = np.cumsum(rng.normal(size=(nobs, 2)), axis=0)
+	y = np.zeros(nobs)
+	for t in range(1, nobs):
+		y[t] = 0.3 + 0.6 * y[t - 1] + 0.3 * x[t, 0] - 0.2 * x[t - 1, 1] + rng.normal()
+	return y, x
+
+
+@pytest.mark.parametrize("case", CASES)
+def test_statistics_match_statsmodels_uecm(case):
+	y, x = _data()
+	trend = CASE_TERMS[case][0]
+	test = bounds_test(ARDL(y, x, 2, [2, 1], trend).fit(), case)
+	reference = UECM(pd.Series(y, name="y"), 2, pd.DataFrame(x, columns=["x1", "x2"]), {"x1": 2, "x2": 1},
+					 trend=trend).fit()
+	assert test.fstat == pytest.approx(reference.bounds_test(CASES.index(case) + 1).statistic, rel=1e-10)
+	# إحصاءة t معرفة فقط في الحالات التي لا يدخل فيها حد محدد في فرضية العدم
+	if CASE_TERMS[case][1]:
+		assert test.tstat is None
+	else:
+		assert test.tstat == pytest.approx(reference.tvalues["y.L1"], rel=1e-10)
+
+
+@pytest.mark.parametrize("stat", ["f", "t"])
+def test_table_matches_surface(stat):
+	table, surface = critical_value_table(), response_surface()
+	for case in CASES:
+		if stat == "t" and CASE_TERMS[case][1]:
+			assert np.isnan(table.lookup(case, 2, 100, stat)).all()
+			continue
+		for k in (0, 3, KMAX):
+			# القيم في أحجام الجدول مطابقة، وبينها الاستيفاء في 1/n قريب من السطح
+			for nobs in SIZES:
+				np.testing.assert_allclose(table.lookup(case, k, nobs, stat),
+										   surface.critical_values(stat, case, k, nobs), rtol=1e-12)
+			for nobs in (33, 90, 300):
+				np.testing.assert_allclose(table.lookup(case, k, nobs, stat),
+										   surface.critical_values(stat, case, k, nobs), rtol=0.01)
+
+
+def test_table_clamps_sample_size():
+	table = critical_value_table()
+	np.testing.assert_array_equal(table.lookup("III", 2, 10), table.lookup("III", 2, SIZES[0]))
+	np.testing.assert_array_equal(table.lookup("III", 2, 10 ** 6), table.lookup("III", 2, SIZES[-1]))
+	with pytest.raises(ValueError):
+		table.lookup("VI", 2, 100)
+	with pytest.raises(ValueError):
+		table.lookup("III", KMAX + 1, 100)
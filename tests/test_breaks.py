@@ -0,0 +1,71 @@
+from itertools import combinations
+
+import numpy as np
+import pytest
+
+from ardl.breaks import f_sequence, optimal_partitions
+
+
+def _ssr(X, y):
+	return float(np.sum((y - X @ np.linalg.lstsq(X, y, rcond=None)[0]) ** 2))
+
+
+def _data(seed, nobs, k):
+	rng = np.random.default_rng(seed)
+	X = np.column_stack([np.ones(nobs), rng.normal(size=(nobs, k - 1))])
+	shift = np.r_[np.zeros(nobs // 2), np.ones(nobs - nobs // 2)]
+	y = X @ rng.normal(size=k) + shift * (X @ rng.normal(size=k)) + rng.normal(size=nobs)
+	return X, y
+
+
+@pytest.mark.parametrize("columns", [None, [0], [1, 2]])
+def test_f_sequence_matches_chow_refits(columns):
+	X, y = _data(0, 90, 3)
+	dates, fstats = f_sequence(X, y, 0.15, columns)
+	n, k = X.shape
+	shifted = np.arange(k) if columns is None else np.asarray(columns)
+	p = len(shifted)
+	ssr_r = _ssr(X, y)
+	expected = []
+	for date in dates:
+		# اختبار Chow: إضافة تفاعل الأعمدة المتغيرة مع مؤشر النظام الجديد
+		after = (np.arange(n) >= date)[:, None]
+		ssr_u = _ssr(np.column_stack([X, X[:, shifted] * after]), y)
+		expected.append((ssr_r - ssr_u) / p / (ssr_u / (n - k - p)))
+	assert dates[0] == int(np.ceil(0.15 * n)) and dates[-1] == n - dates[0]
+	np.testing.assert_allclose(fstats, expected, rtol=1e-8)
+
+
+def _exhaustive(X, y, breaks, h):
+	# كل تقسيمات [0, n) إلى breaks + 1 نظاماً طول كل منها h على الأقل
+	n = len(y)
+	best, best_dates = np.inf, None
+	for dates in combinations(range(h, n - h + 1), breaks):
+		edges = (0,) + dates + (n,)
+		if min(np.diff(edges)) < h:
+			continue
+		ssr = sum(_ssr(X[a:b], y[a:b]) for a, b in zip(edges[:-1], edges[1:]))
+		if ssr < best:
+			best, best_dates = ssr, list(dates)
+	return best, best_dates
+
+
+@pytest.mark.parametrize("seed, nobs, k, h", [(1, 30, 1, 4), (2, 36, 2, 5), (3, 40, 3, 6)])
+def test_optimal_partitions_match_exhaustive_search(seed, nobs, k, h):
+	X, y = _data(seed, nobs, k)
+	max_breaks = 3
+	ssr, dates = optimal_partitions(X, y, max_breaks, h)
+	assert ssr.shape == (max_breaks + 1,) and dates[0] == []
+	assert ssr[0] == pytest.approx(_ssr(X, y), rel=1e-9)
+	for breaks in range(1, max_breaks + 1):
+		expected, expected_dates = _exhaustive(X, y, breaks, h)
+		assert ssr[breaks] == pytest.approx(expected, rel=1e-9)
+		assert dates[breaks] == expected_dates
+
+
+def test_optimal_partitions_rejects_short_regimes():
+	X, y = _data(0, 30, 3)
+	with pytest.raises(ValueError):
+		optimal_partitions(X, y, 2, 2)
+	with pytest.raises(ValueError):
+		optimal_partitions(X, y, 5, 6)
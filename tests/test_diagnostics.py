@@ -0,0 +1,52 @@
+import numpy as np
+import pytest
+import statsmodels.api as sm
+from statsmodels.stats import diagnostic
+from statsmodels.stats.stattools import jarque_bera as sm_jarque_bera
+
+from ardl.diagnostics import breusch_godfrey, breusch_pagan, jarque_bera, reset, white
+from ardl.model import ARDL
+
+
+def _fit(trend, seed=0, nobs=150):
+	rng = np.random.default_rng(seed)
+	x = np.cumsum(rng.normal(size=(nobs, 2)), axis=0) * 0.2 + rng.normal(size=(nobs, 2))
+	y = np.zeros(nobs)
+	for t in range(1, nobs):
+		y[t] = 0.5 + 0.5 * y[t - 1] + 0.4 * x[t, 0] - 0.3 * x[t - 1, 1] + rng.standard_t(6)
+	results = ARDL(y, x, 2, [1, 1], trend).fit()
+	# نفس الانحدار في statsmodels، ومصفوفة اختبارات التباين تتضمن ثابتاً دائماً
+	reference = sm.OLS(results.endog, results.exog).fit()
+	het = results.exog if results.k_constant else sm.add_constant(results.exog, has_constant="add")
+	return results, reference, het
+
+
+@pytest.mark.filterwarnings("ignore::FutureWarning")
+@pytest.mark.parametrize("trend", ["n", "c", "ct"])
+def test_diagnostics_match_statsmodels(trend):
+	results, reference, het = _fit(trend)
+
+	lm, pvalue = diagnostic.acorr_breusch_godfrey(reference, nlags=2)[:2]
+	np.testing.assert_allclose(breusch_godfrey(results, 2)[:2], (lm, pvalue), rtol=1e-8)
+
+	lm, pvalue, _, _ = diagnostic.het_breuschpagan(reference.resid, het)
+	stat, p, df = breusch_pagan(results)
+	np.testing.assert_allclose((stat, p), (lm, pvalue), rtol=1e-8)
+	assert df == het.shape[1] - 1
+
+	lm, pvalue, _, _ = diagnostic.het_white(reference.resid, het)
+	np.testing.assert_allclose(white(results)[:2], (lm, pvalue), rtol=1e-7)
+
+	jb, pvalue, _, _ = sm_jarque_bera(reference.resid)
+	np.testing.assert_allclose(jarque_bera(results)[:2], (jb, pvalue), rtol=1e-8)
+
+	test = diagnostic.linear_reset(reference, power=3, test_type="fitted", use_f=True)
+	stat, p, (df1, df2) = reset(results, 3)
+	np.testing.assert_allclose((stat, p), (test.fvalue, test.pvalue), rtol=1e-6)
+	assert (df1, df2) == (test.df_num, test.df_denom)
+
+
+def test_no_constant_model_does_not_reject_homoskedastic_errors():
+	# أخطاء متجانسة التباين: النموذج بدون ثابت يجب ألا يرفض التجانس بشكل آلي
+	rejections = [breusch_pagan(_fit("n", seed)[0])[1] < 0.05 for seed in range(20)]
+	assert sum(rejections) <= 4
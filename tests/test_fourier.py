@@ -0,0 +1,30 @@
+import numpy as np
+import pytest
+
+from ardl.fourier import GRID, FourierARDL, frequency_search
+from ardl.model import ARDL
+
+
+def _data(seed=0, nobs=120):
+	rng = np.random.default_rng(seed)
+	t = np.arange(1, nobs + 1) / nobs
+	x = np.cumsum(rng.normal(size=(nobs, 2)), axis=0)
+	y = np.zeros(nobs)
+	for i in range(1, nobs):
+		# انكسار تدريجي في الثابت بتردد كسري
+		y[i] = 0.5 * y[i - 1] + 0.4 * x[i, 0] - 0.2 * x[i - 1, 1] + np.sin(2 * np.pi * 1.7 * t[i]) + rng.normal()
+	return y, x
+
+
+@pytest.mark.parametrize("trend", ["c", "ct"])
+def test_frequency_search_matches_refits(trend):
+	y, x = _data()
+	model = FourierARDL(y, x, 2, [1, 1], trend)
+	ssr = frequency_search(model.ardl.fit(), GRID)
+	# إعادة تقدير ARDL كاملة مع زوج كل تردد
+	expected = [ARDL(model.endog, model.exog, 2, [1, 1], trend, fixed=model.terms(k)).fit().ssr for k in GRID]
+	np.testing.assert_allclose(ssr, expected, rtol=1e-9)
+
+	results = model.fit()
+	assert results.frequency == GRID[int(np.argmin(expected))]
+	assert results.results.ssr == pytest.approx(min(expected), rel=1e-9)
@@ -0,0 +1,65 @@
+import numpy as np
+import pytest
+
+from ardl.midas import MIDAS, PARAM_NAMES, START_GRIDS, WEIGHTS, midas_lags, midas_weights
+
+
+def _central_difference(kind, theta, nlags, step=1e-6):
+	columns = []
+	for i in range(len(theta)):
+		delta = np.zeros(len(theta))
+		delta[i] = step
+		columns.append((midas_weights(kind, theta + delta, nlags) - midas_weights(kind, theta - delta, nlags)) / (2 * step))
+	return np.stack(columns, axis=-1)
+
+
+@pytest.mark.parametrize("kind", WEIGHTS)
+def test_weight_jacobian_matches_finite_differences(kind):
+	# بضع نقاط من شبكة القيم الابتدائية لكل دالة وزن
+	for theta in START_GRIDS[kind][::7]:
+		w, dw = midas_weights(kind, theta, 24, jacobian=True)
+		np.testing.assert_allclose(w.sum(), 1)
+		assert dw.shape == (24, len(PARAM_NAMES[kind]))
+		np.testing.assert_allclose(dw, _central_difference(kind, theta, 24), rtol=1e-5, atol=1e-9)
+
+
+def test_batched_weights_match_single_vectors():
+	thetas = START_GRIDS["beta"]
+	w, dw = midas_weights("beta", thetas, 12, jacobian=True)
+	for i in (0, 5, len(thetas) - 1):
+		single = midas_weights("beta", thetas[i], 12, jacobian=True)
+		np.testing.assert_allclose(w[i], single[0])
+		np.testing.assert_allclose(dw[i], single[1])
+
+
+def _data(seed=0, nobs=120, m=3):
+	rng = np.random.default_rng(seed)
+	x = rng.normal(size=(m * nobs, 2))
+	# لكل متغير أثر حقيقي حتى تكون معاملات الأوزان محددة
+	first = midas_lags(x[:, 0], m, 2) @ midas_weights("beta", [1.5, 4.0], 2 * m)
+	second = midas_lags(x[:, 1], m, 2) @ midas_weights("almon", [2.0, -6.0], 2 * m)
+	y = np.zeros(nobs)
+	y[1:] = 0.5 + 0.8 * first - second + rng.normal(size=nobs - 1) * 0.5
+	for t in range(1, nobs):
+		y[t] += 0.3 * y[t - 1]
+	return y, x
+
+
+def test_fit_matches_finite_difference_jacobian(monkeypatch):
+	# نفس التقدير بمشتقات عددية من scipy بدلاً من المشتقات التحليلية
+	from scipy import optimize
+
+	y, x = _data()
+	model = MIDAS(y, x, 1, 3, 2, ["beta", "almon"])
+	analytic = model.fit()
+	least_squares = optimize.least_squares
+
+	def numeric(*args, **kwargs):
+		kwargs["jac"] = "3-point"
+		return least_squares(*args, **kwargs)
+
+	monkeypatch.setattr(optimize, "least_squares", numeric)
+	numeric_fit = model.fit()
+	assert analytic.converged and numeric_fit.converged
+	assert analytic.ssr == pytest.approx(numeric_fit.ssr, rel=1e-6)
+	np.testing.assert_allclose(analytic.params, numeric_fit.params, rtol=1e-3, atol=1e-3)
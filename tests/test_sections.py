@@ -0,0 +1,74 @@
+from pathlib import Path
+
+import plotly.graph_objects as go
+import pytest
+import statsmodels.regression.linear_model as lm
+from streamlit.testing.v1 import AppTest
+
+import ardl.bundle
+from ardl.figures import figure_cache
+from ardl.model import ARDL
+from ardl.sections import SECTIONS
+
+APP = str(Path(__file__).resolve().parents[1] / "ardl2.py")
+
+# عدد تقديرات OLS وعدد الرسوم المبنية عند فتح كل صفحة لأول مرة، ثم عند إعادة تشغيلها
+# (الرسوم الحتمية تأتي من ذاكرة الرسوم عند إعادة التشغيل). زيادة أي رقم تعني أن صفحة
+# أخرى تُنفذ أو أن رسماً خرج من الذاكرة المؤقتة.
+EXPECTED = {
+	"home": ({"ols": 0, "figures": 1}, {"ols": 0, "figures": 1}),
+	"definition": ({"ols": 0, "figures": 1}, {"ols": 0, "figures": 1}),
+	"objectives": ({"ols": 0, "figures": 3}, {"ols": 0, "figures": 1}),
+	"assumptions": ({"ols": 0, "figures": 1}, {"ols": 0, "figures": 0}),
+	"advantages": ({"ols": 0, "figures": 2}, {"ols": 0, "figures": 0}),
+	"steps": ({"ols": 1, "figures": 10}, {"ols": 0, "figures": 5}),
+	"pending": ({"ols": 0, "figures": 0}, {"ols": 0, "figures": 0}),
+	"critiques": ({"ols": 7, "figures": 7}, {"ols": 2, "figures": 0}),
+	"solutions": ({"ols": 11, "figures": 10}, {"ols": 0, "figures": 0})
+}
+
+
+@pytest.fixture
+def counts(monkeypatch):
+	counts = {"ols": 0, "figures": 0}
+
+	def counting(method, key):
+		def wrapper(self, *args, **kwargs):
+			counts[key] += 1
+			return method(self, *args, **kwargs)
+		return wrapper
+
+	monkeypatch.setattr(lm.OLS, "fit", counting(lm.OLS.fit, "ols"))
+	monkeypatch.setattr(ARDL, "fit", counting(ARDL.fit, "ols"))
+	monkeypatch.setattr(go.Figure, "__init__", counting(go.Figure.__init__, "figures"))
+	# بدون الحزمة المبنية مسبقاً وبذاكرة رسوم فارغة حتى تكون الأعداد مستقلة عن البيئة
+	monkeypatch.setattr(ardl.bundle, "load_bundle", lambda *args, **kwargs: None)
+	figure_cache.clear()
+	yield counts
+	figure_cache.clear()
+
+
+def _label(module):
+	return next(label for label, name in SECTIONS.items() if name == module)
+
+
+def test_every_page_is_covered():
+	assert set(EXPECTED) == set(SECTIONS.values())
+
+
+@pytest.mark.parametrize("module", list(EXPECTED))
+def test_page_runs_only_its_own_code(counts, module):
+	at = AppTest.from_file(APP, default_timeout=300)
+	at.run()
+	first, rerun = EXPECTED[module]
+
+	counts.update(ols=0, figures=0)
+	at.sidebar.radio[0].set_value(_label(module)).run()
+	# الأعداد تصف تشغيلاً كاملاً للصفحة فقط إذا لم يتوقف التنفيذ بخطأ
+	assert not at.exception
+	assert counts == first
+
+	counts.update(ols=0, figures=0)
+	at.run()
+	assert not at.exception
+	assert counts == rerun
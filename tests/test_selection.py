@@ -0,0 +1,55 @@
+import numpy as np
+import pytest
+
+from ardl.model import ARDL
+from ardl.selection import CRITERIA, GramLayout, select_order
+
+
+def _problem(seed, k, nobs=80):
+	# بيانات ARDL صغيرة بفجوات حقيقية متفاوتة حتى لا تكون الرتبة المثلى في طرف الشبكة دائماً
+	rng = np.random.default_rng(seed)
+	x = np.cumsum(rng.normal(size=(nobs, k)), axis=0) * 0.3 + rng.normal(size=(nobs, k))
+	y = np.zeros(nobs)
+	for t in range(2, nobs):
+		y[t] = 0.5 * y[t - 1] - 0.2 * y[t - 2] + 0.4 * x[t, 0] + 0.3 * x[t - 2, -1] + rng.normal()
+	return y, x
+
+
+@pytest.mark.parametrize("ic", CRITERIA)
+@pytest.mark.parametrize("seed, k, trend", [(0, 1, "c"), (1, 2, "c"), (2, 2, "ct"), (3, 3, "n"), (4, 2, "c")])
+def test_branch_and_bound_matches_exhaustive(seed, k, trend, ic):
+	y, x = _problem(seed, k)
+	maxorder = [3, 2, 1][:k]
+	exhaustive = select_order(y, x, 4, maxorder, trend)
+	bnb = select_order(y, x, 4, maxorder, trend, method="bnb", ic=ic)
+
+	assert bnb.best(ic) == exhaustive.best(ic)
+	assert getattr(bnb, ic).min() == pytest.approx(getattr(exhaustive, ic).min(), rel=1e-10)
+
+	# عدد النماذج المقدرة مقابل حجم الشبكة كما تعرضه الصفحة
+	grid_size = 4 * np.prod(np.add(maxorder, 1))
+	assert exhaustive.n_candidates == exhaustive.grid_size == len(exhaustive) == grid_size
+	assert bnb.grid_size == grid_size
+	assert bnb.n_candidates == len(bnb) <= grid_size
+
+
+def test_branch_and_bound_prunes_large_grid():
+	y, x = _problem(5, 2, nobs=150)
+	bnb = select_order(y, x, 6, [6, 6], method="bnb", ic="bic")
+	exhaustive = select_order(y, x, 6, [6, 6])
+	assert bnb.best("bic") == exhaustive.best("bic")
+	assert bnb.n_candidates < bnb.grid_size == exhaustive.n_candidates
+
+
+@pytest.mark.parametrize("seed, maxorder, trend", [(0, [3, 2], "c"), (1, [2, 0], "ct"), (2, [1, 2, 3], "n")])
+def test_gram_ssr_matches_least_squares(seed, maxorder, trend):
+	y, x = _problem(seed, len(maxorder))
+	layout = GramLayout.from_data(y, x, 3, maxorder, trend)
+	# مرشحون بترتيب عشوائي حتى لا تكون الجذوع المشتركة متجاورة
+	orders = layout.orders()[np.random.default_rng(seed).permutation(layout.size)]
+	ssr, nparams = layout.ssr(orders)
+	endog, X, _ = ARDL(y, x, 3, maxorder, trend).design()
+	mask = layout.column_mask(orders)
+	expected = [np.sum((endog - X[:, m] @ np.linalg.lstsq(X[:, m], endog, rcond=None)[0]) ** 2) for m in mask]
+	np.testing.assert_allclose(ssr, expected, rtol=1e-10)
+	np.testing.assert_array_equal(nparams, mask.sum(axis=1))
@@ -0,0 +1,59 @@
+import numpy as np
+import pytest
+
+from ardl.bounds import LEVELS
+from ardl.sketch import TDigest
+
+# احتمالات الذيلين التي يقرأ منها Bootstrap القيم الحرجة (F في اليمين وt في اليسار)
+PROBS = np.concatenate([LEVELS, 1 - np.array(LEVELS)])
+
+
+def _draws(dist, size=20000, seed=0):
+	rng = np.random.default_rng(seed)
+	if dist == "f":
+		return rng.f(3, 40, size)
+	return rng.standard_t(5, size)
+
+
+def _check(digest, draws):
+	exact = np.quantile(draws, PROBS)
+	approx = digest.quantile(PROBS)
+	# خطأ الرتبة: نسبة المسحوبات حتى القيمة التقريبية مقارنة بالاحتمال المطلوب
+	ranks = np.searchsorted(np.sort(draws), approx, side="right") / len(draws)
+	np.testing.assert_allclose(ranks, PROBS, atol=1e-3)
+	np.testing.assert_allclose(approx, exact, rtol=0.03, atol=0.01)
+
+
+@pytest.mark.parametrize("dist", ["f", "t"])
+def test_quantiles_match_exact_percentiles(dist):
+	draws = _draws(dist)
+	digest = TDigest()
+	for batch in np.array_split(draws, 40):
+		digest.update(batch)
+	assert digest.count == len(draws)
+	assert len(digest.means) <= digest.compression
+	_check(digest, draws)
+
+
+@pytest.mark.parametrize("dist", ["f", "t"])
+def test_quantiles_after_merging_digests(dist):
+	draws = _draws(dist, seed=1)
+	# كما في المعالجة المتوازية: مُلخص لكل عملية ثم دمجها
+	parts = [TDigest().update(batch) for batch in np.array_split(draws, 8)]
+	digest = parts[0]
+	for part in parts[1:]:
+		digest.merge(part)
+	assert digest.count == len(draws)
+	assert (digest.min, digest.max) == (draws.min(), draws.max())
+	_check(digest, draws)
+
+
+def test_cdf_inverts_quantile():
+	draws = _draws("f", seed=2)
+	digest = TDigest().update(draws)
+	np.testing.assert_allclose(digest.cdf(digest.quantile(PROBS)), PROBS, atol=1e-9)
+
+
+def test_empty_digest_raises():
+	with pytest.raises(ValueError):
+		TDigest().quantile(0.5)
@@ -0,0 +1,33 @@
+import numpy as np
+import pytest
+
+from ardl.stability import recursive_residuals
+
+
+def _brute_force(X, y, skip):
+	# إعادة التقدير على أول t مشاهدة ثم خطأ التنبؤ المعياري للمشاهدة t
+	w = []
+	for t in range(skip, len(y)):
+		P = np.linalg.inv(X[:t].T @ X[:t])
+		beta = P @ (X[:t].T @ y[:t])
+		w.append((y[t] - X[t] @ beta) / np.sqrt(1 + X[t] @ P @ X[t]))
+	return np.array(w)
+
+
+@pytest.mark.parametrize("block", [1, 7, 64, 500])
+@pytest.mark.parametrize("skip", [None, 12])
+def test_recursive_residuals_match_refits(block, skip):
+	rng = np.random.default_rng(3)
+	nobs, k = 150, 5
+	X = np.column_stack([np.ones(nobs), np.cumsum(rng.normal(size=(nobs, k - 1)), axis=0)])
+	y = X @ rng.normal(size=k) + rng.normal(size=nobs)
+	w = recursive_residuals(X, y, skip, block)
+	expected = _brute_force(X, y, k if skip is None else skip)
+	assert w.shape == expected.shape
+	np.testing.assert_allclose(w, expected, rtol=1e-8, atol=1e-10)
+
+
+def test_unidentified_start_raises():
+	X = np.column_stack([np.ones(20), np.r_[np.zeros(5), np.arange(15.0)]])
+	with pytest.raises(ValueError):
+		recursive_residuals(X, np.arange(20.0), skip=4)